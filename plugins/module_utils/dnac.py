@@ -36,6 +36,7 @@ import re
 import socket
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 
 class DnacBase():
@@ -2157,6 +2158,190 @@ class DnacBase():
         self.log("Completed monitoring task '{0}' with task ID '{1}' after {2:.2f} seconds.".format(task_name, task_id, total_elapsed_time), "DEBUG")
         return self
 
+    def execute_concurrently(self, worker, items, max_workers=5):
+        """
+        Run the given worker for every item on a bounded pool of threads.
+        Args:
+            worker (callable): Function called with a single item. It should return its outcome instead of
+                               updating 'self.msg', 'self.status' or 'self.result'.
+            items (list): Items to be processed by the worker.
+            max_workers (int, optional): Maximum number of items processed at the same time. Defaults to 5.
+        Returns:
+            list: The results of the worker in the same order as the given items.
+        Description:
+            The items are processed one after the other when there is a single item or when 'max_workers'
+            is 1. An exception raised by the worker is re-raised to the caller.
+        """
+        items = list(items)
+        if len(items) <= 1 or not max_workers or max_workers <= 1:
+            return [worker(item) for item in items]
+
+        self.log("Processing {0} item(s) with up to {1} concurrent worker(s).".format(len(items), max_workers), "DEBUG")
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(worker, items))
+
+    def fetch_task_details(self, task_id):
+        """
+        Retrieve the details of a task from a worker thread.
+        Args:
+            task_id (str): The ID of the task.
+        Returns:
+            dict: The task details, None if the response is not valid, or details with 'isError' set to True and
+                  a 'failureReason' when the request raises.
+        Description:
+            Unlike 'get_task_details', this method never exits the module nor updates 'self.msg', so it is safe to
+            call concurrently.
+        """
+        try:
+            response = self.dnac._exec(
+                family="task",
+                function="get_task_by_id",
+                params={"task_id": task_id},
+                op_modifies=True,
+            )
+        except Exception as e:
+            return {
+                "isError": True,
+                "failureReason": "Unable to retrieve the status of the task {0}: {1}".format(task_id, str(e))
+            }
+
+        self.log("Retrieving task details by the API 'get_task_by_id' using task ID: {0}, Response: {1}"
+                 .format(task_id, response), "DEBUG")
+        if not isinstance(response, dict):
+            return None
+
+        return response.get("response")
+
+    def wait_for_tasks(self, task_ids, validation_string=None, max_workers=5):
+        """
+        Monitor several tasks together until every one of them completes, fails or the task timeout is reached.
+        Args:
+            task_ids (list): IDs of the tasks to be monitored.
+            validation_string (str, optional): Lower case string marking the task as complete when it is found
+                                               in the task progress, for the APIs which do not set an end time.
+            max_workers (int, optional): Maximum number of task status requests sent at the same time.
+        Returns:
+            dict: Task details keyed by task ID. Tasks which did not complete within 'dnac_api_task_timeout'
+                  or whose status could not be retrieved are reported with 'isError' set to True and a 'failureReason'.
+        Description:
+            Every round queries the status of all the pending tasks and then waits 'dnac_task_poll_interval'
+            seconds once, so monitoring many tasks costs one poll interval per round instead of one per task.
+            The method does not update 'self.msg' or 'self.status', the caller decides how to report the results.
+        """
+        pending_task_ids = []
+        for task_id in task_ids:
+            if task_id and task_id not in pending_task_ids:
+                pending_task_ids.append(task_id)
+
+        task_results = {}
+        loop_start_time = time.time()
+        poll_interval = self.params.get("dnac_task_poll_interval")
+        self.log("Starting to monitor {0} task(s): {1}".format(len(pending_task_ids), pending_task_ids), "DEBUG")
+
+        while pending_task_ids:
+            task_details_list = self.execute_concurrently(self.fetch_task_details, pending_task_ids, max_workers)
+            still_pending = []
+            for task_id, task_details in zip(pending_task_ids, task_details_list):
+                task_details = task_details or {}
+                progress = str(task_details.get("progress") or "").lower()
+                if task_details.get("isError") or task_details.get("endTime") or \
+                        (validation_string and validation_string in progress):
+                    self.log("Task '{0}' completed with details: {1}".format(task_id, task_details), "DEBUG")
+                    task_results[task_id] = task_details
+                else:
+                    still_pending.append(task_id)
+
+            pending_task_ids = still_pending
+            if not pending_task_ids:
+                break
+
+            elapsed_time = time.time() - loop_start_time
+            if elapsed_time > self.params.get("dnac_api_task_timeout"):
+                for task_id in pending_task_ids:
+                    task_results[task_id] = {
+                        "isError": True,
+                        "failureReason": "Task {0} has not completed within the timeout period of {1} seconds.".format(
+                            task_id, int(elapsed_time))
+                    }
+                self.log("Timeout reached while monitoring the task(s): {0}".format(pending_task_ids), "WARNING")
+                break
+
+            self.log("{0} task(s) still in progress, waiting {1} seconds before the next poll.".format(
+                len(pending_task_ids), poll_interval), "DEBUG")
+            time.sleep(poll_interval)
+
+        self.log("Completed monitoring {0} task(s) after {1:.2f} seconds.".format(
+            len(task_results), time.time() - loop_start_time), "DEBUG")
+        return task_results
+
+    def get_backoff_interval(self, attempt, max_interval=30):
+        """
+        Compute the wait before polling again a resource which is still in progress.
+        Args:
+            attempt (int): Number of polls already made, starting at 0.
+            max_interval (int, optional): Upper bound of the wait in seconds. Defaults to 30.
+        Returns:
+            int: 'dnac_task_poll_interval' doubled for every previous attempt and capped at 'max_interval',
+                 so short operations are seen quickly and long ones are not polled needlessly. The wait is at
+                 least 1 second, so a 'dnac_task_poll_interval' of 0 does not turn the polling loops into busy loops.
+        """
+        poll_interval = max(self.params.get("dnac_task_poll_interval") or 0, 1)
+        return max(min(poll_interval * (2 ** min(attempt, 16)), max_interval), 1)
+
+    def get_paginated_response(self, api_family, api_function, api_parameters=None, limit=500):
+        """
+        Retrieve every page of a paginated GET API and return the combined records.
+        Args:
+            api_family (str): The family of the API to call.
+            api_function (str): The specific function of the API to call.
+            api_parameters (dict, optional): Filters passed with every page request.
+            limit (int, optional): Number of records requested per page. Defaults to 500.
+        Returns:
+            list: The records of the 'response' key of all the pages.
+        Description:
+            Pages are requested with an 'offset' starting at 1 until a page holds fewer records than 'limit'.
+        """
+        records = []
+        offset = 1
+        while True:
+            params = dict(api_parameters or {}, offset=offset, limit=limit)
+            response = self.execute_get_request(api_family, api_function, params)
+            page = response.get("response") if isinstance(response, dict) else None
+            if not page:
+                break
+
+            records.extend(page)
+            if len(page) < limit:
+                break
+
+            offset += limit
+
+        self.log("Retrieved {0} record(s) from '{1}' with filters {2}.".format(
+            len(records), api_function, api_parameters), "DEBUG")
+        return records
+
+    def get_device_list_in_bulk(self, param_name, values, batch_size=100):
+        """
+        Retrieve the network devices matching any of the given values with one 'get_device_list' call per batch.
+        Args:
+            param_name (str): The 'get_device_list' filter to match, e.g. 'management_ip_address' or 'serial_number'.
+            values (list): The values to look up.
+            batch_size (int, optional): Number of values sent in a single request. Defaults to 100.
+        Returns:
+            list: Details of the matching devices. Values without a matching device are left out.
+        """
+        values = [value for value in dict.fromkeys(values) if value]
+        devices = []
+        for start in range(0, len(values), batch_size):
+            batch = values[start:start + batch_size]
+            self.log("Fetching device details for {0} '{1}' value(s): {2}".format(len(batch), param_name, batch), "DEBUG")
+            response = self.execute_get_request("devices", "get_device_list", {param_name: batch})
+            if response:
+                devices.extend(response.get("response") or [])
+
+        self.log("Found {0} device(s) for {1} '{2}' value(s).".format(len(devices), len(values), param_name), "DEBUG")
+        return devices
+
     def requires_update(self, have, want, obj_params):
         """
         Check if the config given requires update by comparing
@@ -47,9 +47,60 @@ options:
     type: int
     default: 2
   next_task_after_interval:
-    description: Time in second between Provision and AP updated execution
+    description: |
+      Maximum time in seconds to wait after provisioning for the Access Point to be
+      reachable and associated with its wireless controller, both before the AP update
+      is applied and before the verification. The inventory is polled and the wait ends
+      as soon as the AP is ready.
     type: int
     default: 5
+  ap_batch_size:
+    description: |
+      Maximum number of access points in one reboot or factory reset request. Lists longer
+      than this are grouped by wireless controller and split into requests of this size.
+      Cisco Catalyst Center accepts at most 100 access points per request.
+    type: int
+    default: 100
+    version_added: 6.32.0
+  max_aps_in_flight:
+    description: |
+      Maximum number of access points rebooting or resetting at the same time. Further
+      requests are submitted as earlier ones complete, so reboots can be rolled across a
+      campus. By default all the requests are submitted together, bounded by
+      'max_concurrent_requests'. Must be at least 1.
+    type: int
+    version_added: 6.32.0
+  report_file_path:
+    description: |
+      Path of a file receiving the report rows of the Access Points, keyed by the AP MAC
+      address, with the update and verification messages. Rows are written as they are
+      produced, so the update and the verification of an AP are separate rows. When set, the
+      rows are written to the file instead of being returned in the module response, which
+      only reports the file and the number of APs and rows.
+    type: str
+    version_added: 6.32.0
+  report_format:
+    description: Format of the file written to 'report_file_path'.
+    type: str
+    choices: ["csv", "jsonl"]
+    default: jsonl
+    version_added: 6.32.0
+  fleet_mode:
+    description: |
+      Set to true to process all the Access Points of the config list together. Every AP
+      identifier is resolved in bulk, the AP configurations are read concurrently,
+      provisioning is submitted in batches grouped by site and RF profile, and the APs
+      requiring the same configuration change are updated with a single request.
+    type: bool
+    default: false
+    version_added: 6.32.0
+  max_concurrent_requests:
+    description: |
+      Maximum number of requests sent to Cisco Catalyst Center at the same time
+      when 'fleet_mode' is enabled.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description: List of details of AP being managed.
     type: list
@@ -1054,6 +1105,9 @@ notes:
   - GET  /dna/intent/api/v1/wireless/accesspoint-configuration/details/{task_id}
   - POST /dna/intent/api/v2/wireless/accesspoint-configuration
   - POST /dna/intent/api/v1/assign-device-to-site/{siteId}/device
+  - Added 'fleet_mode' and 'max_concurrent_requests' options in v6.32.0.
+  - Added 'report_file_path' and 'report_format' options in v6.32.0.
+  - Added 'ap_batch_size' and 'max_aps_in_flight' options in v6.32.0.
 """
 
 EXAMPLES = r"""
@@ -1651,6 +1705,9 @@ response_5:
 
 import time
 import re
+import json
+import csv
+import tempfile
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
@@ -1660,6 +1717,160 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
 from ansible.module_utils.basic import AnsibleModule
 
 
+class AccessPointReport(object):
+    """
+    Columnar collection of per Access Point report rows keyed by MAC address.
+
+    Each field is stored as one column list, so a row costs one slot per field instead of a
+    dictionary. Rows are projected on the given fields and merged when the same MAC address is
+    added again.
+    """
+
+    __slots__ = ("fields", "columns", "index", "size", "projected")
+
+    def __init__(self, fields=None):
+        self.projected = bool(fields)
+        self.fields = list(fields) if fields else []
+        self.columns = dict((field, []) for field in self.fields)
+        self.index = {}
+        self.size = 0
+
+    def add(self, record, key=None):
+        """
+        Add a record as a row, or merge it into the row already stored for the key.
+
+        Parameters:
+            record (dict): The values of the row.
+            key (str, optional): The MAC address identifying the row. Rows without a key are
+                always appended.
+
+        Returns:
+            int: The position of the row.
+        """
+        if key is not None:
+            key = str(key).lower()
+        row = self.index.get(key) if key is not None else None
+        if row is None:
+            row = self.size
+            self.size += 1
+            for column in self.columns.values():
+                column.append(None)
+            if key is not None:
+                self.index[key] = row
+
+        for field, value in record.items():
+            if field not in self.columns:
+                if self.projected:
+                    continue
+                self.fields.append(field)
+                self.columns[field] = [None] * self.size
+            self.columns[field][row] = value
+
+        return row
+
+    def rows(self):
+        """
+        Yield every row as a dictionary of the report fields, in insertion order.
+        """
+        for row in range(self.size):
+            yield dict((field, self.columns[field][row]) for field in self.fields)
+
+    def to_list(self):
+        """
+        Return all the rows as a list of dictionaries.
+        """
+        return list(self.rows())
+
+
+class AccessPointReportWriter(object):
+    """
+    Stream per Access Point report rows to a CSV or JSON Lines file as they are recorded.
+
+    Rows are not kept in memory. JSON Lines rows are written to the report file directly. CSV
+    rows are spooled to a temporary file as JSON, because the header needs every field, and are
+    converted when the writer is closed. Rows recorded for the same MAC address at different
+    stages, such as the update and its verification, are written as separate rows.
+    """
+
+    __slots__ = ("file_path", "file_format", "report_file", "spool_file", "fields", "field_names", "size", "keys")
+
+    def __init__(self, file_path, file_format="jsonl"):
+        self.file_path = file_path
+        self.file_format = file_format
+        self.report_file = None
+        self.spool_file = None
+        self.fields = []
+        self.field_names = set()
+        self.size = 0
+        self.keys = set()
+
+    def open(self):
+        """
+        Open the report file, and the spool file of a CSV report, if they are not open yet.
+        """
+        if self.report_file is None:
+            self.report_file = open(self.file_path, "w")
+            if self.file_format == "csv":
+                self.spool_file = tempfile.TemporaryFile("w+")
+
+    def add(self, record, key=None):
+        """
+        Write a record as a row of the report.
+
+        Parameters:
+            record (dict): The values of the row.
+            key (str, optional): The MAC address of the access point the row belongs to.
+
+        Returns:
+            int: The number of rows written so far.
+        """
+        self.open()
+        for field in record:
+            if field not in self.field_names:
+                self.field_names.add(field)
+                self.fields.append(field)
+
+        line = json.dumps(record, default=str) + "\n"
+        if self.spool_file is not None:
+            self.spool_file.write(line)
+        else:
+            self.report_file.write(line)
+
+        if key is not None:
+            self.keys.add(str(key).lower())
+        self.size += 1
+        return self.size
+
+    def close(self):
+        """
+        Complete and close the report file.
+
+        Returns:
+            int: The number of rows written.
+        """
+        self.open()
+        try:
+            if self.spool_file is not None:
+                writer = csv.writer(self.report_file)
+                writer.writerow(self.fields)
+                self.spool_file.seek(0)
+                for line in self.spool_file:
+                    record = json.loads(line)
+                    values = []
+                    for field in self.fields:
+                        value = record.get(field)
+                        if isinstance(value, (dict, list)):
+                            value = json.dumps(value, default=str)
+                        values.append("" if value is None else value)
+                    writer.writerow(values)
+                self.spool_file.close()
+                self.spool_file = None
+        finally:
+            self.report_file.close()
+
+        return self.size
+
+
 class Accesspoint(DnacBase):
     """Class containing member attributes for DNAC Access Point Automation module"""
 
@@ -1668,6 +1879,21 @@ class Accesspoint(DnacBase):
         self.supported_states = ["merged"]
         self.payload = module.params
         self.payload["consolidated_result"] = []
+        self.pending_verifications = []
+        self.ap_config_snapshot = None
+        self.ap_config_batch_size = 500
+        self.ap_lookup_batch_size = 100
+        self.fleet_devices = {}
+        self.site_details = {}
+        self.site_device_ids = {}
+        self.wlc_provision_details = {}
+        self.provisioned_aps = {}
+        self.fleet_records = []
+        self.ap_report = None
+        if module.params.get("report_file_path"):
+            self.ap_report = AccessPointReportWriter(module.params.get("report_file_path"),
+                                                     module.params.get("report_format"))
+        self.consolidated_changed = False
         self.keymap = {
             "mac_addresses": "mac_address",
             "hostnames": "hostname",
@@ -1905,12 +2131,15 @@ class Accesspoint(DnacBase):
 
         site_required_changes = self.have.get("site_required_changes")
         site = self.want.get("site")
+        ap_provisioned = False
 
         if site:
             if site_required_changes:
                 if self.have.get("wlc_provision_status") == "success":
                     provision_status, provision_details = self.provision_device()
                     if provision_status == "SUCCESS":
+                        ap_provisioned = True
+                        self.provisioned_aps[self.have["mac_address"]] = self.have.get("associated_wlc_ip")
                         self.result["changed"] = True
                         self.msg = "AP {0} provisioned successfully.".format(self.have["hostname"])
                         self.log(self.msg, "INFO")
@@ -1927,7 +2156,13 @@ class Accesspoint(DnacBase):
         if not self.ap_update_required:
             return self
 
-        time.sleep(self.payload.get("next_task_after_interval"))
+        if ap_provisioned:
+            if not self.wait_for_ap_ready({self.have["mac_address"]: self.have.get("associated_wlc_ip")}):
+                ap_config_exists, ready_config = self.get_accesspoint_config(
+                    self.payload["access_point_details"]["ap_ethernet_mac_address"])
+                if ap_config_exists:
+                    self.payload["access_point_config"] = ready_config
+                    self.have["current_ap_config"] = ready_config
 
         self.log("Comparing current AP configuration with input data.", "INFO")
         consolidated_data = self.config_diff(self.have["current_ap_config"])
@@ -1987,6 +2222,92 @@ class Accesspoint(DnacBase):
         self.result["response"] = responses
         return self
 
+    def get_ap_readiness(self, mac_address, wlc_ip_address):
+        """
+        Check whether a provisioned Access Point has re-joined its wireless controller.
+
+        Parameters:
+            self (object): An instance of a class for interacting with Cisco Catalyst Center.
+            mac_address (str): The MAC address of the access point.
+            wlc_ip_address (str): The management IP address of the WLC the AP is provisioned on.
+
+        Returns:
+            tuple: (True, None) when the AP is reachable and associated with the WLC,
+            otherwise (False, reason).
+        """
+        try:
+            response = self.dnac._exec(
+                family="devices",
+                function="get_device_list",
+                op_modifies=True,
+                params={"macAddress": mac_address},
+            )
+        except Exception as e:
+            return False, "unable to read the device details: {0}".format(str(e))
+
+        devices = response.get("response") if isinstance(response, dict) else None
+        if not devices:
+            return False, "not present in the inventory"
+
+        device = devices[0]
+        if device.get("reachabilityStatus") != "Reachable":
+            return False, "reachability status is '{0}'".format(device.get("reachabilityStatus"))
+
+        if wlc_ip_address and device.get("associatedWlcIp") != wlc_ip_address:
+            return False, "associated with WLC '{0}' instead of '{1}'".format(
+                device.get("associatedWlcIp"), wlc_ip_address)
+
+        return True, None
+
+    def wait_for_ap_ready(self, access_points):
+        """
+        Poll provisioned Access Points until they are reachable on their wireless controller.
+
+        Parameters:
+            self (object): An instance of a class for interacting with Cisco Catalyst Center.
+            access_points (dict): The MAC addresses of the access points mapped to the
+            management IP address of the WLC they are provisioned on.
+
+        Returns:
+            dict: The access points which are not ready after 'next_task_after_interval'
+            seconds, mapped to the reason, or an empty dict when all of them are ready.
+
+        Description:
+            After provisioning the AP re-joins the controller. The inventory is polled with a
+            backoff between attempts until every AP is reachable and associated with its WLC,
+            so the AP update and the verification only start once the AP is back.
+        """
+        max_wait = self.payload.get("next_task_after_interval")
+        start_time = time.time()
+        attempt = 0
+        pending = dict(access_points)
+        not_ready = {}
+
+        while pending:
+            not_ready = {}
+            for mac_address, wlc_ip_address in pending.items():
+                is_ready, reason = self.get_ap_readiness(mac_address, wlc_ip_address)
+                if is_ready:
+                    self.log("AP '{0}' is ready on WLC '{1}' after {2} attempt(s).".format(
+                        mac_address, wlc_ip_address, attempt + 1), "INFO")
+                    self.provisioned_aps.pop(mac_address, None)
+                else:
+                    not_ready[mac_address] = reason
+
+            pending = dict((mac_address, pending[mac_address]) for mac_address in not_ready)
+            elapsed_time = time.time() - start_time
+            if not pending or elapsed_time >= max_wait:
+                break
+
+            time.sleep(min(self.get_backoff_interval(attempt), max_wait - elapsed_time))
+            attempt += 1
+
+        for mac_address, reason in not_ready.items():
+            self.log("AP '{0}' is not ready within {1} seconds: {2}.".format(
+                mac_address, max_wait, reason), "WARNING")
+
+        return not_ready
+
     def ap_update_required(self):
         """
         Check if the necessary keys are present in the configuration for AP updates.
@@ -2769,8 +3090,12 @@ class Accesspoint(DnacBase):
             Access Point configuration and returns it.
         """
         self.log("Starting to retrieve current configuration with input: {0}".format(str(input_config)), "INFO")
-        accesspoint_exists, current_configuration = self.get_accesspoint_details(
-            input_config)
+        fleet_device = self.fleet_devices.get(self.get_ap_lookup_key(input_config))
+        if fleet_device:
+            accesspoint_exists, current_configuration = True, dict(fleet_device)
+        else:
+            accesspoint_exists, current_configuration = self.get_accesspoint_details(
+                input_config)
         self.log("Access point exists: {0}, Current configuration: {1}"
                  .format(accesspoint_exists, current_configuration), "INFO")
 
@@ -2838,6 +3163,14 @@ class Accesspoint(DnacBase):
         current_configuration = {}
         accesspoint_config_exists = False
 
+        if self.ap_config_snapshot and ap_ethernet_mac_address.lower() in self.ap_config_snapshot:
+            ap_config_response = self.ap_config_snapshot[ap_ethernet_mac_address.lower()]
+            self.keymap = self.map_config_key_to_api_param(self.keymap, ap_config_response)
+            current_configuration = self.camel_to_snake_case(ap_config_response)
+            self.log("Using bulk AP configuration for '{0}': {1}".format(
+                ap_ethernet_mac_address, self.pprint(current_configuration)), "DEBUG")
+            return (True, current_configuration)
+
         try:
             ap_config_response = self.dnac._exec(
                 family="wireless",
@@ -2856,6 +3189,104 @@ class Accesspoint(DnacBase):
 
         return (accesspoint_config_exists, current_configuration)
 
+    def load_accesspoint_configs(self):
+        """
+        Read the configuration of all access points in one paginated bulk query.
+
+        Parameters:
+            self (object): An instance of the class containing the method.
+
+        Returns:
+            self (object): Instance with "ap_config_snapshot" holding the raw AP configurations
+            keyed by lowercase Ethernet MAC address, or None if the bulk read failed.
+
+        Description:
+            Used by the batched verification pass so that every AP is compared against a
+            single read of Cisco Catalyst Center. APs missing from the snapshot are still
+            read individually by "get_accesspoint_config". The paginated form of
+            "get_access_point_configuration" is only available from release 2.3.7.9, so on
+            older releases every AP is read individually.
+        """
+        if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.9") < 0:
+            self.log("Bulk read of the Access Point configurations is not supported on Catalyst Center "
+                     "version {0}, reading the APs individually.".format(self.get_ccc_version()), "INFO")
+            self.ap_config_snapshot = None
+            return self
+
+        snapshot = {}
+        offset = 1
+
+        try:
+            while True:
+                response = self.dnac._exec(
+                    family="wireless",
+                    function="get_access_point_configuration",
+                    params={"limit": self.ap_config_batch_size, "offset": offset},
+                )
+                if isinstance(response, dict):
+                    response = response.get("response")
+
+                if not isinstance(response, list):
+                    break
+
+                for ap_config in response:
+                    eth_mac = ap_config.get("ethMac") or ap_config.get("eth_mac")
+                    if eth_mac:
+                        snapshot[eth_mac.lower()] = ap_config
+
+                if len(response) < self.ap_config_batch_size:
+                    break
+                offset += self.ap_config_batch_size
+
+        except Exception as e:
+            self.log("Unable to read the Access Point configurations in bulk, falling back to "
+                     "per AP reads: {0}".format(str(e)), "WARNING")
+            self.ap_config_snapshot = None
+            return self
+
+        self.log("Loaded {0} Access Point configuration(s) for verification.".format(
+            len(snapshot)), "INFO")
+        self.ap_config_snapshot = snapshot
+        return self
+
+    def verify_pending_configs(self, state):
+        """
+        Verify all Access Points processed in this run in a single batched pass.
+
+        Parameters:
+            self (object): An instance of the class containing the method.
+            state (str): The state whose verify function is applied.
+
+        Returns:
+            self (object): Instance with the consolidated verification result.
+
+        Description:
+            Waits for the APs provisioned in this run to re-join their WLC, then loads every
+            AP configuration once and verifies each queued config against that snapshot,
+            restoring the change status recorded when the config was applied.
+        """
+        if not self.pending_verifications:
+            return self
+
+        self.log("Starting batched verification of {0} AP config(s).".format(
+            len(self.pending_verifications)), "INFO")
+        if self.provisioned_aps:
+            self.wait_for_ap_ready(self.provisioned_aps)
+        self.load_accesspoint_configs()
+
+        for pending in self.pending_verifications:
+            self.reset_values()
+            self.result["changed"] = pending["changed"]
+            self.result["ap_update_status"] = pending["ap_update_status"]
+            self.get_want(pending["config"]).check_return_status()
+            self.verify_diff_state_apply[state](pending["config"]).check_return_status()
+            self.consolidate_output()
+
+        self.publish_consolidated_result()
+        self.pending_verifications = []
+        self.ap_config_snapshot = None
+        return self
+
     def site_exists(self, input_config):
         """
         Checks if the site exists in Cisco Catalyst Center and retrieves current site details
@@ -2886,6 +3317,9 @@ class Accesspoint(DnacBase):
         if floor_name and parent_name:
             site_name = parent_name + "/" + floor_name
             self.want["site_name"] = site_name
+            if site_name in self.site_details:
+                return True, self.site_details[site_name]
+
             try:
                 response = self.get_site(site_name)
                 if response.get("response"):
@@ -2917,6 +3351,7 @@ class Accesspoint(DnacBase):
                     self.log("Current site details: {0}".format(str(current_site)), "INFO")
                     self.log("Site {0} exists in Cisco Catalyst Center".format(site.get("name")), "INFO")
                     site_exists = True
+                    self.site_details[site_name] = current_site
                 else:
                     msg = "The provided site name '{0}' is either invalid or not present in the \
                         Cisco Catalyst Center.".format(self.want.get("site_name"))
@@ -2955,7 +3390,10 @@ class Accesspoint(DnacBase):
         """
         try:
             site_name = self.have.get("site_name_hierarchy", self.want.get("site_name"))
-            api_response, device_list = self.get_device_ids_from_site(site_name, site_id)
+            if site_id in self.site_device_ids:
+                device_list = self.site_device_ids[site_id]
+            else:
+                api_response, device_list = self.get_device_ids_from_site(site_name, site_id)
             if current_config.get("id") is not None and current_config.get("id") in device_list:
                 self.log("Device with MAC address: {0} found in site: {1} Proceeding with ap_site updation."
                          .format(ap_mac_address, site_id), "INFO")
@@ -2990,6 +3428,8 @@ class Accesspoint(DnacBase):
         provision_status = "failed"
         provision_details = None
         device_management_ip_address = wlc_ip_address
+        if wlc_ip_address in self.wlc_provision_details:
+            return self.wlc_provision_details[wlc_ip_address]
 
         try:
             response = self.dnac._exec(
@@ -3004,6 +3444,7 @@ class Accesspoint(DnacBase):
                 self.log("WLC already provisioned.", "INFO")
                 provision_status = "success"
                 provision_details = self.pprint(response)
+                self.wlc_provision_details[wlc_ip_address] = (provision_status, provision_details)
 
         except Exception as e:
             msg = "Wireles controller is not provisioned:"
@@ -3717,18 +4158,11 @@ class Accesspoint(DnacBase):
             if not fields_to_include or fields_to_include.strip() == "":
                 return records
 
-            field_names = [field.strip() for field in fields_to_include.split(",")]
-            filtered_data = []
-
+            report = AccessPointReport([field.strip() for field in fields_to_include.split(",")])
             for record in records:
-                filtered_record = {}
+                report.add(record)
 
-                for field in field_names:
-                    filtered_record[field] = record.get(field)
-
-                filtered_data.append(filtered_record)
-
-            return filtered_data
+            return report.to_list()
 
         except Exception as e:
             self.log("Unable to filter fields: {0}".format(str(e)) , "ERROR")
@@ -3748,22 +4182,609 @@ class Accesspoint(DnacBase):
             "changed": self.result["changed"],
             "response": self.result["response"].get("accesspoints_verify"),
         }
-        self.payload["consolidated_result"].append(each_result)
+        self.add_report_row(self.have.get("mac_address"), dict(each_result["response"] or {},
+                                                               changed=each_result["changed"]))
+        if not self.params.get("report_file_path"):
+            self.payload["consolidated_result"].append(each_result)
         self.log("Each execution Result {0}".format(self.pprint(self.result)))
-        self.result["changed"] = False
-
-        for each_cosolidated in self.payload["consolidated_result"]:
-            if each_cosolidated["changed"]:
-                self.result["changed"] = True
-                break
 
+        self.consolidated_changed = self.consolidated_changed or bool(each_result["changed"])
+        self.result["changed"] = self.consolidated_changed
         if self.result["changed"]:
             self.status = "success"
 
-        self.msg = self.pprint(self.payload["consolidated_result"])
         self.result["response"] = self.payload["consolidated_result"]
-        self.log("Consolidated Result: {0}".format(self.pprint(self.result)))
+        return self
+
+    def publish_consolidated_result(self):
+        """
+        Set the module message once all the access points are consolidated.
+
+        Returns:
+            self (object): Instance with "msg" describing the consolidated result.
+        """
+        self.msg = self.pprint(self.payload["consolidated_result"])
+        self.log("Consolidated Result: {0}".format(self.msg), "INFO")
+        return self
+
+    def add_report_row(self, mac_address, values):
+        """
+        Write the outcome of an access point to the report file.
+
+        Parameters:
+            mac_address (str): MAC address of the access point, written as the row key.
+            values (dict): Report fields of the access point.
+
+        Returns:
+            self (object): The instance with the row written. Nothing is recorded when no
+            'report_file_path' is given. The operation fails if the file cannot be written.
+        """
+        if self.ap_report is None or not mac_address or not isinstance(values, dict):
+            return self
+
+        row = dict(values)
+        row["mac_address"] = mac_address
+        try:
+            self.ap_report.add(row, key=mac_address)
+        except (IOError, OSError) as e:
+            self.msg = "Unable to write the access point report to '{0}': {1}".format(
+                self.params.get("report_file_path"), str(e))
+            self.set_operation_result("failed", self.result.get("changed", False), self.msg, "ERROR").check_return_status()
+
+        return self
+
+    def write_ap_report(self):
+        """
+        Complete the access point report written to 'report_file_path'.
+
+        Returns:
+            self (object): Instance whose response describes the written report. The operation
+            fails if the file cannot be written.
+        """
+        report_file_path = self.params.get("report_file_path")
+        report_format = self.params.get("report_format")
+
+        try:
+            total_rows = self.ap_report.close()
+        except (IOError, OSError) as e:
+            self.msg = "Unable to write the access point report to '{0}': {1}".format(report_file_path, str(e))
+            self.set_operation_result("failed", self.result.get("changed", False), self.msg, "ERROR").check_return_status()
+
+        total_aps = len(self.ap_report.keys)
+        self.msg = "Access point report with {0} row(s) for {1} AP(s) written to '{2}'.".format(
+            total_rows, total_aps, report_file_path)
+        self.log(self.msg, "INFO")
+        self.result["msg"] = self.msg
+        self.result["response"] = {
+            "report_file_path": report_file_path,
+            "report_format": report_format,
+            "total_aps": total_aps,
+            "total_rows": total_rows
+        }
+        return self
+
+    def get_ap_lookup_key(self, ap_config):
+        """
+        Build the key identifying the Access Point of a playbook config entry.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            ap_config (dict): The AP configuration details from the playbook.
+
+        Returns:
+            tuple or None: The identifier field and its lowercase value, taken from the first of
+            "mac_address", "management_ip_address" or "hostname" present in the config.
+        """
+        for key in ("mac_address", "management_ip_address", "hostname"):
+            if ap_config.get(key):
+                return (key, str(ap_config[key]).lower())
+
+        return None
+
+    def resolve_fleet_devices(self, config_list):
+        """
+        Resolve the device details of every Access Point of the config list in bulk.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            config_list (list): The AP configuration entries from the playbook.
+
+        Returns:
+            self (object): Instance with "fleet_devices" holding the AP details keyed by identifier.
+
+        Description:
+            Groups the AP identifiers by type and resolves each group with batched "get_device_list"
+            queries instead of one query per AP. "get_current_config" then uses these details, and
+            the operation fails if any AP is not found.
+        """
+        identifiers = {}
+        for ap_config in config_list:
+            lookup_key = self.get_ap_lookup_key(ap_config)
+            if lookup_key is None:
+                msg = "Required param of mac_address,ip_address or hostname is not in playbook config"
+                self.log(msg, "WARNING")
+                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+
+            key_values = identifiers.setdefault(lookup_key[0], [])
+            if ap_config[lookup_key[0]] not in key_values:
+                key_values.append(ap_config[lookup_key[0]])
+
+        for key, values in identifiers.items():
+            for start in range(0, len(values), self.ap_lookup_batch_size):
+                batch = values[start:start + self.ap_lookup_batch_size]
+                self.log("Resolving {0} AP(s) by '{1}' in one query.".format(len(batch), key), "DEBUG")
+                ap_exists, ap_details = self.get_accesspoint_details(
+                    {"ap_identifier": [{key: value} for value in batch]})
+                for each_ap in ap_details:
+                    if each_ap.get(key):
+                        self.fleet_devices[(key, str(each_ap[key]).lower())] = each_ap
+
+        for ap_config in config_list:
+            lookup_key = self.get_ap_lookup_key(ap_config)
+            if lookup_key not in self.fleet_devices:
+                msg = ("The provided device '{0}' is either invalid, not an Access Point or not present "
+                       "in the Cisco Catalyst Center.".format(ap_config[lookup_key[0]]))
+                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+
+        self.log("Resolved {0} AP(s) for fleet processing.".format(len(config_list)), "INFO")
+        return self
+
+    def fetch_accesspoint_config(self, ap_ethernet_mac_address):
+        """
+        Read the configuration of a single Access Point without updating the instance state.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            ap_ethernet_mac_address (str): The Ethernet MAC address of the access point.
+
+        Returns:
+            tuple: The raw "get_access_point_configuration" response, or None, and an error
+            message when the configuration could not be read.
+        """
+        try:
+            response = self.dnac._exec(
+                family="wireless",
+                function="get_access_point_configuration",
+                params={"key": ap_ethernet_mac_address},
+            )
+        except Exception as e:
+            return None, "Unable to get the Accesspoint configuration for '{0}': {1}".format(
+                ap_ethernet_mac_address, repr(e))
+
+        return response, None
+
+    def load_fleet_ap_configs(self, mac_list):
+        """
+        Read the configuration of the given Access Points concurrently.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            mac_list (list): Ethernet MAC addresses of the access points.
+
+        Returns:
+            self (object): Instance with the configurations added to "ap_config_snapshot".
+
+        Description:
+            The reads are bounded by 'max_concurrent_requests'. "get_accesspoint_config" serves
+            the APs from the snapshot and reads an AP again only when it is missing there.
+        """
+        outcomes = self.execute_concurrently(
+            self.fetch_accesspoint_config, mac_list, self.params.get("max_concurrent_requests"))
+        if self.ap_config_snapshot is None:
+            self.ap_config_snapshot = {}
+
+        for ap_ethernet_mac_address, (response, error) in zip(mac_list, outcomes):
+            if error:
+                self.log(error, "WARNING")
+            elif response:
+                self.ap_config_snapshot[ap_ethernet_mac_address.lower()] = response
+
+        self.log("Loaded the configuration of {0} of {1} AP(s).".format(
+            len(self.ap_config_snapshot), len(mac_list)), "INFO")
+        return self
+
+    def fetch_site_device_ids(self, site):
+        """
+        Read the IDs of the devices assigned to a site.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            site (tuple): The site ID and the site name hierarchy.
+
+        Returns:
+            tuple: IDs of the devices assigned to the site and an error message when they could
+            not be read. Called from worker threads, so failures are returned to the caller.
+        """
+        site_id, site_name = site
+        device_ids = []
+
+        try:
+            if self.dnac_version <= self.dnac_versions["2.3.5.3"]:
+                response = self.dnac._exec(
+                    family="sites",
+                    function="get_membership",
+                    params={"site_id": site_id},
+                )
+                for device in (response or {}).get("device") or []:
+                    for item in device.get("response") or []:
+                        device_ids.append(item.get("instanceUuid"))
+            else:
+                response = self.dnac._exec(
+                    family="site_design",
+                    function="get_site_assigned_network_devices",
+                    params={"site_id": site_id},
+                )
+                for device in (response or {}).get("response") or []:
+                    device_ids.append(device.get("deviceId"))
+        except Exception as e:
+            return [], "Unable to read the devices assigned to the site '{0}': {1}".format(site_name, str(e))
+
+        return device_ids, None
+
+    def prefetch_fleet_details(self, config_list):
+        """
+        Read in bulk the details needed to compute the state of every Access Point.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            config_list (list): The AP configuration entries from the playbook.
+
+        Returns:
+            self (object): Instance with the device, site and AP configuration details cached.
+
+        Description:
+            Resolves the APs in bulk, reads each distinct site and its assigned devices once and
+            reads the AP configurations concurrently, so that "get_have" for every AP is served
+            from these results.
+        """
+        self.resolve_fleet_devices(config_list)
+
+        sites = {}
+        for ap_config in config_list:
+            if ap_config.get("site"):
+                site_exists, current_site = self.site_exists(ap_config)
+                if site_exists:
+                    sites[current_site["site_id"]] = current_site["site_name"]
+
+        site_list = list(sites.items())
+        site_devices = self.execute_concurrently(
+            self.fetch_site_device_ids, site_list, self.params.get("max_concurrent_requests"))
+        errors = [error for device_ids, error in site_devices if error]
+        if errors:
+            self.msg = " ".join(errors)
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+        self.site_device_ids = dict(
+            (site_id, device_ids) for (site_id, site_name), (device_ids, error) in zip(site_list, site_devices))
+
+        mac_list = []
+        for ap_details in self.fleet_devices.values():
+            if ap_details["ap_ethernet_mac_address"] not in mac_list:
+                mac_list.append(ap_details["ap_ethernet_mac_address"])
+
+        return self.load_fleet_ap_configs(mac_list)
+
+    def wait_for_provision_execution(self, execution_id, site_name):
+        """
+        Wait for an Access Point provisioning execution to complete.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            execution_id (str): The execution ID returned by "ap_provision".
+            site_name (str): The site the APs are provisioned to, used in the messages.
+
+        Returns:
+            dict: The execution details once the provisioning succeeded. The operation fails on
+            an execution error or when 'dnac_api_task_timeout' is reached.
+        """
+        start_time = time.time()
+        attempt = 0
+
+        while True:
+            execution_details = self.get_execution_details(execution_id)
+            if execution_details.get("status") == "SUCCESS":
+                return execution_details
+
+            if execution_details.get("bapiError"):
+                self.set_operation_result("failed", self.result["changed"], execution_details.get("bapiError"),
+                                          "ERROR", execution_details).check_return_status()
+
+            if time.time() - start_time > self.params.get("dnac_api_task_timeout"):
+                msg = "Provisioning of the AP(s) to site '{0}' did not complete within {1} seconds.".format(
+                    site_name, self.params.get("dnac_api_task_timeout"))
+                self.set_operation_result("failed", self.result["changed"], msg, "ERROR",
+                                          execution_details).check_return_status()
+
+            time.sleep(self.get_backoff_interval(attempt))
+            attempt += 1
+
+    def provision_fleet(self, provision_groups):
+        """
+        Provision the Access Points in batches grouped by site and RF profile.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            provision_groups (dict): Records of the APs to provision keyed by site ID and RF profile.
+
+        Returns:
+            self (object): Instance with the provisioned records updated.
+
+        Description:
+            Every group is provisioned with a single "ap_provision" request covering all its APs,
+            after assigning them to the site together on releases newer than 2.3.5.3. The tasks of
+            all the groups are then monitored together.
+        """
+        provision_tasks = {}
+
+        for (site_id, rf_profile), group in provision_groups.items():
+            site_name = group[0]["have"].get("site_name_hierarchy")
+            device_ids = [record["have"].get("device_id") for record in group]
+            if not rf_profile or not site_id or not site_name:
+                msg = ("Cannot provision device: Missing parameters - site_name_hierarchy: {0}, "
+                       "rf_profile: {1}, site_id: {2}".format(site_name, rf_profile, site_id))
+                self.set_operation_result("failed", self.result["changed"], msg, "ERROR").check_return_status()
+
+            self.log("Provisioning {0} AP(s) to site '{1}' with RF profile '{2}'.".format(
+                len(group), site_name, rf_profile), "INFO")
+
+            if self.dnac_version <= self.dnac_versions["2.3.5.3"]:
+                provision_params = [{
+                    "rfProfile": rf_profile,
+                    "deviceName": record["have"].get("hostname"),
+                    "type": record["have"].get("ap_type"),
+                    "siteNameHierarchy": site_name
+                } for record in group]
+            else:
+                if not self.assign_device_to_site(device_ids, site_name, site_id):
+                    msg = "Unable to assign the AP(s) {0} to site '{1}'.".format(device_ids, site_name)
+                    self.set_operation_result("failed", self.result["changed"], msg, "ERROR").check_return_status()
+
+                provision_params = {
+                    "rfProfileName": rf_profile,
+                    "networkDevices": [{"deviceId": device_id} for device_id in device_ids],
+                    "siteId": site_id
+                }
+
+            try:
+                response = self.dnac._exec(
+                    family="wireless",
+                    function="ap_provision",
+                    op_modifies=True,
+                    params={"payload": provision_params},
+                )
+                self.log("Response from ap_provision: {0}".format(self.pprint(response)), "INFO")
+            except Exception as e:
+                response = None
+                self.log("An error occurred during device provisioning: {0}".format(str(e)), "ERROR")
+
+            if not response or not isinstance(response, dict):
+                msg = "Unable to provision the AP(s) {0} to site '{1}'.".format(device_ids, site_name)
+                self.set_operation_result("failed", self.result["changed"], msg, "ERROR").check_return_status()
+
+            if self.dnac_version <= self.dnac_versions["2.3.5.3"]:
+                self.wait_for_provision_execution(response.get("executionId"), site_name)
+            else:
+                provision_tasks[response.get("response", {}).get("taskId")] = group
+
+        task_results = self.wait_for_tasks(list(provision_tasks),
+                                           max_workers=self.params.get("max_concurrent_requests"))
+        for task_id, task_details in task_results.items():
+            if task_details.get("isError"):
+                self.msg = "Unable to get success response, hence not provisioned"
+                self.log("Provision error details: {0} .".format(self.pprint(task_details)), "ERROR")
+                self.set_operation_result("failed", self.result["changed"], self.msg, "ERROR",
+                                          task_details).check_return_status()
+
+        for group in provision_groups.values():
+            for record in group:
+                record["changed"] = True
+                record["provisioned"] = True
+                record["responses"]["provision_message"] = "AP {0} provisioned successfully.".format(
+                    record["have"].get("hostname"))
+                self.result["changed"] = True
+
+        return self
+
+    def update_fleet_configuration(self, records):
+        """
+        Update the configuration of the Access Points, grouping the APs with identical changes.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            records (list): Records holding the want and have of every AP.
+
+        Returns:
+            self (object): Instance with the updated records.
+
+        Description:
+            Computes the configuration difference of every AP. The APs whose differences only
+            vary by AP identity (MAC address and name) share a single "configure_access_points_v2"
+            request. The requests are submitted concurrently and their tasks monitored together.
+        """
+        update_groups = {}
+
+        for record in records:
+            self.want = record["want"]
+            self.have = record["have"]
+            self.payload["access_point_details"] = record["access_point_details"]
+            ap_name = self.have["current_ap_config"].get("ap_name")
+            consolidated_config = self.config_diff(self.have["current_ap_config"])
+            if not consolidated_config:
+                record["responses"]["ap_config_message"] = "AP - {0} does not need any update".format(ap_name)
+                continue
+
+            ap_entry = {"macAddress": consolidated_config.get("macAddress")}
+            if consolidated_config.get("apName") is not None:
+                ap_entry["apName"] = consolidated_config["apName"]
+                ap_entry["apNameNew"] = consolidated_config["apNameNew"]
+
+            common_config = dict((key, value) for key, value in consolidated_config.items()
+                                 if key not in ("apName", "apNameNew", "macAddress"))
+            group_key = json.dumps(common_config, sort_keys=True, default=str)
+            group = update_groups.setdefault(group_key, {"config": common_config, "ap_list": [], "records": []})
+            group["ap_list"].append(ap_entry)
+            group["records"].append(record)
+
+        groups = list(update_groups.values())
+        payloads = []
+        for group in groups:
+            payload = dict(group["config"])
+            payload["macAddress"] = group["ap_list"][0]["macAddress"]
+            payload["bulk_update"] = True
+            payload["ap_list"] = group["ap_list"]
+            payloads.append(payload)
+
+        self.log("Updating {0} AP(s) with {1} configuration request(s).".format(
+            sum(len(group["records"]) for group in groups), len(payloads)), "INFO")
+        submissions = self.execute_concurrently(
+            self.submit_ap_update, payloads, self.params.get("max_concurrent_requests"))
+
+        update_tasks = {}
+        failed_tasks = []
+        for group, (task_id, error) in zip(groups, submissions):
+            if error:
+                self.log(error, "ERROR")
+                failed_tasks.append({"ap_list": group["ap_list"], "failureReason": error})
+                continue
+            update_tasks[task_id] = group
+
+        task_results = self.wait_for_tasks(list(update_tasks),
+                                           max_workers=self.params.get("max_concurrent_requests"))
+        for task_id, group in update_tasks.items():
+            task_details = task_results.get(task_id, {})
+            if task_details.get("isError"):
+                failed_tasks.append(task_details)
+                continue
+
+            for record in group["records"]:
+                record["changed"] = True
+                record["ap_update_status"] = True
+                record["responses"]["ap_config_update_status"] = "AP Configuration - {0} updated Successfully".format(
+                    record["have"]["current_ap_config"].get("ap_name"))
+                self.result["changed"] = True
+
+        if failed_tasks:
+            self.msg = "Unable to get success response, hence AP config not updated"
+            self.log("Failure Details: {0} .".format(self.pprint(failed_tasks)), "ERROR")
+            self.set_operation_result("failed", self.result["changed"], self.msg, "ERROR",
+                                      failed_tasks).check_return_status()
+
+        return self
+
+    def submit_ap_update(self, payload):
+        """
+        Send the configuration update request of a group of Access Points.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            payload (dict): The bulk update configuration with the APs in "ap_list".
+
+        Returns:
+            tuple: The task ID of the request, or None, and an error message when the request failed.
+            Called from worker threads, so failures are returned to the caller.
+        """
+        mac_addresses = [entry.get("macAddress") for entry in payload.get("ap_list") or []]
+        try:
+            task_response = self.update_ap_configuration(payload)
+        except Exception as e:
+            return None, "Unable to update the configuration of the AP(s) {0}: {1}".format(mac_addresses, str(e))
 
+        task_id = ((task_response or {}).get("response") or {}).get("taskId")
+        if not task_id:
+            return None, "Unable to update the configuration of the AP(s) {0}.".format(mac_addresses)
+
+        return task_id, None
+
+    def get_diff_fleet(self, config_list):
+        """
+        Provision and update all the Access Points of the config list together.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            config_list (list): The AP configuration entries from the playbook.
+
+        Returns:
+            self (object): Instance with the result of every AP in "result" and the records to
+            verify in "fleet_records".
+
+        Description:
+            Prefetches the details of all the APs, provisions the APs needing a site change in
+            site-grouped batches, reads back the configuration of the provisioned APs and then
+            applies the configuration changes grouped by identical change.
+        """
+        records = []
+        self.prefetch_fleet_details(config_list)
+
+        for ap_config in config_list:
+            self.reset_values()
+            for key in ("site_exists", "current_site", "site_changes", "wlc_provision_status"):
+                self.payload.pop(key, None)
+
+            self.get_want(ap_config).check_return_status()
+            self.get_have(ap_config).check_return_status()
+            self.validate_ap_config_parameters(ap_config).check_return_status()
+            records.append({
+                "config": ap_config,
+                "want": dict(self.want),
+                "have": dict(self.have),
+                "access_point_details": self.payload.get("access_point_details"),
+                "responses": {},
+                "changed": False,
+                "provisioned": False,
+                "ap_update_status": None
+            })
+
+        provision_groups = {}
+        for record in records:
+            if not record["want"].get("site"):
+                continue
+
+            if not record["have"].get("site_required_changes"):
+                record["responses"]["provision_message"] = "AP {0} already provisioned at site {1}.".format(
+                    record["have"].get("hostname"), record["have"].get("site_name_hierarchy"))
+            elif record["have"].get("wlc_provision_status") == "success":
+                group_key = (record["have"].get("site_id"), record["want"].get("rf_profile"))
+                provision_groups.setdefault(group_key, []).append(record)
+
+        if provision_groups:
+            self.provision_fleet(provision_groups)
+            provisioned_records = [record for record in records if record["provisioned"]]
+            mac_list = [record["access_point_details"]["ap_ethernet_mac_address"] for record in provisioned_records]
+            for ap_ethernet_mac_address in mac_list:
+                self.ap_config_snapshot.pop(ap_ethernet_mac_address.lower(), None)
+
+            self.load_fleet_ap_configs(mac_list)
+            for record, ap_ethernet_mac_address in zip(provisioned_records, mac_list):
+                ap_config_exists, current_configuration = self.get_accesspoint_config(ap_ethernet_mac_address)
+                if ap_config_exists:
+                    record["have"]["current_ap_config"] = current_configuration
+
+        self.update_fleet_configuration(records)
+
+        fleet_responses = []
+        for record in records:
+            ap_response = {
+                "mac_address": record["have"].get("mac_address"),
+                "ap_name": record["have"]["current_ap_config"].get("ap_name")
+            }
+            ap_response.update(record["responses"])
+            self.add_report_row(ap_response["mac_address"], dict(ap_response, changed=record["changed"]))
+            if not self.params.get("report_file_path"):
+                fleet_responses.append(ap_response)
+
+        self.fleet_records = [{
+            "config": record["config"],
+            "changed": record["changed"],
+            "ap_update_status": record["ap_update_status"]
+        } for record in records]
+        self.site_device_ids = {}
+        self.ap_config_snapshot = None
+
+        self.msg = "{0} AP(s) processed: {1} provisioned, {2} updated.".format(
+            len(records), len([record for record in records if record["provisioned"]]),
+            len([record for record in records if record["ap_update_status"]]))
+        self.set_operation_result("success", self.result["changed"], self.msg, "INFO")
+        self.result["response"] = {"accesspoints_updates": fleet_responses}
         return self
 
     def reboot_access_point(self, ap_list):
@@ -3978,6 +4999,297 @@ class Accesspoint(DnacBase):
             self.log(error_msg, "ERROR")
             self.set_operation_result("failed", False, error_msg, "ERROR").check_return_status()
 
+    def submit_ap_operation(self, operation):
+        """
+        Submit a reboot or factory reset request for a chunk of access points.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            operation (tuple): The operation, "reboot_aps" or "factory_reset_aps", and the list of
+                Ethernet MAC addresses of the access points.
+
+        Returns:
+            tuple: The task ID of the request, or None, and an error message when the request failed.
+        """
+        reboot_or_reset, eth_mac_list = operation
+        if reboot_or_reset == "reboot_aps":
+            function_name = "reboot_access_points"
+            params = {"apMacAddresses": eth_mac_list}
+        else:
+            function_name = "factory_reset_access_points"
+            params = {"apMacAddresses": eth_mac_list, "keepStaticIPConfig": False}
+
+        try:
+            response = self.dnac._exec(
+                family="wireless",
+                function=function_name,
+                op_modifies=True,
+                params=params,
+            )
+        except Exception as e:
+            return None, "An error occurred while calling '{0}': {1}".format(function_name, repr(e))
+
+        task_id = response.get("response", {}).get("taskId") if isinstance(response, dict) else None
+        if not task_id:
+            return None, "Failed to retrieve task id from '{0}' API response.".format(function_name)
+
+        return task_id, None
+
+    def poll_ap_operation(self, operation):
+        """
+        Read the state of a reboot or factory reset task and, once it ended, the result of each AP.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            operation (tuple): The operation, "reboot_aps" or "factory_reset_aps", and the task ID.
+
+        Returns:
+            dict: "done" and "status" of the task, "ap_results" with the per AP results of an ended
+            task and "error" with a message when the state could not be read.
+        """
+        reboot_or_reset, task_id = operation
+        outcome = {"done": False, "status": None, "ap_results": [], "error": None}
+
+        try:
+            task_details = self.dnac._exec(
+                family="task",
+                function="get_tasks_by_id",
+                params={"id": task_id}
+            )
+            task_details = task_details.get("response") if isinstance(task_details, dict) else None
+            if not task_details or task_details.get("endTime") is None:
+                return outcome
+
+            outcome["done"] = True
+            outcome["status"] = task_details.get("status")
+            if reboot_or_reset == "reboot_aps":
+                response = self.dnac._exec(
+                    family="wireless",
+                    function="get_access_point_reboot_task_result",
+                    op_modifies=True,
+                    params={"parentTaskId": task_id},
+                )
+                for wlc_result in response or []:
+                    outcome["ap_results"].extend(wlc_result.get("apList") or [])
+            else:
+                response = self.dnac._exec(
+                    family="wireless",
+                    function="get_access_points_factory_reset_status",
+                    params={"task_id": task_id},
+                )
+                for wlc_result in (response or {}).get("response") or []:
+                    outcome["ap_results"].extend(wlc_result.get("apResponseInfoList") or [])
+
+        except Exception as e:
+            outcome["error"] = "An error occurred while checking the task '{0}': {1}".format(task_id, repr(e))
+
+        return outcome
+
+    def get_ap_operation_state(self, ap_result):
+        """
+        Classify the reboot or factory reset result of one access point.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            ap_result (dict): An entry of "apList" or "apResponseInfoList".
+
+        Returns:
+            str: "success" when the AP was rebooted or reset, "failed" when the operation failed
+            for the AP and "pending" while the AP has not reported a final status.
+        """
+        status = str(ap_result.get("rebootStatus") or ap_result.get("apFactoryResetStatus") or "").lower()
+        if status == "success":
+            return "success"
+
+        if "fail" in status or ap_result.get("failureReason"):
+            return "failed"
+
+        return "pending"
+
+    def resolve_ap_ethernet_macs(self, ap_indentity, identifiers):
+        """
+        Resolve access point identifiers to their Ethernet MAC address and wireless controller in bulk.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            ap_indentity (str): The identifier type, "mac_addresses", "hostnames" or "management_ip_addresses".
+            identifiers (list): The identifiers of the access points.
+
+        Returns:
+            list: Tuples of the Ethernet MAC address and the associated WLC IP address of every AP,
+            in the order of the identifiers. The operation fails if an AP is not found.
+        """
+        key = self.keymap[ap_indentity]
+        ap_index = {}
+        for start in range(0, len(identifiers), self.ap_lookup_batch_size):
+            batch = identifiers[start:start + self.ap_lookup_batch_size]
+            ap_exist, ap_details = self.get_accesspoint_details(
+                {"ap_identifier": [{key: value} for value in batch]})
+            for each_ap in ap_details:
+                if each_ap.get(key):
+                    ap_index[str(each_ap[key]).lower()] = each_ap
+
+        missing_aps = [value for value in identifiers if str(value).lower() not in ap_index]
+        if missing_aps:
+            msg = "The provided device(s) {0} are either invalid or not present in the Cisco Catalyst Center.".format(
+                missing_aps)
+            self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+
+        return [(ap_index[str(value).lower()].get("ap_ethernet_mac_address"),
+                 ap_index[str(value).lower()].get("associated_wlc_ip")) for value in identifiers]
+
+    def rolling_reboot_reset(self, ap_indentity, identifiers, reboot_or_reset):
+        """
+        Reboot or factory reset a large list of access points in controller sized chunks.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            ap_indentity (str): The identifier type, "mac_addresses", "hostnames" or "management_ip_addresses".
+            identifiers (list): The identifiers of the access points.
+            reboot_or_reset (str): "reboot_aps" or "factory_reset_aps".
+
+        Returns:
+            self (object): Instance with the per AP results in "result".
+
+        Description:
+            The APs are grouped by wireless controller and every group is split into chunks of
+            'ap_batch_size' APs. Chunks are submitted concurrently while the number of APs in flight
+            stays within 'max_aps_in_flight', and one poller tracks all the submitted tasks. An AP stays
+            in flight until its own reboot or reset status is final, so the next chunks are submitted as
+            APs actually complete rather than when the parent task ends. The wait between polls follows
+            a backoff, reset whenever APs complete, and the whole operation is bounded by
+            'dnac_api_task_timeout'. The operation fails if a request or any single AP failed.
+        """
+        operation_name = "reboot" if reboot_or_reset == "reboot_aps" else "reset"
+        batch_size = self.params.get("ap_batch_size")
+        max_in_flight = self.params.get("max_aps_in_flight")
+        max_workers = self.params.get("max_concurrent_requests")
+
+        controller_aps = {}
+        for eth_mac, wlc_ip in self.resolve_ap_ethernet_macs(ap_indentity, identifiers):
+            controller_aps.setdefault(wlc_ip, []).append(eth_mac)
+
+        pending_chunks = []
+        for wlc_ip, eth_mac_list in controller_aps.items():
+            for start in range(0, len(eth_mac_list), batch_size):
+                pending_chunks.append(eth_mac_list[start:start + batch_size])
+
+        self.log("Starting the {0} of {1} AP(s) in {2} request(s) with at most {3} AP(s) in flight.".format(
+            operation_name, len(identifiers), len(pending_chunks), max_in_flight or "all"), "INFO")
+
+        in_flight = {}
+        in_flight_aps = 0
+        ap_results = []
+        failed_chunks = []
+        failed_aps = []
+        start_time = time.time()
+        attempt = 0
+
+        while pending_chunks or in_flight:
+            chunks_to_submit = []
+            while pending_chunks:
+                next_size = in_flight_aps + sum(len(chunk) for chunk in chunks_to_submit) + len(pending_chunks[0])
+                if max_in_flight and next_size > max_in_flight and (in_flight or chunks_to_submit):
+                    break
+                chunks_to_submit.append(pending_chunks.pop(0))
+
+            submissions = self.execute_concurrently(
+                self.submit_ap_operation, [(reboot_or_reset, chunk) for chunk in chunks_to_submit], max_workers)
+            for chunk, (task_id, error) in zip(chunks_to_submit, submissions):
+                if error:
+                    self.log(error, "ERROR")
+                    failed_chunks.append({"ap_list": chunk, "failure_reason": error})
+                    continue
+                in_flight[task_id] = {"ap_list": chunk, "completed": 0, "ap_results": []}
+                in_flight_aps += len(chunk)
+
+            if not in_flight:
+                continue
+
+            task_ids = list(in_flight)
+            polls = self.execute_concurrently(
+                self.poll_ap_operation, [(reboot_or_reset, task_id) for task_id in task_ids], max_workers)
+            for task_id, poll in zip(task_ids, polls):
+                if not poll["done"] and not poll["error"]:
+                    continue
+
+                request = in_flight[task_id]
+                chunk = request["ap_list"]
+                request["ap_results"] = poll["ap_results"] or request["ap_results"]
+                completed = min(len(chunk), len([ap_result for ap_result in request["ap_results"]
+                                                 if self.get_ap_operation_state(ap_result) != "pending"]))
+                if completed > request["completed"]:
+                    in_flight_aps -= completed - request["completed"]
+                    request["completed"] = completed
+                    attempt = 0
+
+                task_ended = poll["error"] or poll["status"] != "SUCCESS"
+                if completed < len(chunk) and not task_ended:
+                    self.log("{0} task '{1}': {2} of {3} AP(s) reported a final status.".format(
+                        operation_name.capitalize(), task_id, completed, len(chunk)), "DEBUG")
+                    continue
+
+                del in_flight[task_id]
+                in_flight_aps -= len(chunk) - request["completed"]
+                attempt = 0
+                ap_results.extend(request["ap_results"])
+                failed_aps.extend(ap_result for ap_result in request["ap_results"]
+                                  if self.get_ap_operation_state(ap_result) == "failed")
+                if task_ended:
+                    failed_chunks.append({"ap_list": chunk, "status": poll["status"],
+                                          "failure_reason": poll["error"]})
+                self.log("{0} task '{1}' for {2} AP(s) ended with status '{3}'.".format(
+                    operation_name.capitalize(), task_id, len(chunk), poll["status"]), "INFO")
+
+            if not in_flight:
+                continue
+
+            if time.time() - start_time > self.params.get("dnac_api_task_timeout"):
+                for task_id, request in in_flight.items():
+                    ap_results.extend(request["ap_results"])
+                    failed_chunks.append({"ap_list": request["ap_list"],
+                                          "failure_reason": "{0} of {1} AP(s) of task {2} have not completed within "
+                                          "{3} seconds.".format(len(request["ap_list"]) - request["completed"],
+                                                                len(request["ap_list"]), task_id,
+                                                                self.params.get("dnac_api_task_timeout"))})
+                for chunk in pending_chunks:
+                    failed_chunks.append({"ap_list": chunk, "failure_reason": "Not submitted before the timeout."})
+                break
+
+            time.sleep(self.get_backoff_interval(attempt))
+            attempt += 1
+
+        for ap_result in ap_results:
+            self.add_report_row(ap_result.get("ethernetMacAddress") or ap_result.get("apName"), ap_result)
+
+        responses = {
+            "accesspoints_updates": {
+                "ap_{0}_task_details".format(operation_name): {
+                    "{0}_api_response".format(operation_name): ap_results
+                }
+            }
+        }
+        if failed_chunks or failed_aps:
+            self.msg = "Unable to get success response, hence APs are not {0}".format(
+                "rebooted" if operation_name == "reboot" else "resetted")
+            if failed_aps:
+                self.msg += ": the {0} failed for {1} AP(s) {2}".format(
+                    operation_name, len(failed_aps),
+                    [ap_result.get("ethernetMacAddress") or ap_result.get("apName") for ap_result in failed_aps])
+            task_details = responses["accesspoints_updates"]["ap_{0}_task_details".format(operation_name)]
+            if failed_chunks:
+                task_details["failed_requests"] = failed_chunks
+            if failed_aps:
+                task_details["failed_aps"] = failed_aps
+            responses["accesspoints_updates"]["ap_{0}_status".format(operation_name)] = self.msg
+            self.set_operation_result("failed", bool(ap_results), self.msg, "ERROR", responses).check_return_status()
+
+        self.msg = "{0} AP(s) {1} successfully".format(
+            len(identifiers), "rebooted" if operation_name == "reboot" else "reset")
+        responses["accesspoints_updates"]["ap_{0}_status".format(operation_name)] = self.msg
+        self.set_operation_result("success", True, self.msg, "INFO", responses)
+        return self
+
     def reboot_factory_reset_function(self, ap_list, reboot_or_reset):
         """
         Process reboot and factory reset function from the main by accepting AP list and reset or reboot mode.
@@ -3991,11 +5303,22 @@ class Accesspoint(DnacBase):
             dict: A dictionary containing the result of the access point reset/reboot status.
         """
         ap_indentity = list(ap_list.keys())[0]
-        if ap_indentity and len(ap_list.get(ap_indentity)) > 100:
-            error_msg = "Maximum allowed AP list 100 but passed {0}".format(str(len(ap_list.get(ap_indentity))))
+        batch_size = self.params.get("ap_batch_size")
+        if not batch_size or batch_size < 1 or batch_size > 100:
+            error_msg = "Maximum allowed AP list 100, 'ap_batch_size' must be between 1 and 100 but passed {0}".format(
+                str(batch_size))
             self.log(error_msg, "ERROR")
             self.set_operation_result("failed", False, error_msg, "ERROR").check_return_status()
 
+        max_in_flight = self.params.get("max_aps_in_flight")
+        if max_in_flight is not None and max_in_flight < 1:
+            self.msg = "'max_aps_in_flight' must be at least 1 but passed {0}".format(str(max_in_flight))
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+        if ap_indentity in self.keymap and ap_list.get(ap_indentity) and \
+                (len(ap_list[ap_indentity]) > batch_size or self.params.get("max_aps_in_flight")):
+            return self.rolling_reboot_reset(ap_indentity, ap_list[ap_indentity], reboot_or_reset)
+
         if ap_indentity and ap_indentity in self.keymap and len(ap_list.get(ap_indentity)) > 0:
             eth_mac_list = []
             for each_ap in ap_list[ap_indentity]:
@@ -4032,6 +5355,12 @@ class Accesspoint(DnacBase):
         common_config = {}
         ap_output_list = []
 
+        identifier_index = {}
+        for position, ap in enumerate(bulk_config.get("ap_identifier")):
+            for key in ("mac_address", "hostname", "management_ip_address"):
+                if ap.get(key) is not None:
+                    identifier_index.setdefault((key, ap[key]), (position, ap.get("ap_name")))
+
         if ap_exist and len(ap_details) > 0:
             self.log("Access points exist. Total count: {0}".format(str(len(ap_details))), "INFO")
 
@@ -4041,10 +5370,10 @@ class Accesspoint(DnacBase):
                          .format(ap_config_exists, self.pprint(ap_configuration)), "INFO")
                 self.want = bulk_config.get("common_fields_to_change")
                 self.want["mac_address"] = each_ap["mac_address"]
-                ap_name = [ap.get('ap_name') for ap in bulk_config.get("ap_identifier")
-                           if (each_ap["mac_address"] == ap.get('mac_address') or
-                               each_ap["hostname"] == ap.get('hostname') or
-                               each_ap["management_ip_address"] == ap.get('management_ip_address'))]
+                matches = [identifier_index[(key, each_ap[key])]
+                           for key in ("mac_address", "hostname", "management_ip_address")
+                           if (key, each_ap[key]) in identifier_index]
+                ap_name = [min(matches)[1]] if matches else []
                 if ap_name:
                     self.want["ap_name"] = ap_name[0]
                     ap_output_list.append(ap_name[0])
@@ -4138,6 +5467,12 @@ def main():
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
         "next_task_after_interval": {"type": "int", "default": 5},
+        "fleet_mode": {"type": "bool", "default": False},
+        "ap_batch_size": {"type": "int", "default": 100},
+        "max_aps_in_flight": {"type": "int"},
+        "report_file_path": {"type": "str"},
+        "report_format": {"type": "str", "default": "jsonl", "choices": ["csv", "jsonl"]},
+        "max_concurrent_requests": {"type": "int", "default": 5},
         "config": {"required": True, "type": "list", "elements": "dict"},
         "validate_response_schema": {"type": "bool", "default": True},
         "state": {"default": "merged", "choices": ["merged", "deleted"]}
@@ -4173,6 +5508,8 @@ def main():
         if ap_list is not None:
             ccc_network.validate_ap_config_parameters(ccc_network.validated_config[0]).check_return_status()
             ccc_network.reboot_factory_reset_function(ap_list, reboot_reset)
+            if ccc_network.params.get("report_file_path"):
+                ccc_network.write_ap_report()
             module.exit_json(**ccc_network.result)
 
     bulk_updates = ccc_network.validated_config[0].get("bulk_update_aps")
@@ -4183,19 +5520,32 @@ def main():
         ccc_network.bulk_ap_update(bulk_updates)
         module.exit_json(**ccc_network.result)
 
-    for config in ccc_network.validated_config:
-        ccc_network.reset_values()
-        ccc_network.get_want(config).check_return_status()
-        ccc_network.get_have(config).check_return_status()
-        ccc_network.get_diff_state_apply[state](config).check_return_status()
-
+    if ccc_network.params.get("fleet_mode"):
+        ccc_network.get_diff_fleet(ccc_network.validated_config).check_return_status()
         if config_verify:
-            waiting_time_to_verify = 10
-            ccc_network.log("Starting verify AP details after {0} seconds".format(
-                str(waiting_time_to_verify)), "INFO")
-            time.sleep(waiting_time_to_verify)
-            ccc_network.verify_diff_state_apply[state](config).check_return_status()
-            ccc_network.consolidate_output()
+            ccc_network.pending_verifications.extend(ccc_network.fleet_records)
+    else:
+        for config in ccc_network.validated_config:
+            ccc_network.reset_values()
+            ccc_network.get_want(config).check_return_status()
+            ccc_network.get_have(config).check_return_status()
+            ccc_network.get_diff_state_apply[state](config).check_return_status()
+            if isinstance(ccc_network.result.get("response"), dict):
+                ccc_network.add_report_row(ccc_network.have.get("mac_address"),
+                                           ccc_network.result["response"].get("accesspoints_updates"))
+
+            if config_verify:
+                ccc_network.pending_verifications.append({
+                    "config": config,
+                    "changed": ccc_network.result.get("changed"),
+                    "ap_update_status": ccc_network.result.pop("ap_update_status", None)
+                })
+
+    if config_verify:
+        ccc_network.verify_pending_configs(state)
+
+    if ccc_network.params.get("report_file_path"):
+        ccc_network.write_ap_report()
 
     module.exit_json(**ccc_network.result)
 
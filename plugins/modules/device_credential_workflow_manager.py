@@ -37,6 +37,15 @@ options:
     type: str
     choices: [ merged, deleted ]
     default: merged
+  max_concurrent_requests:
+    description:
+      - Maximum number of sites processed at the same time while applying the credentials to the sites.
+      - Applies to the site device lookups, the sync status reads and the credential sync requests.
+      - The credentials of one site are always synced one after the other.
+      - Set to 1 to process the sites one after the other.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description:
     - List of details of global device credentials and site names.
@@ -406,6 +415,10 @@ notes:
     get /dna/intent/api/v1/sites/${id}/deviceCredentials/status,
     get /dna/intent/api/v1/networkDevices/assignedToSite,
     get /dna/intent/api/v1/sites,
+
+  - Added 'max_concurrent_requests' option in v6.32.0
+  - From v6.32.0, 'apply_credentials_to_site' skips the sites without devices and applies the credentials
+    to the other sites. Earlier versions ended the operation at the first site without devices.
 """
 
 EXAMPLES = r"""
@@ -863,7 +876,6 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
-    get_dict_result,
 )
 
 
@@ -880,6 +892,9 @@ class DeviceCredential(DnacBase):
                 "apply_credential": {}
             }
         ]
+        self.global_credentials = None
+        self.global_credential_index = None
+        self.site_devices = {}
 
     def validate_input(self):
         """
@@ -1061,8 +1076,13 @@ class DeviceCredential(DnacBase):
 
         Returns:
             global_credentials (dict) - All global device credentials details.
+        Description:
+            The credentials are read once and reused until 'reset_global_credentials' is called.
         """
 
+        if self.global_credentials is not None:
+            return self.global_credentials
+
         try:
             global_credentials = self.dnac._exec(
                 family="discovery",
@@ -1079,8 +1099,98 @@ class DeviceCredential(DnacBase):
             self.status = "failed"
             return self.check_return_status()
 
+        self.global_credentials = global_credentials
         return global_credentials
 
+    def get_global_credential_index(self):
+        """
+        Get the Global Device Credentials indexed by type, ID, description and username.
+
+        Parameters:
+            self - The current object details.
+
+        Returns:
+            global_credential_index (dict) - For every credential type ('cliCredential', 'snmpV2cRead',
+            'snmpV2cWrite', 'httpsRead', 'httpsWrite' and 'snmpV3'), the credentials keyed by 'id',
+            the lists of credentials keyed by 'description' and keyed by 'description_username'.
+        """
+
+        if self.global_credential_index is not None:
+            return self.global_credential_index
+
+        global_credentials = self.get_global_credentials_params() or {}
+        global_credential_index = {}
+        for credential_type, credentials in global_credentials.items():
+            type_index = {
+                "id": {},
+                "description": {},
+                "description_username": {}
+            }
+            for credential in credentials or []:
+                description = credential.get("description")
+                type_index["id"][credential.get("id")] = credential
+                type_index["description"].setdefault(description, []).append(credential)
+                type_index["description_username"].setdefault(
+                    (description, credential.get("username")), []).append(credential)
+
+            global_credential_index[credential_type] = type_index
+
+        self.global_credential_index = global_credential_index
+        return global_credential_index
+
+    def find_global_credentials(self, credential_type, description, username=None):
+        """
+        Find the Global Device Credentials of a type with the given description and username.
+
+        Parameters:
+            credential_type (str) - The credential type, for example 'cliCredential'.
+            description (str) - The description of the credential.
+            username (str) - The username of the credential, None to match on the description only.
+
+        Returns:
+            credentials (list) - The matching credentials, empty if there is none.
+        """
+
+        type_index = self.get_global_credential_index().get(credential_type, {})
+        if username is None:
+            return type_index.get("description", {}).get(description, [])
+
+        return type_index.get("description_username", {}).get((description, username), [])
+
+    def get_global_credential(self, credential_type, key, value):
+        """
+        Get the first Global Device Credential of a type with the given ID or description.
+
+        Parameters:
+            credential_type (str) - The credential type, for example 'snmpV3'.
+            key (str) - Either 'id' or 'description'.
+            value (str) - The ID or the description of the credential.
+
+        Returns:
+            credential (dict) - The credential details, None if there is no match.
+        """
+
+        if key == "id":
+            return self.get_global_credential_index().get(credential_type, {}).get("id", {}).get(value)
+
+        credentials = self.find_global_credentials(credential_type, value)
+        return credentials[0] if credentials else None
+
+    def reset_global_credentials(self):
+        """
+        Discard the Global Device Credentials read from the Cisco Catalyst Center
+        so that the next lookup reads them again.
+
+        Parameters:
+            self - The current object details.
+
+        Returns:
+            None
+        """
+
+        self.global_credentials = None
+        self.global_credential_index = None
+
     def get_cli_params(self, cli_details):
         """
         Format the CLI parameters for the CLI credential configuration in Cisco Catalyst Center.
@@ -1280,7 +1390,7 @@ class DeviceCredential(DnacBase):
                 cli_detail = None
                 cli_id = cli_credential.get("id")
                 if cli_id:
-                    cli_detail = get_dict_result(global_cli_details, "id", cli_id)
+                    cli_detail = self.get_global_credential("cliCredential", "id", cli_id)
                     if not cli_detail:
                         self.msg = "CLI credential ID is invalid"
                         self.status = "failed"
@@ -1289,29 +1399,27 @@ class DeviceCredential(DnacBase):
                 cli_description = cli_credential.get("description")
                 cli_username = cli_credential.get("username")
                 if cli_description and cli_username and (not cli_detail):
-                    for item in global_cli_details:
-                        if item.get("description") == cli_description \
-                                and item.get("username") == cli_username:
-                            if cli_detail:
-                                self.msg = "There are multiple CLI credentials with the same description and username. " + \
-                                           "Kindly provide the ID for the global device credentials."
-                                self.status = "failed"
-                                return self.check_return_status()
-                            cli_detail = item
+                    matching_credentials = self.find_global_credentials("cliCredential", cli_description, cli_username)
+                    if len(matching_credentials) > 1:
+                        self.msg = "There are multiple CLI credentials with the same description and username. " + \
+                                   "Kindly provide the ID for the global device credentials."
+                        self.status = "failed"
+                        return self.check_return_status()
+                    if matching_credentials:
+                        cli_detail = matching_credentials[0]
 
                 if not cli_detail:
                     cli_old_description = cli_credential.get("old_description")
                     cli_old_username = cli_credential.get("old_username")
                     if cli_old_description and cli_old_username and (not cli_detail):
-                        for item in global_cli_details:
-                            if item.get("description") == cli_old_description \
-                                    and item.get("username") == cli_old_username:
-                                if cli_detail:
-                                    self.msg = "There are multiple CLI credentials with the same old_description and old_username. " + \
-                                        "Kindly provide the ID for the global device credentials."
-                                    self.status = "failed"
-                                    return self.check_return_status()
-                                cli_detail = item
+                        matching_credentials = self.find_global_credentials("cliCredential", cli_old_description, cli_old_username)
+                        if len(matching_credentials) > 1:
+                            self.msg = "There are multiple CLI credentials with the same old_description and old_username. " + \
+                                "Kindly provide the ID for the global device credentials."
+                            self.status = "failed"
+                            return self.check_return_status()
+                        if matching_credentials:
+                            cli_detail = matching_credentials[0]
                         if not cli_detail:
                             self.msg = "CLI credential old_description or old_username is invalid"
                             self.status = "failed"
@@ -1349,7 +1457,7 @@ class DeviceCredential(DnacBase):
                 snmp_v2c_read_detail = None
                 snmp_v2c_read_id = snmp_v2c_read_credential.get("id")
                 if snmp_v2c_read_id:
-                    snmp_v2c_read_detail = get_dict_result(global_snmp_v2c_read_details, "id", snmp_v2c_read_id)
+                    snmp_v2c_read_detail = self.get_global_credential("snmpV2cRead", "id", snmp_v2c_read_id)
                     if not snmp_v2c_read_detail:
                         self.msg = "snmp_v2c_read credential ID is invalid"
                         self.status = "failed"
@@ -1357,20 +1465,12 @@ class DeviceCredential(DnacBase):
 
                 snmp_v2c_read_description = snmp_v2c_read_credential.get("description")
                 if snmp_v2c_read_description and (not snmp_v2c_read_detail):
-                    snmp_v2c_read_detail = get_dict_result(
-                        global_snmp_v2c_read_details,
-                        "description",
-                        snmp_v2c_read_description
-                    )
+                    snmp_v2c_read_detail = self.get_global_credential("snmpV2cRead", "description", snmp_v2c_read_description)
 
                 if not snmp_v2c_read_detail:
                     snmp_v2c_read_old_description = snmp_v2c_read_credential.get("old_description")
                     if snmp_v2c_read_old_description and (not snmp_v2c_read_detail):
-                        snmp_v2c_read_detail = get_dict_result(
-                            global_snmp_v2c_read_details,
-                            "description",
-                            snmp_v2c_read_old_description
-                        )
+                        snmp_v2c_read_detail = self.get_global_credential("snmpV2cRead", "description", snmp_v2c_read_old_description)
                         if not snmp_v2c_read_detail:
                             self.msg = "snmp_v2c_read credential old_description is invalid"
                             self.status = "failed"
@@ -1407,7 +1507,7 @@ class DeviceCredential(DnacBase):
                 snmp_v2c_write_detail = None
                 snmp_v2c_write_id = snmp_v2c_write_credential.get("id")
                 if snmp_v2c_write_id:
-                    snmp_v2c_write_detail = get_dict_result(global_snmp_v2c_write_details, "id", snmp_v2c_write_id)
+                    snmp_v2c_write_detail = self.get_global_credential("snmpV2cWrite", "id", snmp_v2c_write_id)
                     if not snmp_v2c_write_detail:
                         self.msg = "snmp_v2c_write credential ID is invalid"
                         self.status = "failed"
@@ -1416,20 +1516,12 @@ class DeviceCredential(DnacBase):
                 snmp_v2c_write_description = snmp_v2c_write_credential.get("description")
 
                 if snmp_v2c_write_description and (not snmp_v2c_write_detail):
-                    snmp_v2c_write_detail = get_dict_result(
-                        global_snmp_v2c_write_details,
-                        "description",
-                        snmp_v2c_write_description
-                    )
+                    snmp_v2c_write_detail = self.get_global_credential("snmpV2cWrite", "description", snmp_v2c_write_description)
 
                 if not snmp_v2c_write_detail:
                     snmp_v2c_write_old_description = snmp_v2c_write_credential.get("old_description")
                     if snmp_v2c_write_old_description and (not snmp_v2c_write_detail):
-                        snmp_v2c_write_detail = get_dict_result(
-                            global_snmp_v2c_write_details,
-                            "description",
-                            snmp_v2c_write_old_description
-                        )
+                        snmp_v2c_write_detail = self.get_global_credential("snmpV2cWrite", "description", snmp_v2c_write_old_description)
                         if not snmp_v2c_write_detail:
                             self.msg = "snmp_v2c_write credential old_description is invalid "
                             self.status = "failed"
@@ -1466,7 +1558,7 @@ class DeviceCredential(DnacBase):
                 https_read__detail = None
                 https_read_id = https_read_credential.get("id")
                 if https_read_id:
-                    https_read__detail = get_dict_result(global_https_read_details, "id", https_read_id)
+                    https_read__detail = self.get_global_credential("httpsRead", "id", https_read_id)
                     if not https_read__detail:
                         self.msg = "https_read credential Id is invalid"
                         self.status = "failed"
@@ -1476,29 +1568,27 @@ class DeviceCredential(DnacBase):
                 https_read_username = https_read_credential.get("username")
 
                 if https_read_description and https_read_username and (not https_read__detail):
-                    for item in global_https_read_details:
-                        if item.get("description") == https_read_description \
-                                and item.get("username") == https_read_username:
-                            if https_read__detail:
-                                self.msg = "There are multiple https_read credentials with the same description and username. " + \
-                                           "Kindly provide the ID for the global device credentials."
-                                self.status = "failed"
-                                return self.check_return_status()
-                            https_read__detail = item
+                    matching_credentials = self.find_global_credentials("httpsRead", https_read_description, https_read_username)
+                    if len(matching_credentials) > 1:
+                        self.msg = "There are multiple https_read credentials with the same description and username. " + \
+                                   "Kindly provide the ID for the global device credentials."
+                        self.status = "failed"
+                        return self.check_return_status()
+                    if matching_credentials:
+                        https_read__detail = matching_credentials[0]
 
                 if not https_read__detail:
                     https_read_old_description = https_read_credential.get("old_description")
                     https_read_old_username = https_read_credential.get("old_username")
                     if https_read_old_description and https_read_old_username and (not https_read__detail):
-                        for item in global_https_read_details:
-                            if item.get("description") == https_read_old_description \
-                                    and item.get("username") == https_read_old_username:
-                                if https_read__detail:
-                                    self.msg = "There are multiple https_read credentials with the same old_description and old_username. " + \
-                                        "Kindly provide the ID for the global device credentials."
-                                    self.status = "failed"
-                                    return self.check_return_status()
-                                https_read__detail = item
+                        matching_credentials = self.find_global_credentials("httpsRead", https_read_old_description, https_read_old_username)
+                        if len(matching_credentials) > 1:
+                            self.msg = "There are multiple https_read credentials with the same old_description and old_username. " + \
+                                "Kindly provide the ID for the global device credentials."
+                            self.status = "failed"
+                            return self.check_return_status()
+                        if matching_credentials:
+                            https_read__detail = matching_credentials[0]
                         if not https_read__detail:
                             self.msg = "https_read credential old_description or old_username is invalid"
                             self.status = "failed"
@@ -1535,7 +1625,7 @@ class DeviceCredential(DnacBase):
                 https_write_detail = None
                 https_write_id = https_write_credential.get("id")
                 if https_write_id:
-                    https_write_detail = get_dict_result(global_https_write_details, "id", https_write_id)
+                    https_write_detail = self.get_global_credential("httpsWrite", "id", https_write_id)
                     if not https_write_detail:
                         self.msg = "https_write credential Id is invalid"
                         self.status = "failed"
@@ -1544,29 +1634,27 @@ class DeviceCredential(DnacBase):
                 https_write_description = https_write_credential.get("description")
                 https_write_username = https_write_credential.get("username")
                 if https_write_description and https_write_username and (not https_write_detail):
-                    for item in global_https_write_details:
-                        if item.get("description") == https_write_description \
-                                and item.get("username") == https_write_username:
-                            if https_write_detail:
-                                self.msg = "There are multiple https_write credentials with the same description and username. " + \
-                                           "Kindly provide the ID for the global device credentials."
-                                self.status = "failed"
-                                return self.check_return_status()
-                            https_write_detail = item
+                    matching_credentials = self.find_global_credentials("httpsWrite", https_write_description, https_write_username)
+                    if len(matching_credentials) > 1:
+                        self.msg = "There are multiple https_write credentials with the same description and username. " + \
+                                   "Kindly provide the ID for the global device credentials."
+                        self.status = "failed"
+                        return self.check_return_status()
+                    if matching_credentials:
+                        https_write_detail = matching_credentials[0]
 
                 if not https_write_detail:
                     https_write_old_description = https_write_credential.get("old_description")
                     https_write_old_username = https_write_credential.get("old_username")
                     if https_write_old_description and https_write_old_username and (not https_write_detail):
-                        for item in global_https_write_details:
-                            if item.get("description") == https_write_old_description \
-                                    and item.get("username") == https_write_old_username:
-                                if https_write_detail:
-                                    self.msg = "There are multiple https_write credentials with the same old_description and old_username. " + \
-                                        "Kindly provide the ID for the global device credentials."
-                                    self.status = "failed"
-                                    return self.check_return_status()
-                                https_write_detail = item
+                        matching_credentials = self.find_global_credentials("httpsWrite", https_write_old_description, https_write_old_username)
+                        if len(matching_credentials) > 1:
+                            self.msg = "There are multiple https_write credentials with the same old_description and old_username. " + \
+                                "Kindly provide the ID for the global device credentials."
+                            self.status = "failed"
+                            return self.check_return_status()
+                        if matching_credentials:
+                            https_write_detail = matching_credentials[0]
 
                         if not https_write_detail:
                             self.msg = "https_write credential old_description or " + \
@@ -1605,7 +1693,7 @@ class DeviceCredential(DnacBase):
                 snmp_v3_detail = None
                 snmp_v3_id = snmp_v3_credential.get("id")
                 if snmp_v3_id:
-                    snmp_v3_detail = get_dict_result(global_snmp_v3_details, "id", snmp_v3_id)
+                    snmp_v3_detail = self.get_global_credential("snmpV3", "id", snmp_v3_id)
                     if not snmp_v3_detail:
                         self.msg = "snmp_v3 credential id is invalid"
                         self.status = "failed"
@@ -1614,12 +1702,12 @@ class DeviceCredential(DnacBase):
                 snmp_v3_description = snmp_v3_credential.get("description")
 
                 if snmp_v3_description and (not snmp_v3_detail):
-                    snmp_v3_detail = get_dict_result(global_snmp_v3_details, "description", snmp_v3_description)
+                    snmp_v3_detail = self.get_global_credential("snmpV3", "description", snmp_v3_description)
 
                 if not snmp_v3_detail:
                     snmp_v3_old_description = snmp_v3_credential.get("old_description")
                     if snmp_v3_old_description and (not snmp_v3_detail):
-                        snmp_v3_detail = get_dict_result(global_snmp_v3_details, "description", snmp_v3_old_description)
+                        snmp_v3_detail = self.get_global_credential("snmpV3", "description", snmp_v3_old_description)
                         if not snmp_v3_detail:
                             self.msg = "snmp_v3 credential old_description is invalid"
                             self.status = "failed"
@@ -2188,16 +2276,15 @@ class DeviceCredential(DnacBase):
                 cli_detail = None
 
                 if cli_id:
-                    cli_detail = get_dict_result(global_cli_details, "id", cli_id)
+                    cli_detail = self.get_global_credential("cliCredential", "id", cli_id)
                     if not cli_detail:
                         self.msg = "The ID for the CLI credential is not valid."
                         self.status = "failed"
                         return self
                 elif cli_description and cli_username:
-                    for item in global_cli_details:
-                        if item.get("description") == cli_description and \
-                                item.get("username") == cli_username:
-                            cli_detail = item
+                    matching_credentials = self.find_global_credentials("cliCredential", cli_description, cli_username)
+                    if matching_credentials:
+                        cli_detail = matching_credentials[-1]
                     if not cli_detail:
                         self.msg = "The username and description of the CLI credential are invalid"
                         self.status = "failed"
@@ -2225,15 +2312,15 @@ class DeviceCredential(DnacBase):
                 snmp_v2c_read_detail = None
 
                 if snmp_v2c_read_id:
-                    snmp_v2c_read_detail = get_dict_result(global_snmp_v2c_read_details, "id", snmp_v2c_read_id)
+                    snmp_v2c_read_detail = self.get_global_credential("snmpV2cRead", "id", snmp_v2c_read_id)
                     if not snmp_v2c_read_detail:
                         self.msg = "The ID of the snmp_v2c_read credential is not valid."
                         self.status = "failed"
                         return self
                 elif snmp_v2c_read_description:
-                    for item in global_snmp_v2c_read_details:
-                        if item.get("description") == snmp_v2c_read_description:
-                            snmp_v2c_read_detail = item
+                    matching_credentials = self.find_global_credentials("snmpV2cRead", snmp_v2c_read_description)
+                    if matching_credentials:
+                        snmp_v2c_read_detail = matching_credentials[-1]
                     if not snmp_v2c_read_detail:
                         self.msg = "The username and description for the snmp_v2c_read credential are invalid."
                         self.status = "failed"
@@ -2261,15 +2348,15 @@ class DeviceCredential(DnacBase):
                 snmp_v2c_write_detail = None
 
                 if snmp_v2c_write_id:
-                    snmp_v2c_write_detail = get_dict_result(global_snmp_v2c_write_details, "id", snmp_v2c_write_id)
+                    snmp_v2c_write_detail = self.get_global_credential("snmpV2cWrite", "id", snmp_v2c_write_id)
                     if not snmp_v2c_write_detail:
                         self.msg = "The ID of the snmp_v2c_write credential is invalid."
                         self.status = "failed"
                         return self
                 elif snmp_v2c_write_description:
-                    for item in global_snmp_v2c_write_details:
-                        if item.get("description") == snmp_v2c_write_description:
-                            snmp_v2c_write_detail = item
+                    matching_credentials = self.find_global_credentials("snmpV2cWrite", snmp_v2c_write_description)
+                    if matching_credentials:
+                        snmp_v2c_write_detail = matching_credentials[-1]
 
                     if not snmp_v2c_write_detail:
                         self.msg = "The username and description of the snmp_v2c_write credential are invalid."
@@ -2299,16 +2386,15 @@ class DeviceCredential(DnacBase):
                 https_read_detail = None
 
                 if https_read_id:
-                    https_read_detail = get_dict_result(global_https_read_details, "id", https_read_id)
+                    https_read_detail = self.get_global_credential("httpsRead", "id", https_read_id)
                     if not https_read_detail:
                         self.msg = "The ID of the https_read credential is not valid."
                         self.status = "failed"
                         return self
                 elif https_read_description and https_read_username:
-                    for item in global_https_read_details:
-                        if item.get("description") == https_read_description and \
-                                item.get("username") == https_read_username:
-                            https_read_detail = item
+                    matching_credentials = self.find_global_credentials("httpsRead", https_read_description, https_read_username)
+                    if matching_credentials:
+                        https_read_detail = matching_credentials[-1]
 
                     if not https_read_detail:
                         self.msg = "The description and username for the https_read credential are invalid."
@@ -2338,16 +2424,15 @@ class DeviceCredential(DnacBase):
                 https_write_detail = None
 
                 if https_write_id:
-                    https_write_detail = get_dict_result(global_https_write_details, "id", https_write_id)
+                    https_write_detail = self.get_global_credential("httpsWrite", "id", https_write_id)
                     if not https_write_detail:
                         self.msg = "The ID of the https_write credential is not valid."
                         self.status = "failed"
                         return self
                 elif https_write_description and https_write_username:
-                    for item in global_https_write_details:
-                        if item.get("description") == https_write_description and \
-                                item.get("username") == https_write_username:
-                            https_write_detail = item
+                    matching_credentials = self.find_global_credentials("httpsWrite", https_write_description, https_write_username)
+                    if matching_credentials:
+                        https_write_detail = matching_credentials[-1]
 
                     if not https_write_detail:
                         self.msg = "The description and username for the https_write credential are invalid."
@@ -2376,15 +2461,15 @@ class DeviceCredential(DnacBase):
                 snmp_v3_detail = None
 
                 if snmp_v3_id:
-                    snmp_v3_detail = get_dict_result(global_snmp_v3_details, "id", snmp_v3_id)
+                    snmp_v3_detail = self.get_global_credential("snmpV3", "id", snmp_v3_id)
                     if not snmp_v3_detail:
                         self.msg = "The ID of the snmp_v3 credential is not valid."
                         self.status = "failed"
                         return self
                 elif snmp_v3_description:
-                    for item in global_snmp_v3_details:
-                        if item.get("description") == snmp_v3_description:
-                            snmp_v3_detail = item
+                    matching_credentials = self.find_global_credentials("snmpV3", snmp_v3_description)
+                    if matching_credentials:
+                        snmp_v3_detail = matching_credentials[-1]
 
                     if not snmp_v3_detail:
                         self.msg = "The username and description for the snmp_v3 credential are missing or invalid."
@@ -2456,16 +2541,15 @@ class DeviceCredential(DnacBase):
                 cli_detail = None
 
                 if cli_id:
-                    cli_detail = get_dict_result(global_cli_details, "id", cli_id)
+                    cli_detail = self.get_global_credential("cliCredential", "id", cli_id)
                     if not cli_detail:
                         self.msg = "The ID for the CLI credential is not valid."
                         self.status = "failed"
                         return self
                 elif cli_description and cli_username:
-                    for item in global_cli_details:
-                        if item.get("description") == cli_description and \
-                                item.get("username") == cli_username:
-                            cli_detail = item
+                    matching_credentials = self.find_global_credentials("cliCredential", cli_description, cli_username)
+                    if matching_credentials:
+                        cli_detail = matching_credentials[-1]
                     if not cli_detail:
                         self.msg = "The username and description of the CLI credential are invalid"
                         self.status = "failed"
@@ -2489,16 +2573,15 @@ class DeviceCredential(DnacBase):
                 snmp_v2c_read_detail = None
 
                 if snmp_v2c_read_id:
-                    snmp_v2c_read_detail = get_dict_result(
-                        global_snmp_v2c_read_details, "id", snmp_v2c_read_id)
+                    snmp_v2c_read_detail = self.get_global_credential("snmpV2cRead", "id", snmp_v2c_read_id)
                     if not snmp_v2c_read_detail:
                         self.msg = "The ID of the snmp_v2c_read credential is not valid."
                         self.status = "failed"
                         return self
                 elif snmp_v2c_read_description:
-                    for item in global_snmp_v2c_read_details:
-                        if item.get("description") == snmp_v2c_read_description:
-                            snmp_v2c_read_detail = item
+                    matching_credentials = self.find_global_credentials("snmpV2cRead", snmp_v2c_read_description)
+                    if matching_credentials:
+                        snmp_v2c_read_detail = matching_credentials[-1]
                     if not snmp_v2c_read_detail:
                         self.msg = "The username and description for the snmp_v2c_read credential are invalid."
                         self.status = "failed"
@@ -2523,16 +2606,15 @@ class DeviceCredential(DnacBase):
                 snmp_v2c_write_detail = None
 
                 if snmp_v2c_write_id:
-                    snmp_v2c_write_detail = get_dict_result(
-                        global_snmp_v2c_write_details, "id", snmp_v2c_write_id)
+                    snmp_v2c_write_detail = self.get_global_credential("snmpV2cWrite", "id", snmp_v2c_write_id)
                     if not snmp_v2c_write_detail:
                         self.msg = "The ID of the snmp_v2c_write credential is invalid."
                         self.status = "failed"
                         return self
                 elif snmp_v2c_write_description:
-                    for item in global_snmp_v2c_write_details:
-                        if item.get("description") == snmp_v2c_write_description:
-                            snmp_v2c_write_detail = item
+                    matching_credentials = self.find_global_credentials("snmpV2cWrite", snmp_v2c_write_description)
+                    if matching_credentials:
+                        snmp_v2c_write_detail = matching_credentials[-1]
                     if not snmp_v2c_write_detail:
                         self.msg = "The username and description of the snmp_v2c_write credential are invalid."
                         self.status = "failed"
@@ -2557,16 +2639,15 @@ class DeviceCredential(DnacBase):
                 snmp_v3_detail = None
 
                 if snmp_v3_id:
-                    snmp_v3_detail = get_dict_result(
-                        global_snmp_v3_details, "id", snmp_v3_id)
+                    snmp_v3_detail = self.get_global_credential("snmpV3", "id", snmp_v3_id)
                     if not snmp_v3_detail:
                         self.msg = "The ID of the snmp_v3 credential is not valid."
                         self.status = "failed"
                         return self
                 elif snmp_v3_description:
-                    for item in global_snmp_v3_details:
-                        if item.get("description") == snmp_v3_description:
-                            snmp_v3_detail = item
+                    matching_credentials = self.find_global_credentials("snmpV3", snmp_v3_description)
+                    if matching_credentials:
+                        snmp_v3_detail = matching_credentials[-1]
                     if not snmp_v3_detail:
                         self.msg = "The username and description for the snmp_v3 credential are missing or invalid."
                         self.status = "failed"
@@ -2866,6 +2947,8 @@ class DeviceCredential(DnacBase):
 
         Returns:
             sync_status - Response for all network devices credential's sync status.
+        Raises:
+            Exception - If the sync status cannot be read, so that the method can run on worker threads.
         """
 
         try:
@@ -2878,13 +2961,12 @@ class DeviceCredential(DnacBase):
             self.log("All global device credentials sync details: {0}"
                      .format(sync_status), "DEBUG")
         except Exception as msg:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting global device credentials sync status: {0}".format(
                     msg)
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return sync_status
 
@@ -2915,6 +2997,31 @@ class DeviceCredential(DnacBase):
 
         return site_credential_response
 
+    def get_site_assigned_device_ids(self, site):
+        """
+        Retrieve the IDs of the devices assigned to one site, to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+            site (tuple): The name hierarchy and the ID of the site.
+
+        Returns:
+            tuple: The list of device IDs and the error message, None if the devices were retrieved.
+        """
+        site_name, site_id = site
+        try:
+            self.log("Fetching devices for site ID: {0} (Site: {1})".format(site_id, site_name), "DEBUG")
+            response = self.dnac._exec(
+                family="site_design",
+                function='get_site_assigned_network_devices',
+                params={"site_id": site_id},
+            )
+            self.log("Received API response from 'get_site_assigned_network_devices': {0}".format(str(response)), "DEBUG")
+        except Exception as e:
+            return [], str(e)
+
+        devices = response.get('response') or []
+        return [device.get("deviceId") for device in devices if device.get("deviceId")], None
+
     def get_devices_in_site(self, site_name, site_id):
         """
         Retrieve the list of device IDs assigned to a site in Cisco Catalyst Center.
@@ -2928,8 +3035,10 @@ class DeviceCredential(DnacBase):
 
         Returns:
             list: A list of device IDs (str) assigned to the matched sites.
+        Description:
+            The devices of every site are kept in 'self.site_devices', so the sites shared by several
+            site names of the playbook are queried once. The sites not queried yet are fetched concurrently.
         """
-        device_id_list = []
         site_names = site_name + ".*"
         self.log("Fetching sites with the name pattern: {0}".format(site_names), "DEBUG")
         get_site_names = self.get_site(site_names)
@@ -2941,31 +3050,103 @@ class DeviceCredential(DnacBase):
                 site_info[item['nameHierarchy']] = item['id']
                 self.log("Site info mapping: {0}".format(site_info), "DEBUG")
 
-        for site_name, site_id in site_info.items():
-            try:
-                self.log("Fetching devices for site ID: {0} (Site: {1})".format(site_id, site_name), "DEBUG")
-                response = self.dnac._exec(
-                    family="site_design",
-                    function='get_site_assigned_network_devices',
-                    params={"site_id": site_id},
-                )
-                self.log("Received API response from 'get_site_assigned_network_devices': {0}".format(str(response)), "DEBUG")
-                devices = response.get('response')
-                if not devices:
-                    self.log("No devices found for site - '{0}'.". format(site_name), "WARNING")
-                    continue
+        sites_to_fetch = [
+            (name, current_site_id) for name, current_site_id in site_info.items() if name not in self.site_devices
+        ]
+        site_device_ids = self.execute_concurrently(
+            self.get_site_assigned_device_ids, sites_to_fetch, self.params.get("max_concurrent_requests"))
+        for (name, current_site_id), (device_ids, error) in zip(sites_to_fetch, site_device_ids):
+            if error:
+                self.log("Unable to fetch the device(s) associated to the site '{0}' due to '{1}'".format(name, error), "WARNING")
+                continue
+
+            if not device_ids:
+                self.log("No devices found for site - '{0}'.". format(name), "WARNING")
 
-                for device in devices:
-                    device_id = device.get("deviceId")
-                    if device_id:
-                        device_id_list.append(device_id)
-                        self.log("Added device ID {0} for site '{1}'".format(device_id, site_name), "DEBUG")
+            self.site_devices[name] = device_ids
 
-            except Exception as e:
-                self.log("Unable to fetch the device(s) associated to the site '{0}' due to '{1}'".format(site_name, str(e)), "WARNING")
+        device_id_list = []
+        for name in site_info:
+            for device_id in self.site_devices.get(name, []):
+                device_id_list.append(device_id)
+                self.log("Added device ID {0} for site '{1}'".format(device_id, name), "DEBUG")
 
         return device_id_list
 
+    def get_site_sync_details(self, site_id):
+        """
+        Retrieve the credential sync status and the credentials assigned to one site,
+        to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+            site_id (str): The ID of the site.
+
+        Returns:
+            tuple: The sync status, the assigned device credentials and the error message,
+            the error message being None if both were retrieved.
+        """
+        try:
+            cred_sync_status = self.get_network_devices_credentials_sync_status(site_id)
+            assigned_device_credential = self.get_assigned_device_credential(site_id)
+        except Exception as msg:
+            return None, None, str(msg)
+
+        return cred_sync_status, assigned_device_credential, None
+
+    def submit_credential_sync(self, param):
+        """
+        Sync one device credential to the devices of a site.
+
+        Parameters:
+            param (dict): The 'deviceCredentialId' and the 'siteId' of the sync request.
+
+        Returns:
+            tuple: The task ID of the sync and the error message, one of them being None.
+        """
+        try:
+            response = self.dnac._exec(
+                family="network_settings",
+                function="sync_network_devices_credential",
+                op_modifies=True,
+                params=param
+            )
+            self.log("Received API response for 'sync_network_devices_credential': {0}".format(response), "DEBUG")
+        except Exception as msg:
+            return None, str(msg)
+
+        task_info = response.get("response") if isinstance(response, dict) else None
+        if not task_info or not task_info.get("taskId"):
+            return None, "Unable to retrieve the task ID of 'sync_network_devices_credential': {0}".format(response)
+
+        return task_info.get("taskId"), None
+
+    def sync_site_credentials(self, site_sync):
+        """
+        Sync the device credentials of one site one after the other, to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+            site_sync (tuple): The site ID and the list of the device credential IDs to be synced to the site.
+
+        Returns:
+            list: The error message of every credential, None for the credentials synced successfully.
+
+        Description:
+            A site runs a single credential sync at a time, so the next sync of the site is only
+            requested once the task of the previous one has completed.
+        """
+        site_id, credential_ids = site_sync
+        errors = []
+        for credential_id in credential_ids:
+            task_id, error = self.submit_credential_sync({"deviceCredentialId": credential_id, "siteId": site_id})
+            if not error:
+                task_details = self.wait_for_tasks([task_id], max_workers=1).get(task_id) or {}
+                if task_details.get("isError"):
+                    error = task_details.get("failureReason") or task_details.get("progress")
+
+            errors.append(error)
+
+        return errors
+
     def apply_credentials_to_site(self):
         """
         Apply Global Device Credential to the Cisco Catalyst
@@ -2978,122 +3159,163 @@ class DeviceCredential(DnacBase):
         Returns:
             self - The current object with updated Global Device Credential information.
 
+        Description:
+            The devices, the sync status and the assigned credentials of the sites are retrieved concurrently.
+            The sites are then synced concurrently, the credentials of one site being synced one after the other.
+            The sites without devices or without credentials to sync are skipped, the operation only exits
+            without changes when none of the sites has devices.
         """
         site_ids = self.want.get("site_id")
         site_names = self.want.get("site_name")
 
-        for site_id, site_name in zip(site_ids, site_names):
-            if self.get_ccc_version_as_integer() >= self.get_ccc_version_as_int_from_str("2.3.7.6"):
-                result_apply_credential = self.result.get("response")[0].get("apply_credential")
-                credential_params = self.want.get("apply_credentials")
-                final_response = []
-                self.log("Applying device credential to site API input parameters: {0}".format(credential_params), "DEBUG")
-
-                if not credential_params:
-                    result_apply_credential.update({
-                        "No Apply Credentials": {
-                            "response": "No Response",
-                            "msg": "No device credential id is available"
-                        }
-                    })
-                    self.msg = "No device credential id is available"
-                    self.status = "success"
-                    return self
+        if self.get_ccc_version_as_integer() < self.get_ccc_version_as_int_from_str("2.3.7.6"):
+            self.msg = (
+                "Cisco Catalyst Center version '{0}' doesn't support apply credentials to site feature."
+                .format(self.payload.get("dnac_version")), "ERROR"
+            )
+            self.log(self.msg, "CRITICAL")
+            self.status = "failed"
+            return self.check_return_status()
 
-                device_id_list = self.get_devices_in_site(site_name, site_id)
-                if not device_id_list:
-                    result_apply_credential.update({
-                        "No Apply Credentials": {
-                            "response": "No Response",
-                            "msg": "No device available in the site"
-                        }
-                    })
-                    self.msg = "No device available in the site: '{0}' with site id {1}".format(site_name, site_id)
-                    self.log(self.msg, "WARNING")
-                    self.status = "exited"
-                    return self
+        result_apply_credential = self.result.get("response")[0].get("apply_credential")
+        credential_params = self.want.get("apply_credentials")
+        final_response = []
+        self.log("Applying device credential to site API input parameters: {0}".format(credential_params), "DEBUG")
 
-                cred_sync_status = self.get_network_devices_credentials_sync_status(site_id)
-                credential_mapping = {
-                    "cli": "cliId",
-                    "snmpV2Read": "snmpV2ReadId",
-                    "snmpV2Write": "snmpV2WriteId",
-                    "snmpV3": "snmpV3Id"
+        if not credential_params:
+            result_apply_credential.update({
+                "No Apply Credentials": {
+                    "response": "No Response",
+                    "msg": "No device credential id is available"
                 }
+            })
+            self.msg = "No device credential id is available"
+            self.status = "success"
+            return self
 
-                not_synced_ids, assigned_site_ids = [], []
+        sites_with_devices, sites_without_devices = [], []
+        for site_id, site_name in zip(site_ids, site_names):
+            if self.get_devices_in_site(site_name, site_id):
+                sites_with_devices.append((site_id, site_name))
+                continue
 
-                for status_key, param_key in credential_mapping.items():
-                    if param_key in credential_params:
-                        status_list = cred_sync_status.get(status_key, [])
-                        for status in status_list:
-                            if status.get('status') != 'Synced':
-                                if credential_params.get(param_key) and credential_params.get(param_key) not in not_synced_ids:
-                                    not_synced_ids.append(credential_params[param_key])
+            sites_without_devices.append(site_name)
+            self.log("No device available in the site: '{0}' with site id {1}, skipping it.".format(site_name, site_id), "WARNING")
 
-                assigned_device_credential = self.get_assigned_device_credential(site_id)
+        if not sites_with_devices:
+            result_apply_credential.update({
+                "No Apply Credentials": {
+                    "response": "No Response",
+                    "msg": "No device available in the site"
+                }
+            })
+            self.msg = "No device available in the site(s): '{0}' with site id(s) {1}".format(site_names, site_ids)
+            self.log(self.msg, "WARNING")
+            self.status = "exited"
+            return self
 
-                for value in assigned_device_credential.values():
-                    if isinstance(value, dict) and "credentialsId" in value:
-                        assigned_site_ids.append(value.get("credentialsId"))
+        max_workers = self.params.get("max_concurrent_requests")
+        site_sync_details = self.execute_concurrently(
+            self.get_site_sync_details, [site_id for site_id, site_name in sites_with_devices], max_workers)
+        credential_mapping = {
+            "cli": "cliId",
+            "snmpV2Read": "snmpV2ReadId",
+            "snmpV2Write": "snmpV2WriteId",
+            "snmpV3": "snmpV3Id"
+        }
 
-                valid_sync_cred_ids, invalid_sync_cred_ids = [], []
+        for (site_id, site_name), (cred_sync_status, assigned_device_credential, error) in \
+                zip(sites_with_devices, site_sync_details):
+            if error:
+                self.msg = error
+                self.status = "failed"
+                return self.check_return_status()
 
-                for id in not_synced_ids:
-                    if id in assigned_site_ids:
-                        valid_sync_cred_ids.append(id)
-                    else:
-                        invalid_sync_cred_ids.append(id)
-                self.log("Credential IDs {0} not assigned to site, so Sync not possible.".format(invalid_sync_cred_ids), "INFO")
-
-                if not valid_sync_cred_ids:
-                    result_apply_credential.update({
-                        "Applied Credentials": {
-                            "response": final_response,
-                            "msg": "Either the provided credentials are already synchronized or they are not assigned to the device."
-                        }
-                    })
-                    self.msg = (
-                        "Provided credentials category is/are already synced: {0}".format(credential_params)
-                    )
-                    self.log(self.msg, "WARNING")
-                    self.status = "skipped"
-                    return self
+            not_synced_ids, assigned_site_ids = [], []
+            for status_key, param_key in credential_mapping.items():
+                if param_key in credential_params:
+                    status_list = cred_sync_status.get(status_key, [])
+                    for status in status_list:
+                        if status.get('status') != 'Synced':
+                            if credential_params.get(param_key) and credential_params.get(param_key) not in not_synced_ids:
+                                not_synced_ids.append(credential_params[param_key])
+
+            for value in assigned_device_credential.values():
+                if isinstance(value, dict) and "credentialsId" in value:
+                    assigned_site_ids.append(value.get("credentialsId"))
+
+            valid_sync_cred_ids, invalid_sync_cred_ids = [], []
+            for id in not_synced_ids:
+                if id in assigned_site_ids:
+                    valid_sync_cred_ids.append(id)
+                else:
+                    invalid_sync_cred_ids.append(id)
+            self.log("Credential IDs {0} not assigned to site {1}, so Sync not possible.".format(invalid_sync_cred_ids, site_id), "INFO")
+
+            for credential_id in valid_sync_cred_ids:
+                self.log("Credential {0} to be synced with {1} site id." .format(credential_id, site_id), "INFO")
+                final_response.append({"deviceCredentialId": credential_id, "siteId": site_id})
+
+        if not final_response:
+            result_apply_credential.update({
+                "Applied Credentials": {
+                    "response": final_response,
+                    "msg": "Either the provided credentials are already synchronized or they are not assigned to the device."
+                }
+            })
+            self.msg = (
+                "Provided credentials category is/are already synced: {0}".format(credential_params)
+            )
+            self.log(self.msg, "WARNING")
+            self.status = "skipped"
+            return self
 
-                for credential_id in valid_sync_cred_ids:
-                    param = {"deviceCredentialId": credential_id,
-                             "siteId": site_id}
-                    self.log("Credential {0} to be synced with {1} site id." .format(credential_id, site_id), "INFO")
-                    final_response.append(copy.deepcopy(param))
-                    response = self.dnac._exec(
-                        family="network_settings",
-                        function="sync_network_devices_credential",
-                        op_modifies=True,
-                        params=param
-                    )
-                    self.log("Received API response for 'sync_network_devices_credential': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response,
-                                                     "sync_network_devices_credential").check_return_status()
-
-                    self.log("Device credential applied to site {0} successfully.".format(site_id), "INFO")
-                    self.log("Desired State for applying credentials to a site: {0}".format(final_response), "DEBUG")
-                    result_apply_credential.update({
-                        "Applied Credentials": {
-                            "response": final_response,
-                            "msg": "Successfully applied credential."
-                        }
-                    })
-                self.msg = "Global Credential is applied Successfully"
-                self.status = "success"
-            else:
-                self.msg = (
-                    "Cisco Catalyst Center version '{0}' doesn't support apply credentials to site feature."
-                    .format(self.payload.get("dnac_version")), "ERROR"
+        site_syncs = {}
+        for param in final_response:
+            site_syncs.setdefault(param.get("siteId"), []).append(param.get("deviceCredentialId"))
+
+        site_sync_errors = self.execute_concurrently(self.sync_site_credentials, list(site_syncs.items()), max_workers)
+        sync_errors = {}
+        for (site_id, credential_ids), site_errors in zip(site_syncs.items(), site_sync_errors):
+            for credential_id, error in zip(credential_ids, site_errors):
+                sync_errors[(site_id, credential_id)] = error
+
+        errors = []
+        for param in final_response:
+            error = sync_errors.get((param.get("siteId"), param.get("deviceCredentialId")))
+            if error:
+                errors.append(
+                    "Failed to sync the credential '{0}' to the site '{1}': {2}"
+                    .format(param.get("deviceCredentialId"), param.get("siteId"), error)
                 )
-                self.log(self.msg, "CRITICAL")
-                self.status = "failed"
-                return self.check_return_status()
+                continue
 
+            self.result["changed"] = True
+            self.log("Device credential {0} applied to site {1} successfully."
+                     .format(param.get("deviceCredentialId"), param.get("siteId")), "INFO")
+
+        if errors:
+            self.msg = " ".join(errors)
+            self.log(self.msg, "ERROR")
+            self.status = "failed"
+            return self.check_return_status()
+
+        self.log("Desired State for applying credentials to a site: {0}".format(final_response), "DEBUG")
+        result_apply_credential.update({
+            "Applied Credentials": {
+                "response": final_response,
+                "msg": "Successfully applied credential."
+            }
+        })
+        if sites_without_devices:
+            result_apply_credential.update({
+                "Skipped Sites": {
+                    "response": sites_without_devices,
+                    "msg": "No device available in the site(s)."
+                }
+            })
+        self.msg = "Global Credential is applied Successfully"
+        self.status = "success"
         return self
 
     def get_diff_merged(self, config):
@@ -3267,6 +3489,7 @@ class DeviceCredential(DnacBase):
             self
         """
 
+        self.reset_global_credentials()
         self.get_have(config)
         self.get_want(config)
         self.log("Current State (have): {0}".format(self.have), "INFO")
@@ -3331,6 +3554,7 @@ class DeviceCredential(DnacBase):
             self
         """
 
+        self.reset_global_credentials()
         self.get_have(config)
         self.log("Current State (have): {0}".format(self.have), "INFO")
         self.log("Desired State (want): {0}".format(self.want), "INFO")
@@ -3369,6 +3593,7 @@ class DeviceCredential(DnacBase):
 
         self.have.clear()
         self.want.clear()
+        self.reset_global_credentials()
         return self
 
 
@@ -3394,6 +3619,7 @@ def main():
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
+        "max_concurrent_requests": {"type": 'int', "default": 5},
     }
 
     # Create an AnsibleModule object with argument specifications
@@ -32,6 +32,14 @@ options:
     type: str
     choices: [ merged, deleted ]
     default: merged
+  max_concurrent_requests:
+    description:
+      - Maximum number of status requests sent at the same time while tracking the discoveries.
+      - The discoveries of all the config entries are started first and then tracked together.
+      - Set to 1 to query the discoveries one after the other.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description:
     - List of details of device being managed.
@@ -337,6 +345,7 @@ notes:
     task.Task.get_task_by_id,
     discovery.Discovery.get_discoveries_by_range,
     discovery.Discovery.get_discovered_network_devices_by_discovery_id',
+    discovery.Discovery.get_discovery_by_id,
     discovery.Discovery.delete_discovery_by_id
     discovery.Discovery.delete_all_discovery
     discovery.Discovery.get_count_of_all_discovery_jobs
@@ -347,11 +356,13 @@ notes:
     get /dna/intent/api/v1/task/{taskId}
     get /dna/intent/api/v1/discovery/{startIndex}/{recordsToReturn}
     get /dna/intent/api/v1/discovery/{id}/network-device
+    get /dna/intent/api/v1/discovery/{id}
     delete /dna/intent/api/v1/discovery/{id}
     delete /dna/intent/api/v1/delete
     get /dna/intent/api/v1/discovery/count
 
   - Removed 'global_cli_len' option in v6.12.0.
+  - Added 'max_concurrent_requests' option in v6.32.0.
 
 """
 
@@ -639,10 +650,14 @@ class Discovery(DnacBase):
           following instance attributes:
           - self.creds_ids_list: An empty list that will be used to store
                                  credentials IDs.
+          - self.current_config: The config entry being processed.
+          - self.discovery_jobs: The discoveries started and not tracked yet.
         """
 
         super().__init__(module)
         self.creds_ids_list = []
+        self.current_config = {}
+        self.discovery_jobs = []
         self.supported_states = ["merged", "deleted"]
 
     def validate_input(self, state=None):
@@ -728,7 +743,7 @@ class Discovery(DnacBase):
         Validates each ip adress paased in the IP_address_list passed by the user before preprocessing it
         """
 
-        ip_address_list = self.validated_config[0].get('ip_address_list')
+        ip_address_list = self.current_config.get('ip_address_list')
         for ip in ip_address_list:
             if '/' in ip:
                 ip = ip.split("/")[0]
@@ -786,7 +801,7 @@ class Discovery(DnacBase):
                                     Global credentials.
         """
 
-        global_credentials = self.validated_config[0].get("global_credentials")
+        global_credentials = self.current_config.get("global_credentials")
         global_credentials_all = {}
 
         cli_credentials_list = global_credentials.get('cli_credentials_list')
@@ -972,13 +987,13 @@ class Discovery(DnacBase):
         response = self.dnac_apply['exec'](
             family="discovery",
             function='get_all_global_credentials_v2',
-            params=self.validated_config[0].get('headers'),
+            params=self.current_config.get('headers'),
             op_modifies=True
         )
         response = response.get('response')
         self.log("The Global credentials response from 'get all global credentials v2' API is {0}".format(str(response)), "DEBUG")
         global_credentials_all = {}
-        global_credentials = self.validated_config[0].get("global_credentials")
+        global_credentials = self.current_config.get("global_credentials")
         if global_credentials:
             global_credentials_all = self.handle_global_credentials(response=response)
 
@@ -1012,7 +1027,7 @@ class Discovery(DnacBase):
           - ip_address_list: The list of devices extracted from the
                           'validated_config' attribute.
         """
-        ip_address_list = self.validated_config[0].get('ip_address_list')
+        ip_address_list = self.current_config.get('ip_address_list')
         self.result.update(dict(devices_info=ip_address_list))
         self.log("Details of the device list passed: {0}".format(str(ip_address_list)), "INFO")
         return ip_address_list
@@ -1035,7 +1050,7 @@ class Discovery(DnacBase):
 
         if ip_address_list is None:
             ip_address_list = []
-        discovery_type = self.validated_config[0].get('discovery_type')
+        discovery_type = self.current_config.get('discovery_type')
         self.log("Discovery type passed for the discovery is {0}".format(discovery_type), "INFO")
         if discovery_type in ["SINGLE", "CDP", "LLDP"]:
             if len(ip_address_list) == 1:
@@ -1113,7 +1128,7 @@ class Discovery(DnacBase):
                                  start discovery API in an updated fashion
         """
 
-        discovery_specific_credentials = self.validated_config[0].get('discovery_specific_credentials')
+        discovery_specific_credentials = self.current_config.get('discovery_specific_credentials')
         cli_credentials_list = discovery_specific_credentials.get('cli_credentials_list')
         http_read_credential = discovery_specific_credentials.get('http_read_credential')
         http_write_credential = discovery_specific_credentials.get('http_write_credential')
@@ -1247,21 +1262,21 @@ class Discovery(DnacBase):
         credential_ids = []
 
         new_object_params = {}
-        new_object_params['cdpLevel'] = self.validated_config[0].get('cdp_level')
-        new_object_params['discoveryType'] = self.validated_config[0].get('discovery_type')
+        new_object_params['cdpLevel'] = self.current_config.get('cdp_level')
+        new_object_params['discoveryType'] = self.current_config.get('discovery_type')
         new_object_params['ipAddressList'] = ip_address_list
-        new_object_params['ipFilterList'] = self.validated_config[0].get('ip_filter_list')
-        new_object_params['lldpLevel'] = self.validated_config[0].get('lldp_level')
-        new_object_params['name'] = self.validated_config[0].get('discovery_name')
-        new_object_params['preferredMgmtIPMethod'] = self.validated_config[0].get('preferred_mgmt_ip_method')
-        new_object_params['protocolOrder'] = self.validated_config[0].get('protocol_order')
-        new_object_params['retry'] = self.validated_config[0].get('retry')
-        new_object_params['timeout'] = self.validated_config[0].get('timeout')
-
-        if self.validated_config[0].get('discovery_specific_credentials'):
+        new_object_params['ipFilterList'] = self.current_config.get('ip_filter_list')
+        new_object_params['lldpLevel'] = self.current_config.get('lldp_level')
+        new_object_params['name'] = self.current_config.get('discovery_name')
+        new_object_params['preferredMgmtIPMethod'] = self.current_config.get('preferred_mgmt_ip_method')
+        new_object_params['protocolOrder'] = self.current_config.get('protocol_order')
+        new_object_params['retry'] = self.current_config.get('retry')
+        new_object_params['timeout'] = self.current_config.get('timeout')
+
+        if self.current_config.get('discovery_specific_credentials'):
             self.handle_discovery_specific_credentials(new_object_params=new_object_params)
 
-        global_cred_flag = self.validated_config[0].get('use_global_credentials')
+        global_cred_flag = self.current_config.get('use_global_credentials')
         global_credentials_all = {}
 
         if global_cred_flag is True:
@@ -1315,52 +1330,6 @@ class Discovery(DnacBase):
         self.log("Task Id of the API task created is {0}".format(result.response.get('taskId')), "INFO")
         return result.response.get('taskId')
 
-    def get_merged_task_status(self, task_id=None):
-        """
-        Monitor the status of a task of creation of dicovery in the Cisco Catalyst Center.
-        It checks the task status periodically until the task is no longer 'In Progress'
-        or other states. If the task encounters an error or fails, it immediately fails the
-        module and returns False.
-
-        Parameters:
-          - task_id: The ID of the task to monitor.
-
-        Returns:
-          - result: True if the task completed successfully, False otherwise.
-        """
-
-        result = False
-        params = dict(task_id=task_id)
-        while True:
-            response = self.dnac_apply['exec'](
-                family="task",
-                function='get_task_by_id',
-                params=params,
-                op_modifies=True,
-            )
-            response = response.response
-            self.log("Task status for the task id {0} is {1}, is_error: {2}".format(str(task_id), str(response), str(response.get('isError'))), "INFO")
-            if response.get('isError') or re.search(
-                'failed', response.get('progress'), flags=re.IGNORECASE
-            ):
-                msg = 'Discovery task with id {0} has not completed - Reason: {1}'.format(
-                    task_id, response.get("failureReason"))
-                self.log(msg, "CRITICAL")
-                self.module.fail_json(msg=msg)
-                return False
-
-            self.log("Task status for the task id (before checking status) {0} is {1}".format(str(task_id), str(response)), "INFO")
-            progress = response.get('progress')
-            try:
-                progress_value = int(progress)
-                result = True
-                self.log("The discovery process is completed", "INFO")
-                self.result.update(dict(discovery_task=response))
-                return result
-            except Exception:
-                self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds".format(progress))
-                time.sleep(3)
-
     def get_deleted_task_status(self, task_id=None):
         """
         Monitor the status of a task of deletion of dicovery in the Cisco Catalyst Center.
@@ -1376,6 +1345,7 @@ class Discovery(DnacBase):
 
         result = False
         params = dict(task_id=task_id)
+        attempt = 0
         while True:
             response = self.dnac_apply['exec'](
                 family="task",
@@ -1402,8 +1372,10 @@ class Discovery(DnacBase):
                 self.result.update(dict(discovery_task=response))
                 return result
 
-            self.log("The progress status is {0}, continue to check the status after 3 seconds. Putting into sleep for 3 seconds".format(progress))
-            time.sleep(3)
+            interval = self.get_backoff_interval(attempt)
+            self.log("The progress status is {0}, continue to check the status after {1} seconds.".format(progress, interval))
+            time.sleep(interval)
+            attempt += 1
 
     def lookup_discovery_by_range_via_name(self):
         """
@@ -1415,8 +1387,8 @@ class Discovery(DnacBase):
                        of discoveries. If no matching discovery is found, it
                        returns None.
         """
-        start_index = self.validated_config[0].get("start_index")
-        records_to_return = self.validated_config[0].get("records_to_return")
+        start_index = self.current_config.get("start_index")
+        records_to_return = self.current_config.get("records_to_return")
 
         response = {"response": []}
         if records_to_return > 500:
@@ -1425,7 +1397,7 @@ class Discovery(DnacBase):
                 params = dict(
                     start_index=1 + num * 500,
                     records_to_return=500,
-                    headers=self.validated_config[0].get("headers")
+                    headers=self.current_config.get("headers")
                 )
                 response_part = self.dnac_apply['exec'](
                     family="discovery",
@@ -1436,9 +1408,9 @@ class Discovery(DnacBase):
                 response["response"].extend(response_part["response"])
         else:
             params = dict(
-                start_index=self.validated_config[0].get("start_index"),
-                records_to_return=self.validated_config[0].get("records_to_return"),
-                headers=self.validated_config[0].get("headers"),
+                start_index=self.current_config.get("start_index"),
+                records_to_return=self.current_config.get("records_to_return"),
+                headers=self.current_config.get("headers"),
             )
 
             response = self.dnac_apply['exec'](
@@ -1451,119 +1423,185 @@ class Discovery(DnacBase):
 
         return next(
             filter(
-                lambda x: x['name'] == self.validated_config[0].get('discovery_name'),
+                lambda x: x['name'] == self.current_config.get('discovery_name'),
                 response.get("response")
             ), None
         )
 
-    def get_discoveries_by_range_until_success(self):
+    def poll_discovery_job(self, job):
         """
-        Continuously retrieve a specific discovery by name from a range of
-        discoveries in the Cisco Catalyst Center until the discovery is complete.
+        Query the progress of one started discovery, to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+          - job: The started discovery, holding its name, task ID and headers. The discovery ID,
+                 the discovery details and the discovered devices are stored in it as they are known.
 
         Returns:
-          - discovery: The completed discovery with the specified name from
-                       the range of discoveries. If the discovery is not
-                       found or not completed, the function fails the module
-                       and returns None.
+          - error: The reason why the discovery failed, None while it is in progress or once it is complete.
+        Description:
+          The ID of the new discovery is read from the progress of the 'start_discovery' task, so the
+          discovery is queried by its ID instead of being looked up by name in the ranges of discoveries.
+          The devices are collected as soon as the discovery is complete.
         """
+        try:
+            if not job.get("discovery_id"):
+                response = self.dnac_apply['exec'](
+                    family="task",
+                    function='get_task_by_id',
+                    params=dict(task_id=job.get("task_id")),
+                    op_modifies=True,
+                )
+                task_details = response.get("response") or {}
+                self.log("Task status for the task id {0} is {1}".format(job.get("task_id"), task_details), "DEBUG")
+                progress = str(task_details.get("progress") or "")
+                if task_details.get("isError") or re.search('failed', progress, flags=re.IGNORECASE):
+                    return 'Discovery task with id {0} has not completed - Reason: {1}'.format(
+                        job.get("task_id"), task_details.get("failureReason"))
 
-        result = False
-        aborted = False
-        discovery = self.lookup_discovery_by_range_via_name()
+                if not progress.isdigit():
+                    return None
 
-        if not discovery:
-            msg = 'Cannot find any discovery task with name {0} -- Discovery result: {1}'.format(
-                str(self.validated_config[0].get("discovery_name")), str(discovery))
-            self.log(msg, "INFO")
-            self.module.fail_json(msg=msg)
+                job["discovery_id"] = progress
+                job["task"] = task_details
 
-        while True:
-            discovery = self.lookup_discovery_by_range_via_name()
-            discovery_condition = discovery.get('discoveryCondition')
-            if discovery_condition == 'Complete':
-                result = True
-                break
-            elif discovery_condition == 'Aborted':
-                aborted = True
-                break
-            time.sleep(3)
+            response = self.dnac_apply['exec'](
+                family="discovery",
+                function='get_discovery_by_id',
+                params=dict(id=job.get("discovery_id")),
+                op_modifies=True,
+            )
+            discovery = response.get("response") or {}
+            discovery_condition = discovery.get("discoveryCondition")
+            self.log("Condition of the discovery '{0}' is {1}".format(job.get("name"), discovery_condition), "DEBUG")
+            if discovery_condition == 'Aborted':
+                return 'Discovery with name {0} is aborted by the user on the GUI'.format(job.get("name"))
 
-        if not result:
-            if aborted is True:
-                msg = 'Discovery with name {0} is aborted by the user on the GUI'.format(str(self.validated_config[0].get("discovery_name")))
-                self.log(msg, "CRITICAL")
-                self.module.fail_json(msg=msg)
-            else:
-                msg = 'Cannot find any discovery task with name {0} -- Discovery result: {1}'.format(
-                    str(self.validated_config[0].get("discovery_name")), str(discovery))
-                self.log(msg, "CRITICAL")
-                self.module.fail_json(msg=msg)
+            if discovery_condition != 'Complete':
+                return None
 
-        self.result.update(dict(discovery_range=discovery))
-        return discovery
+            job["discovery"] = discovery
+            response = self.dnac_apply['exec'](
+                family="discovery",
+                function='get_discovered_network_devices_by_discovery_id',
+                params=dict(id=job.get("discovery_id"), headers=job.get("headers")),
+                op_modifies=True,
+            )
+            job["devices"] = response.get("response") or []
+        except Exception as e:
+            return "Unable to track the discovery '{0}': {1}".format(job.get("name"), repr(e))
+
+        return None
 
-    def get_discovery_device_info(self, discovery_id=None, task_id=None):
+    def watch_discovery_jobs(self, jobs):
         """
-        Retrieve the information of devices discovered by a specific discovery
-        process in the Cisco Catalyst Center. It checks the reachability status of the
-        devices periodically until all devices are reachable or until a
-        maximum of 3 attempts.
+        Track the started discoveries together until each of them completes, fails or times out.
 
         Parameters:
-          - discovery_id: ID of the discovery process to retrieve devices from.
-          - task_id: ID of the task associated with the discovery process.
+          - jobs: The started discoveries.
 
-        Returns:
-          - result: True if all devices are reachable, False otherwise.
+        Yields:
+          - job: Each discovery as soon as it is complete, with its 'devices', or failed, with its 'error'.
+        Description:
+          Every round queries the pending discoveries concurrently, bounded by 'max_concurrent_requests',
+          and then waits once. The wait starts at 'dnac_task_poll_interval' and doubles every round up
+          to 30 seconds. A discovery still in progress after 'dnac_api_task_timeout' seconds is failed.
         """
+        pending_jobs = list(jobs)
+        start_time = time.time()
+        attempt = 0
+        while pending_jobs:
+            errors = self.execute_concurrently(
+                self.poll_discovery_job, pending_jobs, self.params.get("max_concurrent_requests"))
+            still_pending = []
+            for job, error in zip(pending_jobs, errors):
+                if error:
+                    job["error"] = error
+                    yield job
+                elif "devices" in job:
+                    yield job
+                else:
+                    still_pending.append(job)
 
-        params = dict(
-            id=discovery_id,
-            task_id=task_id,
-            headers=self.validated_config[0].get("headers"),
-        )
-        result = False
-        count = 0
-        while True:
-            response = self.dnac_apply['exec'](
-                family="discovery",
-                function='get_discovered_network_devices_by_discovery_id',
-                params=params,
-                op_modifies=True,
-            )
-            devices = response.response
-
-            self.log("Retrieved device details using the API 'get_discovered_network_devices_by_discovery_id': {0}".format(str(devices)), "DEBUG")
-            if all(res.get('reachabilityStatus') == 'Success' for res in devices):
-                result = True
-                self.log("All devices in the range are reachable", "INFO")
+            pending_jobs = still_pending
+            if not pending_jobs:
                 break
 
-            elif any(res.get('reachabilityStatus') == 'Success' for res in devices):
-                result = True
-                self.log("Some devices in the range are reachable", "INFO")
+            elapsed_time = time.time() - start_time
+            if elapsed_time > self.params.get("dnac_api_task_timeout"):
+                for job in pending_jobs:
+                    job["error"] = "Discovery with name {0} has not completed within {1} seconds".format(
+                        job.get("name"), int(elapsed_time))
+                    yield job
                 break
 
-            elif all(res.get('reachabilityStatus') != 'Success' for res in devices):
-                result = True
-                self.log("All devices are not reachable, but discovery is completed", "WARNING")
-                break
+            interval = self.get_backoff_interval(attempt)
+            self.log("{0} discovery(ies) still in progress, checking again after {1} seconds".format(
+                len(pending_jobs), interval), "DEBUG")
+            time.sleep(interval)
+            attempt += 1
 
-            count += 1
-            if count == 3:
-                break
+    def track_discovery_jobs(self):
+        """
+        Wait for all the started discoveries and report the devices they discovered.
+
+        Returns:
+          - self: The instance of the class with updated attributes.
+        Description:
+          The reachability of the discovered devices is logged as each discovery completes. The module
+          fails once all the discoveries are tracked if any of them failed.
+        """
+        jobs, self.discovery_jobs = self.discovery_jobs, []
+        if not jobs:
+            return self
 
-            time.sleep(3)
+        errors = []
+        discoveries = []
+        for job in self.watch_discovery_jobs(jobs):
+            if job.get("error"):
+                self.log(job.get("error"), "CRITICAL")
+                errors.append(job.get("error"))
+                continue
+
+            devices = job.get("devices")
+            for device in devices:
+                self.log("Discovery '{0}' found the device {1} with the reachability status '{2}'".format(
+                    job.get("name"), device.get("managementIpAddress"), device.get("reachabilityStatus")), "INFO")
+
+            reachable_count = len([device for device in devices if device.get('reachabilityStatus') == 'Success'])
+            if not devices or reachable_count == len(devices):
+                self.log("All devices of the discovery '{0}' are reachable".format(job.get("name")), "INFO")
+            elif reachable_count:
+                self.log("Some devices of the discovery '{0}' are reachable".format(job.get("name")), "INFO")
+            else:
+                self.log("All devices are not reachable, but discovery '{0}' is completed".format(job.get("name")), "WARNING")
+
+            self.log('Discovery network device with id {0} got completed'.format(job.get("discovery_id")), "INFO")
+            self.result.update(dict(
+                discovery_task=job.get("task"),
+                discovery_range=job.get("discovery"),
+                discovery_device_info=devices
+            ))
+            discoveries.append(dict(
+                discovery_name=job.get("name"),
+                discovery_id=job.get("discovery_id"),
+                task_id=job.get("task_id"),
+                devices=devices
+            ))
+
+        if discoveries:
+            self.result["changed"] = True
+            self.result["discoveries"] = discoveries
 
-        if not result:
-            msg = 'Discovery network device with id {0} has not completed'.format(discovery_id)
-            self.log(msg, "CRITICAL")
-            self.module.fail_json(msg=msg)
+        if errors:
+            self.msg = " ".join(errors)
+            self.status = "failed"
+            return self
 
-        self.log('Discovery network device with id {0} got completed'.format(discovery_id), "INFO")
-        self.result.update(dict(discovery_device_info=devices))
-        return result
+        self.result['msg'] = "Discovery Created Successfully"
+        self.result['diff'] = self.validated_config
+        self.log(self.result['msg'], "INFO")
+        self.status = "success"
+        return self
 
     def get_exist_discovery(self):
         """
@@ -1611,10 +1649,10 @@ class Discovery(DnacBase):
 
     def get_diff_merged(self):
         """
-        Retrieve the information of devices discovered by a specific discovery
-        process in the Cisco Catalyst Center, delete existing discoveries if they exist,
-        and create a new discovery. The function also updates various
-        attributes of the class instance.
+        Delete the existing discovery with the same name if it exists and start
+        a new discovery in the Cisco Catalyst Center. The started discovery is
+        tracked with the discoveries of the other config entries by
+        'track_discovery_jobs'.
 
         Returns:
           - self: The instance of the class with updated attributes.
@@ -1631,15 +1669,16 @@ class Discovery(DnacBase):
 
         discovery_task_id = self.create_discovery(
             ip_address_list=ip_address_list)
-        complete_discovery = self.get_merged_task_status(task_id=discovery_task_id)
-        discovery_task_info = self.get_discoveries_by_range_until_success()
-        result = self.get_discovery_device_info(discovery_id=discovery_task_info.get('id'))
-        self.result["changed"] = True
-        self.result['msg'] = "Discovery Created Successfully"
-        self.result['diff'] = self.validated_config
+        self.discovery_jobs.append(dict(
+            name=self.current_config.get("discovery_name"),
+            task_id=discovery_task_id,
+            headers=self.current_config.get("headers")
+        ))
         self.result['response'] = discovery_task_id
-        self.result.update(dict(msg='Discovery Created Successfully'))
-        self.log(self.result['msg'], "INFO")
+        self.msg = "Discovery {0} started with the task id {1}".format(
+            self.current_config.get("discovery_name"), discovery_task_id)
+        self.log(self.msg, "INFO")
+        self.status = "success"
         return self
 
     def get_diff_deleted(self):
@@ -1653,7 +1692,7 @@ class Discovery(DnacBase):
           - self: The instance of the class with updated attributes.
         """
 
-        if self.validated_config[0].get("delete_all"):
+        if self.current_config.get("delete_all"):
             count_discoveries = self.dnac_apply['exec'](
                 family="discovery",
                 function="get_count_of_all_discovery_jobs",
@@ -1662,7 +1701,7 @@ class Discovery(DnacBase):
                 msg = "There are no discoveries present in the Discovery Dashboard for deletion"
                 self.result['msg'] = msg
                 self.log(msg, "WARNING")
-                self.result['response'] = self.validated_config[0]
+                self.result['response'] = self.current_config
                 return self
 
             delete_all_response = self.dnac_apply['exec'](
@@ -1678,7 +1717,7 @@ class Discovery(DnacBase):
             exist_discovery = self.get_exist_discovery()
             if not exist_discovery:
                 self.result['msg'] = "Discovery {0} Not Found".format(
-                    self.validated_config[0].get("discovery_name"))
+                    self.current_config.get("discovery_name"))
                 self.log(self.result['msg'], "ERROR")
                 return self
 
@@ -1711,8 +1750,17 @@ class Discovery(DnacBase):
         self.log("Current State (have): {0}".format(str(self.have)), "INFO")
         self.log("Desired State (want): {0}".format(str(config)), "INFO")
         # Code to validate Cisco Catalyst Center config for merged state
-        discovery_task_info = self.get_discoveries_by_range_until_success()
-        discovery_id = discovery_task_info.get('id')
+        discovery_name = config.get('discovery_name')
+        discovery_id = None
+        for discovery in self.result.get("discoveries", []):
+            if discovery.get("discovery_name") == discovery_name:
+                discovery_id = discovery.get("discovery_id")
+
+        if not discovery_id:
+            self.log("Requested Discovery with name {0} is not completed".format(discovery_name), "WARNING")
+            self.status = "success"
+            return self
+
         params = dict(
             id=discovery_id
         )
@@ -1722,7 +1770,6 @@ class Discovery(DnacBase):
             params=params,
             op_modifies=True,
         )
-        discovery_name = config.get('discovery_name')
         if response:
             self.log("Requested Discovery with name {0} is completed".format(discovery_name), "INFO")
 
@@ -1792,6 +1839,7 @@ def main():
                     'config_verify': {"type": 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'max_concurrent_requests': {'type': 'int', 'default': 5},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
@@ -1821,8 +1869,13 @@ def main():
     ccc_discovery.validate_input(state=state).check_return_status()
     for config in ccc_discovery.validated_config:
         ccc_discovery.reset_values()
+        ccc_discovery.current_config = config
         ccc_discovery.get_diff_state_apply[state]().check_return_status()
-        if config_verify:
+
+    ccc_discovery.track_discovery_jobs().check_return_status()
+    if config_verify:
+        for config in ccc_discovery.validated_config:
+            ccc_discovery.current_config = config
             ccc_discovery.verify_diff_state_apply[state](config).check_return_status()
 
     module.exit_json(**ccc_discovery.result)
@@ -37,6 +37,31 @@ options:
     type: str
     choices: [ merged, deleted ]
     default: merged
+  event_catalog_cache_file:
+    description:
+      - Path of a local JSON file used to keep the event catalog of Cisco Catalyst Center (event IDs, names, categories,
+        types and severities) between runs.
+      - The cached catalog is keyed by the Cisco Catalyst Center host and version and is refreshed when the version changes
+        or the cache is older than I(event_catalog_cache_ttl).
+      - When not set, the event catalog is fetched once per run and is not persisted.
+    type: str
+    version_added: 6.32.0
+  event_catalog_cache_ttl:
+    description:
+      - Number of seconds for which a cached event catalog stays valid.
+      - Set to 0 to refresh the cached catalog on every run.
+    type: int
+    default: 86400
+    version_added: 6.32.0
+  event_name_fuzzy_match:
+    description:
+      - Set to true to use the closest event name of the event catalog when an event name given in the subscription
+        notifications does not match any event exactly.
+      - Every substituted event name is reported in the C(warnings) of the module result.
+      - When false, an event name without an exact match fails the module with the closest event name as a suggestion.
+    type: bool
+    default: false
+    version_added: 6.32.0
   config:
     description: List containing the subscription configuration for events, notification on site through one or more channels.
     type: list
@@ -521,6 +546,11 @@ notes:
     events.Events.update_email_event_subscription,
     events.Events.delete_event_subscriptions
 
+  - Added 'event_catalog_cache_file' and 'event_catalog_cache_ttl' options in v6.32.0. Event names given in the
+    subscription notifications are resolved against the cached event catalog; a name that does not match any event
+    exactly fails the module with the closest event name as a suggestion, unless 'event_name_fuzzy_match' is set.
+  - Added 'event_name_fuzzy_match' option in v6.32.0.
+
 """
 
 EXAMPLES = r"""
@@ -831,6 +861,28 @@ EXAMPLES = r"""
           events: ["AP Flap", "AP Reboot Crash"]
           destination: "Syslog Demo"
 
+- name: Creating Syslog Notification resolving the events from a locally cached event catalog.
+  cisco.dnac.events_and_notifications_workflow_manager:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log_level: "{{dnac_log_level}}"
+    dnac_log: False
+    state: merged
+    event_catalog_cache_file: "/tmp/catalyst_event_catalog.json"
+    event_catalog_cache_ttl: 43200
+    config:
+      - syslog_event_notification:
+          name: "Syslog Notification."
+          description: "Notification for syslog events subscription"
+          sites: ["Global/India", "Global/USA"]
+          events: ["AP Flap", "AP Reboot Crash"]
+          destination: "Syslog Demo"
+
 - name: Updating Syslog Notification with the list of names of subscribed events in the system.
   cisco.dnac.events_and_notifications_workflow_manager:
     dnac_host: "{{dnac_host}}"
@@ -937,6 +989,9 @@ from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
 )
+import difflib
+import json
+import os
 import re
 import time
 
@@ -950,6 +1005,9 @@ class Events(DnacBase):
         self.create_dest, self.update_dest, self.no_update_dest = [], [], []
         self.create_notification, self.update_notification, self.no_update_notification = [], [], []
         self.delete_dest, self.delete_notification, self.absent_dest, self.absent_notification = [], [], [], []
+        self.ccc_snapshot, self.snapshot_changes = {}, 0
+        self.event_catalog, self.event_catalog_from_cache = None, False
+        self.site_id_cache = {}
 
     def validate_input(self):
         """
@@ -1234,57 +1292,318 @@ class Events(DnacBase):
 
         return self
 
-    def get_syslog_destination_in_ccc(self, name):
+    def get_event_management_records(self, api_function, response_key=None, limit=100):
         """
-        Retrieve the details of syslog destinations present in Cisco Catalyst Center.
+        Retrieve every record returned by an 'event_management' listing API from Cisco Catalyst Center.
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            name (str): The name of the syslog destination to retrieve details for.
+            api_function (str): The name of the 'event_management' API function to call.
+            response_key (str, optional): The key holding the list of records when the API wraps them in a dictionary.
+            limit (int, optional): The number of records requested per page. Defaults to 100.
         Returns:
-            dict or None: A dictionary containing the details of syslog destination present in Cisco Catalyst Center.
-                If not present then it just return the None.
+            list: All the records returned by the API, or an empty list if there are none.
         Description:
-            This function queries Cisco Catalyst Center to retrieve the details of syslog destinations.
-            The response contains the status message indicating the syslog destinations present in Cisco Catalyst Center.
-            If no syslog destinations are found, it returns an empty string.
-            In case of any errors during the API call, an exception is raised with an error message.
+            This function walks the API page by page until a page holds fewer records than the limit, so the whole
+            collection is fetched with a handful of large requests instead of one filtered request per item. Responses
+            that cannot be parsed because Cisco Catalyst Center has no records are treated as an empty page.
         """
-        try:
-            response = self.dnac._exec(
-                family="event_management",
-                function='get_syslog_destination',
-                op_modifies=True,
-                params={"name": name}
+
+        records = []
+        offset = 0
+        expected_exception_msgs = [
+            "Expecting value: line 1 column 1",
+            "not iterable",
+            "has no attribute"
+        ]
+
+        while True:
+            params = {"offset": offset, "limit": limit}
+            try:
+                response = self.dnac._exec(
+                    family="event_management",
+                    function=api_function,
+                    params=params
+                )
+                self.log("Received API response from '{0}': {1}".format(api_function, str(response)), "DEBUG")
+            except Exception as e:
+                if any(msg in str(e) for msg in expected_exception_msgs):
+                    self.log("No more records returned by '{0}' at offset {1}.".format(api_function, offset), "DEBUG")
+                    break
+
+                self.status = "failed"
+                self.msg = "Error while retrieving the records from '{0}' in Cisco Catalyst Center: {1}".format(api_function, str(e))
+                self.log(self.msg, "ERROR")
+                self.result['response'] = self.msg
+                self.check_return_status()
+
+            if response_key and isinstance(response, dict):
+                response = response.get(response_key)
+
+            if not response or not isinstance(response, list):
+                break
+
+            records.extend(response)
+            if len(response) < limit:
+                break
+
+            offset += limit
+
+        self.log("Retrieved {0} record(s) from '{1}'.".format(len(records), api_function), "INFO")
+
+        return records
+
+    def get_ccc_snapshot(self, category):
+        """
+        Return the name-indexed snapshot of a destination or subscription category present in Cisco Catalyst Center.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            category (str): One of the categories defined in 'snapshot_apis', e.g. 'syslog_destinations'.
+        Returns:
+            dict: A dictionary mapping the name of each record in the category to its details.
+        Description:
+            Each category is loaded once with large pages and kept for the rest of the run, so looking up a
+            destination or subscription by name is a dictionary access rather than an API call. The snapshot
+            is dropped whenever a destination or notification has been created, updated or deleted since it
+            was loaded, so the verification step always works against the current state.
+        """
+
+        snapshot_apis = {
+            "syslog_destinations": ("get_syslog_destination", "statusMessage"),
+            "snmp_destinations": ("get_snmp_destination", None),
+            "webhook_destinations": ("get_webhook_destination", "statusMessage"),
+            "syslog_subscription_details": ("get_syslog_subscription_details", None),
+            "webhook_subscription_details": ("get_rest_webhook_subscription_details", None),
+            "email_subscription_details": ("get_email_subscription_details", None),
+            "syslog_event_subscriptions": ("get_syslog_event_subscriptions", None),
+            "webhook_event_subscriptions": ("get_rest_webhook_event_subscriptions", None),
+            "email_event_subscriptions": ("get_email_event_subscriptions", None),
+        }
+
+        changes = (
+            len(self.create_dest) + len(self.update_dest) + len(self.delete_dest) +
+            len(self.create_notification) + len(self.update_notification) + len(self.delete_notification)
+        )
+        if changes != self.snapshot_changes:
+            self.log("Configuration changed since the last snapshot was taken, discarding the cached records.", "DEBUG")
+            self.ccc_snapshot = {}
+            self.snapshot_changes = changes
+
+        if category not in self.ccc_snapshot:
+            api_function, response_key = snapshot_apis[category]
+            records = self.get_event_management_records(api_function, response_key)
+            self.ccc_snapshot[category] = dict(
+                (record.get("name"), record) for record in records if record.get("name")
             )
-            self.log("Received API response from 'get_syslog_destination': {0}".format(str(response)), "DEBUG")
-            response = response.get('statusMessage')
+            self.log("Loaded {0} '{1}' record(s) from Cisco Catalyst Center.".format(len(self.ccc_snapshot[category]), category), "INFO")
 
-            if not response:
-                self.log("There is no Syslog destination '{0}' present in Cisco Catalyst Center".format(name), "INFO")
-                return response
+        return self.ccc_snapshot[category]
 
-            return response
+    def load_event_catalog_cache(self):
+        """
+        Load the event catalog of the current Cisco Catalyst Center from the local cache file.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Returns:
+            dict or None: The cached catalog mapping the lower-cased event names to their details, or None if there is
+                no cache file, no entry for this host and version, or the entry is older than 'event_catalog_cache_ttl'.
+        Description:
+            The cache file holds one entry per Cisco Catalyst Center host and version, so an upgrade of the controller
+            always triggers a fresh download of the event catalog. A cache file that cannot be read is ignored.
+        """
 
-        except Exception as e:
-            expected_exception_msgs = [
-                "Expecting value: line 1 column 1",
-                "not iterable",
-                "has no attribute"
-            ]
+        cache_file = self.params.get("event_catalog_cache_file")
+        if not cache_file or not os.path.isfile(cache_file):
+            return None
 
-            for msg in expected_exception_msgs:
-                if msg in str(e):
-                    self.log(
-                        "An exception occurred while checking for the Syslog destination with the name '{0}'. "
-                        "It was not found in Cisco Catalyst Center.".format(name), "WARNING"
-                    )
-                    return None
+        try:
+            with open(cache_file, "r") as file:
+                cache = json.load(file)
+        except (IOError, OSError, ValueError) as e:
+            self.log("Unable to read the event catalog cache '{0}', ignoring it: {1}".format(cache_file, str(e)), "WARNING")
+            return None
 
-            self.status = "failed"
-            self.msg = "Error while getting the details of Syslog destination present in Cisco Catalyst Center: {0}".format(str(e))
-            self.log(self.msg, "ERROR")
-            self.result['response'] = self.msg
-            self.check_return_status()
+        cache_key = "{0}|{1}".format(self.params.get("dnac_host"), self.get_ccc_version())
+        entry = cache.get(cache_key) if isinstance(cache, dict) else None
+        if not entry:
+            self.log("No cached event catalog found for '{0}' in '{1}'.".format(cache_key, cache_file), "INFO")
+            return None
+
+        age = time.time() - entry.get("timestamp", 0)
+        if age > self.params.get("event_catalog_cache_ttl", 86400):
+            self.log("The cached event catalog for '{0}' expired {1} second(s) ago.".format(
+                cache_key, int(age - self.params.get("event_catalog_cache_ttl", 86400))), "INFO")
+            return None
+
+        self.log("Using the cached event catalog for '{0}' from '{1}'.".format(cache_key, cache_file), "INFO")
+
+        return dict((event.get("name").lower(), event) for event in entry.get("events", []) if event.get("name"))
+
+    def save_event_catalog_cache(self, event_catalog):
+        """
+        Store the event catalog of the current Cisco Catalyst Center in the local cache file.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            event_catalog (dict): The catalog mapping the lower-cased event names to their details.
+        Returns:
+            None
+        Description:
+            Entries of other hosts and versions already present in the cache file are kept. The file is written to a
+            temporary path first and then moved in place, so a concurrent run never reads a partially written cache.
+            Failures to write the cache are logged and otherwise ignored.
+        """
+
+        cache_file = self.params.get("event_catalog_cache_file")
+        if not cache_file:
+            return
+
+        cache = {}
+        if os.path.isfile(cache_file):
+            try:
+                with open(cache_file, "r") as file:
+                    cache = json.load(file)
+            except (IOError, OSError, ValueError):
+                cache = {}
+
+        if not isinstance(cache, dict):
+            cache = {}
+
+        cache_key = "{0}|{1}".format(self.params.get("dnac_host"), self.get_ccc_version())
+        cache[cache_key] = {
+            "timestamp": time.time(),
+            "events": list(event_catalog.values())
+        }
+
+        temp_file = "{0}.{1}.tmp".format(cache_file, os.getpid())
+        try:
+            with open(temp_file, "w") as file:
+                json.dump(cache, file)
+            os.replace(temp_file, cache_file)
+            self.log("Stored {0} event(s) for '{1}' in the event catalog cache '{2}'.".format(
+                len(event_catalog), cache_key, cache_file), "INFO")
+        except (IOError, OSError) as e:
+            self.log("Unable to write the event catalog cache '{0}': {1}".format(cache_file, str(e)), "WARNING")
+
+    def get_event_catalog(self, refresh=False):
+        """
+        Return the event catalog of Cisco Catalyst Center indexed by event name.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            refresh (bool, optional): Whether to ignore the cache file and download the catalog again. Defaults to False.
+        Returns:
+            dict: A dictionary mapping the lower-cased name of each event to its 'name', 'eventId', 'category',
+                'type' and 'severity'.
+        Description:
+            The catalog is taken from the local cache file when it holds a valid entry for this host and version.
+            Otherwise the event artifacts are fetched once with large pages, reduced to the fields needed to
+            resolve events and written back to the cache file.
+        """
+
+        if self.event_catalog is not None and not refresh:
+            return self.event_catalog
+
+        event_catalog = None if refresh else self.load_event_catalog_cache()
+        self.event_catalog_from_cache = event_catalog is not None
+
+        if event_catalog is None:
+            event_catalog = {}
+            for artifact in self.get_event_management_records("get_eventartifacts"):
+                event_payload = artifact.get("eventPayload") or {}
+                name = artifact.get("name")
+                event_id = event_payload.get("eventId") or artifact.get("eventId")
+                if not name or not event_id:
+                    continue
+
+                event_catalog[name.lower()] = {
+                    "name": name,
+                    "eventId": event_id,
+                    "category": event_payload.get("category"),
+                    "type": event_payload.get("type"),
+                    "severity": event_payload.get("severity"),
+                }
+
+            self.save_event_catalog_cache(event_catalog)
+
+        self.event_catalog = event_catalog
+        self.log("Indexed {0} event(s) from the Cisco Catalyst Center event catalog.".format(len(event_catalog)), "INFO")
+
+        return self.event_catalog
+
+    def get_closest_event_name(self, event_name):
+        """
+        Find the event name of the Cisco Catalyst Center event catalog closest to the given name.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            event_name (str): The name of the event as given in the playbook.
+        Returns:
+            str or None: The catalog name of the closest event, or None if no event name is close enough.
+        """
+
+        event_catalog = self.get_event_catalog()
+        close_matches = difflib.get_close_matches(event_name.lower(), list(event_catalog), n=1, cutoff=0.85)
+        if not close_matches:
+            return None
+
+        return event_catalog[close_matches[0]].get("name")
+
+    def resolve_event_name(self, event_name):
+        """
+        Resolve an event name given in the playbook to an event of the Cisco Catalyst Center event catalog.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            event_name (str): The name of the event as given in the playbook.
+        Returns:
+            dict or None: The catalog entry of the event, or None if no event matches the given name.
+        Description:
+            The name is matched exactly, ignoring case. When the catalog was loaded from the cache file and has
+            no such event, it is downloaded again in case the event was added since the cache was written.
+            The closest event name is used instead only when 'event_name_fuzzy_match' is set, and the
+            substitution is then reported in the warnings of the result.
+        """
+
+        key = event_name.lower()
+        event_catalog = self.get_event_catalog()
+        if key not in event_catalog and self.event_catalog_from_cache:
+            self.log("Event '{0}' is not in the cached event catalog, refreshing it.".format(event_name), "INFO")
+            event_catalog = self.get_event_catalog(refresh=True)
+
+        if key in event_catalog:
+            return event_catalog[key]
+
+        if not self.params.get("event_name_fuzzy_match"):
+            return None
+
+        closest_name = self.get_closest_event_name(event_name)
+        if not closest_name:
+            return None
+
+        warning = "Event '{0}' not found in Cisco Catalyst Center, using the closest event '{1}' instead.".format(
+            event_name, closest_name)
+        self.log(warning, "WARNING")
+        self.result["warnings"].append(warning)
+
+        return event_catalog[closest_name.lower()]
+
+    def get_syslog_destination_in_ccc(self, name):
+        """
+        Retrieve the details of syslog destinations present in Cisco Catalyst Center.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            name (str): The name of the Syslog destination to retrieve details for.
+        Returns:
+            list or None: A list holding the details of the syslog destination present in Cisco Catalyst Center, or None if it is not present.
+        Description:
+            The lookup is answered from the 'syslog_destinations' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every destination.
+        """
+
+        record = self.get_ccc_snapshot("syslog_destinations").get(name)
+        if not record:
+            self.log("There is no Syslog destination with name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+            return None
+
+        self.log("Syslog destination '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+
+        return [record]
 
     def syslog_dest_needs_update(self, syslog_details, syslog_details_in_ccc):
         """
@@ -1475,61 +1794,22 @@ class Events(DnacBase):
         Retrieve the details of SNMP destinations present in Cisco Catalyst Center.
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            name (str): The name of the syslog destination to retrieve details for.
+            name (str): The name of the SNMP destination to retrieve details for.
         Returns:
-            dict or None: A dictionary containing the details of SNMP destination present in Cisco Catalyst Center.
-                If not present then it just return the None.
+            dict or None: A dictionary containing the details of SNMP destination present in Cisco Catalyst Center, or None if it is not present.
         Description:
-            This function queries Cisco Catalyst Center to retrieve the details of SNMP destinations.
-            It utilizes the 'event_management' API endpoint with the 'get_snmp_destination' function.
-            The response contains information about the SNMP destinations present in Cisco Catalyst Center.
-            If no SNMP destinations are found, it returns an empty dictionary.
+            The lookup is answered from the 'snmp_destinations' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every destination.
         """
 
-        try:
-            offset = 0
-            limit = 10
-            while True:
-                try:
-                    response = self.dnac._exec(
-                        family="event_management",
-                        function='get_snmp_destination',
-                        params={
-                            "offset": offset * limit,
-                            "limit": limit
-                        }
-                    )
-                    offset = offset + 1
-                    self.log("Received API response from 'get_snmp_destination': {0}".format(str(response)), "DEBUG")
-
-                    if not response:
-                        self.log("There is no SNMP destination with name '{0}' present in Cisco Catalyst Center".format(name), "INFO")
-                        return response
-
-                    for destination in response:
-                        if destination.get("name") == name:
-                            self.log("SNMP Destination '{0}' present in Cisco Catalyst Center".format(name), "INFO")
-                            return destination
-                    time.sleep(1)
-                except Exception as e:
-                    expected_exception_msgs = [
-                        "Expecting value: line 1 column 1",
-                        "not iterable",
-                        "has no attribute"
-                    ]
-                    for msg in expected_exception_msgs:
-                        if msg in str(e):
-                            self.log(
-                                "An exception occurred while checking for the SNMP destination with the name '{0}'. "
-                                "It was not found in Cisco Catalyst Center.".format(name), "WARNING"
-                            )
-                            return None
+        record = self.get_ccc_snapshot("snmp_destinations").get(name)
+        if not record:
+            self.log("There is no SNMP destination with name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+            return None
 
-        except Exception as e:
-            self.status = "failed"
-            self.msg = "Error while getting the details of SNMP destination present in Cisco Catalyst Center: {0}".format(str(e))
-            self.log(self.msg, "ERROR")
-            self.check_return_status()
+        self.log("SNMP destination '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+
+        return record
 
     def collect_snmp_playbook_params(self, snmp_details):
         """
@@ -1833,62 +2113,22 @@ class Events(DnacBase):
         Retrieve details of Rest Webhook destinations present in Cisco Catalyst Center.
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            name (str): The name of the syslog destination to retrieve details for.
+            name (str): The name of the Webhook destination to retrieve details for.
         Returns:
-            dict: A dictionary containing details of Rest Webhook destination present in Cisco Catalyst Center,
-                or None if no Rest Webhook destinations are found.
+            dict or None: A dictionary containing details of Rest Webhook destination present in Cisco Catalyst Center, or None if it is not present.
         Description:
-            This function retrieves the details of Rest Webhook destinations present in Cisco Catalyst Center
-            using the 'event_management' API endpoint with the 'get_webhook_destination' function.
-            If an error occurs during the retrieval process, it logs the error message and raises an Exception.
+            The lookup is answered from the 'webhook_destinations' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every destination.
         """
 
-        try:
-            offset = 0
-            limit = 10
-            while True:
-                try:
-                    response = self.dnac._exec(
-                        family="event_management",
-                        function='get_webhook_destination',
-                        params={
-                            "offset": offset * limit,
-                            "limit": limit
-                        }
-                    )
-                    offset = offset + 1
-                    self.log("Received API response from 'get_webhook_destination': {0}".format(str(response)), "DEBUG")
-                    response = response.get('statusMessage')
-
-                    if not response:
-                        self.log("There is no Rest Webhook destination present in Cisco Catalyst Center", "INFO")
-                        return response
-
-                    for destination in response:
-                        if destination.get("name") == name:
-                            self.log("Webhook Destination '{0}' present in Cisco Catalyst Center".format(name), "INFO")
-                            return destination
+        record = self.get_ccc_snapshot("webhook_destinations").get(name)
+        if not record:
+            self.log("There is no Webhook destination with name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+            return None
 
-                    time.sleep(1)
-                except Exception as e:
-                    expected_exception_msgs = [
-                        "Expecting value: line 1 column 1",
-                        "not iterable",
-                        "has no attribute"
-                    ]
-                    for msg in expected_exception_msgs:
-                        if msg in str(e):
-                            self.log(
-                                "An exception occurred while checking for the Webhook destination with the name '{0}'. "
-                                "It was not found in Cisco Catalyst Center.".format(name), "WARNING"
-                            )
-                            return None
+        self.log("Webhook destination '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
 
-        except Exception as e:
-            self.status = "failed"
-            self.msg = "Error while getting the details of Webhook destination(s) present in Cisco Catalyst Center: {0}".format(str(e))
-            self.log(self.msg, "ERROR")
-            self.check_return_status()
+        return record
 
     def collect_webhook_playbook_params(self, webhook_details):
         """
@@ -2768,104 +3008,42 @@ class Events(DnacBase):
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
             name (str): The name of the Syslog Event Notification to retrieve details for.
         Returns:
-            dict or None: A dictionary containing the details of the Syslog Event Notification subscription if found.
-                        Returns None if no subscription is found or if an error occurs during the API call.
+            list or None: A list holding the details of the Syslog Event Notification subscription if found, otherwise None.
         Description:
-            This function calls an API to fetch the details of a specified Syslog Event Notification subscription. If the
-            subscription exists, it returns the response containing the subscription details. If no subscription is found
-            or an error occurs, it logs the appropriate message and handles the exception accordingly.
+            The lookup is answered from the 'syslog_event_subscriptions' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every notification.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="event_management",
-                function='get_syslog_event_subscriptions',
-                op_modifies=True,
-                params={"name": name}
-            )
-            self.log("Received API response from 'get_syslog_event_subscriptions': {0}".format(str(response)), "DEBUG")
+        record = self.get_ccc_snapshot("syslog_event_subscriptions").get(name)
+        if not record:
+            self.log("There is no Syslog Event Notification with name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+            return None
 
-            if not response:
-                self.log("There is no Syslog Event Notification with given name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
-                return response
+        self.log("Syslog Event Notification '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
 
-            return response
-
-        except Exception as e:
-            expected_exception_msgs = [
-                "Expecting value: line 1 column 1",
-                "not iterable",
-                "has no attribute"
-            ]
-            for msg in expected_exception_msgs:
-                if msg in str(e):
-                    self.log(
-                        "An exception occurred while checking for the Syslog Event Notification with the name '{0}'. "
-                        "It was not found in Cisco Catalyst Center.".format(name), "WARNING"
-                    )
-                    return None
-
-            self.status = "failed"
-            self.msg = (
-                "An error occurred while retrieving Syslog Event subscription Notification details "
-                "from Cisco Catalyst Center: {0}".format(repr(e))
-            )
-            self.log(self.msg, "ERROR")
-            self.result['response'] = self.msg
-            self.check_return_status()
+        return [record]
 
     def get_syslog_subscription_detail(self, destination):
         """
         Retrieves the details of a specific Syslog destination subscription from the Cisco Catalyst Center.
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            destination (str): The name of the Syslog destination for which details needs to be fetched.
+            destination (str): The name of the Syslog subscription destination to retrieve details for.
         Returns:
-            dict or list: A dictionary containing the details of the Syslog destination subscription if found.
-                        Returns an empty list if no destination is found or if an error occurs during the API call.
+            dict or None: A dictionary containing the details of the Syslog destination subscription if found, otherwise None.
         Description:
-            This function calls an API to fetch the details of all Syslog destination from the Cisco Catalyst Center.
-            It then searches for a subscription that matches the given `destination`. If a match is found, it returns
-            details of the matching subscription. If no match is found or if an error occurs, it logs the appropriate message
-            and handles the exception accordingly.
+            The lookup is answered from the 'syslog_subscription_details' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every notification.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="event_management",
-                function='get_syslog_subscription_details',
-                op_modifies=True,
-                params={"name": destination}
-            )
-            self.log("Received API response from 'get_syslog_subscription_details': {0}".format(str(response)), "DEBUG")
+        record = self.get_ccc_snapshot("syslog_subscription_details").get(destination)
+        if not record:
+            self.log("There is no Syslog subscription destination with name '{0}' present in Cisco Catalyst Center.".format(destination), "INFO")
+            return None
 
-            if not response:
-                self.log("Syslog destination with the name '{0}' not found in Cisco Catalyst Center.".format(destination), "INFO")
-                return response
-
-            return response[0]
-
-        except Exception as e:
-            expected_exception_msgs = [
-                "Expecting value: line 1 column 1",
-                "not iterable",
-                "has no attribute"
-            ]
-            for msg in expected_exception_msgs:
-                if msg in str(e):
-                    self.log(
-                        "An exception occurred while checking for the Syslog destination with the name '{0}'. "
-                        "It was not found in Cisco Catalyst Center.".format(destination), "WARNING"
-                    )
-                    return None
+        self.log("Syslog subscription destination '{0}' present in Cisco Catalyst Center.".format(destination), "INFO")
 
-            self.status = "failed"
-            self.msg = (
-                "Error while getting the details of the Syslog Subscription with the given name '{0}'"
-                " from Cisco Catalyst Center: {1}".format(destination, repr(e))
-            )
-            self.log(self.msg, "ERROR")
-            self.check_return_status()
+        return record
 
     def is_valid_event_types(self, event_types):
         """
@@ -2882,7 +3060,7 @@ class Events(DnacBase):
             and logs an error message. The function returns the instance itself to allow for method chaining.
         """
 
-        defined_types = ["SECURITY", "APP", "NETWORK", "SYSTEM", "AUDIT_LOG", "INTEGRATIONS"]
+        defined_types = {"SECURITY", "APP", "NETWORK", "SYSTEM", "AUDIT_LOG", "INTEGRATIONS"}
         invalid_event_types = []
 
         if not isinstance(event_types, list):
@@ -2923,7 +3101,7 @@ class Events(DnacBase):
             sets an appropriate error message. It also logs the error message.
         """
 
-        categories = ["TASK_FAILURE", "TASK_COMPLETE", "WARN", "TASK_PROGRESS", "QUERY", "COMMAND", "ALERT", "INFO", "CONVERSATION", "ERROR"]
+        categories = {"TASK_FAILURE", "TASK_COMPLETE", "WARN", "TASK_PROGRESS", "QUERY", "COMMAND", "ALERT", "INFO", "CONVERSATION", "ERROR"}
         invalid_event_categories = []
 
         if not isinstance(event_categories, list):
@@ -3030,41 +3208,61 @@ class Events(DnacBase):
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
             events (list of str): A list of event names for which the event IDs need to be retrieved.
         Returns:
-            list of str: A list of event IDs corresponding to the provided event names. If an event name is not
-                    found, it is skipped.
+            list of str: A list of event IDs corresponding to the provided event names.
         Description:
-            This function iterates over a list of event names and calls an API to fetch the details of each event from
-            the Cisco Catalyst Center. If the event is found, its event ID is extracted and added to the list of event IDs.
-            The function logs messages for successfulAPI responses, missing events, and any errors encountered during the
-            process. The final list of event IDs is returned.
+            This function resolves each event name against the event catalog, which is loaded once per run or taken
+            from the local event catalog cache. When the catalog is empty, the name is searched with
+            'get_eventartifacts' and only an event with the same name is accepted. If any event name cannot be
+            resolved, the operation fails and the message suggests the closest event name of the catalog.
         """
 
-        event_ids = []
+        event_ids, missing_events = [], []
 
         for event_name in events:
-            try:
-                response = self.dnac._exec(
-                    family="event_management",
-                    function='get_eventartifacts',
-                    op_modifies=True,
-                    params={"search": event_name}
-                )
-                self.log("Received API response from 'get_eventartifacts': {0}".format(str(response)), "DEBUG")
+            event = self.resolve_event_name(event_name)
+            if event:
+                event_ids.append(event.get("eventId"))
+                continue
+
+            if not self.get_event_catalog():
+                try:
+                    response = self.dnac._exec(
+                        family="event_management",
+                        function='get_eventartifacts',
+                        op_modifies=True,
+                        params={"search": event_name}
+                    )
+                    self.log("Received API response from 'get_eventartifacts': {0}".format(str(response)), "DEBUG")
+
+                    for artifact in response or []:
+                        event_payload = artifact.get('eventPayload') or {}
+                        if str(artifact.get("name")).lower() == event_name.lower() and event_payload.get('eventId'):
+                            event_ids.append(event_payload.get('eventId'))
+                            break
+                    else:
+                        self.log("There is no Event with name '{0}' present in Cisco Catalyst Center.".format(event_name), "INFO")
+                        missing_events.append(event_name)
 
-                if not response:
-                    self.log("There is no Event with name '{0}' present in Cisco Catalyst Center.".format(event_name), "INFO")
                     continue
 
-                response = response[0]
-                event_payload = response.get('eventPayload')
-                if event_payload:
-                    event_id = event_payload.get('eventId')
-                    event_ids.append(event_id)
+                except Exception as e:
+                    self.msg = """Error while getting the details of Event with given name '{0}' present in
+                            Cisco Catalyst Center: {1}""".format(event_name, str(e))
+                    self.log(self.msg, "ERROR")
 
-            except Exception as e:
-                self.msg = """Error while getting the details of Event with given name '{0}' present in
-                        Cisco Catalyst Center: {1}""".format(event_name, str(e))
-                self.log(self.msg, "ERROR")
+            missing_events.append(event_name)
+
+        if missing_events:
+            not_found = []
+            for event_name in missing_events:
+                closest_name = self.get_closest_event_name(event_name)
+                if closest_name:
+                    not_found.append("'{0}' (did you mean '{1}'?)".format(event_name, closest_name))
+                else:
+                    not_found.append("'{0}'".format(event_name))
+
+            self.msg = "Event(s) not found in Cisco Catalyst Center: {0}.".format(", ".join(not_found))
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
         return event_ids
 
@@ -3080,12 +3278,16 @@ class Events(DnacBase):
         Description:
             This function iterates over a list of site names and calls an API to fetch the details of each site
             from the Cisco Catalyst Center. If the site is found, its site ID is extracted and added to the list
-            of site IDs. The function logs messages for successful API responses, missing sites, and any errors
-            encountered during the process. The final list of site IDs is returned.
+            of site IDs. Resolved site IDs are cached, so a site shared by several notifications is only looked up
+            once. The final list of site IDs is returned.
         """
 
         site_ids = []
         for site in sites:
+            if site in self.site_id_cache:
+                site_ids.append(self.site_id_cache[site])
+                continue
+
             try:
                 response = self.dnac._exec(
                     family="sites",
@@ -3102,6 +3304,7 @@ class Events(DnacBase):
                 if not site_id:
                     self.log("Site '{0}' found, but no ID available in the response.".format(site), "WARNING")
                     continue
+                self.site_id_cache[site] = site_id
                 site_ids.append(site_id)
 
             except Exception as e:
@@ -3583,97 +3786,42 @@ class Events(DnacBase):
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
             name (str): The name of the Webhook Event Notification to retrieve details for.
         Returns:
-            dict or None: A dictionary containing the details of the Webhook Event Notification subscription if found.
-                        Returns None if no subscription is found or if an error occurs during the API call.
+            list or None: A list holding the details of the Webhook Event Notification subscription if found, otherwise None.
         Description:
-            This function calls an API to fetch the details of a specified Webhook Event Notification subscription. If the
-            subscription exists, it returns the response containing the subscription details. If no subscription is found
-            or an error occurs, it logs the appropriate message and handles the exception accordingly.
+            The lookup is answered from the 'webhook_event_subscriptions' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every notification.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="event_management",
-                function='get_rest_webhook_event_subscriptions',
-                op_modifies=True,
-                params={"name": name}
-            )
-            self.log("Received API response from 'get_rest_webhook_event_subscriptions': {0}".format(str(response)), "DEBUG")
-
-            if not response:
-                self.log("There is no Webhook Event Notification with given name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
-                return response
-
-            return response
+        record = self.get_ccc_snapshot("webhook_event_subscriptions").get(name)
+        if not record:
+            self.log("There is no Webhook Event Notification with name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+            return None
 
-        except Exception as e:
-            expected_exception_msgs = [
-                "Expecting value: line 1 column 1",
-                "not iterable",
-                "has no attribute"
-            ]
-            for msg in expected_exception_msgs:
-                if msg in str(e):
-                    self.log(
-                        "An exception occurred while checking for the Webhook Event Notification with the name '{0}'. "
-                        "It was not found in Cisco Catalyst Center.".format(name), "WARNING"
-                    )
-                    return None
+        self.log("Webhook Event Notification '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
 
-            self.status = "failed"
-            self.log("Error while retrieving Webhook Event Notification details: {0}".format(str(e)), "ERROR")
-            self.log(self.msg, "ERROR")
-            self.check_return_status()
+        return [record]
 
     def get_webhook_subscription_detail(self, destination):
         """
         Retrieves the details of a specific webhook destination subscription from the Cisco Catalyst Center.
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            destination (str): The name of the webhook destination for which details needs to be fetched.
+            destination (str): The name of the Webhook subscription destination to retrieve details for.
         Returns:
-            dict or list: A dictionary containing the details of the webhook destination subscription if found.
-                        Returns an empty list if no destination is found or if an error occurs during the API call.
+            dict or None: A dictionary containing the details of the webhook destination subscription if found, otherwise None.
         Description:
-            This function calls an API to fetch the details of all webhook destination from the Cisco Catalyst Center.
-            It then searches for a subscription that matches the given `destination`. If a match is found, it returns
-            details of the matching subscription. If no match is found or if an error occurs, it logs the appropriate message
-            and handles the exception accordingly.
+            The lookup is answered from the 'webhook_subscription_details' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every notification.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="event_management",
-                function='get_rest_webhook_subscription_details',
-                op_modifies=True,
-                params={"name": destination}
-            )
-            self.log("Received API response from 'get_rest_webhook_subscription_details': {0}".format(str(response)), "DEBUG")
-            if not response:
-                self.log("Webhook destination with the name '{0}' not found in Cisco Catalyst Center.".format(destination), "INFO")
-                return response
+        record = self.get_ccc_snapshot("webhook_subscription_details").get(destination)
+        if not record:
+            self.log("There is no Webhook subscription destination with name '{0}' present in Cisco Catalyst Center.".format(destination), "INFO")
+            return None
 
-            return response[0]
+        self.log("Webhook subscription destination '{0}' present in Cisco Catalyst Center.".format(destination), "INFO")
 
-        except Exception as e:
-            expected_exception_msgs = [
-                "Expecting value: line 1 column 1",
-                "not iterable",
-                "has no attribute"
-            ]
-            for msg in expected_exception_msgs:
-                if msg in str(e):
-                    self.log(
-                        "An exception occurred while checking for the Webhook destination with the name '{0}'. "
-                        "It was not found in Cisco Catalyst Center.".format(destination), "WARNING"
-                    )
-                    return None
-
-            self.status = "failed"
-            self.msg = """Error while getting the details of webhook Subscription with given name '{0}' present in
-                    Cisco Catalyst Center: {1}""".format(destination, str(e))
-            self.log(self.msg, "ERROR")
-            self.check_return_status()
+        return record
 
     def collect_webhook_notification_playbook_params(self, webhook_notification_details):
         """
@@ -4038,98 +4186,42 @@ class Events(DnacBase):
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
             name (str): The name of the Email Event Notification to retrieve details for.
         Returns:
-            dict or None: A dictionary containing the details of the email Event Notification subscription if found.
-                        Returns None if no subscription is found or if an error occurs during the API call.
+            list or None: A list holding the details of the Email Event Notification subscription if found, otherwise None.
         Description:
-            This function calls an API to fetch the details of a specified email Event Notification subscription. If the
-            subscription exists, it returns the response containing the subscription details. If no subscription is found
-            or an error occurs, it logs the appropriate message and handles the exception accordingly.
+            The lookup is answered from the 'email_event_subscriptions' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every notification.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="event_management",
-                function='get_email_event_subscriptions',
-                op_modifies=True,
-                params={"name": name}
-            )
-            self.log("Received API response from 'get_email_event_subscriptions': {0}".format(str(response)), "DEBUG")
-
-            if not response:
-                self.log("There is no Email Event Notification with given name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
-                return response
-
-            return response
+        record = self.get_ccc_snapshot("email_event_subscriptions").get(name)
+        if not record:
+            self.log("There is no Email Event Notification with name '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
+            return None
 
-        except Exception as e:
-            expected_exception_msgs = [
-                "Expecting value: line 1 column 1",
-                "not iterable",
-                "has no attribute"
-            ]
-            for msg in expected_exception_msgs:
-                if msg in str(e):
-                    self.log(
-                        "An exception occurred while checking for the Email Event Notification with the name '{0}'. "
-                        "It was not found in Cisco Catalyst Center.".format(name), "WARNING"
-                    )
-                    return None
+        self.log("Email Event Notification '{0}' present in Cisco Catalyst Center.".format(name), "INFO")
 
-            self.msg = "Exception occurred while retrieving Email Event Subscription Notification: {0}".format(str(e))
-            self.log(self.msg, "ERROR")
-            self.check_return_status()
+        return [record]
 
     def get_email_subscription_detail(self, instance):
         """
         Retrieves the details of a specific email destination subscription from the Cisco Catalyst Center.
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            instance (str): The name of the email destination for which details needs to be fetched.
+            instance (str): The name of the Email subscription instance to retrieve details for.
         Returns:
-            dict or list: A dictionary containing the details of the email destination subscription if found.
-                        Returns an empty list if no destination is found or if an error occurs during the API call.
+            dict or None: A dictionary containing the details of the email destination subscription if found, otherwise None.
         Description:
-            This function calls an API to fetch the details of all email destination from the Cisco Catalyst Center.
-            It then searches for a subscription that matches the given `instance`. If a match is found, it returns
-            details of the matching subscription. If no match is found or if an error occurs, it logs the appropriate message
-            and handles the exception accordingly.
+            The lookup is answered from the 'email_subscription_details' snapshot, which is loaded once with large pages,
+            instead of querying Cisco Catalyst Center for every notification.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="event_management",
-                function='get_email_subscription_details',
-                op_modifies=True,
-                params={"name": instance}
-            )
-            self.log("Received API response from 'get_email_subscription_details': {0}".format(str(response)), "DEBUG")
-            email_destination_details = None
-
-            if not response:
-                self.log("Email instance with given name '{0}' present in Cisco Catalyst Center.".format(instance), "INFO")
-                return response
+        record = self.get_ccc_snapshot("email_subscription_details").get(instance)
+        if not record:
+            self.log("There is no Email subscription instance with name '{0}' present in Cisco Catalyst Center.".format(instance), "INFO")
+            return None
 
-            return response[0]
+        self.log("Email subscription instance '{0}' present in Cisco Catalyst Center.".format(instance), "INFO")
 
-        except Exception as e:
-            expected_exception_msgs = [
-                "Expecting value: line 1 column 1",
-                "not iterable",
-                "has no attribute"
-            ]
-            for msg in expected_exception_msgs:
-                if msg in str(e):
-                    self.log(
-                        "An exception occurred while checking for the Email instance with the name '{0}'. "
-                        "It was not found in Cisco Catalyst Center.".format(instance), "WARNING"
-                    )
-                    return None
-
-            self.status = "failed"
-            self.msg = """Error while getting the details of Email event Subscription with given destination name '{0}' present in
-                    Cisco Catalyst Center: {1}""".format(instance, str(e))
-            self.log(self.msg, "ERROR")
-            self.check_return_status()
+        return record
 
     def collect_email_notification_playbook_params(self, email_notification_details):
         """
@@ -5578,6 +5670,9 @@ def main():
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'event_catalog_cache_file': {'type': 'str'},
+                    'event_catalog_cache_ttl': {'type': 'int', 'default': 86400},
+                    'event_name_fuzzy_match': {'type': 'bool', 'default': False},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
@@ -304,7 +304,8 @@ options:
             elements: str
       provision_wired_device:
         description: This parameter takes a list of dictionaries. Each dictionary provides the IP address of a wired device and
-            the name of the site where the device will be provisioned.
+            the name of the site where the device will be provisioned. For Catalyst Center versions later than 2.3.5.3 the
+            state of all the devices is checked together and each device is provisioned as soon as it reaches the managed state.
         type: list
         elements: dict
         suboptions:
@@ -751,6 +752,7 @@ class Inventory(DnacBase):
         self.resync_successful_devices, self.device_not_exist_to_resync, self.device_role_ip_already_updated = [], [], []
         self.cred_updated_not_required, self.device_role_already_updated = [], []
         self.ap_rebooted_successfully = []
+        self.provision_site_ids = {}
 
     def validate_input(self):
         """
@@ -1721,6 +1723,65 @@ class Inventory(DnacBase):
         self.log("Device '{0}' did not transition to the Managed state within the retry limit.".format(device_ip), "WARNING")
         return False, device_ip
 
+    def watch_devices_managed_state(self, provision_wired_list):
+        """
+        Watches all the given devices together until they reach the managed state.
+        Parameters:
+            provision_wired_list (list): List of dictionaries containing the device IP address and its
+                                         'resync_retry_count' and 'resync_retry_interval'.
+        Yields:
+            tuple: After every polling round, the IP addresses of the devices which reached the managed state
+                   in that round and the IP addresses of the devices which will not reach it.
+        Description:
+            Every round fetches the state of all the pending devices with batched 'get_device_list' calls instead
+            of polling each device on its own. A device stops being watched once it is managed or once its
+            collection fails. All the devices share one time budget, the largest 'resync_retry_count' *
+            'resync_retry_interval' of the devices, counted from the start of the watch. The devices still
+            pending when it runs out will not reach the managed state. The shortest retry interval of the
+            pending devices is used between two rounds, without sleeping past the end of the budget.
+        """
+        start_time = time.time()
+        pending, budget = {}, 0
+        for device_info in provision_wired_list:
+            retry_interval = device_info.get("resync_retry_interval", 2)
+            pending[device_info['device_ip']] = retry_interval
+            budget = max(budget, device_info.get("resync_retry_count", 200) * retry_interval)
+
+        deadline = start_time + budget
+        self.log("Watching {0} device(s) for up to {1} seconds.".format(len(pending), budget), "DEBUG")
+
+        while pending:
+            device_states = {}
+            for device in self.get_device_list_in_bulk("management_ip_address", list(pending)):
+                device_states[device.get("managementIpAddress")] = device
+
+            managed, not_managed = [], []
+            for device_ip in list(pending):
+                device = device_states.get(device_ip, {})
+                management_state = device.get('managementState')
+                collection_status = device.get('collectionStatus')
+
+                if management_state == "Managed" and collection_status == "Managed":
+                    self.log("Device '{0}' reached Managed state after {1:.0f} seconds.".format(
+                        device_ip, time.time() - start_time), "INFO")
+                    managed.append(device_ip)
+                elif collection_status in ["Partial Collection Failure", "Could Not Synchronize"]:
+                    self.log("Device '{0}' reached '{1}' state.".format(device_ip, collection_status), "INFO")
+                    not_managed.append(device_ip)
+                elif time.time() >= deadline:
+                    self.log("Device '{0}' did not transition to the Managed state within the retry limit.".format(device_ip), "WARNING")
+                    not_managed.append(device_ip)
+                else:
+                    self.log("Device '{0}' is in {1} state, waiting for Managed State.".format(device_ip, management_state), "DEBUG")
+                    continue
+
+                del pending[device_ip]
+
+            yield managed, not_managed
+
+            if pending:
+                time.sleep(max(0, min(min(pending.values()), deadline - time.time())))
+
     def provisioned_wired_device(self):
         """
         Main function to provision wired devices in Cisco Catalyst Center.
@@ -1778,31 +1839,23 @@ class Inventory(DnacBase):
                 self.provision_wired_device_v1(device_ip, site_name_hierarchy, device_type)
 
         else:
-            device_ip_in_managed_state = []
+            device_type = "Wired"
             device_ip_not_in_managed_state = []
+            device_ip_list = [device_info['device_ip'] for device_info in provision_wired_list]
             self.log("Starting to process the provisioned wired list.", "DEBUG")
-            for device_info in provision_wired_list:
-                device_ip = device_info['device_ip']
-                site_name_hierarchy = device_info['site_name']
-                device_ip_list.append(device_ip)
-                self.log("Processing device {0} at site {1}".format(device_ip, site_name_hierarchy), "DEBUG")
-                device_type = "Wired"
-                resync_retry_count = device_info.get("resync_retry_count", 200)
-                resync_retry_interval = device_info.get("resync_retry_interval", 2)
-                self.log("Retry count: {0}, Retry interval: {1} seconds for device {2}".format(resync_retry_count, resync_retry_interval, device_ip), "DEBUG")
 
-                # Check if device reaches managed state
-                managed_flag, device_ip_info = self.wait_for_device_to_be_managed_v1(device_ip, resync_retry_count, resync_retry_interval)
-                if not managed_flag:
-                    device_ip_not_in_managed_state.append(device_ip_info)
-                    self.log("Device {0} did not transition to the managed state, so provisioning cannot be performed.".format(device_ip), "WARNING")
+            # Provision the devices of every polling round as soon as they reach the managed state
+            for device_ip_in_managed_state, device_ip_not_managed in self.watch_devices_managed_state(provision_wired_list):
+                device_ip_not_in_managed_state.extend(device_ip_not_managed)
+                if not device_ip_in_managed_state:
                     continue
 
-                self.log("Device {0} reached managed state. Adding to the managed state list.".format(device_ip), "INFO")
-                device_ip_in_managed_state.append(device_ip_info)
+                self.log("Initiating provisioning for devices in managed state: {0}".format(device_ip_in_managed_state), "DEBUG")
+                self.provision_wired_device_v2(None, None, device_ip_in_managed_state, provision_wired_list)
 
-            self.log("Initiating provisioning for devices in managed state.", "DEBUG")
-            self.provision_wired_device_v2(device_ip, site_name_hierarchy, device_ip_in_managed_state, provision_wired_list)
+            if device_ip_not_in_managed_state:
+                self.log("Device(s) {0} did not transition to the managed state, so provisioning cannot be performed.".format(
+                    device_ip_not_in_managed_state), "WARNING")
 
         # Handle final provisioning results
         self.handle_final_provisioning_result(total_devices, self.provision_count, self.already_provisioned_count, device_ip_list, device_type)
@@ -1908,27 +1961,27 @@ class Inventory(DnacBase):
             self.log("Managed state devices: {0}".format(device_ip_in_managed_state), "DEBUG")
             self.log("Provision wired list: {0}".format(provision_wired_list), "DEBUG")
 
-            site_data = {}
             device_data = {}
+            for device in self.get_device_list_in_bulk("management_ip_address", device_ip_in_managed_state):
+                device_data[device.get("managementIpAddress")] = device.get("id")
+            self.log("Device IPs mapped to device IDs: {0}".format(device_data), "DEBUG")
 
-            # Collect site and device information
+            # Site IDs are kept across the calls made for every polling round
+            site_data = self.provision_site_ids
             for item in provision_wired_list:
                 site_name = item['site_name']
+                if item['device_ip'] not in device_ip_in_managed_state or site_name in site_data:
+                    continue
+
                 site_exist, site_id = self.get_site_id(site_name)
                 self.log("Checked site '{0}', exists: {1}, site ID: {2}".format(site_name, site_exist, site_id), "DEBUG")
-                if site_exist:
-                    site_data[site_name] = site_id
-
-                device_ip = item['device_ip']
-                device_ids = self.get_device_ids([device_ip])
-                self.log("Device IP '{0}' mapped to device IDs: {1}".format(device_ip, device_ids), "DEBUG")
-                if device_ids:
-                    device_data[device_ip] = device_ids[0]
+                site_data[site_name] = site_id if site_exist else None
 
+            provision_items = dict((item['device_ip'], item) for item in provision_wired_list)
             devices_to_assign_and_provision = []
             device_already_provisioned = []
             for device_ip in device_ip_in_managed_state:
-                provision_item = next((item for item in provision_wired_list if item['device_ip'] == device_ip), None)
+                provision_item = provision_items.get(device_ip)
                 if provision_item:
                     site_name = provision_item['site_name']
                     site_id = site_data.get(site_name)
@@ -2086,11 +2139,15 @@ class Inventory(DnacBase):
         try:
             response = self.dnac._exec(family="sda", function='provision_devices', op_modifies=True, params={"payload": provision_params})
             self.log("Received API response from 'provision_devices': {0}".format(str(response)), "DEBUG")
+            # Every round is judged on its own task, a failed earlier round must not hide the later successes
+            self.status = "success"
             self.check_tasks_response_status(response, api_name='provision_device')
 
             if self.status not in ["failed", "exited"]:
                 self.log("Wired Device '{0}' provisioning completed successfully.".format(device_ip), "INFO")
-                self.provision_count += 1
+                self.provision_count += len(device_ip)
+            else:
+                self.log("Wired Device '{0}' provisioning failed: {1}".format(device_ip, self.msg), "ERROR")
 
         except Exception as e:
             self.log("Exception occurred during provisioning: {0}".format(str(e)), "ERROR")
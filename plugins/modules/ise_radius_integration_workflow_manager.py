@@ -33,6 +33,14 @@ options:
     type: str
     choices: ["merged", "deleted"]
     default: merged
+  max_concurrent_requests:
+    description:
+      - Maximum number of Authentication and Policy Servers created, updated or deleted at the same time.
+      - The Cisco ISE integration steps which follow the creation or update of a Cisco ISE server
+        are performed one server at a time.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description:
       - List of details of Authentication and Policy Servers being managed.
@@ -206,8 +214,10 @@ options:
             type: bool
           ise_integration_wait_time:
             description:
-              - Indicates the sleep time after initiating the Cisco ISE integration process.
-              - Maximum sleep time should be less or equal to 120 seconds.
+              - Indicates the maximum wait time after initiating the Cisco ISE integration process.
+              - The integration status is polled with an increasing interval and the wait ends
+                as soon as the integration completes or fails.
+              - Maximum wait time should be less or equal to 120 seconds.
             default: 20
             type: int
 requirements:
@@ -230,6 +240,7 @@ notes:
     get /dna/intent/api/v1/authentication-policy-servers
     get /dna/intent/api/v1/ise-integration-status
 
+  - Added 'max_concurrent_requests' option in v6.32.0.
 """
 
 EXAMPLES = r"""
@@ -435,6 +446,7 @@ class IseRadiusIntegration(DnacBase):
         self.authentication_policy_server_obj_params = \
             self.get_obj_params("authenticationPolicyServer")
         self.validation_string = ""
+        self.auth_server_snapshot = None
 
     def validate_input(self):
         """
@@ -622,6 +634,71 @@ class IseRadiusIntegration(DnacBase):
 
         return auth_server
 
+    def get_auth_server_snapshot(self, refresh=False):
+        """
+        Get the Authentication and Policy Servers of the Cisco Catalyst Center keyed by IP address.
+
+        Parameters:
+            refresh (bool) - Set to True to discard the cached servers and retrieve them again.
+
+        Returns:
+            dict or None - The details of every Authentication and Policy Server keyed by its
+                           IP address, or None if the servers could not be retrieved.
+
+        Description:
+            The servers are retrieved with a single 'get_authentication_and_policy_servers' call and
+            cached, so the existence checks of all the servers in the playbook share one request.
+            The cache is cleared whenever a server is created, updated or deleted.
+        """
+
+        if self.auth_server_snapshot is not None and not refresh:
+            return self.auth_server_snapshot
+
+        response = self.dnac._exec(
+            family="system_settings",
+            function='get_authentication_and_policy_servers',
+        )
+        if not isinstance(response, dict):
+            self.log("Failed to retrieve the Authentication and Policy Server details - "
+                     "Response is not a dictionary", "CRITICAL")
+            return None
+
+        self.auth_server_snapshot = {}
+        for auth_server_details in response.get("response") or []:
+            self.auth_server_snapshot[auth_server_details.get("ipAddress")] = auth_server_details
+
+        self.log("Retrieved {0} Authentication and Policy Server(s) from the Cisco Catalyst Center."
+                 .format(len(self.auth_server_snapshot)), "DEBUG")
+        return self.auth_server_snapshot
+
+    def get_ise_server_details(self, ip_address=None, refresh=False):
+        """
+        Get the details of a Cisco ISE server from the cached Authentication and Policy Servers.
+
+        Parameters:
+            ip_address (str) - IP address of the Cisco ISE server. The first Cisco ISE server
+                               is returned when it is not given or not found.
+            refresh (bool) - Set to True to retrieve the servers again.
+
+        Returns:
+            dict or None - The details of the Cisco ISE server, or None if the servers could not be retrieved.
+                           An empty dict is returned when there is no Cisco ISE server.
+        """
+
+        auth_servers = self.get_auth_server_snapshot(refresh)
+        if auth_servers is None:
+            return None
+
+        ise_server_details = auth_servers.get(ip_address)
+        if ise_server_details and ise_server_details.get("iseEnabled"):
+            return ise_server_details
+
+        for auth_server_details in auth_servers.values():
+            if auth_server_details.get("iseEnabled"):
+                return auth_server_details
+
+        return {}
+
     def auth_server_exists(self, ipAddress):
         """
         Check if the Authentication and Policy Server with the given ipAddress exists
@@ -645,17 +722,11 @@ class IseRadiusIntegration(DnacBase):
             "details": None,
             "id": None
         }
-        response = self.dnac._exec(
-            family="system_settings",
-            function='get_authentication_and_policy_servers',
-        )
-        if not isinstance(response, dict):
-            self.log("Failed to retrieve the Authentication and Policy Server details - "
-                     "Response is not a dictionary", "CRITICAL")
+        all_auth_server_details = self.get_auth_server_snapshot()
+        if all_auth_server_details is None:
             return AuthServer
 
-        all_auth_server_details = response.get("response")
-        auth_server_details = get_dict_result(all_auth_server_details, "ipAddress", ipAddress)
+        auth_server_details = all_auth_server_details.get(ipAddress)
         self.log("Authentication and Policy Server Ip Address: {0}"
                  .format(ipAddress), "DEBUG")
         self.log("Authentication and Policy Server details: {0}"
@@ -1061,14 +1132,9 @@ class IseRadiusIntegration(DnacBase):
                             .format(ip_address),
                             "DEBUG"
                         )
-                        response = self.dnac._exec(
-                            family="system_settings",
-                            function='get_authentication_and_policy_servers',
-                            params={"is_ise_enabled": True}
-                        )
+                        ise_server_details = self.get_ise_server_details(item.get("server_ip_address"))
                         self.log("Successfully retrieved authentication server response; processing Cisco ISE details.", "DEBUG")
-                        response = response.get("response")
-                        if response is None:
+                        if ise_server_details is None:
                             self.msg = (
                                 "Failed to retrieve information from 'get_authentication_and_policy_servers' for IP '{0}'."
                                 .format(ip_address)
@@ -1077,7 +1143,7 @@ class IseRadiusIntegration(DnacBase):
                             self.status = "failed"
                             return self
 
-                        cisco_ise_dtos = response[0].get("ciscoIseDtos")
+                        cisco_ise_dtos = ise_server_details.get("ciscoIseDtos")
                         if not cisco_ise_dtos:
                             self.msg = "No Cisco ISE details available for IP '{0}'.".format(ip_address)
                             self.status = "failed"
@@ -1220,6 +1286,74 @@ class IseRadiusIntegration(DnacBase):
         self.status = "success"
         return self
 
+    def get_ise_integration_status(self):
+        """
+        Get the overall status of the Cisco ISE server integration.
+
+        Parameters:
+            None
+
+        Returns:
+            str or None - The 'overallStatus' of the integration, or None if it could not be retrieved.
+        """
+
+        try:
+            cisco_ise_status = self.dnac._exec(
+                family="system_settings",
+                function="cisco_ise_server_integration_status",
+                op_modifies=True,
+            )
+        except Exception as msg:
+            self.log("Exception occurred while checking the status of the Cisco ISE server integration: {0}"
+                     .format(msg), "ERROR")
+            return None
+
+        self.log("Received API response for 'cisco_ise_server_integration_status': {0}"
+                 .format(cisco_ise_status), "DEBUG")
+        if not isinstance(cisco_ise_status, dict):
+            return None
+
+        return cisco_ise_status.get("overallStatus")
+
+    def watch_ise_integration_status(self, ip_address, expected_statuses, timeout, max_interval):
+        """
+        Poll the Cisco ISE server integration until it reaches one of the expected phases.
+
+        Parameters:
+            ip_address (str) - The IP address of the Cisco ISE server.
+            expected_statuses (tuple) - The 'overallStatus' values ending the wait.
+            timeout (int) - Maximum number of seconds to wait.
+            max_interval (int) - Upper bound of the wait between two polls, in seconds.
+
+        Returns:
+            str or None - The reached status, or None if none of the expected statuses was reached in time.
+
+        Description:
+            The first polls are close to each other and the interval then doubles up to 'max_interval',
+            so a short phase is seen quickly while a long one is not polled needlessly.
+        """
+
+        start_time = time.time()
+        attempt = 0
+        while True:
+            overall_status = self.get_ise_integration_status()
+            if overall_status in expected_statuses:
+                self.log("The status of the Cisco ISE server '{ip}' is '{status}'"
+                         .format(ip=ip_address, status=overall_status), "INFO")
+                return overall_status
+
+            elapsed_time = time.time() - start_time
+            if elapsed_time >= timeout:
+                self.log("The Cisco ISE server '{ip}' did not reach {expected} within {timeout} second(s), current status '{status}'."
+                         .format(ip=ip_address, expected=expected_statuses, timeout=timeout, status=overall_status), "WARNING")
+                return None
+
+            sleep_time = min(self.get_backoff_interval(attempt, max_interval), max(timeout - elapsed_time, 0))
+            self.log("Cisco ISE server '{ip}' integration status is '{status}', checking again in {sleep} second(s)."
+                     .format(ip=ip_address, status=overall_status, sleep=sleep_time), "DEBUG")
+            time.sleep(sleep_time)
+            attempt += 1
+
     def check_ise_server_integration_status(self, ip_address):
         """
         Check whether the Cisco ISE server is ready for the accepting the user authentication certificate.
@@ -1232,37 +1366,36 @@ class IseRadiusIntegration(DnacBase):
             self - The current object with updated desired Authentication Policy Server information.
         """
 
-        start_time = time.time()
-        while True:
-            try:
-                cisco_ise_status = self.dnac._exec(
-                    family="system_settings",
-                    function="cisco_ise_server_integration_status",
-                    op_modifies=True,
-                )
-            except Exception as msg:
-                self.msg = (
-                    "Exception occurred while checking the status of the Cisco ISE server with IP address '{ip}'."
-                    .format(ip=ip_address)
-                )
+        statuses = ("WAITING_USER_INPUT", "COMPLETE", "FAILED")
+        if self.watch_ise_integration_status(ip_address, statuses, 10, 2) is None:
+            self.msg = (
+                "The Cisco Catalyst Center took more than 10 seconds to accept "
+                "the PxGrid certificate of the Cisco ISE server with IP address '{ip}'.".format(ip=ip_address)
+            )
+            self.status = "failed"
+            return self
 
-            overall_status = cisco_ise_status.get("overallStatus")
-            statuses = ["WAITING_USER_INPUT", "COMPLETE"]
-            if overall_status in statuses:
-                self.log("The status of the Cisco ISE server is '{status}'".format(status=overall_status))
-                break
+        self.status = "success"
+        return self
 
-            if (time.time() - start_time) >= 10:
-                self.msg = (
-                    "The Cisco Catalyst Center took more than 10 seconds to accept "
-                    "the PxGrid certificate of the Cisco ISE server with ."
-                )
-                self.status = "failed"
-                break
+    def wait_for_ise_integration(self, ip_address, ise_integration_wait_time):
+        """
+        Wait for the Cisco ISE server integration to end after the certificate is accepted.
 
-            time.sleep(1)
+        Parameters:
+            ip_address (str) - The IP address of the Cisco ISE server.
+            ise_integration_wait_time (int) - Maximum number of seconds to wait.
 
-        return self
+        Returns:
+            dict or None - The refreshed details of the Cisco ISE server, or None if they could not be retrieved.
+
+        Description:
+            Instead of sleeping for 'ise_integration_wait_time', the integration status is polled with a
+            backoff and the wait ends as soon as the integration completes or fails.
+        """
+
+        self.watch_ise_integration_status(ip_address, ("COMPLETE", "FAILED"), ise_integration_wait_time, 10)
+        return self.get_ise_server_details(ip_address, refresh=True)
 
     def accept_cisco_ise_server_certificate(self, ipAddress, trusted_server):
         """
@@ -1311,65 +1444,107 @@ class IseRadiusIntegration(DnacBase):
 
         return
 
-    def check_auth_server_response_status(self, response, validation_string_set, api_name):
+    def get_auth_server_task_result(self, response, validation_string_set, api_name):
         """
-        Checks the status of a task related to updating the authentication and policy server
+        Checks the status of a task related to the authentication and policy server
         by polling the task details until it completes or a timeout is reached.
 
         Parameters:
             response (dict): The initial response from the task creation API.
-            validation_string_set (set): A set of strings expected to be found in the task progress for a successful operation.
+            validation_string_set (tuple): Strings expected to be found in the task progress for a successful operation.
             api_name (str): Name of the function during the SDK call.
 
         Returns:
-            self - The current object with updated desired Authentication Policy Server information.
+            tuple - The status ('success' or 'failed'), the message and the task ID.
+
+        Description:
+            The task is polled with an interval starting at 'dnac_task_poll_interval' and doubling up to
+            10 seconds. The method does not update 'self.msg' or 'self.status', so the tasks of several
+            servers can be monitored at the same time.
         """
 
-        response = response.get("response")
+        response = (response or {}).get("response") or {}
         if response.get("errorcode") is not None:
-            self.msg = response.get("detail")
-            self.status = "failed"
-            return self
+            return "failed", response.get("detail"), None
 
         task_id = response.get("taskId")
         start_time = time.time()
-        sleep_time = self.max_timeout / 1000
+        attempt = 0
         while True:
             end_time = time.time()
             if (end_time - start_time) >= self.max_timeout:
-                self.msg = "Max timeout of {0} sec has reached for the execution id '{1}'.".format(self.max_timeout, task_id) + \
-                           "Exiting the loop due to unexpected API '{0}' status.".format(api_name)
-                self.status = "failed"
-                break
+                msg = "Max timeout of {0} sec has reached for the execution id '{1}'.".format(self.max_timeout, task_id) + \
+                      "Exiting the loop due to unexpected API '{0}' status.".format(api_name)
+                return "failed", msg, task_id
 
-            task_details = self.get_task_details(task_id)
+            task_details = self.get_task_details(task_id) or {}
             self.log('Getting task details from task ID {0}: {1}'.format(task_id, task_details), "DEBUG")
             if task_details.get("isError") is True:
                 failure_reason = task_details.get("failureReason")
                 if failure_reason:
-                    self.msg = str(failure_reason)
-                else:
-                    self.msg = str(task_details.get("progress"))
-                self.status = "failed"
-                break
+                    return "failed", str(failure_reason), task_id
 
-            for validation_string in validation_string_set:
-                if validation_string in task_details.get("progress").lower():
-                    self.result['changed'] = True
-                    self.validation_string = validation_string
-                    self.status = "success"
-                    break
+                return "failed", str(task_details.get("progress")), task_id
 
-            if self.result['changed'] is True:
-                self.log("The task with task id '{0}' is successfully executed".format(task_id), "DEBUG")
-                break
+            progress = str(task_details.get("progress") or "").lower()
+            for validation_string in validation_string_set:
+                if validation_string in progress:
+                    self.log("The task with task id '{0}' is successfully executed".format(task_id), "DEBUG")
+                    return "success", progress, task_id
 
             # sleep time after checking the status of the response from the API
+            sleep_time = self.get_backoff_interval(attempt, 10)
             self.log("The time interval before checking the next response, sleep for {0}".format(sleep_time))
             time.sleep(sleep_time)
+            attempt += 1
             self.log("Progress set to {0} for taskid: {1}".format(task_details.get('progress'), task_id), "DEBUG")
 
-        return self
+    def apply_auth_server_change(self, change):
+        """
+        Create, update or delete one Authentication and Policy Server and wait for its task.
+
+        Parameters:
+            change (dict) - The 'function' name, its 'params', the 'validation_string_set' of the
+                            task and the 'ip_address' of the server.
+
+        Returns:
+            tuple - The status ('success' or 'failed'), the message and the task ID.
+        """
+
+        function_name = change.get("function")
+        try:
+            response = self.dnac._exec(
+                family="system_settings",
+                function=function_name,
+                params=change.get("params"),
+            )
+        except Exception as e:
+            return "failed", "Exception occurred while calling '{0}' for the Authentication and Policy Server '{1}': {2}" \
+                   .format(function_name, change.get("ip_address"), repr(e)), None
+
+        self.log("Received API response for '{0}' of '{1}': {2}"
+                 .format(function_name, change.get("ip_address"), response), "DEBUG")
+        return self.get_auth_server_task_result(response, change.get("validation_string_set"), function_name)
+
+    def apply_auth_server_changes(self, changes):
+        """
+        Apply the changes of several Authentication and Policy Servers concurrently.
+
+        Parameters:
+            changes (list of dict) - The changes accepted by 'apply_auth_server_change'.
+
+        Returns:
+            list - The outcome of every change in the same order.
+        """
+
+        if not changes:
+            return []
+
+        outcomes = self.execute_concurrently(
+            self.apply_auth_server_change, changes, self.params.get("max_concurrent_requests")
+        )
+        self.auth_server_snapshot = None
+        return outcomes
 
     def check_ise_server_updation_status(self, have_auth_details, want_auth_details):
         """
@@ -1456,6 +1631,81 @@ class IseRadiusIntegration(DnacBase):
         self.status = "success"
         return self
 
+    def complete_ise_server_creation(self, ip_address):
+        """
+        Accept the certificate of a newly created Cisco ISE server and wait for its integration.
+
+        Parameters:
+            ip_address (str) - The IP address of the Cisco ISE server.
+
+        Returns:
+            str or None - The error message if the integration did not succeed, else None.
+        """
+
+        trusted_server = self.want.get("trusted_server")
+        self.check_ise_server_integration_status(ip_address)
+        integration_error = self.msg if self.status == "failed" else None
+        self.accept_cisco_ise_server_certificate(ip_address, trusted_server)
+        ise_integration_wait_time = self.want.get("ise_integration_wait_time")
+        ise_server_details = self.wait_for_ise_integration(ip_address, ise_integration_wait_time)
+        if ise_server_details is None:
+            return "Failed to retrieve the information from the API 'get_authentication_and_policy_servers' of {0}." \
+                   .format(ip_address)
+
+        state = ise_server_details.get("state")
+        if state == "INPROGRESS":
+            return "The Cisco ISE server '{ip}' integration is incomplete, currently in 'INPROGRESS' state. ".format(ip=ip_address) + \
+                   "The integration has exceeded the expected duration of '{wait_time}' second(s)." \
+                   .format(wait_time=ise_integration_wait_time)
+
+        if state == "FAILED":
+            msg = "The Cisco ISE server '{ip}' integration has failed and in 'FAILED' state." \
+                  .format(ip=ip_address)
+            if trusted_server is False:
+                msg += " This is the first time Cisco Catalyst Center has encountered " + \
+                       "this certificate from Cisco ISE, and it is not yet trusted."
+            return msg
+
+        return integration_error
+
+    def complete_ise_server_update(self, ip_address, state):
+        """
+        Complete the integration of an updated Cisco ISE server which is not active yet.
+
+        Parameters:
+            ip_address (str) - The IP address of the Cisco ISE server.
+            state (str) - The state of the Cisco ISE server before the update.
+
+        Returns:
+            tuple - The message added to the result when the server is not trusted,
+                    and the error message if the integration could not be checked, else None.
+        """
+
+        integration_error = None
+        if state != "ACTIVE":
+            self.check_ise_server_integration_status(ip_address)
+            integration_error = self.msg if self.status == "failed" else None
+            self.accept_cisco_ise_server_certificate(ip_address, self.want.get("trusted_server"))
+            ise_server_details = self.wait_for_ise_integration(ip_address, self.want.get("ise_integration_wait_time"))
+        else:
+            ise_server_details = self.get_ise_server_details(ip_address, refresh=True)
+
+        if not ise_server_details:
+            return "", "The response from the API 'get_authentication_and_policy_servers' is empty."
+
+        self.log(str(ise_server_details))
+        state = ise_server_details.get("state")
+        if not state:
+            return "", (
+                "The parameter 'state' is not available in the ISE details response "
+                "from the API 'get_authentication_and_policy_servers'."
+            )
+
+        if state == "FAILED":
+            return " But the server is not trusted.", integration_error
+
+        return "", integration_error
+
     def update_auth_policy_server(self, authentication_policy_server):
         """
         Update/Create Authentication and Policy Server in Cisco
@@ -1466,83 +1716,38 @@ class IseRadiusIntegration(DnacBase):
 
         Returns:
             None
+
+        Description:
+            The servers to create or update are collected first and their requests are sent concurrently,
+            with up to 'max_concurrent_requests' servers at the same time. The Cisco ISE integration of the
+            created or updated Cisco ISE servers is then completed one server at a time.
         """
 
         result_auth_server = self.result.get("response")[0].get("authenticationPolicyServer")
-        auth_server_index = -1
-        for item in authentication_policy_server:
-            auth_server_index += 1
+        if self.get_ccc_version_as_integer() >= self.get_ccc_version_as_int_from_str("2.3.7.9"):
+            create_validation_string_set = ("successfully created aaa settings", "operation successful")
+            update_validation_string_set = ("successfully updated aaa settings", "operation successful")
+        else:
+            create_validation_string_set = ("successfully created aaa settings", "operation sucessful")
+            update_validation_string_set = ("successfully updated aaa settings", "operation sucessful")
+
+        changes = []
+        for auth_server_index, item in enumerate(authentication_policy_server):
             ip_address = item.get("server_ip_address")
             result_auth_server.get("response").update({ip_address: {}})
 
-            # Check Authentication and Policy Server exist, if not create and return
-            is_ise_server = self.want.get("authenticationPolicyServer")[auth_server_index].get("isIseEnabled")
+            # Check Authentication and Policy Server exist, if not create it
             if not self.have.get("authenticationPolicyServer")[auth_server_index].get("exists"):
                 auth_server_params = self.want.get("authenticationPolicyServer")[auth_server_index]
                 self.log("Desired State for Authentication and Policy Server for the IP '{0}' (want): {1}"
                          .format(ip_address, auth_server_params), "DEBUG")
-                function_name = "add_authentication_and_policy_server_access_configuration"
-                response = self.dnac._exec(
-                    family="system_settings",
-                    function=function_name,
-                    params=auth_server_params,
-                )
-                if self.get_ccc_version_as_integer() >= self.get_ccc_version_as_int_from_str("2.3.7.9"):
-                    validation_string_set = ("successfully created aaa settings", "operation successful")
-                else:
-                    validation_string_set = ("successfully created aaa settings", "operation sucessful")
-
-                self.check_auth_server_response_status(response, validation_string_set, function_name)
-                if self.status == "failed":
-                    self.log(self.msg, "ERROR")
-                    return
-
-                if is_ise_server:
-                    trusted_server = self.want.get("trusted_server")
-                    self.check_ise_server_integration_status(ip_address)
-                    self.accept_cisco_ise_server_certificate(ip_address, trusted_server)
-                    ise_integration_wait_time = self.want.get("ise_integration_wait_time")
-                    time.sleep(ise_integration_wait_time)
-                    response = self.dnac._exec(
-                        family="system_settings",
-                        function='get_authentication_and_policy_servers',
-                        params={"is_ise_enabled": True}
-                    )
-                    response = response.get("response")
-                    if response is None:
-                        self.msg = "Failed to retrieve the information from the API 'get_authentication_and_policy_servers' of {0}." \
-                                   .format(ip_address)
-                        self.status = "failed"
-                        return
-
-                    ise_server_details = get_dict_result(response, "ipAddress", ip_address)
-                    ise_state_set = {"FAILED", "INPROGRESS"}
-                    state = ise_server_details.get("state")
-                    if state in ise_state_set:
-                        if state == "INPROGRESS":
-                            self.msg = "The Cisco ISE server '{ip}' integration is incomplete, currently in 'INPROGRESS' state. ".format(ip=ip_address) + \
-                                       "The integration has exceeded the expected duration of '{wait_time}' second(s)." \
-                                       .format(wait_time=ise_integration_wait_time)
-                        elif state == "FAILED":
-                            self.msg = "The Cisco ISE server '{ip}' integration has failed and in 'FAILED' state." \
-                                       .format(ip=ip_address)
-                            if self.want.get("trusted_server") is False:
-                                self.msg += " This is the first time Cisco Catalyst Center has encountered " + \
-                                            "this certificate from Cisco ISE, and it is not yet trusted."
-
-                        self.log(str(self.msg), "ERROR")
-                        self.status = "failed"
-                        return
-
-                self.log("Successfully created Authentication and Policy Server '{0}'."
-                         .format(ip_address), "INFO")
-                result_auth_server.get("response").get(ip_address) \
-                    .update({
-                        "authenticationPolicyServer Details": self.want
-                            .get("authenticationPolicyServer")[auth_server_index]
-                            })
-                result_auth_server.get("msg").update({
-                    ip_address: "Authentication and Policy Server Created Successfully"
+                changes.append({
+                    "index": auth_server_index,
+                    "ip_address": ip_address,
+                    "function": "add_authentication_and_policy_server_access_configuration",
+                    "params": auth_server_params,
+                    "validation_string_set": create_validation_string_set,
+                    "is_ise_server": auth_server_params.get("isIseEnabled"),
                 })
                 continue
 
@@ -1593,68 +1798,53 @@ class IseRadiusIntegration(DnacBase):
                      .format(auth_server_params), "DEBUG")
             self.log("Current State for Authentication and Policy Server (have): {0}"
                      .format(have_auth_server_details), "DEBUG")
-            function_name = "edit_authentication_and_policy_server_access_configuration"
-            response = self.dnac._exec(
-                family="system_settings",
-                function=function_name,
-                params=auth_server_params,
-            )
-            if self.get_ccc_version_as_integer() >= self.get_ccc_version_as_int_from_str("2.3.7.9"):
-                validation_string_set = ("successfully updated aaa settings", "operation successful")
-            else:
-                validation_string_set = ("successfully updated aaa settings", "operation sucessful")
-
-            self.check_auth_server_response_status(response, validation_string_set, function_name)
-            if self.status == "failed":
-                self.log(self.msg, "ERROR")
-                return
-
-            trusted_server_msg = ""
-            if is_ise_server_enabled:
-                trusted_server = self.want.get("trusted_server")
-                state = have_auth_server_details.get("state")
-                if state != "ACTIVE":
-                    self.check_ise_server_integration_status(ip_address)
-                    self.accept_cisco_ise_server_certificate(ip_address, trusted_server)
-                    ise_integration_wait_time = self.want.get("ise_integration_wait_time")
-                    time.sleep(ise_integration_wait_time)
-
-                ise_details = self.dnac._exec(
-                    family="system_settings",
-                    function='get_authentication_and_policy_servers',
-                    params={"is_ise_enabled": True}
-                )
+            changes.append({
+                "index": auth_server_index,
+                "ip_address": ip_address,
+                "function": "edit_authentication_and_policy_server_access_configuration",
+                "params": auth_server_params,
+                "validation_string_set": update_validation_string_set,
+                "is_ise_server": is_ise_server_enabled,
+                "state": have_auth_server_details.get("state"),
+            })
 
-                ise_details = ise_details.get("response")
-                if not ise_details:
-                    self.msg = (
-                        "The response from the API 'get_authentication_and_policy_servers' is empty."
-                    )
-                    self.log(self.msg, "CRITICAL")
-                    self.status = "failed"
-                    return self
+        failures = []
+        for change, (status, msg, task_id) in zip(changes, self.apply_auth_server_changes(changes)):
+            ip_address = change.get("ip_address")
+            auth_server_index = change.get("index")
+            if status == "failed":
+                self.log(msg, "ERROR")
+                failures.append(msg)
+                continue
 
-                if not isinstance(ise_details, list):
-                    self.msg = (
-                        "The response from the API 'get_authentication_and_policy_servers' "
-                        "is not a dictionary."
-                    )
-                    self.log(self.msg, "CRITICAL")
-                    self.status = "failed"
-                    return self
+            self.result['changed'] = True
+            if change.get("function") == "add_authentication_and_policy_server_access_configuration":
+                if change.get("is_ise_server"):
+                    error_msg = self.complete_ise_server_creation(ip_address)
+                    if error_msg:
+                        self.log(error_msg, "ERROR")
+                        failures.append(error_msg)
+                        continue
 
-                self.log(str(ise_details))
-                state = ise_details[0].get("state")
-                if not state:
-                    self.msg = (
-                        "The parameter 'state' is not available in the ISE details response "
-                        "from the API 'get_authentication_and_policy_servers'."
-                    )
-                    self.status = "failed"
-                    return self
+                self.log("Successfully created Authentication and Policy Server '{0}'."
+                         .format(ip_address), "INFO")
+                result_auth_server.get("response").get(ip_address) \
+                    .update({
+                        "authenticationPolicyServer Details": self.want
+                            .get("authenticationPolicyServer")[auth_server_index]
+                            })
+                result_auth_server.get("msg").update({
+                    ip_address: "Authentication and Policy Server Created Successfully"
+                })
+                continue
 
-                if state == "FAILED":
-                    trusted_server_msg = " But the server is not trusted."
+            trusted_server_msg = ""
+            if change.get("is_ise_server"):
+                trusted_server_msg, error_msg = self.complete_ise_server_update(ip_address, change.get("state"))
+                if error_msg:
+                    self.log(error_msg, "CRITICAL")
+                    failures.append(error_msg)
+                    continue
 
             self.log("Authentication and Policy Server '{0}' updated successfully"
                      .format(ip_address), "INFO")
@@ -1664,6 +1854,12 @@ class IseRadiusIntegration(DnacBase):
                 ip_address: "Authentication and Policy Server Updated Successfully.{0}".format(trusted_server_msg)
             })
 
+        if failures:
+            self.msg = " ".join(failures)
+            self.status = "failed"
+            return
+
+        self.status = "success"
         return
 
     def get_diff_merged(self, config):
@@ -1694,44 +1890,54 @@ class IseRadiusIntegration(DnacBase):
 
         Returns:
             self
+
+        Description:
+            The existing servers are deleted concurrently, with up to 'max_concurrent_requests' servers at the same time.
         """
 
         result_auth_server = self.result.get("response")[0].get("authenticationPolicyServer")
-        auth_server_index = 0
-        for item in authentication_policy_server:
+        changes = []
+        for auth_server_index, item in enumerate(authentication_policy_server):
             ipAddress = item.get("server_ip_address")
             auth_server_exists = self.have.get("authenticationPolicyServer")[auth_server_index].get("exists")
             if not auth_server_exists:
                 result_auth_server.get("msg").update({
                     ipAddress: "Authentication and Policy Server not found."
                 })
-                auth_server_index += 1
-                self.msg = "Authentication and Policy Server not found."
-                self.status = "success"
                 continue
 
-            response = self.dnac._exec(
-                family="system_settings",
-                function="delete_authentication_and_policy_server_access_configuration",
-                params={"id": self.have.get("authenticationPolicyServer")[auth_server_index].get("id")},
-            )
+            changes.append({
+                "ip_address": ipAddress,
+                "function": "delete_authentication_and_policy_server_access_configuration",
+                "params": {"id": self.have.get("authenticationPolicyServer")[auth_server_index].get("id")},
+                "validation_string_set": ("successfully deleted aaa settings",),
+            })
 
-            self.log("Received API response for 'delete_authentication_and_"
-                     "policy_server_access_configuration': {0}".format(response), "DEBUG")
+        failures = []
+        for change, (status, msg, taskid) in zip(changes, self.apply_auth_server_changes(changes)):
+            ipAddress = change.get("ip_address")
+            if status == "failed":
+                if taskid and "check task tree" in str(msg).lower():
+                    time.sleep(self.params.get('dnac_task_poll_interval'))
+                    msg = self.check_task_tree_response(taskid)
 
-            # Check the task status
-            validation_string = "successfully deleted aaa settings"
-            self.check_task_response_status(response, validation_string, "delete_authentication_and_policy_server_access_configuration").check_return_status()
-            taskid = response.get("response").get("taskId")
+                self.log(msg, "ERROR")
+                failures.append(msg)
+                continue
 
             # Update result information
+            self.result['changed'] = True
             result_auth_server.get("response").update({ipAddress: {}})
             result_auth_server.get("response").get(ipAddress).update({"Task Id": taskid})
             result_auth_server.get("msg").update({
                 ipAddress: "Authentication and Policy Server deleted successfully."
             })
             self.log("Authentication and Policy Server - {0} deleted successfully.".format(ipAddress))
-            auth_server_index += 1
+
+        if failures:
+            self.msg = " ".join(str(failure) for failure in failures)
+            self.status = "failed"
+            return self
 
         self.msg = "Authentication and Policy Server(s) deleted successfully."
         self.status = "success"
@@ -1881,6 +2087,7 @@ def main():
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
+        "max_concurrent_requests": {"type": 'int', "default": 5},
         "validate_response_schema": {"type": 'bool', "default": True},
     }
 
@@ -39,6 +39,13 @@ options:
     description: The interval, in seconds, to poll for task completion.
     type: int
     default: 30
+  max_concurrent_requests:
+    description: Maximum number of requests sent to Cisco Catalyst Center at the same time
+                 when the devices and links of the LAN automated device updates are checked,
+                 and when the loopback, hostname and link updates are submitted and tracked.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config_verify:
     description: Set to true to verify the LAN Automation config after applying
                  the playbook config.
@@ -276,6 +283,10 @@ notes:
     However, if a device is in an Error state or authorization is not checked on
     Catalyst Center, the playbook will keep running until the state of the device
     is active or reached the timeout value.
+  - While waiting for the LAN automation session, the devices given for authorization
+    are checked in PnP every 5 seconds, backing off up to 'dnac_task_poll_interval' while
+    none is ready, and authorized in bulk once they reach 'Pending Authorization' state.
+  - Added 'max_concurrent_requests' option in v6.32.0.
 
   - SDK Method used are
     ccc_lan_automation.lanautomation.lan_automation_start_v2
@@ -537,6 +548,8 @@ class LanAutomation(DnacBase):
         self.updated_hostname, self.no_hostname_updated = [], []
         self.added_link, self.no_link_added = [], []
         self.deleted_link, self.no_link_deleted = [], []
+        self.device_details_by_ip = {}
+        self.pnp_min_check_interval = 5
 
     def validate_input(self):
         """
@@ -975,17 +988,21 @@ class LanAutomation(DnacBase):
 
         return ip_exists
 
-    def get_hostname_details(self, management_ip_address):
+    def get_device_details(self, management_ip_address, refresh=False):
         """
-        Retrieve the hostname of the device associated with the provided management IP address from Catalyst Center.
-        This method queries the device inventory and returns the hostname for the given IP address, if available.
+        Retrieve the inventory record of the device with the provided management IP address from Catalyst Center.
         Args:
             - management_ip_address (str): The management IP address of the device.
+            - refresh (bool, optional): Query Catalyst Center again even when the record is already cached.
         Returns:
-            - str or None: The hostname of the device with the provided IP, or None if not found.
+            - dict or None: The device record, or None if the device was not found or the request failed.
+        Description:
+            Records are cached in 'self.device_details_by_ip', so the hostname and the device ID of a device
+            are read from a single 'get_device_list' request. A failed request is not cached.
         """
+        if not refresh and management_ip_address in self.device_details_by_ip:
+            return self.device_details_by_ip[management_ip_address]
 
-        hostname = None
         try:
             response = self.dnac_apply['exec'](
                 family="devices",
@@ -993,24 +1010,60 @@ class LanAutomation(DnacBase):
                 params={"management_ip_address": management_ip_address},
                 op_modifies=False
             )
-        except Exception:
-            self.log(
-                "Exception occurred while retrieving hostname for management IP address {0}.".format(
-                    management_ip_address),
-                "ERROR"
-            )
+        except Exception as e:
+            self.log("Error fetching device details for {0}: {1}".format(management_ip_address, repr(e)), "ERROR")
             return None
 
-        if response:
-            self.log("Received device details for IP address {0}.".format(management_ip_address), "DEBUG")
-            device_details = response.get("response", [])
+        device_list = response.get("response") if isinstance(response, dict) else None
+        device_details = device_list[0] if device_list else None
+        self.device_details_by_ip[management_ip_address] = device_details
+        self.log("Device details for IP address {0}: {1}".format(management_ip_address, device_details), "DEBUG")
 
-            if len(device_details) > 0:
-                hostname = device_details[0].get("hostname")
-                if hostname:
-                    self.log("Hostname for IP {0} is {1}.".format(management_ip_address, hostname), "INFO")
-            else:
-                self.log("No device found with IP address {0}.".format(management_ip_address), "WARNING")
+        return device_details
+
+    def prefetch_device_details(self, management_ip_addresses, refresh=False):
+        """
+        Retrieve the inventory records of several devices concurrently and cache them.
+        Args:
+            - management_ip_addresses (list): The management IP addresses of the devices.
+            - refresh (bool, optional): Query Catalyst Center again for the devices already cached.
+        Description:
+            Up to 'max_concurrent_requests' devices are looked up at the same time, so the hostname and link
+            checks which follow are answered from 'self.device_details_by_ip'.
+        """
+        ip_addresses = []
+        for ip_address in management_ip_addresses:
+            if ip_address and ip_address not in ip_addresses and \
+                    (refresh or ip_address not in self.device_details_by_ip):
+                ip_addresses.append(ip_address)
+
+        if not ip_addresses:
+            return
+
+        self.log("Fetching device details for IP addresses: {0}".format(ip_addresses), "DEBUG")
+        self.execute_concurrently(
+            lambda ip_address: self.get_device_details(ip_address, refresh),
+            ip_addresses, self.params.get("max_concurrent_requests")
+        )
+
+    def get_hostname_details(self, management_ip_address):
+        """
+        Retrieve the hostname of the device associated with the provided management IP address from Catalyst Center.
+        This method queries the device inventory and returns the hostname for the given IP address, if available.
+        Args:
+            - management_ip_address (str): The management IP address of the device.
+        Returns:
+            - str or None: The hostname of the device with the provided IP, or None if not found.
+        """
+
+        device_details = self.get_device_details(management_ip_address)
+        if not device_details:
+            self.log("No device found with IP address {0}.".format(management_ip_address), "WARNING")
+            return None
+
+        hostname = device_details.get("hostname")
+        if hostname:
+            self.log("Hostname for IP {0} is {1}.".format(management_ip_address, hostname), "INFO")
 
         return hostname
 
@@ -1610,34 +1663,19 @@ class LanAutomation(DnacBase):
             str or None: The device ID if found, otherwise None.
         Description:
             This method retrieves the device ID associated with the provided management IP address
-            by making a call to the API. If an error occurs during the API call or if no device
-            is found, it logs an appropriate message and returns None. If the device is found,
-            it logs the device ID and returns it.
+            from the cached device details, querying Catalyst Center when the device is not cached.
+            If an error occurs during the API call or if no device is found, it logs an appropriate
+            message and returns None. If the device is found, it logs the device ID and returns it.
         """
 
-        try:
-            response = self.dnac_apply['exec'](
-                family="devices",
-                function='get_device_list',
-                params={"management_ip_address": device_ip},
-                op_modifies=False
-            )
-        except Exception as e:
-            self.log("Error fetching device ID for {0}: {1}".format(device_ip, str(e)), "ERROR")
-            return None
-
-        if not response or "response" not in response:
-            self.log("No device found for {0}".format(device_ip), "INFO")
-            return None
-
-        device_list = response.get("response", [])
-        if device_list and len(device_list) > 0:
-            device_id = device_list[0].get("id")
+        device_details = self.get_device_details(device_ip)
+        device_id = device_details.get("id") if device_details else None
+        if device_id:
             self.log("Device ID for {0} is {1}".format(device_ip, device_id), "INFO")
             return device_id
-        else:
-            self.log("No device ID found for {0}".format(device_ip), "INFO")
-            return None
+
+        self.log("No device ID found for {0}".format(device_ip), "INFO")
+        return None
 
     def check_link_details(self, source_device_ip, interface_name):
         """
@@ -1695,6 +1733,35 @@ class LanAutomation(DnacBase):
             self.log("Invalid link details for {0} on {1}".format(source_device_ip, interface_name), "INFO")
             return False
 
+    def check_links_details(self, link_updates):
+        """
+        Check the link details of the source and destination interfaces of several links concurrently.
+        Args:
+            link_updates (list): Dictionaries with "sourceDeviceManagementIPAddress", "sourceDeviceInterfaceName",
+                                 "destinationDeviceManagementIPAddress" and "destinationDeviceInterfaceName".
+        Returns:
+            dict: The result of 'check_link_details' keyed by (device IP, interface name).
+        Description:
+            The devices of all the links are looked up first, then the interfaces are checked with up to
+            'max_concurrent_requests' requests at the same time.
+        """
+        interfaces = []
+        for link in link_updates:
+            for ip_key, interface_key in (("sourceDeviceManagementIPAddress", "sourceDeviceInterfaceName"),
+                                          ("destinationDeviceManagementIPAddress", "destinationDeviceInterfaceName")):
+                interface = (link.get(ip_key), link.get(interface_key))
+                if interface not in interfaces:
+                    interfaces.append(interface)
+
+        if not interfaces:
+            return {}
+
+        self.prefetch_device_details([device_ip for device_ip, interface_name in interfaces])
+        results = self.execute_concurrently(
+            lambda interface: self.check_link_details(*interface), interfaces, self.params.get("max_concurrent_requests")
+        )
+        return dict(zip(interfaces, results))
+
     def fail_with_error(self, error_message):
         """
         Log an error and raise a failure.
@@ -1852,6 +1919,7 @@ class LanAutomation(DnacBase):
 
         lan_devices = self.want.get("lan_automated_device_update", {})
         if lan_devices:
+            self.prefetch_device_details(self.get_update_device_ips(lan_devices, verify=True), refresh=True)
             self.process_loopback_updates(lan_devices.get("loopbackUpdateDeviceList", []))
             self.process_hostname_updates(lan_devices.get("hostnameUpdateDevices", []))
             self.process_link_addition(lan_devices.get("linkAdd", {}))
@@ -1880,7 +1948,7 @@ class LanAutomation(DnacBase):
         self.log("Processing loopback updates.", "INFO")
         for loopback in loopback_updates:
             new_ip = loopback.get("newLoopback0IPAddress")
-            if self.get_ip_details(new_ip, "new loopback IP update"):
+            if self.get_device_details(new_ip):
                 self.log("Verified loopback IP address {0} was updated on Catalyst Center.".format(new_ip), "INFO")
             else:
                 self.log("Loopback IP address {0} was not updated on Catalyst Center.".format(new_ip), "WARNING")
@@ -1942,8 +2010,9 @@ class LanAutomation(DnacBase):
         destination_ip_address = link_add.get("destinationDeviceManagementIPAddress")
         destination_interface_name = link_add.get("destinationDeviceInterfaceName")
 
-        if self.check_link_details(source_ip_address, source_interface_name) and \
-                self.check_link_details(destination_ip_address, destination_interface_name):
+        link_details = self.check_links_details([link_add])
+        if link_details.get((source_ip_address, source_interface_name)) and \
+                link_details.get((destination_ip_address, destination_interface_name)):
             self.log("Link between {0}/{1} and {2}/{3} was added successfully in Catalyst Center.".format(
                 source_ip_address, source_interface_name, destination_ip_address, destination_interface_name),
                 "INFO")
@@ -1977,8 +2046,9 @@ class LanAutomation(DnacBase):
         destination_ip_address = link_delete.get("destinationDeviceManagementIPAddress")
         destination_interface_name = link_delete.get("destinationDeviceInterfaceName")
 
-        if not self.check_link_details(source_ip_address, source_interface_name) and \
-                not self.check_link_details(destination_ip_address, destination_interface_name):
+        link_details = self.check_links_details([link_delete])
+        if not link_details.get((source_ip_address, source_interface_name)) and \
+                not link_details.get((destination_ip_address, destination_interface_name)):
             self.log("Link between {0}/{1} and {2}/{3} has already been removed.".format(
                 source_ip_address, source_interface_name, destination_ip_address, destination_interface_name),
                 "INFO")
@@ -2111,6 +2181,10 @@ class LanAutomation(DnacBase):
         }
 
         filtered_updates = {}
+        self.prefetch_device_details(self.get_update_device_ips(update_device))
+        link_details = self.check_links_details(
+            [update_device[link_key] for link_key in ("linkAdd", "linkDelete") if update_device.get(link_key)]
+        )
 
         for update_key, update_type in update_types.items():
             updates = update_device.get(update_key, {} if update_key in ["linkAdd", "linkDelete"] else [])
@@ -2156,8 +2230,8 @@ class LanAutomation(DnacBase):
                     destination_ip_address = updates.get("destinationDeviceManagementIPAddress")
                     destination_interface_name = updates.get("destinationDeviceInterfaceName")
 
-                    if self.check_link_details(source_ip_address, source_interface_name) and \
-                            self.check_link_details(destination_ip_address, destination_interface_name):
+                    if link_details.get((source_ip_address, source_interface_name)) and \
+                            link_details.get((destination_ip_address, destination_interface_name)):
                         self.log("Link already exists between {}/{} and {}/{}. No update needed.".format(
                             source_ip_address, source_interface_name, destination_ip_address,
                             destination_interface_name),
@@ -2167,17 +2241,17 @@ class LanAutomation(DnacBase):
                     else:
                         filtered_updates[update_key] = updates
 
-                    if not filtered_updates[update_key]:
+                    if not filtered_updates.get(update_key):
                         self.log("No link add updates needed after filtering.", "INFO")
 
                 elif update_type == "link_delete":
-                    if not self.check_link_details(
+                    if not link_details.get((
                             updates.get("sourceDeviceManagementIPAddress"),
                             updates.get("sourceDeviceInterfaceName")
-                    ) and not self.check_link_details(
+                    )) and not link_details.get((
                         updates.get("destinationDeviceManagementIPAddress"),
                         updates.get("destinationDeviceInterfaceName")
-                    ):
+                    )):
                         filtered_updates[update_key] = updates
                         self.log("Link delete updates ready for processing: {}".format(updates), "DEBUG")
                     else:
@@ -2191,6 +2265,32 @@ class LanAutomation(DnacBase):
 
         return filtered_updates
 
+    def get_update_device_ips(self, update_device, verify=False):
+        """
+        Collect the management IP addresses of the devices referenced by the LAN automated device updates.
+        Args:
+            update_device (dict): The LAN automated device updates in camelCase.
+            verify (bool, optional): Also collect the new loopback IP addresses, which identify the devices
+                                     once the loopback updates are applied.
+        Returns:
+            list: The management IP addresses, without duplicates.
+        """
+        ip_addresses = []
+        for device in update_device.get("hostnameUpdateDevices") or []:
+            ip_addresses.append(device.get("deviceManagementIPAddress"))
+
+        if verify:
+            for device in update_device.get("loopbackUpdateDeviceList") or []:
+                ip_addresses.append(device.get("newLoopback0IPAddress"))
+
+        for link_key in ("linkAdd", "linkDelete"):
+            link = update_device.get(link_key) or {}
+            ip_addresses.extend([link.get("sourceDeviceManagementIPAddress"),
+                                 link.get("destinationDeviceManagementIPAddress")])
+
+        return [ip_address for index, ip_address in enumerate(ip_addresses)
+                if ip_address and ip_address not in ip_addresses[:index]]
+
     def update_lan_auto_devices(self, filtered_updates):
         """
         Update LAN automated devices based on the filtered configuration from the input file.
@@ -2199,9 +2299,11 @@ class LanAutomation(DnacBase):
         Returns:
             dict: A dictionary containing task IDs for each type of update process.
         Description:
-            This method iterates through the provided filtered updates and initiates API calls for each update type.
-            It logs the processing steps and captures task IDs returned by the API. If no updates are found for a type,
-            it logs that the update is being skipped. In case of an error during API calls, the method logs the failure.
+            This method initiates the API calls of all the update types found in the filtered updates concurrently,
+            with up to 'max_concurrent_requests' calls at the same time. It logs the processing steps and captures
+            task IDs returned by the API. If no updates are found for a type, it logs that the update is being
+            skipped. In case of an error during API calls, the method logs the failure and marks the operation
+            as failed.
         """
 
         task_ids = {
@@ -2218,21 +2320,31 @@ class LanAutomation(DnacBase):
             "linkDelete": "link_delete"
         }
 
+        requests = []
         for update_key, update_type in update_types.items():
             updates = filtered_updates.get(update_key, [])
 
             if updates:
                 self.log("Processing updates for {}: {}".format(update_key, updates), "DEBUG")
+                requests.append((update_type, updates))
+            else:
+                self.log("No updates found for {}, skipping.".format(update_key), "INFO")
 
-                task_id = self.call_lan_auto_update_api(update_type, updates)
+        responses = self.execute_concurrently(
+            lambda request: self.call_lan_auto_update_api(*request), requests, self.params.get("max_concurrent_requests")
+        )
+        # The hostnames, loopbacks and links change with the updates, so the cached device details are outdated.
+        self.device_details_by_ip.clear()
 
-                if task_id:
-                    task_ids[update_type] = task_id
-                    self.log("Successfully initiated {} update. Task ID: {}".format(update_type, task_id), "INFO")
-                else:
-                    self.log("Failed to get task ID for {} update: {}".format(update_type, updates), "ERROR")
+        for (update_type, updates), (task_id, error_msg) in zip(requests, responses):
+            if task_id:
+                task_ids[update_type] = task_id
+                self.log("Successfully initiated {} update. Task ID: {}".format(update_type, task_id), "INFO")
             else:
-                self.log("No updates found for {}, skipping.".format(update_key), "INFO")
+                self.log("Failed to get task ID for {} update: {}".format(update_type, updates), "ERROR")
+
+            if error_msg:
+                self.set_operation_result("failed", False, error_msg, "CRITICAL")
 
         self.log("Generated task_ids: {}".format(task_ids))
 
@@ -2249,8 +2361,12 @@ class LanAutomation(DnacBase):
             The method handles both scenarios of waiting for task completion and logging progress.
             If 'launch_and_wait' is False, it retrieves task details once and logs the outcome.
             If True, it continuously polls the task status and checks for errors or completion.
-            It also handles PnP device authorizations if enabled, logging necessary information throughout the process.
-            The method ensures to set the operation result based on the final status of the task.
+            It also handles PnP device authorizations if enabled: the devices still waiting for authorization are
+            looked up with a single PnP request, the ones discovered since the previous check are logged and all
+            of them which reached 'Pending Authorization' are authorized in bulk. The PnP checks run on their own
+            schedule, starting every 'pnp_min_check_interval' seconds and backing off up to 'dnac_task_poll_interval'
+            while no device is ready, between the polls of the LAN automation task. The method ensures to set the
+            operation result based on the final status of the task.
         """
 
         lan_automation = self.want.get("lan_automation", {})
@@ -2266,7 +2382,9 @@ class LanAutomation(DnacBase):
         self.log("Device Serial Numbers: {}".format(device_serials), "DEBUG")
 
         start_time = time.time()
+        last_log_collection_time = start_time
         remaining_auth_devices = device_serials.copy()
+        discovered_devices = set()
         pending_authorization = True
 
         task_id = task_id.get("response", {}).get("taskId")
@@ -2309,49 +2427,61 @@ class LanAutomation(DnacBase):
 
         self.log("Entering polling loop for LAN automation task completion...", "DEBUG")
 
+        poll_interval = self.params.get("dnac_task_poll_interval", 30)
+        pnp_check_interval = min(self.pnp_min_check_interval, poll_interval)
+        next_task_check_time = start_time
         while True:
-            task_details = self.get_task_details(task_id)
-            if not task_details:
-                self.msg = "Error retrieving task status for starting LAN Automation with task_id '{}'.".format(task_id)
-                self.set_operation_result("failed", False, self.msg, "ERROR")
-                break
+            if time.time() < next_task_check_time:
+                # Only the PnP devices are checked until the LAN automation session is due for its next poll
+                task_details = None
+            else:
+                task_details = self.get_task_details(task_id)
+                next_task_check_time = time.time() + poll_interval
+                if not task_details:
+                    self.msg = "Error retrieving task status for starting LAN Automation with task_id '{}'.".format(task_id)
+                    self.set_operation_result("failed", False, self.msg, "ERROR")
+                    break
 
-            self.log("Current task details for task ID {}: {}".format(task_id, task_details), "DEBUG")
+            if task_details:
+                self.log("Current task details for task ID {}: {}".format(task_id, task_details), "DEBUG")
 
-            if task_details.get("isError") is True:
-                error_msg = task_details.get("failureReason") or task_details.get("progress")
-                self.msg = "Error encountered: {}".format(error_msg)
-                self.status = "failed"
-                self.log(self.msg, "ERROR")
-                self.set_operation_result("failed", True, self.msg, "INFO")
-                break
+                if task_details.get("isError") is True:
+                    error_msg = task_details.get("failureReason") or task_details.get("progress")
+                    self.msg = "Error encountered: {}".format(error_msg)
+                    self.status = "failed"
+                    self.log(self.msg, "ERROR")
+                    self.set_operation_result("failed", True, self.msg, "INFO")
+                    break
 
-            if "complete" in task_details.get("progress", "").lower():
-                self.msg = "LAN automation has completed successfully: {}".format(task_details.get('progress'))
-                self.log(self.msg, "INFO")
-                self.completed_lan_automation.append(lan_automation.get("primaryDeviceManagmentIPAddress"))
-                self.status = "success"
-                self.set_operation_result("success", True, self.msg, "INFO")
-                break
+                if "complete" in task_details.get("progress", "").lower():
+                    self.msg = "LAN automation has completed successfully: {}".format(task_details.get('progress'))
+                    self.log(self.msg, "INFO")
+                    self.completed_lan_automation.append(lan_automation.get("primaryDeviceManagmentIPAddress"))
+                    self.status = "success"
+                    self.set_operation_result("success", True, self.msg, "INFO")
+                    break
 
-            self.log("Current progress for task ID {}: {}".format(task_id, task_details.get('progress')), "DEBUG")
-            elapsed_time = time.time() - start_time
-            if int(elapsed_time) % 300 == 0:
-                logs = self.collect_logs()
-                if logs:
-                    self.log("Collected logs: {}".format(logs), "INFO")
-                    self.msg = "LAN Automation Session Logs: {}".format(logs)
+                self.log("Current progress for task ID {}: {}".format(task_id, task_details.get('progress')), "DEBUG")
+                if time.time() - last_log_collection_time >= 300:
+                    last_log_collection_time = time.time()
+                    logs = self.collect_logs()
+                    if logs:
+                        self.log("Collected logs: {}".format(logs), "INFO")
+                        self.msg = "LAN Automation Session Logs: {}".format(logs)
 
             if pnp_authorization and pending_authorization:
                 if remaining_auth_devices:
                     self.log(
                         "Authorizing devices in PnP with serial numbers provided: {}".format(remaining_auth_devices),
                         "DEBUG")
-                    authorized_devices = self.authorize_devices(remaining_auth_devices)
+                    authorized_devices = self.authorize_devices(remaining_auth_devices, discovered_devices)
                     self.log("Authorized devices: {}".format(', '.join(authorized_devices)), "INFO")
                     remaining_auth_devices = [device for device in remaining_auth_devices if
                                               device not in authorized_devices]
 
+                    # Check again soon after a device was authorized, and back off while none is ready
+                    pnp_check_interval = (min(self.pnp_min_check_interval, poll_interval) if authorized_devices
+                                          else min(pnp_check_interval * 2, poll_interval))
                     if not authorized_devices:
                         self.log(
                             "Some devices from {} were not authorized as their state is not Pending Authorization. "
@@ -2373,8 +2503,12 @@ class LanAutomation(DnacBase):
                                 "discovery. Please authorize devices manually in the PnP page in Catalyst Center.")
                     self.set_operation_result("failed", False, self.msg, "ERROR")
 
-            self.log("Waiting for 30 seconds before the next status check...", "DEBUG")
-            time.sleep(self.params.get("dnac_task_poll_interval", 30))
+            wait_time = max(next_task_check_time - time.time(), 0)
+            if pnp_authorization and pending_authorization:
+                wait_time = min(wait_time, pnp_check_interval)
+
+            self.log("Waiting for {0:.0f} seconds before the next status check...".format(wait_time), "DEBUG")
+            time.sleep(wait_time)
 
         if self.status != "success":
             elapsed_time = time.time() - start_time
@@ -2395,12 +2529,13 @@ class LanAutomation(DnacBase):
             payload (list): The payload containing the update details from the input file. The structure
                             depends on the update type and is derived from filtered updates.
         Returns:
-            str: The task ID from the API response if successful, otherwise None.
+            tuple: The task ID from the API response if successful, otherwise None, and the error message
+                   if the API call raised an error, otherwise None.
         Description:
             The method prepares the request parameters according to the type of update and makes the API call.
             It logs the parameters and response received from the API. If the API returns a task ID,
             it logs and returns that ID. In case of an error during the API call, it logs the error
-            and returns None.
+            and returns it, so the method can run concurrently for several update types.
         """
         feature_map = {
             "loopback_update": "LOOPBACK0_IPADDRESS_UPDATE",
@@ -2439,16 +2574,15 @@ class LanAutomation(DnacBase):
             if response:
                 task_id = response["response"].get("taskId")
                 self.log("Task ID for {} update is {}".format(update_type, task_id), "DEBUG")
-                return task_id
+                return task_id, None
             else:
                 self.log("No response received from {} API call".format(update_type), "ERROR")
-                return None
+                return None, None
 
         except Exception as e:
-            self.log("Error occurred during {} update: {}".format(update_type, str(e)), "CRITICAL")
-            self.set_operation_result("failed", False,
-                                      "Error occurred during {} update: {}".format(update_type, str(e)), "CRITICAL")
-        return None
+            error_msg = "Error occurred during {} update: {}".format(update_type, str(e))
+            self.log(error_msg, "CRITICAL")
+            return None, error_msg
 
     def get_update_lan_task_status(self, task_ids):
         """
@@ -2458,57 +2592,64 @@ class LanAutomation(DnacBase):
         Returns:
             self: An instance of the class used for interacting with Cisco Catalyst Center.
         Description:
-            This method iterates through each task ID associated with different update types, such as
-            loopback updates, hostname updates, and link management. For each task ID, it retrieves the
-            status, checks for errors, and logs the relevant information. If an update is completed
-            successfully, it appends the task ID to the corresponding list of completed tasks. In case of
-            errors, appropriate messages are logged, and the operation result is marked as failed.
+            This method monitors the task IDs of all the update types, such as loopback updates, hostname
+            updates, and link management, together. Every round retrieves the status of the pending tasks
+            with up to 'max_concurrent_requests' requests at the same time and then waits once for
+            'dnac_task_poll_interval' seconds. If an update is completed successfully, it appends the task ID
+            to the corresponding list of completed tasks. The errors of all the failed updates are logged and
+            the operation result is marked as failed once every task has finished.
         """
         self.log("Task Ids is: {}".format(task_ids))
 
-        for update_type, task_id in task_ids.items():
-            if task_id is not None:
-                self.log("Monitoring task ID: {} for update type: {}".format(task_id, update_type), "INFO")
-
-                while True:
-                    task_details = self.get_task_details(task_id)
-                    if not task_details:
-                        self.msg = "Error retrieving task status for task_id '{}'.".format(task_id)
-                        self.log(self.msg, "ERROR")
-                        self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
-                        break
-
-                    self.log("Task details for task ID {}: {}".format(task_id, task_details), "DEBUG")
-
-                    if task_details.get("isError") is True:
-                        error_msg = task_details.get("failureReason") or task_details.get("progress")
-                        self.msg = "Error encountered for update type {} with Task ID: '{}': {} Check the logs " \
-                                   "for more details.".format(update_type, task_id, error_msg)
-
-                        self.log(self.msg, "ERROR")
-                        self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
-                        break
+        completed_lists = {
+            "loopback_update": self.updated_loopback,
+            "hostname_update": self.updated_hostname,
+            "link_add": self.added_link,
+            "link_delete": self.deleted_link
+        }
+        success_markers = ("deleted", "config push success", "update performed successfully")
+        pending = [(update_type, task_id) for update_type, task_id in task_ids.items() if task_id is not None]
+        errors = []
 
-                    if ("deleted" in task_details.get("progress", "").lower() or
-                            "config push success" in task_details.get("progress", "").lower() or
-                            "update performed successfully" in task_details.get("progress", "").lower()):
-                        self.msg = "Update {} for task ID '{}' completed successfully".format(update_type, task_id)
-                        self.log(self.msg, "INFO")
-
-                        if update_type == "loopback_update":
-                            self.updated_loopback.append(task_id)
-                        elif update_type == "hostname_update":
-                            self.updated_hostname.append(task_id)
-                        elif update_type == "link_add":
-                            self.added_link.append(task_id)
-                        elif update_type == "link_delete":
-                            self.deleted_link.append(task_id)
-                        break
+        for update_type, task_id in pending:
+            self.log("Monitoring task ID: {} for update type: {}".format(task_id, update_type), "INFO")
 
+        while pending:
+            task_details_list = self.execute_concurrently(
+                lambda task: self.get_task_details(task[1]), pending, self.params.get("max_concurrent_requests")
+            )
+            still_pending = []
+            for (update_type, task_id), task_details in zip(pending, task_details_list):
+                if not task_details:
+                    errors.append("Error retrieving task status for task_id '{}'.".format(task_id))
+                    self.log(errors[-1], "ERROR")
+                    continue
+
+                self.log("Task details for task ID {}: {}".format(task_id, task_details), "DEBUG")
+                progress = task_details.get("progress", "").lower()
+
+                if task_details.get("isError") is True:
+                    error_msg = task_details.get("failureReason") or task_details.get("progress")
+                    errors.append("Error encountered for update type {} with Task ID: '{}': {} Check the logs "
+                                  "for more details.".format(update_type, task_id, error_msg))
+                    self.log(errors[-1], "ERROR")
+                elif any(marker in progress for marker in success_markers):
+                    self.log("Update {} for task ID '{}' completed successfully".format(update_type, task_id), "INFO")
+                    completed_lists[update_type].append(task_id)
+                else:
                     self.log("Current progress for task ID {}: {}".format(task_id, task_details.get('progress')),
                              "DEBUG")
+                    still_pending.append((update_type, task_id))
 
-                    time.sleep(self.params.get("dnac_task_poll_interval", 30))
+            pending = still_pending
+            if pending:
+                time.sleep(self.params.get("dnac_task_poll_interval", 30))
+
+        if errors:
+            self.msg = " ".join(errors)
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        elif self.updated_loopback or self.updated_hostname or self.added_link or self.deleted_link:
+            self.msg = "LAN automated device updates completed successfully."
 
         return self
 
@@ -2542,20 +2683,32 @@ class LanAutomation(DnacBase):
             self.log("Error retrieving log status: {}".format(str(e)), "WARNING")
             return {}
 
-    def authorize_devices(self, device_serials):
+    def authorize_devices(self, device_serials, discovered_devices=None):
         """
         Authorizes devices based on serial numbers either from device_serial_numbers or discovery_devices.
+        Args:
+            device_serials (list): Serial numbers of the devices still waiting for authorization.
+            discovered_devices (set, optional): Serial numbers of the devices already seen in PnP. The devices
+                                                found for the first time are logged and added to it.
         Returns:
             list: A list of successfully authorized device serial numbers.
         Description:
-            This method checks the state of devices corresponding to the provided serial numbers.
-            If devices are in 'Pending Authorization' state, it attempts to authorize them. The method
-            returns a list of successfully authorized devices or an empty list if some devices were not found.
+            This method checks the state of devices corresponding to the provided serial numbers with a single
+            PnP device list request. All the devices in 'Pending Authorization' state are authorized together
+            with one request. The method returns a list of successfully authorized devices or an empty list if
+            some devices were not found.
         """
 
         self.log("Retrieving device IDs for serial numbers: {}".format(device_serials), "DEBUG")
         device_list_response = self.get_device_list(device_serials)
 
+        if discovered_devices is not None:
+            found_serials = [(device.get("deviceInfo") or {}).get("serialNumber") for device in device_list_response]
+            new_serials = [serial for serial in found_serials if serial in device_serials and serial not in discovered_devices]
+            if new_serials:
+                discovered_devices.update(new_serials)
+                self.log("Newly discovered devices in PnP: {}".format(', '.join(new_serials)), "INFO")
+
         if not device_list_response:
             self.log(
                 "Failed to retrieve device list and information for authorization. Devices might have not onboarded "
@@ -2967,6 +3120,7 @@ def main():
                     "config_verify": {"type": "bool", "default": False},
                     "dnac_api_task_timeout": {"type": "int", "default": 604800},
                     "dnac_task_poll_interval": {"type": "int", "default": 30},
+                    "max_concurrent_requests": {"type": "int", "default": 5},
                     "config": {"required": True, "type": "list", "elements": "dict"},
                     "state": {"default": "merged", "choices": ["merged", "deleted"]}
                     }
@@ -36,6 +36,15 @@ options:
    type: str
    choices: [merged, deleted]
    default: merged
+ max_concurrent_requests:
+   description:
+    - Maximum number of sites whose network settings are read or updated at the same time.
+    - The settings of a single site are still updated one after the other.
+    - Set to 1 to process the sites one after the other.
+    - Applicable only for Catalyst Center version 2.3.7.6 and later.
+   type: int
+   default: 5
+   version_added: 6.32.0
  config:
    description:
     - List of details of global pool, reserved pool, network being managed.
@@ -445,6 +454,7 @@ notes:
     put /dna/intent/api/v1/reserve-ip-subpool/{siteId},
     put /dna/intent/api/v2/network/{siteId},
 
+  - Added 'max_concurrent_requests' option in v6.32.0
 """
 EXAMPLES = r"""
 - name: Create global pool
@@ -700,6 +710,7 @@ response_3:
 """
 
 import copy
+import ipaddress
 import re
 import time
 from ansible.module_utils.basic import AnsibleModule
@@ -726,6 +737,9 @@ class NetworkSettings(DnacBase):
         self.reserve_pool_obj_params = self.get_obj_params("ReservePool")
         self.network_obj_params = self.get_obj_params("Network")
         self.all_reserved_pool_details = {}
+        self.global_pool_index = None
+        self.reserve_pool_index = {}
+        self.pool_page_limit = 500
         self.global_pool_response = {}
         self.reserve_pool_response = {}
 
@@ -1125,12 +1139,11 @@ class NetworkSettings(DnacBase):
 
             self.log("Successfully retrieved DNS settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, dhcp_response), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting DHCP settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return dhcp_details
 
@@ -1164,12 +1177,11 @@ class NetworkSettings(DnacBase):
 
             self.log("Successfully retrieved DNS settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, dns_details), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting DNS settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return dns_details
 
@@ -1204,12 +1216,11 @@ class NetworkSettings(DnacBase):
 
             self.log("Successfully retrieved telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, telemetry_details), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return telemetry_details
 
@@ -1246,12 +1257,11 @@ class NetworkSettings(DnacBase):
 
             self.log("Successfully retrieved NTP server settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, ntpserver_details), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting NTP server settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return ntpserver_details
 
@@ -1285,12 +1295,11 @@ class NetworkSettings(DnacBase):
 
             self.log("Successfully retrieved time zone settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, timezone_details), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting time zone settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return timezone_details
 
@@ -1325,12 +1334,11 @@ class NetworkSettings(DnacBase):
             self.log("Successfully retrieved banner (Message of the Day) settings for site '{0}' (ID: {1}): {2}"
                      .format(site_name, site_id, messageoftheday_details), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting banner settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return messageoftheday_details
 
@@ -1384,12 +1392,11 @@ class NetworkSettings(DnacBase):
             self.log("Successfully retrieved AAA Client and Endpoint settings for site '{0}' (ID: {1}): {2}"
                      .format(site_name, site_id, client_and_endpoint_aaa), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while getting AAA settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return network_aaa, client_and_endpoint_aaa
 
@@ -1419,6 +1426,9 @@ class NetworkSettings(DnacBase):
 
         Returns:
             network_details: Processed Network data in a format suitable for configuration, or None on error.
+
+        Raises:
+            Exception: If the network settings of the site cannot be retrieved.
         """
         self.log("Attempting to retrieve network configuration details for site '{0}' (ID: {1})".format(site_name, site_id), "INFO")
 
@@ -1430,13 +1440,12 @@ class NetworkSettings(DnacBase):
                 params={"site_id": site_id}
             )
         except Exception as msg:
-            self.msg = (
-                "Exception occurred while getting the network settings details "
-                "from Cisco Catalyst Center: {msg}".format(msg=msg)
+            error_message = (
+                "Exception occurred while getting the network settings details of the site '{site_name}' "
+                "from Cisco Catalyst Center: {msg}".format(site_name=site_name, msg=msg)
             )
-            self.log(str(msg), "ERROR")
-            self.status = "failed"
-            return self
+            self.log(error_message, "ERROR")
+            raise Exception(error_message)
 
         self.log("Received API response from 'get_network_v2' for site '{0}' (ID: {1}): {2}".format(site_name, site_id, response,), "DEBUG")
         if not isinstance(response, dict):
@@ -1811,7 +1820,8 @@ class NetworkSettings(DnacBase):
                     op_modifies=True,
                     params={
                         "site_id": site_id,
-                        "offset": offset
+                        "offset": offset,
+                        "limit": self.pool_page_limit
                     }
                 )
             except Exception as msg:
@@ -1834,12 +1844,13 @@ class NetworkSettings(DnacBase):
 
             self.all_reserved_pool_details.get(site_id).extend(reserve_pool_details)
 
+            # Older releases ignore the limit and return pages of 25 records
             if len(reserve_pool_details) < 25:
                 self.log("Found {0} record(s), No more record available for the next offset"
                          .format(str(len(reserve_pool_details))), "INFO")
                 break
 
-            offset += 25
+            offset += len(reserve_pool_details)
 
             end_time = time.time()
             if (end_time - start_time) >= self.max_timeout:
@@ -1852,40 +1863,36 @@ class NetworkSettings(DnacBase):
 
         return self
 
-    def global_pool_exists(self, name):
+    def get_global_pool_index(self):
         """
-        Check if the Global Pool with the given name exists
+        Load all the Global Pools from the Cisco Catalyst Center once and index them by name and CIDR.
 
         Parameters:
-            name (str) - The name of the Global Pool to check for existence
+            self (object) - The current object details.
 
         Returns:
-            dict - A dictionary containing information about the Global Pool's existence:
-            - 'exists' (bool): True if the Global Pool exists, False otherwise.
-            - 'id' (str or None): The ID of the Global Pool if it exists, or None if it doesn't.
-            - 'details' (dict or None): Details of the Global Pool if it exists, else None.
+            dict - The Global Pool index with the keys
+            - 'pools' (list): The Global Pool details as returned by the API.
+            - 'by_name' (dict): The Global Pool details keyed by the pool name.
+            - 'by_cidr' (dict): The Global Pool details keyed by the pool CIDR.
         """
 
-        global_pool = {
-            "exists": False,
-            "details": None,
-            "id": None
-        }
-        all_global_pool = []
+        if self.global_pool_index is not None:
+            return self.global_pool_index
+
+        all_global_pool_details = []
         offset = 1
-        global_pool_details = None
-        response = None
         while True:
             try:
                 response = self.dnac._exec(
                     family="network_settings",
                     function="get_global_pool",
-                    params={"offset": offset}
+                    params={"offset": offset, "limit": self.pool_page_limit}
                 )
             except Exception as msg:
                 self.msg = (
-                    "Exception occurred while getting the global pool details with name '{name}': {msg}"
-                    .format(name=name, msg=msg)
+                    "Exception occurred while getting the global pool details: {msg}"
+                    .format(msg=msg)
                 )
                 self.log(str(msg), "ERROR")
                 self.fail_and_exit(self.msg)
@@ -1895,49 +1902,164 @@ class NetworkSettings(DnacBase):
                 self.log(self.msg, "CRITICAL")
                 self.fail_and_exit(self.msg)
 
-            all_global_pool_details = response.get("response")
-            if not all_global_pool_details:
-                if name == "":
-                    self.log("Global pool '{0}' does not exist".format(all_global_pool), "INFO")
-                    return all_global_pool
-                self.log("Global pool '{0}' does not exist".format(name), "INFO")
-                return global_pool
+            global_pool_details = response.get("response")
+            if not global_pool_details:
+                break
 
-            if name == "":
-                global_pool_details = all_global_pool_details
-            else:
-                global_pool_details = get_dict_result(all_global_pool_details, "ipPoolName", name)
+            all_global_pool_details.extend(global_pool_details)
 
-            if global_pool_details and isinstance(global_pool_details, dict):
-                self.log("Global pool found with name '{0}': {1}".format(name, global_pool_details), "INFO")
-                global_pool.update({"exists": True})
-                global_pool.update({"id": global_pool_details.get("id")})
-                global_pool["details"] = self.get_global_pool_params(global_pool_details)
+            # Older releases ignore the limit and return pages of 25 records
+            if len(global_pool_details) < 25:
                 break
 
-            if global_pool_details and isinstance(global_pool_details, list) and name == "":
-                self.log("Global pool found {0}".format(
-                    self.pprint(global_pool_details)), "INFO")
+            offset += len(global_pool_details)
 
-                for each_pool in global_pool_details:
-                    global_del_pool = {
-                        "exists": True,
-                        "id": each_pool.get("id"),
-                        "details": self.get_global_pool_params(each_pool)
-                    }
-                    all_global_pool.append(global_del_pool)
+        self.global_pool_index = {
+            "pools": all_global_pool_details,
+            "by_name": dict((pool.get("ipPoolName"), pool) for pool in all_global_pool_details),
+            "by_cidr": dict((pool.get("ipPoolCidr"), pool) for pool in all_global_pool_details),
+        }
+        self.log("Indexed {0} global pool(s) from the Cisco Catalyst Center."
+                 .format(len(all_global_pool_details)), "INFO")
+        return self.global_pool_index
 
-            if len(all_global_pool_details) < 25:
-                self.log("Found {0} record(s), No more record available for the next offset"
-                         .format(str(len(all_global_pool_details))), "INFO")
-                if self.payload.get("state") == "deleted" and name == "":
-                    self.log("Formatted global pool details: {0}".format(
-                        self.pprint(all_global_pool)), "DEBUG")
-                    return all_global_pool
-                break
+    def get_reserve_pool_index(self, site_name):
+        """
+        Load all the Reserved Pools of a site from the Cisco Catalyst Center once and index them by name and CIDR.
+        Use check_return_status() to check for failure
+
+        Parameters:
+            site_name (str) - The name of the site where the Reserved Pools are located.
+
+        Returns:
+            dict or None - The Reserved Pool index of the site with the keys 'site_id', 'pools',
+            'by_name' (Reserved Pool details keyed by the group name) and 'by_cidr' (Reserved Pool
+            details keyed by the CIDR of each of its IPv4 and IPv6 pools), or None if the site doesn't exist.
+        """
+
+        if site_name in self.reserve_pool_index:
+            return self.reserve_pool_index.get(site_name)
 
-            offset += 25
+        site_exist, site_id = self.get_site_id(site_name)
+        self.log("Site ID for the site name {0}: {1}".format(site_name, site_id), "DEBUG")
+        if not site_id:
+            self.msg = "Failed to get the site id from the site name {0}".format(site_name)
+            self.status = "failed"
+            return None
+
+        if site_id not in self.all_reserved_pool_details:
+            self.get_reserved_ip_subpool(site_name, site_id)
+
+        all_reserve_pool_details = self.all_reserved_pool_details.get(site_id) or []
+        reserve_pool_index = {
+            "site_id": site_id,
+            "pools": all_reserve_pool_details,
+            "by_name": {},
+            "by_cidr": {}
+        }
+        for pool in all_reserve_pool_details:
+            reserve_pool_index["by_name"][pool.get("groupName")] = pool
+            for ip_pool in pool.get("ipPools") or []:
+                reserve_pool_index["by_cidr"][ip_pool.get("ipPoolCidr")] = pool
+
+        self.reserve_pool_index[site_name] = reserve_pool_index
+        self.log("Indexed {0} reserved pool(s) in the site '{1}'."
+                 .format(len(all_reserve_pool_details), site_name), "INFO")
+        return reserve_pool_index
+
+    def reset_pool_index(self):
+        """
+        Discard the Global Pool and Reserved Pool indexes so that the next lookup reads the pools again.
 
+        Parameters:
+            self (object) - The current object details.
+
+        Returns:
+            None
+        """
+
+        self.all_reserved_pool_details = {}
+        self.global_pool_index = None
+        self.reserve_pool_index = {}
+
+    def get_overlapping_pools(self, cidr, pools_by_cidr):
+        """
+        Find the pools whose CIDR overlaps with the given CIDR.
+
+        Parameters:
+            cidr (str) - The CIDR to check, for example '10.0.0.0/8'.
+            pools_by_cidr (dict) - The pool details keyed by CIDR, as in the pool indexes.
+
+        Returns:
+            list - The CIDRs of the pools overlapping with the given CIDR. Empty if the given CIDR is
+            not a valid network, the Cisco Catalyst Center validates it in that case.
+        """
+
+        try:
+            network = ipaddress.ip_network(cidr, strict=False)
+        except ValueError:
+            return []
+
+        overlapping_pools = []
+        for pool_cidr in pools_by_cidr:
+            try:
+                pool_network = ipaddress.ip_network(pool_cidr, strict=False)
+            except (TypeError, ValueError):
+                continue
+
+            if pool_network.version == network.version and pool_network.overlaps(network):
+                overlapping_pools.append(pool_cidr)
+
+        return overlapping_pools
+
+    def global_pool_exists(self, name):
+        """
+        Check if the Global Pool with the given name exists
+
+        Parameters:
+            name (str) - The name of the Global Pool to check for existence
+
+        Returns:
+            dict - A dictionary containing information about the Global Pool's existence:
+            - 'exists' (bool): True if the Global Pool exists, False otherwise.
+            - 'id' (str or None): The ID of the Global Pool if it exists, or None if it doesn't.
+            - 'details' (dict or None): Details of the Global Pool if it exists, else None.
+        """
+
+        global_pool = {
+            "exists": False,
+            "details": None,
+            "id": None
+        }
+        global_pool_index = self.get_global_pool_index()
+        if name == "":
+            all_global_pool = []
+            for each_pool in global_pool_index.get("pools"):
+                global_del_pool = {
+                    "exists": True,
+                    "id": each_pool.get("id"),
+                    "details": self.get_global_pool_params(each_pool)
+                }
+                all_global_pool.append(global_del_pool)
+
+            if self.payload.get("state") == "deleted" or not all_global_pool:
+                self.log("Formatted global pool details: {0}".format(
+                    self.pprint(all_global_pool)), "DEBUG")
+                return all_global_pool
+
+            return global_pool
+
+        global_pool_details = global_pool_index.get("by_name").get(name)
+        if not global_pool_details:
+            self.log("Global pool '{0}' does not exist".format(name), "INFO")
+            return global_pool
+
+        self.log("Global pool found with name '{0}': {1}".format(name, global_pool_details), "INFO")
+        global_pool.update({
+            "exists": True,
+            "id": global_pool_details.get("id"),
+            "details": self.get_global_pool_params(global_pool_details)
+        })
         self.log("Formatted global pool details: {0}".format(global_pool), "DEBUG")
         return global_pool
 
@@ -1963,35 +2085,23 @@ class NetworkSettings(DnacBase):
             "id": None,
             "success": True
         }
-        site_exist, site_id = self.get_site_id(site_name)
-        self.log("Site ID for the site name {0}: {1}".format(site_name, site_id), "DEBUG")
-        if not site_id:
+        reserve_pool_index = self.get_reserve_pool_index(site_name)
+        if not reserve_pool_index:
             reserve_pool.update({"success": False})
-            self.msg = "Failed to get the site id from the site name {0}".format(site_name)
-            self.status = "failed"
             return reserve_pool
 
-        if not self.all_reserved_pool_details.get(site_id):
-            self.get_reserved_ip_subpool(site_name, site_id)
-
-        if not self.all_reserved_pool_details.get(site_id):
+        if not reserve_pool_index.get("pools"):
             self.log("Reserved pool {0} does not exist in the site {1}"
                      .format(name, site_name), "DEBUG")
             return reserve_pool
 
-        reserve_pool_details = None
-        if name == "":
-            reserve_pool_details = self.all_reserved_pool_details.get(site_id)
-        else:
-            reserve_pool_details = get_dict_result(
-                self.all_reserved_pool_details.get(site_id), "groupName", name)
-
-        if not reserve_pool_details:
-            self.log("Reserved pool {0} does not exist in the site {1}"
-                     .format(name, site_name), "DEBUG")
-            return reserve_pool
+        if name != "":
+            reserve_pool_details = reserve_pool_index.get("by_name").get(name)
+            if not reserve_pool_details:
+                self.log("Reserved pool {0} does not exist in the site {1}"
+                         .format(name, site_name), "DEBUG")
+                return reserve_pool
 
-        if isinstance(reserve_pool_details, dict):
             self.log("Reserve pool found with name {0} in the site '{1}': {2}"
                      .format(name, site_name, reserve_pool_details), "INFO")
             reserve_pool.update({"exists": True})
@@ -2001,24 +2111,21 @@ class NetworkSettings(DnacBase):
             self.log("Reserved pool id: {0}".format(reserve_pool.get("id")), "DEBUG")
             return reserve_pool
 
-        if isinstance(reserve_pool_details, list):
-            self.log("Found reserve pools for site '{0}': {1}"
-                     .format(site_name, self.pprint(reserve_pool_details)), "INFO")
-            all_reserve_pool = []
-            for each_pool in reserve_pool_details:
-                reserve_del_pool = {
-                    "exists": True,
-                    "id": each_pool.get("id"),
-                    "details": self.get_reserve_pool_params(each_pool),
-                    "success": True
-                }
-                all_reserve_pool.append(reserve_del_pool)
-
-            self.log("Reserved pool list details: {0}".format(
-                self.pprint(all_reserve_pool)), "DEBUG")
-            return all_reserve_pool
+        self.log("Found reserve pools for site '{0}': {1}"
+                 .format(site_name, self.pprint(reserve_pool_index.get("pools"))), "INFO")
+        all_reserve_pool = []
+        for each_pool in reserve_pool_index.get("pools"):
+            reserve_del_pool = {
+                "exists": True,
+                "id": each_pool.get("id"),
+                "details": self.get_reserve_pool_params(each_pool),
+                "success": True
+            }
+            all_reserve_pool.append(reserve_del_pool)
 
-        return reserve_pool
+        self.log("Reserved pool list details: {0}".format(
+            self.pprint(all_reserve_pool)), "DEBUG")
+        return all_reserve_pool
 
     def get_have_global_pool(self, global_pool_details):
         """
@@ -2168,8 +2275,9 @@ class NetworkSettings(DnacBase):
 
             # Check if the Reserved Pool exists in Cisco Catalyst Center
             # based on the provided name and site name
-            if self.reserve_pool_exists(name, site_name):
-                reserve_pool.append(self.reserve_pool_exists(name, site_name))
+            reserve_pool_info = self.reserve_pool_exists(name, site_name)
+            if reserve_pool_info:
+                reserve_pool.append(reserve_pool_info)
             else:
                 self.have.update({"reservePool": reserve_pool})
                 return self
@@ -2219,6 +2327,23 @@ class NetworkSettings(DnacBase):
         self.status = "success"
         return self
 
+    def fetch_network_params_for_site(self, site):
+        """
+        Read the network settings of one site, to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+            site (tuple) - The site name and the site ID.
+
+        Returns:
+            tuple - The network details of the site and the error message, one of them being None.
+        """
+
+        site_name, site_id = site
+        try:
+            return self.get_network_params(site_name, site_id), None
+        except Exception as msg:
+            return None, str(msg)
+
     def get_have_network(self, network_details):
         """
         Get the current Network details from Cisco Catalyst
@@ -2231,8 +2356,8 @@ class NetworkSettings(DnacBase):
             self - The current object with updated Network information.
         """
         all_network_management_details = []
+        sites = []
         for item in network_details:
-            network = {}
             site_name = item.get("site_name")
             if site_name is None:
                 site_name = "Global"
@@ -2244,9 +2369,25 @@ class NetworkSettings(DnacBase):
                 self.status = "failed"
                 return self
 
-            network["site_name"] = site_name
-            network["site_id"] = site_id
-            network["net_details"] = self.get_network_params(site_name, site_id)
+            sites.append((site_name, site_id))
+
+        # From version 2.3.7.6 the settings of the sites are read concurrently, the settings of one site one after the other
+        max_workers = 1
+        if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.6") >= 0:
+            max_workers = self.params.get("max_concurrent_requests")
+
+        site_network_details = self.execute_concurrently(self.fetch_network_params_for_site, sites, max_workers)
+        for (site_name, site_id), (net_details, error) in zip(sites, site_network_details):
+            if error:
+                self.msg = error
+                self.status = "failed"
+                return self
+
+            network = {
+                "site_name": site_name,
+                "site_id": site_id,
+                "net_details": net_details
+            }
             self.log("Network details from the Catalyst Center for site '{0}': {1}".format(site_name, network), "DEBUG")
             all_network_management_details.append(network)
 
@@ -2305,43 +2446,15 @@ class NetworkSettings(DnacBase):
             self.status = "failed"
             return self.check_return_status()
 
-        value = 1
-        while True:
-            try:
-                response = self.dnac._exec(
-                    family="network_settings",
-                    function="get_global_pool",
-                    params={"offset": value}
-                )
-            except Exception as msg:
-                self.msg = (
-                    "Exception occurred while getting the global pool details with name '{name}': {msg}"
-                    .format(name=global_pool_name, msg=msg)
-                )
-                self.log(str(msg), "ERROR")
-                self.status = "failed"
-                return self
-
-            value += 25
-            if not isinstance(response, dict):
-                self.msg = "Failed to retrieve the global pool details - Response is not a dictionary"
-                self.log(self.msg, "CRITICAL")
-                self.status = "failed"
-                return self.check_return_status()
-
-            all_global_pool_details = response.get("response")
-            if not all_global_pool_details:
-                self.log("Invalid global_pool_name '{0}' under reserve_pool_details".format(global_pool_name), "ERROR")
-                self.msg = "No information found for the global pool named '{0}'".format(global_pool_name)
-                self.status = "failed"
-                return self.check_return_status()
-
-            global_pool_details = get_dict_result(all_global_pool_details, "ipPoolName", global_pool_name)
-            if global_pool_details:
-                global_pool_cidr = global_pool_details.get("ipPoolCidr")
-                self.log("Global pool found with name '{0}': {1}".format(global_pool_name, global_pool_details), "INFO")
-                break
+        global_pool_details = self.get_global_pool_index().get("by_name").get(global_pool_name)
+        if not global_pool_details:
+            self.log("Invalid global_pool_name '{0}' under reserve_pool_details".format(global_pool_name), "ERROR")
+            self.msg = "No information found for the global pool named '{0}'".format(global_pool_name)
+            self.status = "failed"
+            return self.check_return_status()
 
+        global_pool_cidr = global_pool_details.get("ipPoolCidr")
+        self.log("Global pool found with name '{0}': {1}".format(global_pool_name, global_pool_details), "INFO")
         self.log("Global Pool '{0}' cidr: {1}".format(global_pool_name, global_pool_cidr), "INFO")
         return global_pool_cidr
 
@@ -2408,6 +2521,16 @@ class NetworkSettings(DnacBase):
                     pool_values.update({"gateway": ""})
                 if pool_values.get("type") is None:
                     pool_values.update({"type": "Generic"})
+
+                overlapping_pools = self.get_overlapping_pools(
+                    pool_values.get("ipPoolCidr"), self.get_global_pool_index().get("by_cidr"))
+                if overlapping_pools:
+                    self.msg = (
+                        "The CIDR '{0}' of the global pool '{1}' overlaps with the existing global pool(s) {2}."
+                        .format(pool_values.get("ipPoolCidr"), pool_values.get("ipPoolName"), overlapping_pools)
+                    )
+                    self.status = "failed"
+                    return self
             else:
                 have_ippool = self.have.get("globalPool")[global_pool_index].get("details")
 
@@ -2513,6 +2636,22 @@ class NetworkSettings(DnacBase):
                     self.status = "failed"
                     return self
 
+                # The subnets reserved in a site must not overlap with the other pools of the site
+                site_reserve_pools = self.get_reserve_pool_index(item.get("site_name")) or {}
+                for subnet, prefix_length in [("ipv4Subnet", "ipv4PrefixLength"), ("ipv6Subnet", "ipv6PrefixLength")]:
+                    if not (pool_values.get(subnet) and pool_values.get(prefix_length)):
+                        continue
+
+                    reserve_cidr = "{0}/{1}".format(pool_values.get(subnet), pool_values.get(prefix_length))
+                    overlapping_pools = self.get_overlapping_pools(reserve_cidr, site_reserve_pools.get("by_cidr", {}))
+                    if overlapping_pools:
+                        self.msg = (
+                            "The subnet '{0}' of the reserve pool '{1}' overlaps with the reserved pool(s) {2} in the site '{3}'."
+                            .format(reserve_cidr, pool_values.get("name"), overlapping_pools, item.get("site_name"))
+                        )
+                        self.status = "failed"
+                        return self
+
                 if pool_values.get("type") is None:
                     pool_values.update({"type": "Generic"})
                 if pool_values.get("ipv4DhcpServers") is None:
@@ -3610,12 +3749,11 @@ class NetworkSettings(DnacBase):
             )
             self.log("DHCP settings updated for for site '{0}' (ID: {1}): {2}".format(site_name, site_id, dhcp_settings), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while updating DHCP settings for site {0}: {1}".format(site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return response
 
@@ -3643,12 +3781,11 @@ class NetworkSettings(DnacBase):
             )
             self.log("NTP settings updated for site '{0}' (ID: {1}): {2}".format(site_name, site_id, ntp_settings), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while updating NTP settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return response
 
@@ -3676,12 +3813,11 @@ class NetworkSettings(DnacBase):
             )
             self.log("Time zone settings updated for site '{0}' (ID: {1}): {2}".format(site_name, site_id, time_zone_settings), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while updating time zone settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return response
 
@@ -3723,12 +3859,11 @@ class NetworkSettings(DnacBase):
             )
             self.log("DNS settings updated for site '{0}' (ID: {1}): {2}".format(site_name, site_id, dns_settings), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while updating DNS settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return response
 
@@ -3763,12 +3898,11 @@ class NetworkSettings(DnacBase):
             )
             self.log("Telemetry settings updated for site '{0}' (ID: {1}): {2}".format(site_name, site_id, telemetry_settings), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while updating telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return response
 
@@ -3796,12 +3930,11 @@ class NetworkSettings(DnacBase):
             )
             self.log("Banner settings updated for site '{0}' (ID: {1}): {2}".format(site_name, site_id, banner_settings), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while updating banner settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return response
 
@@ -3838,15 +3971,116 @@ class NetworkSettings(DnacBase):
             self.log("AAA settings updated for site '{0}' (ID: {1}): Network AAA: {2}, Client and Endpoint AAA: {3}"
                      .format(site_name, site_id, network_aaa, client_and_endpoint_aaa), "DEBUG")
         except Exception as e:
-            self.msg = (
+            error_message = (
                 "Exception occurred while updating AAA settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
             )
-            self.log(self.msg, "CRITICAL")
-            self.status = "failed"
-            return self.check_return_status()
+            self.log(error_message, "CRITICAL")
+            raise Exception(error_message)
 
         return response
 
+    def get_network_update_requests(self, net_params):
+        """
+        Collect the network settings of a site which have to be updated, for Catalyst Center version >= 2.3.7.6.
+
+        Parameters:
+            net_params (dict) - The desired network settings of the site.
+
+        Returns:
+            list - The API name, the update function and the settings for every setting to be updated,
+            in the order they are applied to the site.
+        """
+
+        settings = net_params.get("settings", {})
+        update_requests = []
+        if settings.get("dhcpServer"):
+            update_requests.append(("set_dhcp_settings_for_a_site", self.update_dhcp_settings_for_site,
+                                    (settings.get("dhcpServer"),)))
+
+        if settings.get("ntpServer"):
+            update_requests.append(("set_n_t_p_settings_for_a_site", self.update_ntp_settings_for_site,
+                                    (settings.get("ntpServer"),)))
+
+        if settings.get("timezone"):
+            update_requests.append(("set_time_zone_for_a_site", self.update_time_zone_settings_for_site,
+                                    (settings.get("timezone"),)))
+
+        if settings.get("dnsServer"):
+            update_requests.append(("set_d_n_s_settings_for_a_site", self.update_dns_settings_for_site,
+                                    (settings.get("dnsServer"),)))
+
+        if settings.get("messageOfTheday"):
+            update_requests.append(("set_banner_settings_for_a_site", self.update_banner_settings_for_site,
+                                    (settings.get("messageOfTheday"),)))
+
+        if any([
+            settings.get("snmpServer"),
+            settings.get("syslogServer"),
+            settings.get("netflowcollector"),
+            settings.get("wired_data_collection"),
+            settings.get("wireless_telemetry")
+        ]):
+            telemetry_settings = {
+                "snmp_server": settings.get("snmpServer"),
+                "syslog_server": settings.get("syslogServer"),
+                "netflowcollector": settings.get("netflowcollector"),
+                "wired_data_collection": settings.get("wired_data_collection"),
+                "wireless_telemetry": settings.get("wireless_telemetry")
+            }
+            update_requests.append(("set_telemetry_settings_for_a_site", self.update_telemetry_settings_for_site,
+                                    (telemetry_settings,)))
+
+        if settings.get("network_aaa") or settings.get("client_and_endpoint_aaa"):
+            update_requests.append(("set_aaa_settings_for_a_site", self.update_aaa_settings_for_site,
+                                    (settings.get("network_aaa"), settings.get("client_and_endpoint_aaa"))))
+
+        return update_requests
+
+    def update_network_settings_for_site(self, site_update):
+        """
+        Apply the network settings updates of one site, to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+            site_update (tuple) - The site name, the site ID and the update requests of the site
+            as returned by 'get_network_update_requests'.
+
+        Returns:
+            tuple - The number of settings updated and the error message, None if every update succeeded.
+        Description:
+            The settings of one site are applied one after the other, each update waiting for its task,
+            as the Cisco Catalyst Center handles a single settings operation per site at a time.
+        """
+
+        site_name, site_id, update_requests = site_update
+        updated_count = 0
+        for api_name, update_function, settings in update_requests:
+            try:
+                response = update_function(site_name, site_id, *settings)
+            except Exception as msg:
+                return updated_count, str(msg)
+
+            self.log("Received API response of '{0}': {1}".format(api_name, response), "DEBUG")
+            task_info = response.get("response") if isinstance(response, dict) else None
+            if not task_info or not task_info.get("taskId"):
+                error = (task_info or {}).get("detail") or response
+                return updated_count, (
+                    "Failed to update the network settings of the site '{0}' using '{1}': {2}"
+                    .format(site_name, api_name, error)
+                )
+
+            task_id = task_info.get("taskId")
+            task_details = self.wait_for_tasks([task_id]).get(task_id) or {}
+            if task_details.get("isError"):
+                return updated_count, (
+                    task_details.get("failureReason") or
+                    "The task '{0}' of the API '{1}' failed for the site '{2}'.".format(task_id, api_name, site_name)
+                )
+
+            self.log("The task with task ID '{0}' is executed successfully.".format(task_id), "INFO")
+            updated_count += 1
+
+        return updated_count, None
+
     def update_network(self, network_management):
         """
         Update or create a network configuration in Cisco Catalyst
@@ -3857,11 +4091,15 @@ class NetworkSettings(DnacBase):
 
         Returns:
             self - The current object with Global Pool, Reserved Pool, Network Servers information.
+        Description:
+            From Catalyst Center version 2.3.7.6, the sites are updated concurrently with up to
+            'max_concurrent_requests' sites at the same time.
         """
-        network_management_index = 0
-        for item in network_management:
+
+        result_network = self.result.get("response")[2].get("network")
+        site_updates = []
+        for network_management_index, item in enumerate(network_management):
             site_name = item.get("site_name")
-            result_network = self.result.get("response")[2].get("network")
             result_network.get("response").update({site_name: {}})
             have_network_details = self.have.get("network")[network_management_index].get("net_details")
             want_network_details = self.want.get("wantNetwork")[network_management_index]
@@ -3911,71 +4149,47 @@ class NetworkSettings(DnacBase):
                     self.log(str(msg), "ERROR")
                     self.status = "failed"
                     return self
+
+                self.log("Network under the site '{0}' has been changed successfully".format(site_name), "INFO")
+                result_network.get("msg") \
+                    .update({site_name: "Network Updated successfully"})
+                result_network.get("response").get(site_name) \
+                    .update({"Network Details": want_network_details.get("settings")})
             else:
-                site_id = net_params.get("site_id")
                 site_name = self.have.get("network")[network_management_index].get("site_name")
+                site_updates.append((site_name, net_params.get("site_id"), self.get_network_update_requests(net_params),
+                                     want_network_details))
 
-                if net_params.get("settings").get("dhcpServer"):
-                    dhcp_settings = net_params.get("settings").get("dhcpServer")
-                    response = self.update_dhcp_settings_for_site(site_name, site_id, dhcp_settings)
-                    self.log("Received API response of 'set_dhcp_settings_for_a_site': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response, "set_dhcp_settings_for_a_site").check_return_status()
-
-                if net_params.get("settings").get("ntpServer"):
-                    ntp_settings = net_params.get("settings").get("ntpServer")
-                    response = self.update_ntp_settings_for_site(site_name, site_id, ntp_settings)
-                    self.log("Received API response of 'set_n_t_p_settings_for_a_site': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response, "set_n_t_p_settings_for_a_site").check_return_status()
-
-                if net_params.get("settings").get("timezone"):
-                    time_zone_settings = net_params.get("settings").get("timezone")
-                    response = self.update_time_zone_settings_for_site(site_name, site_id, time_zone_settings)
-                    self.log("Received API response of 'set_time_zone_for_a_site': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response, "set_time_zone_for_a_site").check_return_status()
-
-                if net_params.get("settings").get("dnsServer"):
-                    dns_settings = net_params.get("settings").get("dnsServer")
-                    response = self.update_dns_settings_for_site(site_name, site_id, dns_settings)
-                    self.log("Received API response of 'set_d_n_s_settings_for_a_site': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response, "set_d_n_s_settings_for_a_site").check_return_status()
-
-                if net_params.get("settings").get("messageOfTheday"):
-                    banner_settings = net_params.get("settings").get("messageOfTheday")
-                    response = self.update_banner_settings_for_site(site_name, site_id, banner_settings)
-                    self.log("Received API response of 'set_banner_settings_for_a_site': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response, "set_banner_settings_for_a_site").check_return_status()
-
-                if any([
-                    net_params.get("settings", {}).get("snmpServer"),
-                    net_params.get("settings", {}).get("syslogServer"),
-                    net_params.get("settings", {}).get("netflowcollector"),
-                    net_params.get("settings", {}).get("wired_data_collection"),
-                    net_params.get("settings", {}).get("wireless_telemetry")
-                ]):
-                    telemetry_settings = {
-                        "snmp_server": net_params.get("settings").get("snmpServer"),
-                        "syslog_server": net_params.get("settings").get("syslogServer"),
-                        "netflowcollector": net_params.get("settings").get("netflowcollector"),
-                        "wired_data_collection": net_params.get("settings").get("wired_data_collection"),
-                        "wireless_telemetry": net_params.get("settings").get("wireless_telemetry")
-                    }
-                    response = self.update_telemetry_settings_for_site(site_name, site_id, telemetry_settings)
-                    self.log("Received API response of 'set_telemetry_settings_for_a_site': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response, "set_telemetry_settings_for_a_site").check_return_status()
+        if not site_updates:
+            return self
 
-                if net_params.get("settings").get("network_aaa") or net_params.get("settings").get("client_and_endpoint_aaa"):
-                    network_aaa = net_params.get("settings").get("network_aaa")
-                    client_and_endpoint_aaa = net_params.get("settings").get("client_and_endpoint_aaa")
-                    response = self.update_aaa_settings_for_site(site_name, site_id, network_aaa, client_and_endpoint_aaa)
-                    self.log("Received API response of 'set_aaa_settings_for_a_site': {0}".format(response), "DEBUG")
-                    self.check_tasks_response_status(response, "set_aaa_settings_for_a_site").check_return_status()
+        self.log("Updating the network settings of {0} site(s).".format(len(site_updates)), "INFO")
+        site_results = self.execute_concurrently(
+            self.update_network_settings_for_site,
+            [site_update[:3] for site_update in site_updates],
+            self.params.get("max_concurrent_requests")
+        )
+        errors = []
+        for (site_name, site_id, update_requests, want_network_details), (updated_count, error) in \
+                zip(site_updates, site_results):
+            if updated_count:
+                self.result["changed"] = True
+
+            if error:
+                self.log("Failed to update the network settings of the site '{0}': {1}".format(site_name, error), "ERROR")
+                errors.append(error)
+                continue
 
             self.log("Network under the site '{0}' has been changed successfully".format(site_name), "INFO")
             result_network.get("msg") \
                 .update({site_name: "Network Updated successfully"})
             result_network.get("response").get(site_name) \
-                .update({"Network Details": self.want.get("wantNetwork")[network_management_index].get("settings")})
-            network_management_index += 1
+                .update({"Network Details": want_network_details.get("settings")})
+
+        if errors:
+            self.msg = " ".join(errors)
+            self.status = "failed"
+            return self
 
         return self
 
@@ -4244,7 +4458,7 @@ class NetworkSettings(DnacBase):
             self - The current object with Global Pool, Reserved Pool, Network Servers information.
         """
 
-        self.all_reserved_pool_details = {}
+        self.reset_pool_index()
         self.get_have(config)
         self.log("Current State (have): {0}".format(self.have), "INFO")
         self.log("Requested State (want): {0}".format(self.want), "INFO")
@@ -4327,7 +4541,7 @@ class NetworkSettings(DnacBase):
             self - The current object with Global Pool, Reserved Pool, Network Servers information.
         """
 
-        self.all_reserved_pool_details = {}
+        self.reset_pool_index()
         self.get_have(config)
         self.log("Current State (have): {0}".format(self.have), "INFO")
         self.log("Desired State (want): {0}".format(self.want), "INFO")
@@ -4461,6 +4675,7 @@ class NetworkSettings(DnacBase):
 
         self.have.clear()
         self.want.clear()
+        self.reset_pool_index()
         return
 
 
@@ -4486,6 +4701,7 @@ def main():
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
+        "max_concurrent_requests": {"type": 'int', "default": 5},
     }
 
     # Create an AnsibleModule object with argument specifications
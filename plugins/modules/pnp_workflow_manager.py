@@ -39,6 +39,14 @@ options:
     type: str
     choices: [merged, deleted]
     default: merged
+  max_concurrent_requests:
+    description:
+      - Maximum number of PnP requests sent to Cisco Catalyst Center at the same time.
+      - Applies to the bulk lookups of the PnP devices and to the claims of the devices to the sites.
+      - Set to 1 to send the requests one after the other.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description: |
       List of details of device being managed.
@@ -198,6 +206,7 @@ notes:
     /dna/intent/api/v1/onboarding/pnp-device put /onboarding/pnp-device/${id}
     get /dna/intent/api/v1/site get /dna/intent/api/v1/image/importation get
     /dna/intent/api/v1/template-programmer/template
+  - Added 'max_concurrent_requests' option in v6.32.0
 
 """
 
@@ -362,6 +371,12 @@ class PnP(DnacBase):
     def __init__(self, module):
         super().__init__(module)
         self.supported_states = ["merged", "deleted"]
+        self.pnp_devices = {}
+        self.pnp_lookup_batch_size = 50
+        self.image_details = {}
+        self.project_templates = {}
+        self.site_details = {}
+        self.pending_claims = []
 
     def validate_input(self):
         """
@@ -449,7 +464,7 @@ class PnP(DnacBase):
         response = None
 
         try:
-            response = self.get_site(self.want.get("site_name"))
+            response = self.get_site_response(self.want.get("site_name"))
             if response:
                 self.log("Received site details for '{0}': {1}".format(self.want.get("site_name"),
                                                                        str(response)), "DEBUG")
@@ -466,6 +481,22 @@ class PnP(DnacBase):
             self.log(self.msg, "CRITICAL")
             self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
+    def get_site_response(self, site_name):
+        """
+        Get the site details from the Cisco Catalyst Center, once per site name.
+
+        Parameters:
+          - self: The instance of the class containing the 'config' attribute
+                  to be validated.
+          - site_name: The name hierarchy of the site.
+        Returns:
+          The response of the site lookup, shared by all the devices claimed to the site.
+        """
+        if site_name not in self.site_details:
+            self.site_details[site_name] = self.get_site(site_name)
+
+        return self.site_details[site_name]
+
     def get_site_type(self):
         """
         Fetches the type of site
@@ -483,7 +514,7 @@ class PnP(DnacBase):
         """
 
         try:
-            response = self.get_site(self.want.get("site_name"))
+            response = self.get_site_response(self.want.get("site_name"))
             if response:
                 self.log("Received site details for '{0}': {1}".format(self.want.get("site_name"),
                                                                        str(response)), "DEBUG")
@@ -571,8 +602,8 @@ class PnP(DnacBase):
         passed by the user
         """
 
-        self.log(msg, "CRITICAL")
-        self.module.fail_json(msg=msg)
+        self.msg = msg
+        self.set_operation_result("failed", False, self.msg, "CRITICAL").check_return_status()
 
     def get_claim_params(self):
         """
@@ -737,23 +768,10 @@ class PnP(DnacBase):
 
             if self.params.get("state") == "merged":
                 # check if given image exists, if exists store image_id
-                image_response = self.dnac_apply['exec'](
-                    family="software_image_management_swim",
-                    function='get_software_image_details',
-                    params=self.want.get("image_params"),
-                )
-                image_list = image_response.get("response")
-                self.log("Image details obtained from the API 'get_software_image_details': {0}"
-                         .format(self.pprint(image_response)), "DEBUG")
+                image_list = self.get_image_list(self.want.get("image_params"))
 
                 # check if project has templates or not
-                template_list = self.dnac_apply['exec'](
-                    family="configuration_templates",
-                    function='gets_the_templates_available',
-                    params={"project_names": self.want.get("project_name")},
-                )
-                self.log("List of templates under the project '{0}': {1}"
-                         .format(self.want.get("project_name"), self.pprint(template_list)), "DEBUG")
+                template_list = self.get_project_templates(self.want.get("project_name"))
 
                 dev_details_response = self.get_device_by_id_pnp(device_response.get("id"))
                 self.log("Device details retrieved after calling the 'get_device_by_id' API: {0}"
@@ -835,6 +853,53 @@ class PnP(DnacBase):
         self.log("Current State (have): {0}".format(self.pprint(self.have)), "DEBUG")
         return self
 
+    def get_image_list(self, image_params):
+        """
+        Get the images matching the image parameters, once per image name and golden tag.
+
+        Parameters:
+          - self: The instance of the class containing the 'config' attribute
+                  to be validated.
+          - image_params: The image name and golden tag passed from the playbook.
+        Returns:
+          The list of matching images, shared by all the devices claimed with the same image.
+        """
+        image_key = (image_params.get("image_name"), image_params.get("is_tagged_golden"))
+        if image_key not in self.image_details:
+            image_response = self.dnac_apply['exec'](
+                family="software_image_management_swim",
+                function='get_software_image_details',
+                params=image_params,
+            )
+            self.log("Image details obtained from the API 'get_software_image_details': {0}"
+                     .format(self.pprint(image_response)), "DEBUG")
+            self.image_details[image_key] = image_response.get("response")
+
+        return self.image_details[image_key]
+
+    def get_project_templates(self, project_name):
+        """
+        Get the templates available under a project, once per project.
+
+        Parameters:
+          - self: The instance of the class containing the 'config' attribute
+                  to be validated.
+          - project_name: The name of the project holding the templates.
+        Returns:
+          The list of templates of the project, shared by all the devices claimed with the project.
+        """
+        if project_name not in self.project_templates:
+            template_list = self.dnac_apply['exec'](
+                family="configuration_templates",
+                function='gets_the_templates_available',
+                params={"project_names": project_name},
+            )
+            self.log("List of templates under the project '{0}': {1}"
+                     .format(project_name, self.pprint(template_list)), "DEBUG")
+            self.project_templates[project_name] = template_list
+
+        return self.project_templates[project_name]
+
     def get_want(self, config):
         """
         Get all the image, template and site and pnp related
@@ -950,7 +1015,7 @@ class PnP(DnacBase):
                 self.log("Device details for serial number {0} \
                         obtained from the API 'get_device_list': {1}".format(device["deviceInfo"]["serialNumber"],
                                                                              str(multi_device_response)), "DEBUG")
-                if (multi_device_response and (len(multi_device_response) == 1)):
+                if multi_device_response:
                     devices_added.append(device)
                     self.log("Details of the added device:{0}".format(str(device)), "INFO")
             if len(self.want.get("pnp_params")) == len(devices_added):
@@ -970,6 +1035,9 @@ class PnP(DnacBase):
                 params={"payload": bulk_list},
                 op_modifies=True,
             )
+            for device in bulk_list:
+                self.pnp_devices.pop(device["deviceInfo"]["serialNumber"], None)
+
             self.log("Response from API 'import_devices_in_bulk' for imported devices: {0}".format(bulk_params), "DEBUG")
             if len(bulk_params.get("successList")) > 0:
                 self.result['msg'] = "{0} device(s) imported successfully".format(
@@ -1033,22 +1101,12 @@ class PnP(DnacBase):
                 claim_params = self.get_claim_params()
                 claim_params["deviceId"] = dev_add_response.get("id")
 
-                claim_response = self.claim_device_site(claim_params)
-                self.log("Response from API 'claim a device to a site' for a single claiming: {0}".format(str(claim_response)), "DEBUG")
-
-                if claim_response.get("response") == "Device Claimed" and self.have["deviceInfo"]:
-                    self.result['msg'] = "Device Added and Claimed Successfully"
-                    self.log(self.result['msg'], "INFO")
-                    self.result['response'] = claim_response
-                    self.result['diff'] = self.validated_config
-                    self.result['changed'] = True
-
-                else:
+                if not self.have["deviceInfo"]:
                     self.msg = "Device Claim Failed"
                     self.log(self.msg, "CRITICAL")
                     self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
-                return self
+                return self.queue_device_claim(claim_params, "Device Added and Claimed Successfully")
 
         prov_dev_response = self.pnp_device_count(provisioned_count_params)
         self.log("Response from 'get device count' API for provisioned devices: {0}".format(str(prov_dev_response)), "DEBUG")
@@ -1083,6 +1141,7 @@ class PnP(DnacBase):
             op_modifies=True,
         )
         self.log("Response from 'update_device' API for device's config update: {0}".format(str(update_response)), "DEBUG")
+        self.pnp_devices.pop(self.want.get("serial_number"), None)
 
         if pnp_state == "Error":
             reset_paramters = self.get_reset_params()
@@ -1116,18 +1175,132 @@ class PnP(DnacBase):
         claim_params = self.get_claim_params()
         self.log("Parameters for claiming the device: {0}".format(str(claim_params)), "DEBUG")
 
-        claim_response = self.claim_device_site(claim_params)
-        self.log("Response from 'claim_a_device_to_a_site' API for claiming: {0}".format(str(claim_response)), "DEBUG")
+        return self.queue_device_claim(claim_params, "Only Device Claimed Successfully")
 
-        if claim_response.get("response") == "Device Claimed":
-            self.result['msg'] = "Only Device Claimed Successfully"
-            self.log(self.result['msg'], "INFO")
-            self.result['response'] = claim_response
-            self.result['diff'] = self.validated_config
+    def queue_device_claim(self, claim_params, success_msg):
+        """
+        Queue the claim of the device to the site, the queued claims being submitted together by 'claim_queued_devices'.
+
+        Parameters:
+            - self (object): An instance of the class containing the method.
+            - claim_params (dict): The parameters of the 'claim_a_device_to_a_site' API.
+            - success_msg (str): The message reported when the claim succeeds.
+        Returns:
+            - self (object): An instance of the class with the claim queued.
+        """
+        self.pending_claims.append({
+            "serial_number": self.want.get("serial_number"),
+            "claim_params": claim_params,
+            "success_msg": success_msg,
+            "diff": self.validated_config
+        })
+        self.msg = "Claim of the device '{0}' queued".format(self.want.get("serial_number"))
+        self.log(self.msg, "INFO")
+        self.status = "success"
+        return self
+
+    def claim_queued_device(self, claim):
+        """
+        Claim one queued device to its site, to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+            - self (object): An instance of the class containing the method.
+            - claim (dict): The queued claim.
+        Returns:
+            - tuple: The response of the claim and the error message, one of them being None.
+        """
+        try:
+            return self.claim_device_site(claim["claim_params"]), None
+        except Exception as e:
+            return None, str(e)
+
+    def claim_queued_devices(self):
+        """
+        Claim all the queued devices to their sites concurrently.
+
+        Parameters:
+            - self (object): An instance of the class containing the method.
+        Returns:
+            - self (object): An instance of the class with the result of the claims.
+        Description:
+            The claims are bounded by 'max_concurrent_requests'. The result of a single claim
+            is reported as before, the claims of several devices are reported together.
+            A failed claim sets the status to 'failed' without exiting, the caller checks it.
+        """
+        claims, self.pending_claims = self.pending_claims, []
+        if not claims:
+            return self
+
+        claim_responses = self.execute_concurrently(
+            self.claim_queued_device, claims, self.params.get("max_concurrent_requests"))
+        claimed, failed = [], []
+        for claim, (claim_response, error) in zip(claims, claim_responses):
+            self.pnp_devices.pop(claim["serial_number"], None)
+            self.log("Response from 'claim_a_device_to_a_site' API for claiming the device '{0}': {1}"
+                     .format(claim["serial_number"], str(claim_response)), "DEBUG")
+            if error or not claim_response or claim_response.get("response") != "Device Claimed":
+                self.log("Unable to claim the device '{0}': {1}".format(claim["serial_number"], error or claim_response), "ERROR")
+                failed.append(claim["serial_number"])
+                continue
+
+            claimed.append((claim, claim_response))
+
+        if claimed:
             self.result['changed'] = True
+            self.result['diff'] = [claim["diff"] for claim, claim_response in claimed]
 
+        if len(claims) == 1:
+            if failed:
+                self.msg = "Device Claim Failed"
+                self.log(self.msg, "CRITICAL")
+                self.set_operation_result("failed", False, self.msg, "ERROR")
+                return self
+
+            claim, claim_response = claimed[0]
+            self.result['msg'] = claim["success_msg"]
+            self.result['response'] = claim_response
+            self.result['diff'] = claim["diff"]
+            self.log(self.result['msg'], "INFO")
+            self.status = "success"
+            return self
+
+        if failed:
+            self.msg = "Device Claim Failed for the device(s) with serial number(s): {0}".format(failed)
+            self.log(self.msg, "CRITICAL")
+            self.set_operation_result("failed", self.result['changed'], self.msg, "ERROR")
+            return self
+
+        self.result['msg'] = "{0} device(s) claimed successfully".format(len(claimed))
+        self.result['response'] = [claim_response for claim, claim_response in claimed]
+        self.log(self.result['msg'], "INFO")
+        self.status = "success"
         return self
 
+    def check_return_status(self):
+        """
+        Claim the queued devices before the module fails or exits, then check the return status.
+
+        Parameters:
+            - self (object): An instance of the class containing the method.
+        Returns:
+            - None
+        Description:
+            The claims queued by the previous config entries are submitted first, so a failure in
+            a later entry does not leave the devices already added to the PnP database unclaimed.
+            The message of the failure is kept and the outcome of the claims is appended to it.
+        """
+        if self.pending_claims and self.status in ("failed", "exited", "invalid"):
+            status, msg, response = self.status, self.msg, self.result.get("response")
+            self.log("Submitting {0} queued device claim(s) before the module stops with the status '{1}'."
+                     .format(len(self.pending_claims), status), "INFO")
+            self.claim_queued_devices()
+            claim_msg = self.msg if self.status == "failed" else self.result.get("msg")
+            self.msg = "{0} Queued device claim(s) of the previous config entries: {1}".format(msg, claim_msg)
+            self.status = status
+            self.result.update({"msg": self.msg, "response": response})
+
+        super().check_return_status()
+
     def get_diff_deleted(self):
         """
         If the given device is added to pnp database
@@ -1162,6 +1335,7 @@ class PnP(DnacBase):
                 self.log("Device details for the deleted device with \
                         serial number '{0}': {1}".format(device["deviceInfo"]["serialNumber"], str(response)), "DEBUG")
                 if response.get("deviceInfo", {}).get("state") == "Deleted":
+                    self.pnp_devices[device["deviceInfo"]["serialNumber"]] = None
                     devices_deleted.append(device["deviceInfo"]["serialNumber"])
                     self.want.get("pnp_params").remove(device)
                 else:
@@ -1199,6 +1373,7 @@ class PnP(DnacBase):
         self.log("Current State (have): {0}".format(str(self.have)), "INFO")
         self.log("Desired State (want): {0}".format(str(config)), "INFO")
         # Code to validate Cisco Catalyst Center config for merged state
+        self.load_pnp_devices([device["deviceInfo"]["serialNumber"] for device in self.want.get("pnp_params")], refresh=True)
         for device in self.want.get("pnp_params"):
             device_response = self.get_device_list_pnp(device["deviceInfo"]["serialNumber"])
 
@@ -1234,6 +1409,7 @@ class PnP(DnacBase):
         self.log("Current State (have): {0}".format(str(self.have)), "INFO")
         self.log("Desired State (want): {0}".format(str(config)), "INFO")
         # Code to validate Cisco Catalyst Center config for deleted state
+        self.load_pnp_devices([device["deviceInfo"]["serialNumber"] for device in self.want.get("pnp_params")], refresh=True)
         for device in self.want.get("pnp_params"):
             device_response = self.get_device_list_pnp(device["deviceInfo"]["serialNumber"])
 
@@ -1265,7 +1441,13 @@ class PnP(DnacBase):
 
         Example:
           passing device details and getting pnp device details response
+        Description:
+          The devices loaded by 'load_pnp_devices' are returned without calling the API again.
         """
+        if serial_number in self.pnp_devices:
+            self.log("Using the loaded PNP device details for serial number: {0}".format(serial_number), "DEBUG")
+            return self.pnp_devices[serial_number]
+
         try:
             response = self.dnac_apply['exec'](
                 family="device_onboarding_pnp",
@@ -1275,11 +1457,13 @@ class PnP(DnacBase):
 
             if response and isinstance(response, list) and len(response) == 1:
                 self.device_response = response[0]
+                self.pnp_devices[serial_number] = self.device_response
                 self.log("Successfully retrieved PNP device details for serial number: {0}".format(serial_number), "INFO")
                 return self.device_response
 
             msg = "No device found with serial number: {0}".format(serial_number)
             self.log(msg, "WARNING")
+            self.pnp_devices[serial_number] = None
             return None
 
         except Exception as e:
@@ -1287,6 +1471,98 @@ class PnP(DnacBase):
             self.log(msg + str(e), "WARNING")
             self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
 
+    def get_pnp_device_batch(self, serial_numbers):
+        """
+        Get the PNP devices of a batch of serial numbers, to be used as the worker of 'execute_concurrently'.
+
+        Parameters:
+          - self (object): An instance of the class containing the method.
+          - serial_numbers (list): The serial numbers of the batch.
+        Returns:
+          - tuple: The list of PNP devices and the error message, one of them being None.
+        """
+        try:
+            response = self.dnac_apply['exec'](
+                family="device_onboarding_pnp",
+                function='get_device_list',
+                params={"serial_number": serial_numbers, "limit": len(serial_numbers)},
+            )
+        except Exception as e:
+            return None, "An error occurred while retrieving the devices: {0}".format(repr(e))
+
+        if not isinstance(response, list):
+            return None, "Unexpected response from 'get_device_list': {0}".format(response)
+
+        return response, None
+
+    def load_pnp_devices(self, serial_numbers, refresh=False):
+        """
+        Load the PNP devices of the given serial numbers in bulk from the Cisco Catalyst Center.
+
+        Parameters:
+          - self (object): An instance of the class containing the method.
+          - serial_numbers (list): The serial numbers of the devices to load.
+          - refresh (bool): Load the devices again even if they were already loaded.
+        Returns:
+          - self (object): An instance of the class with 'pnp_devices' updated.
+        Description:
+          The serial numbers are queried in batches of 'pnp_lookup_batch_size', the batches
+          being sent concurrently. The serial numbers not returned are recorded as not present,
+          so that 'get_device_list_pnp' answers from the loaded devices. The batches that
+          cannot be loaded are left to the lookups of the single devices.
+        """
+        serial_numbers_to_load = []
+        for serial_number in serial_numbers:
+            if serial_number in serial_numbers_to_load or (serial_number in self.pnp_devices and not refresh):
+                continue
+
+            serial_numbers_to_load.append(serial_number)
+
+        if not serial_numbers_to_load:
+            return self
+
+        batches = [
+            serial_numbers_to_load[index:index + self.pnp_lookup_batch_size]
+            for index in range(0, len(serial_numbers_to_load), self.pnp_lookup_batch_size)
+        ]
+        batch_responses = self.execute_concurrently(
+            self.get_pnp_device_batch, batches, self.params.get("max_concurrent_requests"))
+        for batch, (devices, error) in zip(batches, batch_responses):
+            if error:
+                self.log("Unable to load the PNP devices {0} in bulk: {1}".format(batch, error), "WARNING")
+                for serial_number in batch:
+                    self.pnp_devices.pop(serial_number, None)
+                continue
+
+            devices_by_serial = {}
+            for device in devices:
+                serial_number = (device.get("deviceInfo") or {}).get("serialNumber")
+                devices_by_serial.setdefault(serial_number, device)
+
+            for serial_number in batch:
+                self.pnp_devices[serial_number] = devices_by_serial.get(serial_number)
+
+        self.log("Loaded the PNP devices of {0} serial number(s) in {1} batch(es)"
+                 .format(len(serial_numbers_to_load), len(batches)), "INFO")
+        return self
+
+    def prefetch_pnp_devices(self):
+        """
+        Load the PNP devices of all the serial numbers given in the playbook.
+
+        Parameters:
+          - self (object): An instance of the class containing the method.
+        Returns:
+          - self (object): An instance of the class with 'pnp_devices' updated.
+        """
+        serial_numbers = []
+        for config in self.validated_config:
+            for device in config.get("device_info") or []:
+                if device.get("serial_number"):
+                    serial_numbers.append(device.get("serial_number"))
+
+        return self.load_pnp_devices(serial_numbers)
+
     def get_device_by_id_pnp(self, device_id):
         """
         Get the PNP device details using by device id from the Cisco Catalyst Center.
@@ -1348,13 +1624,14 @@ class PnP(DnacBase):
             )
             if device_add_response:
                 self.device_response = device_add_response  # Update the instance attribute
+                self.pnp_devices.pop(pnp_params.get("deviceInfo", {}).get("serialNumber"), None)
                 self.log("Successfully added PNP device with parameters: {0}".format(pnp_params), "INFO")
                 return self.device_response
 
             # If the response is empty, log a warning
             msg = "No response received when trying to add the PNP device with parameters: {0}".format(pnp_params)
-            self.log(msg, "WARNING")
-            self.module.fail_json(msg=msg)
+            self.msg = msg
+            self.set_operation_result("failed", False, self.msg, "WARNING").check_return_status()
 
         except Exception as e:
             msg = "Unable to add the PNP device with parameters: {0}. Error: {1}".format(pnp_params, str(e))
@@ -1409,6 +1686,8 @@ class PnP(DnacBase):
 
         Example:
             passing device claim param and getting pnp claim response
+        Raises:
+            Exception: If the claim fails, so that the method can run on worker threads.
         """
         self.log("Attempting to claim device to site with parameters: {0}".format(claim_params), "INFO")
         try:
@@ -1418,19 +1697,19 @@ class PnP(DnacBase):
                 op_modifies=True,
                 params=claim_params,
             )
-            if claim_response:
-                self.log("Successfully claimed device to site: {0}".format(claim_response), "INFO")
-                return claim_response
-
-            # If the response is empty, log a warning
-            msg = "No response received when trying to claim the device to site with parameters: {0}".format(claim_params)
-            self.log(msg, "WARNING")
-            self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
-
         except Exception as e:
             msg = "Unable to claim the device to site with parameters: {0}. Error: {1}".format(claim_params, str(e))
-            self.log(msg + str(e), "WARNING")
-            self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+            self.log(msg, "WARNING")
+            raise Exception(msg)
+
+        if claim_response:
+            self.log("Successfully claimed device to site: {0}".format(claim_response), "INFO")
+            return claim_response
+
+        # If the response is empty, log a warning
+        msg = "No response received when trying to claim the device to site with parameters: {0}".format(claim_params)
+        self.log(msg, "WARNING")
+        raise Exception(msg)
 
 
 def main():
@@ -1453,6 +1732,7 @@ def main():
                     'config_verify': {"type": 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'max_concurrent_requests': {'type': 'int', 'default': 5},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
@@ -1478,13 +1758,22 @@ def main():
 
     ccc_pnp.validate_input().check_return_status()
     config_verify = ccc_pnp.params.get("config_verify")
+    ccc_pnp.prefetch_pnp_devices().check_return_status()
 
+    applied_configs = []
     for config in ccc_pnp.validated_config:
         ccc_pnp.reset_values()
         ccc_pnp.get_want(config).check_return_status()
         ccc_pnp.get_have().check_return_status()
         ccc_pnp.get_diff_state_apply[state]().check_return_status()
-        if config_verify:
+        applied_configs.append((config, dict(ccc_pnp.want), dict(ccc_pnp.have)))
+
+    # The queued claims are submitted before the verification, so the claimed devices are verified
+    ccc_pnp.claim_queued_devices().check_return_status()
+
+    if config_verify:
+        for config, want, have in applied_configs:
+            ccc_pnp.want, ccc_pnp.have = want, have
             ccc_pnp.verify_diff_state_apply[state](config).check_return_status()
 
     module.exit_json(**ccc_pnp.result)
@@ -33,6 +33,22 @@ options:
     type: str
     choices: [ merged, deleted ]
     default: merged
+  provision_batch_size:
+    description:
+      - Number of wired devices sent in a single provisioning or reprovisioning request.
+      - Applies to the bulk wired provisioning of Cisco Catalyst version 2.3.7.6 and later.
+      - Must be at least 1.
+    type: int
+    default: 100
+    version_added: 6.32.0
+  max_concurrent_batches:
+    description:
+      - Maximum number of wired provisioning or reprovisioning batches submitted and tracked at the same time.
+      - Set to 1 to submit the batches one after the other.
+      - Applies to the bulk wired provisioning of Cisco Catalyst version 2.3.7.6 and later.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description:
     - List of details of device being managed.
@@ -157,6 +173,11 @@ notes:
     sda.Sda.get_provisioned_wired_device,
     sda.Sda.re_provision_wired_device,
     sda.Sda.provision_wired_device,
+    sda.Sda.get_provisioned_devices,
+    sda.Sda.provision_devices,
+    sda.Sda.re_provision_devices,
+    devices.Devices.get_device_list,
+    site_design.Site_design.get_site_assigned_network_devices,
     wireless.Wireless.provision
 
   - Paths used are
@@ -167,9 +188,15 @@ notes:
     put /dna/intent/api/v1/business/sda/provision-device
     post /dna/intent/api/v1/business/sda/provision-device
     post /dna/intent/api/v1/wireless/provision
+    get /dna/intent/api/v1/sda/provisionDevices
+    post /dna/intent/api/v1/sda/provisionDevices
+    put /dna/intent/api/v1/sda/provisionDevices
+    get /dna/intent/api/v1/network-device
+    get /dna/intent/api/v1/networkDevices/assignedToSite
 
   - Added 'provisioning' option in v6.16.0
   - Added provisioning and reprovisioning of wireless devices in v6.16.0
+  - Added 'provision_batch_size' and 'max_concurrent_batches' options in v6.32.0
 
 """
 
@@ -271,6 +298,27 @@ EXAMPLES = r"""
           management_ip_address: 204.192.3.40
           provisioning: false
 
+- name: Provision many wired devices in batches of 50 with up to 4 batches in flight
+  cisco.dnac.provision_workflow_manager:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log: true
+    state: merged
+    provision_batch_size: 50
+    max_concurrent_batches: 4
+    config:
+        - site_name_hierarchy: Global/USA/San Francisco/BGL_18
+          management_ip_address: 204.192.3.40
+        - site_name_hierarchy: Global/USA/San Francisco/BGL_18
+          management_ip_address: 204.192.3.41
+        - site_name_hierarchy: Global/USA/RTP/BLD11
+          management_ip_address: 204.192.12.10
+
 - name: Provision a wireless device to a site
   cisco.dnac.provision_workflow_manager:
     dnac_host: "{{dnac_host}}"
@@ -383,6 +431,13 @@ class Provision(DnacBase):
             'self.status' will be 'failed', and 'self.msg' will describe the validation issues.
         """
 
+        provision_batch_size = self.params.get("provision_batch_size")
+        if provision_batch_size is not None and provision_batch_size < 1:
+            self.msg = "'provision_batch_size' must be at least 1 but passed {0}".format(provision_batch_size)
+            self.log(self.msg, "ERROR")
+            self.status = "failed"
+            return self
+
         if not self.config:
             self.msg = "config not available in playbook for validation"
             self.status = "success"
@@ -1150,6 +1205,89 @@ class Provision(DnacBase):
 
         return self
 
+    def get_wired_provisioning_snapshot(self, device_ips, site_names):
+        """
+        Load, once for the whole run, the details needed to plan the provisioning of the wired devices.
+
+        Args:
+            device_ips (list): Management IP addresses of the wired devices in the playbook.
+            site_names (list): Site name hierarchies the wired devices are provisioned or assigned to.
+
+        Returns:
+            dict: A dictionary with the following keys:
+                - 'device_ids' (dict): Device ID keyed by management IP address.
+                - 'site_ids' (dict): Site ID keyed by site name hierarchy.
+                - 'provisioned' (dict): Provisioning record keyed by network device ID.
+
+        Description:
+            Device IDs are fetched with batched 'get_device_list' calls and the provisioning records of all the
+            devices with a single paginated 'get_provisioned_devices' walk, instead of several calls per device.
+        """
+        self.log("Loading provisioning details for {0} wired device(s) and {1} site(s).".format(
+            len(device_ips), len(site_names)), "INFO")
+
+        device_ids = {}
+        for device in self.get_device_list_in_bulk("management_ip_address", device_ips):
+            device_ids[device.get("managementIpAddress")] = device.get("id")
+
+        site_ids = {}
+        for site_name in site_names:
+            site_ids[site_name] = self.get_site_id(site_name)[1]
+
+        provisioned = {}
+        for record in self.get_paginated_response("sda", "get_provisioned_devices"):
+            provisioned[record.get("networkDeviceId")] = record
+
+        self.log("Found {0} device ID(s), {1} site ID(s) and {2} provisioned device(s).".format(
+            len(device_ids), len(site_ids), len(provisioned)), "DEBUG")
+        return {"device_ids": device_ids, "site_ids": site_ids, "provisioned": provisioned}
+
+    def get_devices_assigned_to_site(self, site_id):
+        """
+        Retrieves the IDs of the network devices assigned to the given site.
+
+        Args:
+            site_id (str): The ID of the site.
+
+        Returns:
+            set: The network device IDs assigned to the site.
+        """
+        records = self.get_paginated_response("site_design", "get_site_assigned_network_devices", {"site_id": site_id})
+        return set(record.get("deviceId") for record in records)
+
+    def submit_wired_provisioning_batch(self, batch):
+        """
+        Submits one batch of wired devices for provisioning or reprovisioning.
+
+        Args:
+            batch (tuple): The API function name ('provision_devices' or 're_provision_devices'), the payload
+                           of the batch and the management IP addresses of its devices.
+
+        Returns:
+            tuple: The task ID of the batch and the error message, one of them being None.
+
+        Description:
+            Called from the worker threads, so the outcome is returned instead of being stored in the instance.
+        """
+        api_function, payload, device_ips = batch
+        try:
+            response = self.dnac._exec(
+                family="sda",
+                function=api_function,
+                op_modifies=True,
+                params={"payload": payload}
+            )
+            self.log("Received API response from '{0}' for the device(s) {1}: {2}".format(
+                api_function, device_ips, response), "DEBUG")
+            task_info = response.get("response") if isinstance(response, dict) else None
+            if not task_info or not task_info.get("taskId"):
+                return None, "Invalid response received from '{0}': {1}".format(api_function, response)
+
+            return task_info.get("taskId"), None
+
+        except Exception as e:
+            return None, str(e)
+
     def provision_bulk_wired_device(self):
         """
         Provisions or reprovisions wired network devices in bulk based on the given validated configuration.
@@ -1162,106 +1300,142 @@ class Provision(DnacBase):
 
         Description:
             This method:
-            - Identifies devices that need provisioning or reprovisioning.
-            - Checks their current provision status.
-            - Logs and updates provisioning status accordingly.
+            - Loads the device IDs, the provisioning records and the site IDs of all the wired devices at once.
+            - Computes the devices to provision, reprovision, assign to a site or skip in memory.
+            - Assigns the devices which only need a site assignment with one request per site, skipping the
+              devices already assigned to that site.
+            - Submits provisioning and reprovisioning in batches of 'provision_batch_size' devices, with up to
+              'max_concurrent_batches' batches in flight, and tracks all the resulting tasks together.
             - Ensures already provisioned devices are not unnecessarily reprovisioned unless forced.
-            - Updates the instance with provisioning results and logs messages accordingly.
         """
-
-        provision_params, reprovision_params, self.device_ips = [], [], []
-        already_provisioned_devices = []
-
-        self.reprovisioned_device, self.provisioned_device, self.already_provisioned_devices = [], [], []
-        success_msg, provision_needed, reprovision_needed = [], [], []
         self.log("Starting bulk wired device provisioning process.", "INFO")
+        self.reprovisioned_device, self.provisioned_device, self.already_provisioned_devices = [], [], []
+        success_msg, failure_msg = [], []
 
+        wired_configs = []
         for config in self.validated_config:
             device_ip = config.get("management_ip_address")
-
             if device_ip not in self.device_dict['wired']:
                 self.log("Skipping device '{0}': Not a wired device.".format(device_ip), "DEBUG")
                 continue
 
-            site_name = config.get("site_name_hierarchy")
-            site_id_tuple = self.get_site_id(site_name)
-            site_id = site_id_tuple[1]
-            self.device_ips.append(device_ip)
+            wired_configs.append(config)
 
-            network_device_id = self.get_device_ids_from_device_ips([device_ip]).get(device_ip)
+        self.device_ips = [config.get("management_ip_address") for config in wired_configs]
+        site_names = list(dict.fromkeys(config.get("site_name_hierarchy") for config in wired_configs))
+        snapshot = self.get_wired_provisioning_snapshot(self.device_ips, site_names)
+
+        provision_needed, reprovision_needed, assign_needed = [], [], {}
+        for config in wired_configs:
+            device_ip = config.get("management_ip_address")
+            site_name = config.get("site_name_hierarchy")
+            site_id = snapshot["site_ids"].get(site_name)
+            network_device_id = snapshot["device_ids"].get(device_ip)
             if not network_device_id:
                 self.log("Skipping device '{0}': Device ID not found.".format(device_ip), "ERROR")
                 continue
 
-            provision_id, status = self.get_device_provision_status(network_device_id, device_ip)
-            self.log("Device '{0}': provision_id='{1}', status='{2}'".format(device_ip, provision_id, status), "DEBUG")
-
+            provision_record = snapshot["provisioned"].get(network_device_id)
             to_force_provisioning = config.get("force_provisioning", False)
             to_provisioning = config.get("provisioning", False)
+            self.log("Device '{0}': provisioned='{1}', provisioning='{2}', force_provisioning='{3}'".format(
+                device_ip, bool(provision_record), to_provisioning, to_force_provisioning), "DEBUG")
 
-            if not to_provisioning and status != "success":
-                self.log("Provisioning not required; assigning device '{0}' to site '{1}' (site_id: {2}).".format(device_ip, site_name, site_id), "INFO")
-                if self.assign_device_to_site([network_device_id], site_name, site_id):
-                    success_msg.append("Wired Device '{0}' is assigned to site {1}.".format(device_ip, site_name))
+            if not provision_record:
+                if to_provisioning:
+                    self.log("Device '{0}' requires provisioning.".format(device_ip), "INFO")
+                    provision_needed.append((device_ip, {"siteId": site_id, "networkDeviceId": network_device_id}))
+                else:
+                    assign_needed.setdefault(site_name, []).append((device_ip, network_device_id))
 
                 continue
 
-            if status == "success":
-                if not to_force_provisioning:
-                    self.already_provisioned_devices.append(device_ip)
-                    success_msg.append("Wired Device '{0}' is already provisioned.".format(device_ip))
-                    self.log(success_msg[-1], "INFO")
-
-                    if not to_provisioning:
-                        self.msg = ("Cannot assign a provisioned device to the site. "
-                                    "The device is already provisioned. "
-                                    "To re-provision the device, set both 'provisioning' and 'force_provisioning' to 'true', "
-                                    "or unprovision the device and try again.")
-                        self.set_operation_result("failed", False, self.msg, "ERROR")
-                    continue
+            if not to_force_provisioning:
+                self.already_provisioned_devices.append(device_ip)
+                success_msg.append("Wired Device '{0}' is already provisioned.".format(device_ip))
+                self.log(success_msg[-1], "INFO")
+
+                if not to_provisioning:
+                    failure_msg.append(
+                        "Cannot assign the provisioned device '{0}' to the site. "
+                        "The device is already provisioned. "
+                        "To re-provision the device, set both 'provisioning' and 'force_provisioning' to 'true', "
+                        "or unprovision the device and try again.".format(device_ip))
+                    self.log(failure_msg[-1], "ERROR")
 
-                self.log("Device '{0}' requires reprovisioning.".format(device_ip), "INFO")
-                reprovision_needed.append(device_ip)
-                reprovision_params.append({
-                    "id": provision_id,
-                    "siteId": site_id,
-                    "networkDeviceId": network_device_id
-                })
+                continue
 
-            else:
-                if to_provisioning:
-                    self.log("Device '{0}' requires provisioning.".format(device_ip), "INFO")
-                    provision_needed.append(device_ip)
-                    provision_params.append({
-                        "siteId": site_id,
-                        "networkDeviceId": network_device_id
-                    })
+            self.log("Device '{0}' requires reprovisioning.".format(device_ip), "INFO")
+            reprovision_needed.append((device_ip, {
+                "id": provision_record.get("id"),
+                "siteId": site_id,
+                "networkDeviceId": network_device_id
+            }))
 
         self.log("Provisioning/Reprovisioning evaluation:", "INFO")
-        self.log("Provision Needed: {0}".format(provision_needed), "INFO")
-        self.log("Reprovision Needed: {0}".format(reprovision_needed), "INFO")
+        self.log("Provision Needed: {0}".format([device[0] for device in provision_needed]), "INFO")
+        self.log("Reprovision Needed: {0}".format([device[0] for device in reprovision_needed]), "INFO")
+        self.log("Site Assignment Needed: {0}".format(
+            dict((site, [device[0] for device in devices]) for site, devices in assign_needed.items())), "INFO")
+
+        is_changed = False
+        for site_name, devices in assign_needed.items():
+            site_id = snapshot["site_ids"].get(site_name)
+            assigned_device_ids = self.get_devices_assigned_to_site(site_id)
+            to_assign = [device for device in devices if device[1] not in assigned_device_ids]
+            for device_ip, network_device_id in devices:
+                if network_device_id in assigned_device_ids:
+                    success_msg.append("Wired Device '{0}' is already assigned to site {1}.".format(device_ip, site_name))
+
+            if not to_assign:
+                continue
 
-        if set(already_provisioned_devices) == set(self.device_ips):
-            self.msg = "All devices are already provisioned: {0}".format(already_provisioned_devices)
-            self.set_operation_result("success", False, self.msg, "INFO")
-            return self
+            self.log("Assigning the device(s) {0} to site '{1}' (site_id: {2}).".format(
+                [device[0] for device in to_assign], site_name, site_id), "INFO")
+            if self.assign_device_to_site([device[1] for device in to_assign], site_name, site_id):
+                is_changed = True
+                for device_ip, network_device_id in to_assign:
+                    success_msg.append("Wired Device '{0}' is assigned to site {1}.".format(device_ip, site_name))
 
-        if reprovision_params:
-            self.reprovision_wired_device(reprovision_params, device_ips=reprovision_needed)
-            re_prov_success_msg = "re-provisioning of the device(s) '{0}' completed successfully.".format(reprovision_needed)
-            success_msg.append(re_prov_success_msg)
+        batch_size = self.params.get("provision_batch_size")
+        batches = []
+        for api_function, devices in (("re_provision_devices", reprovision_needed), ("provision_devices", provision_needed)):
+            for start in range(0, len(devices), batch_size):
+                batch = devices[start:start + batch_size]
+                batches.append((api_function, [device[1] for device in batch], [device[0] for device in batch]))
+
+        if batches:
+            max_workers = self.params.get("max_concurrent_batches")
+            self.log("Submitting {0} provisioning batch(es) of up to {1} device(s) with up to {2} batch(es) in flight.".format(
+                len(batches), batch_size, max_workers), "INFO")
+            submissions = self.execute_concurrently(self.submit_wired_provisioning_batch, batches, max_workers)
+            task_results = self.wait_for_tasks([task_id for task_id, error in submissions if task_id], max_workers=max_workers)
+
+            for (api_function, payload, device_ips), (task_id, error) in zip(batches, submissions):
+                operation = "re-provisioning" if api_function == "re_provision_devices" else "Provisioning"
+                task_details = task_results.get(task_id) or {}
+                if not error and task_details.get("isError"):
+                    error = task_details.get("failureReason") or task_details.get("progress")
+
+                if error:
+                    failure_msg.append("Error in {0} of the device(s) '{1}' due to {2}".format(
+                        operation.lower(), device_ips, error))
+                    self.log(failure_msg[-1], "ERROR")
+                    continue
 
-        if provision_params:
-            for i in range(0, len(provision_params), 100):
-                batch_params = provision_params[i:i + 100]
-                batch_devices = provision_needed[i:i + 100]
-                self.log("Provisioning of the device(s) - {0} with the param - {1}".format(batch_devices, batch_params), "INFO")
-                self.initialize_wired_provisioning(batch_params, device_ips=batch_devices)
-                success_msg.append("Provisioning of the device(s) '{0}' completed successfully.".format(batch_devices))
+                is_changed = True
+                if api_function == "re_provision_devices":
+                    self.reprovisioned_device.extend(device_ips)
+                else:
+                    self.provisioned_device.extend(device_ips)
+                success_msg.append("{0} of the device(s) '{1}' completed successfully.".format(operation, device_ips))
 
-        if success_msg:
+        if failure_msg:
+            self.msg = failure_msg + success_msg
+            self.set_operation_result("failed", is_changed, self.msg, "ERROR")
+        elif success_msg:
             self.msg = success_msg
-            self.set_operation_result("success", True, self.msg, "INFO")
+            self.set_operation_result("success", is_changed, self.msg, "INFO")
 
         self.log("Bulk wired device provisioning process completed.", "INFO")
         return self
@@ -2115,7 +2289,9 @@ def main():
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
                     'validate_response_schema': {'type': 'bool', 'default': True},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
-                    'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
+                    'state': {'default': 'merged', 'choices': ['merged', 'deleted']},
+                    'provision_batch_size': {'type': 'int', 'default': 100},
+                    'max_concurrent_batches': {'type': 'int', 'default': 5}
                     }
     module = AnsibleModule(argument_spec=element_spec,
                            supports_check_mode=False)
@@ -80,6 +80,15 @@ options:
       The timeout interval, in seconds, for operations.
     type: int
     default: 100
+  max_concurrent_requests:
+    description: |
+      Maximum number of requests sent to Cisco Catalyst Center at the same time
+      when several faulty devices are replaced in a single run.
+      The device lookups, the marking and the replacement workflows of all the
+      pairs are then started together and tracked with a single status poll.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description: |
       A list of faulty and replacement device details for initiating the RMA workflow.
@@ -158,6 +167,7 @@ notes:
     - LAN automation using an overlapping pool.
   - If the replacement device onboards through PnP-DHCP functionality,
     ensure the device receives the same IP address after every reload and that the DHCP lease timeout is longer than two hours.
+  - Added 'max_concurrent_requests' option in v6.32.0.
 """
 
 """
@@ -534,78 +544,9 @@ class DeviceReplacement(DnacBase):
         have = {}
         config = self.want["config"]
         if self.payload.get("state") == "replaced":
-            identifier_keys = [
-                ("faulty_device_serial_number", "replacement_device_serial_number"),
-                ("faulty_device_serial_number", "replacement_device_name"),
-                ("faulty_device_serial_number", "replacement_device_ip_address"),
-                ("faulty_device_name", "replacement_device_serial_number"),
-                ("faulty_device_name", "replacement_device_name"),
-                ("faulty_device_name", "replacement_device_ip_address"),
-                ("faulty_device_ip_address", "replacement_device_ip_address"),
-                ("faulty_device_ip_address", "replacement_device_name"),
-                ("faulty_device_ip_address", "replacement_device_serial_number")
-            ]
-
-            valid_identifier_found = False
-
-            # Iterate through identifier keys to find valid device combinations
-            for faulty_key, replacement_key in identifier_keys:
-                faulty_identifier = config.get(faulty_key)
-                replacement_identifier = config.get(replacement_key)
-
-                if faulty_identifier and replacement_identifier:
-                    valid_identifier_found = True
-
-                    # Check if faulty device exists
-                    faulty_device = self.device_exists(faulty_identifier, faulty_key)
-
-                    if not faulty_device:
-                        self.msg = "Faulty device '{0}' not found in Cisco Catalyst Center".format(faulty_identifier)
-                        self.log(self.msg, "ERROR")
-                        self.status = "failed"
-                        return self
-
-                    have["faulty_device_id"] = faulty_device.get("device_id")
-                    have["faulty_device_serial_number"] = faulty_device.get("serial_number")
-                    have["faulty_device_name"] = faulty_device.get("device_name")
-                    have["faulty_device_reachability_status"] = faulty_device.get("reachability_status")
-                    have["faulty_device_platform_id"] = faulty_device.get("platform_id")
-                    have[faulty_key] = faulty_identifier
-                    have["faulty_device_exists"] = True
-                    self.log("Faulty device '{0}' found in Cisco Catalyst Center".format(faulty_identifier), "INFO")
-
-                    # Check if replacement device exists
-                    replacement_device = self.device_exists(replacement_identifier, replacement_key)
-
-                    if not replacement_device:
-                        self.log("Replacement device '{0}' not found in inventory, checking in PnP...", "DEBUG")
-                        replacement_device = self.pnp_device_exists(replacement_identifier, replacement_key)
-
-                        if not replacement_device:
-                            self.msg = "Replacement device '{0}' not found in PnP".format(replacement_identifier)
-                            self.log(self.msg, "ERROR")
-                            self.status = "failed"
-                            return self
-
-                    have["replacement_device_id"] = replacement_device.get("device_id")
-                    have["replacement_device_serial_number"] = replacement_device.get("serial_number")
-                    have["replacement_device_name"] = replacement_device.get("device_name")
-                    have["replacement_device_reachability_status"] = replacement_device.get("reachability_status")
-                    have["replacement_device_platform_id"] = replacement_device.get("platform_id")
-                    have["is_pnp_replacement_device"] = replacement_device.get("is_pnp_device")
-                    have[replacement_key] = replacement_identifier
-                    have["replacement_device_exists"] = True
-                    self.log("Replacement device '{0}' found in Cisco Catalyst Center".format(replacement_identifier), "INFO")
-                    break
-
-            # Check if any valid identifier combination was not found
-            if not valid_identifier_found:
-                provided_identifiers = {
-                    key: value
-                    for key, value in config.items()
-                    if key in [item for sublist in identifier_keys for item in sublist] and value
-                }
-                self.msg = "No valid device combination found in config. Provided values in config: {0}".format(provided_identifiers)
+            have, error_msg = self.resolve_replacement_pair(config)
+            if error_msg:
+                self.msg = error_msg
                 self.log(self.msg, "ERROR")
                 self.status = "failed"
                 return self
@@ -648,6 +589,110 @@ class DeviceReplacement(DnacBase):
 
         return self
 
+    def resolve_replacement_pair(self, config):
+        """
+        Look up the faulty and replacement devices of one replacement pair in Cisco Catalyst Center.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - config (dict): The validated faulty and replacement device identifiers of the pair.
+        Returns:
+            tuple: The details of both devices in the format of 'self.have' and None when both devices are found,
+                   otherwise an empty dict and the error message.
+        Description:
+            The first identifier combination present in the config is used. The replacement device is searched in
+            the inventory first and then in PnP. The method does not update 'self.msg' or 'self.status', so it can
+            be used to look up several pairs at the same time.
+        """
+        identifier_keys = [
+            ("faulty_device_serial_number", "replacement_device_serial_number"),
+            ("faulty_device_serial_number", "replacement_device_name"),
+            ("faulty_device_serial_number", "replacement_device_ip_address"),
+            ("faulty_device_name", "replacement_device_serial_number"),
+            ("faulty_device_name", "replacement_device_name"),
+            ("faulty_device_name", "replacement_device_ip_address"),
+            ("faulty_device_ip_address", "replacement_device_ip_address"),
+            ("faulty_device_ip_address", "replacement_device_name"),
+            ("faulty_device_ip_address", "replacement_device_serial_number")
+        ]
+
+        # Iterate through identifier keys to find valid device combinations
+        for faulty_key, replacement_key in identifier_keys:
+            faulty_identifier = config.get(faulty_key)
+            replacement_identifier = config.get(replacement_key)
+
+            if not (faulty_identifier and replacement_identifier):
+                continue
+
+            # Check if faulty device exists
+            faulty_device = self.device_exists(faulty_identifier, faulty_key)
+
+            if not faulty_device:
+                return {}, "Faulty device '{0}' not found in Cisco Catalyst Center".format(faulty_identifier)
+
+            have = {}
+            have["faulty_device_id"] = faulty_device.get("device_id")
+            have["faulty_device_serial_number"] = faulty_device.get("serial_number")
+            have["faulty_device_name"] = faulty_device.get("device_name")
+            have["faulty_device_reachability_status"] = faulty_device.get("reachability_status")
+            have["faulty_device_platform_id"] = faulty_device.get("platform_id")
+            have[faulty_key] = faulty_identifier
+            have["faulty_device_exists"] = True
+            self.log("Faulty device '{0}' found in Cisco Catalyst Center".format(faulty_identifier), "INFO")
+
+            # Check if replacement device exists
+            replacement_device = self.device_exists(replacement_identifier, replacement_key)
+
+            if not replacement_device:
+                self.log("Replacement device '{0}' not found in inventory, checking in PnP...".format(replacement_identifier), "DEBUG")
+                replacement_device = self.pnp_device_exists(replacement_identifier, replacement_key)
+
+                if not replacement_device:
+                    return {}, "Replacement device '{0}' not found in PnP".format(replacement_identifier)
+
+            have["replacement_device_id"] = replacement_device.get("device_id")
+            have["replacement_device_serial_number"] = replacement_device.get("serial_number")
+            have["replacement_device_name"] = replacement_device.get("device_name")
+            have["replacement_device_reachability_status"] = replacement_device.get("reachability_status")
+            have["replacement_device_platform_id"] = replacement_device.get("platform_id")
+            have["is_pnp_replacement_device"] = replacement_device.get("is_pnp_device")
+            have[replacement_key] = replacement_identifier
+            have["replacement_device_exists"] = True
+            self.log("Replacement device '{0}' found in Cisco Catalyst Center".format(replacement_identifier), "INFO")
+            return have, None
+
+        # No valid identifier combination was found
+        provided_identifiers = {
+            key: value
+            for key, value in config.items()
+            if key in [item for sublist in identifier_keys for item in sublist] and value
+        }
+        return {}, "No valid device combination found in config. Provided values in config: {0}".format(provided_identifiers)
+
+    def get_replacement_pre_check_error(self, have):
+        """
+        Check that a faulty device can be replaced with the given replacement device.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - have (dict): The details of the faulty and replacement devices of the pair.
+        Returns:
+            str or None: The reason the replacement cannot be performed, or None when the pre-check passes.
+        """
+        if have["faulty_device_platform_id"] != have["replacement_device_platform_id"]:
+            return (
+                "The faulty device and the replacement device do not belong to the same platform, family and series."
+                " These attributes must match for a valid replacement."
+            )
+
+        self.log("The faulty device and the replacement device belong to the same platform, family and series.", "DEBUG")
+
+        if not have["is_pnp_replacement_device"]:
+            if have["replacement_device_reachability_status"] != "Reachable":
+                return "The replacement device is not reachable. Unable to proceed with the RMA device replacement."
+
+            self.log("The replacement device '{0}' is reachable.".format(have.get("replacement_device_name")), "DEBUG")
+
+        return None
+
     def rma_device_replacement_pre_check(self):
         """
         Performs a pre-check for RMA device replacement to ensure compatibility and reachability.
@@ -662,25 +707,11 @@ class DeviceReplacement(DnacBase):
             updates the status to 'failed', and returns the instance for further handling in the RMA workflow.
         """
 
-        if self.have["faulty_device_platform_id"] != self.have["replacement_device_platform_id"]:
-            self.msg = (
-                "The faulty device and the replacement device do not belong to the same platform, family and series."
-                " These attributes must match for a valid replacement."
-            )
+        error_msg = self.get_replacement_pre_check_error(self.have)
+        if error_msg:
+            self.msg = error_msg
             self.log(self.msg, "ERROR")
             self.status = "failed"
-            return self
-
-        self.log("The faulty device and the replacement device belong to the same platform, family and series.", "DEBUG")
-
-        if not self.have["is_pnp_replacement_device"]:
-            if self.have["replacement_device_reachability_status"] != "Reachable":
-                self.msg = "The replacement device is not reachable. Unable to proceed with the RMA device replacement."
-                self.log(self.msg, "ERROR")
-                self.status = "failed"
-                return self
-
-            self.log("The replacement device '{0}' is reachable.".format(self.have.get("replacement_device_name")), "DEBUG")
 
         return self
 
@@ -1106,6 +1137,7 @@ class DeviceReplacement(DnacBase):
         Description:
             This method monitors the status of a device replacement task in Cisco Catalyst Center. It performs the following steps:
             - Initializes retry count and interval for checking task status.
+            - The wait between two checks starts at 'dnac_task_poll_interval' and doubles up to 'resync_retry_interval'.
             - Enters a loop to periodically check the task status:
                 - Retrieves task details using the get_task_details method.
                 - Checks if the task has completed successfully:
@@ -1122,6 +1154,7 @@ class DeviceReplacement(DnacBase):
 
         resync_retry_count = self.params.get('resync_retry_count')
         resync_retry_interval = self.params.get('resync_retry_interval')
+        attempt = 0
         while resync_retry_count:
             task_details = self.get_task_details(self.task_id)
             self.log("Task Details: {0}".format(self.pprint(task_details)), "DEBUG")
@@ -1148,7 +1181,8 @@ class DeviceReplacement(DnacBase):
                 return {"status": "failed", "msg": self.msg}
 
             self.log("RMA workflow in progress: {0}".format(task_details.get("progress")), "INFO")
-            time.sleep(resync_retry_interval)
+            time.sleep(self.get_backoff_interval(attempt, resync_retry_interval))
+            attempt += 1
             resync_retry_count -= 1
 
         # If we've exhausted all retries without a definitive result
@@ -1272,6 +1306,359 @@ class DeviceReplacement(DnacBase):
             time.sleep(ccc_poll_interval)
             timeout_interval -= ccc_poll_interval
 
+        error_message = "{0}: Task did not complete within {1} seconds.".format(error_prefix, self.params.get('timeout_interval'))
+        self.log(error_message, "ERROR")
+        return {"status": "failed", "msg": error_message}
+
+    def get_replacement_records(self):
+        """
+        Retrieve every device replacement record of Cisco Catalyst Center with a single request.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Returns:
+            dict or None: The replacement records keyed by the faulty device serial number,
+                          or None if the records could not be retrieved.
+        """
+        try:
+            response = self.dnac._exec(
+                family="device_replacement",
+                function='return_replacement_devices_with_details'
+            )
+            self.log("Received API response from 'return_replacement_devices_with_details': {0}".format(self.pprint(response)), "DEBUG")
+        except Exception as e:
+            self.log("Exception occurred while retrieving the device replacement records: {0}".format(str(e)), "ERROR")
+            return None
+
+        records = {}
+        for device in (response or {}).get("response") or []:
+            records[device.get("faultyDeviceSerialNumber")] = device
+
+        return records
+
+    def submit_replacement_request(self, request):
+        """
+        Send one device replacement request to Cisco Catalyst Center.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - request (tuple): The 'device_replacement' function name and its payload.
+        Returns:
+            tuple: The task ID and None on success, otherwise None and the error message.
+        Description:
+            Used to mark, deploy and unmark several replacement pairs at the same time, so it reports its
+            outcome instead of updating 'self.msg' or 'self.status'.
+        """
+        function, payload = request
+        try:
+            response = self.dnac._exec(
+                family="device_replacement",
+                function=function,
+                op_modifies=True,
+                params=dict(payload=payload)
+            )
+            self.log("Received API response from '{0}': {1}".format(function, self.pprint(response)), "DEBUG")
+        except Exception as e:
+            return None, "Exception occurred while calling '{0}': {1}".format(function, repr(e))
+
+        task_id = (response or {}).get("response", {}).get("taskId")
+        if not task_id:
+            return None, "No task ID received from '{0}': {1}".format(function, response)
+
+        return task_id, None
+
+    def run_replacement_requests(self, pairs, build_request, success_message):
+        """
+        Submit one replacement request per pair concurrently and wait for all their tasks together.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - pairs (list): The replacement pairs to process.
+            - build_request (callable): Returns the function name and payload of the request of a pair.
+            - success_message (str): The message logged for every pair whose task succeeded.
+        Returns:
+            dict: The error message keyed by the index of every pair in 'pairs' whose request failed.
+        """
+        max_workers = self.params.get("max_concurrent_requests")
+        submitted = self.execute_concurrently(
+            self.submit_replacement_request, [build_request(pair) for pair in pairs], max_workers
+        )
+        errors = {}
+        for index, (task_id, error_msg) in enumerate(submitted):
+            if error_msg:
+                errors[index] = error_msg
+
+        task_results = self.wait_for_tasks(
+            [task_id for task_id, error_msg in submitted if task_id], "successful", max_workers
+        )
+        for index, (task_id, error_msg) in enumerate(submitted):
+            if not task_id:
+                continue
+
+            task_details = task_results.get(task_id) or {}
+            if task_details.get("isError"):
+                errors[index] = task_details.get("failureReason") or "Task '{0}' failed.".format(task_id)
+            else:
+                self.log("{0}: {1}".format(success_message, pairs[index]["have"].get("faulty_device_name")), "INFO")
+
+        return errors
+
+    def monitor_replacement_workflows(self, pairs):
+        """
+        Track the replacement workflows of several pairs until each of them is replaced, fails or times out.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - pairs (list): The replacement pairs whose workflow was deployed.
+        Returns:
+            None: The 'status' and 'msg' of every pair are updated.
+        Description:
+            Every round reads all the replacement records with one 'return_replacement_devices_with_details'
+            request instead of polling each workflow task. A pair whose record is no longer listed falls back to
+            its deployment task. Rounds are spaced with a backoff capped at 'resync_retry_interval' and stop
+            after 'resync_retry_count' rounds.
+        """
+        failure_statuses = ("ERROR", "NETWORK-READINESS-FAILED", "REPLACEMENT-FAILED")
+        resync_retry_count = self.params.get('resync_retry_count')
+        resync_retry_interval = self.params.get('resync_retry_interval')
+        pending = list(pairs)
+        attempt = 0
+
+        while pending and attempt < resync_retry_count:
+            records = self.get_replacement_records()
+            still_pending = []
+            for pair in pending:
+                if records is None:
+                    still_pending.append(pair)
+                    continue
+
+                record = records.get(pair["have"].get("faulty_device_serial_number"))
+                replacement_status = (record or {}).get("replacementStatus")
+                if replacement_status == "REPLACED":
+                    pair["status"] = "success"
+                    pair["msg"] = "Device replacement completed successfully"
+                elif replacement_status in failure_statuses:
+                    pair["msg"] = "Error in device replacement: {0}".format(replacement_status)
+                elif record is None:
+                    task_details = self.get_task_details(pair["task_id"]) or {}
+                    if task_details.get("isError"):
+                        pair["msg"] = "Error in device replacement: {0}".format(
+                            task_details.get("failureReason") or task_details.get("progress"))
+                    elif task_details.get("endTime") is not None:
+                        pair["status"] = "success"
+                        pair["msg"] = "Device replacement completed successfully: {0}".format(task_details.get("progress"))
+                    else:
+                        still_pending.append(pair)
+                        continue
+                else:
+                    self.log("RMA workflow of the faulty device '{0}' in progress: {1}".format(
+                        pair["have"].get("faulty_device_name"), replacement_status), "DEBUG")
+                    still_pending.append(pair)
+                    continue
+
+                self.log("RMA workflow of the faulty device '{0}': {1}".format(pair["have"].get("faulty_device_name"), pair["msg"]), "INFO")
+
+            pending = still_pending
+            if pending:
+                self.log("{0} RMA workflow(s) still in progress.".format(len(pending)), "INFO")
+                time.sleep(self.get_backoff_interval(attempt, resync_retry_interval))
+            attempt += 1
+
+        for pair in pending:
+            pair["msg"] = "Device replacement monitoring timed out after {0} attempts".format(resync_retry_count)
+
+    def get_diff_replaced_bulk(self, config_list):
+        """
+        Replace several faulty devices in Cisco Catalyst Center at the same time.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - config_list (list): The validated faulty and replacement device details of every pair.
+        Returns:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Description:
+            - Validates every pair and looks up all the devices concurrently, with up to 'max_concurrent_requests'
+              requests at the same time. No device is marked when a pair fails its pre-checks.
+            - Reads the replacement records once to find the faulty devices already ready for replacement,
+              then marks the other ones and deploys all the workflows concurrently.
+            - Tracks every workflow from a single replacement records poll and unmarks the faulty devices of
+              the failed pairs using their own replacement ID.
+            - The outcome of every pair is stored in 'self.result["replacement_results"]'.
+        """
+        pairs, errors = [], []
+        for config in config_list:
+            self.get_want(config)
+            if self.status == "failed":
+                errors.append(self.msg)
+                continue
+
+            pairs.append({"config": self.want["config"], "status": "failed", "msg": None})
+
+        lookups = self.execute_concurrently(
+            self.resolve_replacement_pair, [pair["config"] for pair in pairs], self.params.get("max_concurrent_requests")
+        )
+        faulty_serial_numbers = set()
+        for pair, (have, error_msg) in zip(pairs, lookups):
+            pair["have"] = have
+            if not error_msg:
+                error_msg = self.get_replacement_pre_check_error(have)
+            if not error_msg and have["faulty_device_serial_number"] in faulty_serial_numbers:
+                error_msg = "Faulty device '{0}' is given in more than one replacement pair".format(have["faulty_device_name"])
+            if error_msg:
+                errors.append(error_msg)
+                continue
+
+            faulty_serial_numbers.add(have["faulty_device_serial_number"])
+
+        if errors:
+            self.status = "failed"
+            self.msg = "RMA pre-checks failed, no device was marked for replacement: {0}".format(" | ".join(errors))
+            self.log(self.msg, "ERROR")
+            return self
+
+        records = self.get_replacement_records() or {}
+        to_mark = []
+        for pair in pairs:
+            record = records.get(pair["have"]["faulty_device_serial_number"])
+            if record and record.get("replacementStatus") == "READY-FOR-REPLACEMENT":
+                pair["device_replacement_id"] = record.get("id")
+                self.log("The device '{0}' is already in the 'READY-FOR-REPLACEMENT' state.".format(pair["have"]["faulty_device_name"]), "DEBUG")
+            else:
+                to_mark.append(pair)
+
+        if to_mark:
+            self.log("Marking {0} faulty device(s) for replacement.".format(len(to_mark)), "INFO")
+            mark_errors = self.run_replacement_requests(
+                to_mark,
+                lambda pair: ("mark_device_for_replacement", [{
+                    "faultyDeviceId": pair["have"].get("faulty_device_id"),
+                    "replacementStatus": "MARKED-FOR-REPLACEMENT"
+                }]),
+                "Device marked for replacement successfully"
+            )
+            for index, error_msg in mark_errors.items():
+                to_mark[index]["msg"] = "Error while marking device for replacement: {0}".format(error_msg)
+
+            records = self.get_replacement_records() or {}
+            for pair in to_mark:
+                record = records.get(pair["have"]["faulty_device_serial_number"])
+                if record:
+                    pair["device_replacement_id"] = record.get("id")
+
+        to_deploy = [pair for pair in pairs if not pair["msg"]]
+        if to_deploy:
+            self.log("Deploying {0} device replacement workflow(s).".format(len(to_deploy)), "INFO")
+            submitted = self.execute_concurrently(
+                self.submit_replacement_request,
+                [("deploy_device_replacement_workflow", {
+                    "faultyDeviceSerialNumber": pair["have"].get("faulty_device_serial_number"),
+                    "replacementDeviceSerialNumber": pair["have"].get("replacement_device_serial_number")
+                }) for pair in to_deploy],
+                self.params.get("max_concurrent_requests")
+            )
+            for pair, (task_id, error_msg) in zip(to_deploy, submitted):
+                pair["task_id"] = task_id
+                if error_msg:
+                    pair["msg"] = "Device replacement task failed: {0}".format(error_msg)
+
+            deployed = [pair for pair in to_deploy if pair["task_id"]]
+            task_results = self.wait_for_tasks(
+                [pair["task_id"] for pair in deployed], "successful", self.params.get("max_concurrent_requests")
+            )
+            initiated = []
+            for pair in deployed:
+                task_details = task_results.get(pair["task_id"]) or {}
+                if task_details.get("isError"):
+                    pair["msg"] = "Device replacement task failed: {0}".format(
+                        task_details.get("failureReason") or "Error in device replacement task initiation")
+                else:
+                    initiated.append(pair)
+
+            self.monitor_replacement_workflows(initiated)
+
+        failed_pairs = [pair for pair in pairs if pair["status"] != "success"]
+        to_unmark = [pair for pair in failed_pairs if pair.get("device_replacement_id")]
+        if to_unmark:
+            self.log("Attempting to unmark {0} device(s) after failure".format(len(to_unmark)), "INFO")
+            unmark_errors = self.run_replacement_requests(
+                to_unmark,
+                lambda pair: ("unmark_device_for_replacement", [{
+                    "id": pair["device_replacement_id"],
+                    "replacementStatus": "NON-FAULTY"
+                }]),
+                "Device unmarked for replacement successfully"
+            )
+            for index, pair in enumerate(to_unmark):
+                pair["msg"] = "{0} | Unmarking result: {1}".format(
+                    pair["msg"], unmark_errors.get(index, "Device unmarked for replacement successfully"))
+
+        replacement_results = []
+        for pair in pairs:
+            if pair["status"] == "success":
+                self.faulty_device.append(pair["have"].get("faulty_device_name"))
+                self.replacement_device.append(pair["have"].get("replacement_device_name"))
+            replacement_results.append({
+                "faulty_device_name": pair["have"].get("faulty_device_name"),
+                "faulty_device_serial_number": pair["have"].get("faulty_device_serial_number"),
+                "replacement_device_name": pair["have"].get("replacement_device_name"),
+                "status": pair["status"],
+                "msg": pair["msg"]
+            })
+        self.result["replacement_results"] = replacement_results
+
+        if failed_pairs:
+            self.update_rma_profile_messages()
+            failure_msg = "RMA failed to replace the faulty device(s): {0}".format(" | ".join(
+                "'{0}': {1}".format(pair["have"].get("faulty_device_name"), pair["msg"]) for pair in failed_pairs))
+            self.msg = "{0} {1}".format(self.msg, failure_msg) if self.faulty_device else failure_msg
+            self.status = "failed"
+            self.log(self.msg, "ERROR")
+            return self
+
+        self.msg = "Device replacement completed successfully for {0} pair(s)".format(len(pairs))
+        self.status = "success"
+        return self
+
+    def verify_diff_replaced_bulk(self, config_list):
+        """
+        Verify the device replacement status of several pairs with a single request to Cisco Catalyst Center.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - config_list (list): The validated faulty and replacement device details of every pair.
+        Returns:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Description:
+            Reads the replacement records once and checks that the record of every pair replaced by
+            'get_diff_replaced_bulk' is in the 'REPLACED' state. The verification fails otherwise.
+        """
+        records = self.get_replacement_records()
+        if records is None:
+            self.status = "failed"
+            self.msg = "Unable to retrieve the device replacement records to verify the replacement"
+            self.log(self.msg, "ERROR")
+            return self
+
+        verified, unverified = [], []
+        for replacement_result in self.result.get("replacement_results", []):
+            if replacement_result["status"] != "success":
+                continue
+
+            record = records.get(replacement_result["faulty_device_serial_number"])
+            replacement_status = (record or {}).get("replacementStatus")
+            self.log("Replacement status of the faulty device '{0}': {1}".format(
+                replacement_result["faulty_device_name"], self.pprint(record)), "INFO")
+            if replacement_status != "REPLACED":
+                unverified.append("'{0}': {1}".format(replacement_result["faulty_device_name"], replacement_status))
+            else:
+                verified.append(replacement_result["faulty_device_name"])
+
+        if unverified:
+            self.status = "failed"
+            self.msg = "Device replacement could not be verified, the faulty device(s) are not in the 'REPLACED' state: {0}".format(
+                " | ".join(unverified))
+            self.log(self.msg, "ERROR")
+            return self
+
+        self.status = "success"
+        self.msg = "Device replacement verified successfully for {0} pair(s)".format(len(verified))
+        self.log(self.msg, "INFO")
+        return self
+
     def update_rma_profile_messages(self):
         """
         Updates and logs messages based on the status of RMA device replacements.
@@ -1411,6 +1798,7 @@ def main():
         'resync_retry_interval': {'type': 'int', 'default': 30},
         'ccc_poll_interval': {'type': 'int', 'default': 2},
         'timeout_interval': {'type': 'int', 'default': 100},
+        'max_concurrent_requests': {'type': 'int', 'default': 5},
         'config': {'required': True, 'type': 'list', 'elements': 'dict'},
         'validate_response_schema': {'type': 'bool', 'default': True},
         'state': {'default': 'replaced', 'choices': ['replaced', 'deleted']}
@@ -1426,6 +1814,14 @@ def main():
     ccc_device_replacement.validate_input().check_return_status()
     config_verify = ccc_device_replacement.params.get("config_verify")
 
+    if state == "replaced" and len(ccc_device_replacement.validated_config) > 1:
+        ccc_device_replacement.get_diff_replaced_bulk(ccc_device_replacement.validated_config).check_return_status()
+        if config_verify:
+            ccc_device_replacement.verify_diff_replaced_bulk(ccc_device_replacement.validated_config).check_return_status()
+
+        ccc_device_replacement.update_rma_profile_messages().check_return_status()
+        module.exit_json(**ccc_device_replacement.result)
+
     for config in ccc_device_replacement.validated_config:
         ccc_device_replacement.reset_values()
         ccc_device_replacement.get_want(config).check_return_status()
@@ -32,6 +32,23 @@ options:
     type: str
     choices: [merged, deleted]
     default: merged
+  sda_fabric_devices_batch_size:
+    description:
+      - Maximum number of fabric devices sent in a single add or update request.
+      - Larger requests are split into batches of this size.
+      - Must be at least 1.
+    type: int
+    default: 40
+    version_added: 6.32.0
+  max_concurrent_batches:
+    description:
+      - Maximum number of fabric device batches submitted and tracked at the same time.
+      - The Control Plane Nodes are always added before the other devices.
+      - Set to 1 to submit the batches one after the other.
+      - Must be at least 1.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description:
       - A list of SDA fabric device configurations associated with fabric sites.
@@ -330,6 +347,7 @@ notes:
     sda.Sda.delete_fabric_device_layer3_handoff_with_ip_transit_by_id,
     task.Task.get_tasks_by_id,
     task.Task.get_task_details_by_id,
+    task.Task.get_task_by_id,
 
   - Paths used are
     get /dna/intent/api/v1/sites
@@ -358,7 +376,9 @@ notes:
     delete /dna/intent/api/v1/sda/fabricDevices/layer3Handoffs/ipTransits/${id}
     get /dna/intent/api/v1/tasks/${id}
     get /dna/intent/api/v1/tasks/${id}/detail
-
+    get /dna/intent/api/v1/task/${taskId}
+  - Added 'sda_fabric_devices_batch_size' and 'max_concurrent_batches' options in v6.32.0
+  - The fabric devices and the handoffs of a fabric site are fetched once for all the devices in 'device_config'.
 """
 
 EXAMPLES = r"""
@@ -912,6 +932,9 @@ class FabricDevices(DnacBase):
         self.fabric_l3_handoff_sda_obj_params = self.get_obj_params("fabricSdaL3Handoff")
         self.fabric_l3_handoff_ip_obj_params = self.get_obj_params("fabricIpL3Handoff")
         self.max_timeout = self.params.get('dnac_api_task_timeout')
+        self.fabric_device_snapshot = {}
+        self.network_device_details = {}
+        self.transit_ids = {}
 
     def validate_input(self):
         """
@@ -930,6 +953,13 @@ class FabricDevices(DnacBase):
             'self.msg' will describe the validation issues.
         """
 
+        for batch_param in ("sda_fabric_devices_batch_size", "max_concurrent_batches"):
+            batch_value = self.params.get(batch_param)
+            if batch_value is not None and batch_value < 1:
+                self.msg = "'{param}' must be at least 1 but passed {value}".format(param=batch_param, value=batch_value)
+                self.status = "failed"
+                return self
+
         if not self.config:
             self.msg = "config not available in playbook for validation."
             self.status = "success"
@@ -1059,12 +1089,19 @@ class FabricDevices(DnacBase):
             transit_id (str or None): The ID of the transit network. None, if transit doesnot exist.
         Description:
             Call the API 'get_transit_networks' by setting the 'name' field with the
-            given transit name.
+            given transit name, unless the ID of the transit is already known.
             If the response is not empty, fetch the Id and return. Else, return None.
         """
 
         self.log("Starting to get transit ID for transit name: '{name}'".format(name=transit_name), "DEBUG")
-        transit_id = None
+        transit_id = self.transit_ids.get(transit_name)
+        if transit_id:
+            self.log(
+                "Returning the cached transit ID '{id}' for the transit name '{name}'."
+                .format(id=transit_id, name=transit_name), "DEBUG"
+            )
+            return transit_id
+
         try:
             transit_details = self.dnac._exec(
                 family="sda",
@@ -1082,6 +1119,7 @@ class FabricDevices(DnacBase):
                 return transit_id
 
             transit_id = transit_details[0].get("id")
+            self.transit_ids[transit_name] = transit_id
             self.log(
                 "Transit ID found: '{id}' for transit name: '{name}'."
                 .format(id=transit_id, name=transit_name), "DEBUG"
@@ -1109,13 +1147,19 @@ class FabricDevices(DnacBase):
         Returns:
             device_details (dict or None): The details of the network device. None, if the device doesnot exist.
         Description:
-            Call the API 'get_device_list' by setting the 'management_ip_address' field with the
-            given IP address.
+            Return the details prefetched by 'prefetch_network_devices', if any. Else, call the API
+            'get_device_list' by setting the 'management_ip_address' field with the given IP address.
             If the response is not empty, return the device details. Else, return None.
         """
 
         self.log("Starting to get device details for device IP: '{ip}'.".format(ip=device_ip), "DEBUG")
-        device_details = None
+        device_details = self.network_device_details.get(device_ip)
+        if device_details:
+            self.log(
+                "Returning the prefetched device details: '{details}'.".format(details=device_details), "DEBUG"
+            )
+            return device_details
+
         try:
             device_details = self.dnac._exec(
                 family="devices",
@@ -1150,6 +1194,31 @@ class FabricDevices(DnacBase):
         )
         return device_details
 
+    def prefetch_network_devices(self, device_ips):
+        """
+        Get the network device details of several IP addresses at once.
+
+        Parameters:
+            device_ips (list): The IP addresses of the network devices.
+        Returns:
+            None
+        Description:
+            Call the API 'get_device_list' with batches of IP addresses and store the details of every
+            device found by its management IP address, for the later calls of 'get_device_details_from_ip'.
+        """
+
+        device_ips = [device_ip for device_ip in device_ips if device_ip and device_ip not in self.network_device_details]
+        if not device_ips:
+            return
+
+        for device in self.get_device_list_in_bulk("management_ip_address", device_ips):
+            self.network_device_details.setdefault(device.get("managementIpAddress"), []).append(device)
+
+        self.log(
+            "Prefetched the details of {count} network device(s) out of {total} IP address(es)."
+            .format(count=len(self.network_device_details), total=len(device_ips)), "DEBUG"
+        )
+
     def check_valid_virtual_network_name(self, virtual_network_name):
         """
         Get the fabric ID from the given site hierarchy name.
@@ -1552,77 +1621,26 @@ class FabricDevices(DnacBase):
         Returns:
             l2_handoff_id (dict or None) - L2 Handoff ID from the Cisco Catalyst Center.
         Description:
-            Call the API 'get_fabric_devices_layer2_handoffs'. If the response is empty return None.
-            Else, return the id of the l2 handoff.
+            Look up the L2 Handoffs of the device in the fabric snapshot of 'get_fabric_devices_layer2_handoffs'.
+            If there is no matching L2 Handoff return None. Else, return the id of the l2 handoff.
         """
 
         l2_handoff_id = None
-        offset = 1
-        start_time = time.time()
+        all_l2_handoff_details = self.get_fabric_device_records("get_fabric_devices_layer2_handoffs", fabric_id, device_id)
+        if not all_l2_handoff_details:
+            self.log(
+                "There is no L2 Handoffs are available associated with the device with ID '{id}' in the Cisco Catalyst Center."
+                .format(id=device_id), "INFO"
+            )
 
-        # Call the SDK with incremental offset till we find the L2 Handoff with given
-        # interface name and internal vlan id
-        while True:
-            try:
-                all_l2_handoff_details = self.dnac._exec(
-                    family="sda",
-                    function="get_fabric_devices_layer2_handoffs",
-                    params={
-                        "fabric_id": fabric_id,
-                        "network_device_id": device_id,
-                        "offset": offset
-                    }
-                )
+        for item in all_l2_handoff_details:
+            if item.get("internalVlanId") == internal_vlan_id and item.get("interfaceName") == interface_name:
                 self.log(
-                    "Response received from 'get_fabric_devices_layer2_handoffs': {response}"
-                    .format(response=all_l2_handoff_details), "DEBUG"
+                    "The L2 handoff details with the internal VLAN Id: {details}"
+                    .format(details=internal_vlan_id), "DEBUG"
                 )
-
-                if not isinstance(all_l2_handoff_details, dict):
-                    self.msg = "Failed to retrieve the L2 Handoff details - Response is not a dictionary"
-                    self.log(str(self.msg), "CRITICAL")
-                    self.status = "failed"
-                    return self.check_return_status()
-
-                all_l2_handoff_details = all_l2_handoff_details.get("response")
-                if not all_l2_handoff_details:
-                    self.log(
-                        "There is no L2 Handoffs are available associated with the device with ID '{id}' in the Cisco Catalyst Center."
-                        .format(id=device_id), "INFO"
-                    )
-                    break
-
-                l2_handoff_details = None
-                for item in all_l2_handoff_details:
-                    if item.get("internalVlanId") == internal_vlan_id and item.get("interfaceName") == interface_name:
-                        l2_handoff_details = item
-                        break
-
-                if l2_handoff_details:
-                    self.log(
-                        "The L2 handoff details with the internal VLAN Id: {details}"
-                        .format(details=internal_vlan_id), "DEBUG"
-                    )
-                    l2_handoff_id = l2_handoff_details.get("id")
-                    break
-
-                offset += 500
-                end_time = time.time()
-                if (end_time - start_time) >= self.max_timeout:
-                    self.msg = (
-                        "Max timeout of {max_time} sec has reached for the API 'l2_handoff_exists' status."
-                        .format(max_time=self.max_timeout)
-                    )
-                    self.status = "failed"
-                    return self.check_return_status()
-            except Exception as msg:
-                self.msg = (
-                    "Exception occurred while running the API 'get_fabric_devices_layer2_handoffs': {msg}"
-                    .format(msg=msg)
-                )
-                self.log(self.msg, "CRITICAL")
-                self.status = "failed"
-                return self.check_return_status()
+                l2_handoff_id = item.get("id")
+                break
 
         if l2_handoff_id:
             self.log(
@@ -1648,8 +1666,8 @@ class FabricDevices(DnacBase):
             sda_l3_handoff_details (dict or None): The details of the L3 Handoff with SDA transit with
             the given transit name. None if the there is no L3 Handoff with SDA transit.
         Description:
-            Call the API 'get_fabric_devices_layer3_handoffs_with_sda_transit'. If the response is
-            empty return None. Else, return the details of the l3 handoff with SDA transit.
+            Look up the L3 Handoffs of the device in the fabric snapshot of 'get_fabric_devices_layer3_handoffs_with_sda_transit'.
+            If there is none return None. Else, return the details of the l3 handoff with SDA transit.
         """
 
         sda_l3_handoff_details = None
@@ -1674,61 +1692,16 @@ class FabricDevices(DnacBase):
             self.status = "failed"
             return self.check_return_status()
 
-        start_time = time.time()
-        offset = 1
-
-        # Call the SDK with incremental offset till to find the SDA L3 Handoff
-        while True:
-            try:
-                all_sda_l3_handoff_details = self.dnac._exec(
-                    family="sda",
-                    function="get_fabric_devices_layer3_handoffs_with_sda_transit",
-                    params={
-                        "fabric_id": fabric_id,
-                        "network_device_id": device_id,
-                        "offset": offset
-                    }
-                )
-
-                offset += 500
-                if not isinstance(all_sda_l3_handoff_details, dict):
-                    self.msg = "Failed to retrieve the L2 Handoff details - Response is not a dictionary"
-                    self.log(self.msg, "CRITICAL")
-                    self.status = "failed"
-                    return self.check_return_status()
-
-                all_sda_l3_handoff_details = all_sda_l3_handoff_details.get("response")
-                if not all_sda_l3_handoff_details:
-                    self.log(
-                        "There is no L3 Handoffs with SDA transit associated with the device with ID '{id}' in the Cisco Catalyst Center."
-                        .format(id=device_id), "INFO"
-                    )
-                    break
-
-                sda_l3_handoff_details = get_dict_result(all_sda_l3_handoff_details, "transitNetworkId", transit_id)
-                if sda_l3_handoff_details:
-                    self.log(
-                        "The L3 Handoff with SDA transit details with the transit name '{name}': '{details}"
-                        .format(name=transit_name, details=sda_l3_handoff_details), "DEBUG"
-                    )
-                    break
-
-                end_time = time.time()
-                if (end_time - start_time) >= self.max_timeout:
-                    self.msg = (
-                        "Max timeout of {max_time} sec has reached for the API 'sda_l3_handoff_exists' status."
-                        .format(max_time=self.max_timeout)
-                    )
-                    self.status = "failed"
-                    return self.check_return_status()
-            except Exception as msg:
-                self.msg = (
-                    "Received API response from 'get_fabric_devices_layer3_handoffs_with_sda_transit' "
-                    "with the transit name '{name}': {msg}".format(name=transit_name, msg=msg)
-                )
-                self.log(self.msg, "CRITICAL")
-                self.status = "failed"
-                return self.check_return_status()
+        all_sda_l3_handoff_details = self.get_fabric_device_records(
+            "get_fabric_devices_layer3_handoffs_with_sda_transit", fabric_id, device_id
+        )
+        if not all_sda_l3_handoff_details:
+            self.log(
+                "There is no L3 Handoffs with SDA transit associated with the device with ID '{id}' in the Cisco Catalyst Center."
+                .format(id=device_id), "INFO"
+            )
+        else:
+            sda_l3_handoff_details = get_dict_result(all_sda_l3_handoff_details, "transitNetworkId", transit_id)
 
         if sda_l3_handoff_details:
             self.log(
@@ -1758,8 +1731,8 @@ class FabricDevices(DnacBase):
             the given transit name, virtual network name or VLAN ID.
             None if the there is no L3 Handoff with Ip transit.
         Description:
-            Call the API 'get_fabric_devices_layer3_handoffs_with_ip_transit'. If the response is
-            empty return None. Else, return the details of the l3 handoff with SDA transit which matches
+            Look up the L3 Handoffs of the device in the fabric snapshot of 'get_fabric_devices_layer3_handoffs_with_ip_transit'.
+            If there is none return None. Else, return the details of the l3 handoff with IP transit which matches
             the given transit name and virtual network name or vlan id from the fabric device.
         """
 
@@ -1792,94 +1765,94 @@ class FabricDevices(DnacBase):
             "Transit ID for '{transit_name}' successfully retrieved: {transit_id}"
             .format(transit_name=transit_name, transit_id=transit_id), "DEBUG"
         )
-        start_time = time.time()
-        offset = 1
-
-        # Call the SDK with incremental offset till we find the IP L3 Handoff with given virtual network name
         self.log(
             "Fetching IP L3 Handoff details for fabric ID '{fabric_id}' and device ID '{device_id}'."
             .format(fabric_id=fabric_id, device_id=device_id), "DEBUG"
         )
-        while True:
-            try:
-                all_ip_l3_handoff_details = self.dnac._exec(
-                    family="sda",
-                    function="get_fabric_devices_layer3_handoffs_with_ip_transit",
-                    params={
-                        "fabric_id": fabric_id,
-                        "network_device_id": device_id,
-                        "offset": offset
-                    }
-                )
-                self.log(
-                    "IP L3 Handoff details fetched successfully for offset {offset}."
-                    .format(offset=offset), "DEBUG"
-                )
-                self.log(
-                    "Received response from 'get_fabric_devices_layer3_handoffs_with_ip_transit': {response}"
-                    .format(response=all_ip_l3_handoff_details), "DEBUG"
-                )
-            except Exception as msg:
-                self.msg = (
-                    "Exception occurred while getting the details of Layer3 Handoffs with IP transit "
-                    "with the transit name '{name}': {msg}".format(name=transit_name, msg=msg)
-                )
-                self.log(self.msg, "CRITICAL")
-                self.status = "failed"
-                return self.check_return_status()
-
-            offset += 500
-            if not isinstance(all_ip_l3_handoff_details, dict):
-                self.msg = "Failed to retrieve the L2 Handoff details - Response is not a dictionary"
-                self.log(self.msg, "CRITICAL")
-                self.status = "failed"
-                return self.check_return_status()
+        all_ip_l3_handoff_details = self.get_fabric_device_records(
+            "get_fabric_devices_layer3_handoffs_with_ip_transit", fabric_id, device_id
+        )
+        if not all_ip_l3_handoff_details:
+            self.log(
+                "There is no L3 Handoffs with IP transit associated with the device with ID '{id}' in the Cisco Catalyst Center."
+                .format(id=device_id), "INFO"
+            )
+            return ip_l3_handoff_details
 
-            all_ip_l3_handoff_details = all_ip_l3_handoff_details.get("response")
-            if not all_ip_l3_handoff_details:
+        self.log(
+            "Scanning IP L3 Handoff details for matching transit ID '{transit_id}' and virtual network '{virtual_network}' or VLAN ID '{vlan_id}'."
+            .format(transit_id=transit_id, virtual_network=virtual_network_name, vlan_id=vlan_id), "DEBUG"
+        )
+        virtual_network = virtual_network_name
+        check_string = "virtualNetworkName"
+        if not virtual_network:
+            virtual_network = vlan_id
+            check_string = "vlanId"
+
+        for item in all_ip_l3_handoff_details:
+            if item.get("transitNetworkId") == transit_id and item.get(check_string) == virtual_network:
+                ip_l3_handoff_details = item
                 self.log(
-                    "There is no L3 Handoffs with IP transit associated with the device with ID '{id}' in the Cisco Catalyst Center."
-                    .format(id=device_id), "INFO"
+                    "Matching IP L3 Handoff found for transit '{transit_name}' with details: {details}"
+                    .format(transit_name=transit_name, details=ip_l3_handoff_details), "INFO"
                 )
                 break
 
+        if not ip_l3_handoff_details:
             self.log(
-                "Scanning IP L3 Handoff details for matching transit ID '{transit_id}' and virtual network '{virtual_network}' or VLAN ID '{vlan_id}'."
-                .format(transit_id=transit_id, virtual_network=virtual_network_name, vlan_id=vlan_id), "DEBUG"
+                "No matching IP L3 Handoff found for transit '{transit_name}'."
+                .format(transit_name=transit_name), "INFO"
             )
-            virtual_network = virtual_network_name
-            check_string = "virtualNetworkName"
-            if not virtual_network:
-                virtual_network = vlan_id
-                check_string = "vlanId"
-
-            for item in all_ip_l3_handoff_details:
-                if item.get("transitNetworkId") == transit_id and item.get(check_string) == virtual_network:
-                    ip_l3_handoff_details = item
-                    self.log(
-                        "Matching IP L3 Handoff found for transit '{transit_name}' with details: {details}"
-                        .format(transit_name=transit_name, details=ip_l3_handoff_details), "INFO"
-                    )
-                    break
 
-            if not ip_l3_handoff_details:
-                self.log(
-                    "No matching IP L3 Handoff found for transit '{transit_name}'."
-                    .format(transit_name=transit_name), "INFO"
-                )
-            else:
-                break
+        return ip_l3_handoff_details
 
-            end_time = time.time()
-            if (end_time - start_time) >= self.max_timeout:
-                self.msg = (
-                    "Max timeout of {max_time} sec has reached for the API 'ip_l3_handoff_exists' status."
-                    .format(max_time=self.max_timeout)
-                )
-                self.status = "failed"
-                return self.check_return_status()
+    def get_fabric_device_records(self, api_function, fabric_id, device_id):
+        """
+        Get the records of a network device from the snapshot of a fabric site.
 
-        return ip_l3_handoff_details
+        Parameters:
+            api_function (str): The SDA API listing the records, such as 'get_fabric_devices' or
+                                'get_fabric_devices_layer2_handoffs'.
+            fabric_id (str): The Id of the fabric site or zone.
+            device_id (str): The Id of the network device.
+        Returns:
+            list: The records of the network device, an empty list if there is none.
+        Description:
+            The first lookup in a fabric site calls the given API once for the whole fabric site, with pagination,
+            and indexes the records by network device ID. The later lookups in the same fabric site are
+            answered from the index until the snapshot is cleared by 'clear_fabric_device_snapshot'.
+        """
+
+        snapshot_key = (api_function, fabric_id)
+        if snapshot_key not in self.fabric_device_snapshot:
+            self.log(
+                "Loading the '{api}' records of the fabric with ID '{fabric_id}'."
+                .format(api=api_function, fabric_id=fabric_id), "DEBUG"
+            )
+            records_by_device = {}
+            for record in self.get_paginated_response("sda", api_function, {"fabric_id": fabric_id}):
+                records_by_device.setdefault(record.get("networkDeviceId"), []).append(record)
+
+            self.fabric_device_snapshot[snapshot_key] = records_by_device
+            self.log(
+                "Loaded the '{api}' records of {count} device(s) in the fabric with ID '{fabric_id}'."
+                .format(api=api_function, count=len(records_by_device), fabric_id=fabric_id), "DEBUG"
+            )
+
+        return self.fabric_device_snapshot[snapshot_key].get(device_id, [])
+
+    def clear_fabric_device_snapshot(self):
+        """
+        Clear the snapshot of the fabric devices and handoffs, so the next lookups fetch them again.
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+
+        self.log("Clearing the snapshot of the fabric devices and handoffs.", "DEBUG")
+        self.fabric_device_snapshot.clear()
 
     def fabric_device_exists(self, fabric_id, device_id, device_ip):
         """
@@ -1898,9 +1871,8 @@ class FabricDevices(DnacBase):
                 - 'device_details' (dict or None): Details of the fabric device if it exists else None.
         Description:
             Sets the existance, details and the id of the fabric device as None.
-            Calls the API 'get_fabric_devices' by settings the fields 'fabric_id'
-            and 'network_device_id'.
-            If the response is empty return the device_info, Else, format the given
+            Looks up the device in the fabric snapshot of 'get_fabric_devices'.
+            If there is no record of the device return the device_info, Else, format the given
             details and return the device_info.
         """
 
@@ -1913,27 +1885,9 @@ class FabricDevices(DnacBase):
             "device_details": None,
             "id": None,
         }
-        fabric_device_details = self.dnac._exec(
-            family="sda",
-            function="get_fabric_devices",
-            params={
-                "fabric_id": fabric_id,
-                "network_device_id": device_id,
-            }
-        )
-        self.log(
-            "Successfully retrieved details for fabric device with ID '{device_id}'."
-            .format(device_id=device_id), "DEBUG"
-        )
-
-        if not isinstance(fabric_device_details, dict):
-            self.msg = "Error in getting fabric devices - Response is not a dictionary"
-            self.log(self.msg, "ERROR")
-            self.status = "failed"
-            return self.check_return_status()
+        fabric_device_details = self.get_fabric_device_records("get_fabric_devices", fabric_id, device_id)
 
-        # If the SDK return an empty response, then the fabric device is not available
-        fabric_device_details = fabric_device_details.get("response")
+        # If the fabric snapshot has no record of the device, then the fabric device is not available
         if not fabric_device_details:
             self.log("Fabric device with IP {ip} does not exist.".format(ip=device_ip), "DEBUG")
             return device_info
@@ -2195,6 +2149,8 @@ class FabricDevices(DnacBase):
             self.status = "failed"
             return self
 
+        # Look up all the network devices of the fabric at once before checking them one by one
+        self.prefetch_network_devices([item.get("device_ip") for item in device_config])
         for item in device_config:
             fabric_devices_info = {
                 "exists": False,
@@ -3592,57 +3548,125 @@ class FabricDevices(DnacBase):
         self.status = "success"
         return self
 
-    def bulk_add_fabric_devices(self, create_fabric_devices, fabric_name):
+    def submit_fabric_devices_batch(self, batch):
         """
-        Add the SDA fabric devices with the given payload under the fabric.
+        Submit one batch of fabric devices to be added or updated.
 
         Parameters:
-            create_fabric_devices (list): The payload for adding the fabric devices in bulk.
-            fabric_name (str): The name of the fabric site or zone.
+            batch (tuple): The API function name ('add_fabric_devices' or 'update_fabric_devices')
+                           and the payload of the batch.
         Returns:
-            self (object): The current object with adding SDA fabric device information.
+            tuple: The task ID of the batch and the error message, one of them being None.
         Description:
-            Find the length of the payload, if it is greater than 40, seperate it out into batches of 40.
-            Call the add fabric devices API with the bulk payload. Check the task status from the task ID.
+            Called from the worker threads, so the outcome is returned instead of being stored in the object.
         """
 
+        api_function, payload = batch
         try:
-            self.log("Starting to add fabric devices in batches.", "INFO")
-            num_devices = len(create_fabric_devices)
+            response = self.dnac._exec(
+                family="sda",
+                function=api_function,
+                op_modifies=True,
+                params={"payload": payload}
+            )
+            self.log(
+                "Received API response from '{api}' for {count} device(s): {response}"
+                .format(api=api_function, count=len(payload), response=response), "DEBUG"
+            )
+            task_info = response.get("response") if isinstance(response, dict) else None
+            if not task_info or not task_info.get("taskId"):
+                return None, "Unable to retrive the task_id for the task '{api}': {response}".format(
+                    api=api_function, response=response)
 
-            for item in range(0, num_devices, 40):
-                payload = {"payload": create_fabric_devices[item:item + 40]}
-                task_name = "add_fabric_devices"
-                task_id = self.get_taskid_post_api_call("sda", task_name, payload)
-                if not task_id:
-                    self.msg = (
-                        "Unable to retrive the task_id for the task '{task_name}'."
-                        .format(task_name=task_name)
-                    )
-                    self.set_operation_result("failed", False, self.msg, "ERROR")
-                    return self
+            return task_info.get("taskId"), None
 
-                success_msg = (
-                    "Successfully added the fabric device with details '{device_details}'."
-                    .format(device_details=create_fabric_devices[item:item + 40])
+        except Exception as msg:
+            return None, str(msg)
+
+    def process_fabric_devices_in_batches(self, api_function, fabric_devices):
+        """
+        Add or update the SDA fabric devices with batches submitted concurrently.
+
+        Parameters:
+            api_function (str): The API function name, 'add_fabric_devices' or 'update_fabric_devices'.
+            fabric_devices (list): The payload of all the fabric devices.
+        Returns:
+            list: The error messages of the batches which failed, an empty list if all succeeded.
+        Description:
+            Split the payload in batches of 'sda_fabric_devices_batch_size' devices. Submit up to
+            'max_concurrent_batches' batches at the same time and check the status of all the tasks together.
+        """
+
+        batch_size = self.params.get("sda_fabric_devices_batch_size")
+        batches = [
+            (api_function, fabric_devices[item:item + batch_size])
+            for item in range(0, len(fabric_devices), batch_size)
+        ]
+        max_workers = self.params.get("max_concurrent_batches")
+        self.log(
+            "Submitting {count} device(s) to '{api}' in {batches} batch(es) with up to {workers} batch(es) in flight."
+            .format(count=len(fabric_devices), api=api_function, batches=len(batches), workers=max_workers), "INFO"
+        )
+        submissions = self.execute_concurrently(self.submit_fabric_devices_batch, batches, max_workers)
+        task_results = self.wait_for_tasks([task_id for task_id, error in submissions if task_id], max_workers=max_workers)
+
+        errors = []
+        for (api_function, payload), (task_id, error) in zip(batches, submissions):
+            task_details = task_results.get(task_id) or {}
+            if not error and task_details.get("isError"):
+                error = task_details.get("failureReason") or task_details.get("progress")
+
+            if error:
+                errors.append(
+                    "Failed to process the fabric devices with details '{details}' using '{api}': {error}"
+                    .format(details=payload, api=api_function, error=error)
+                )
+                self.log(errors[-1], "ERROR")
+            else:
+                self.log(
+                    "Successfully processed the fabric devices with details '{details}' using '{api}'."
+                    .format(details=payload, api=api_function), "INFO"
                 )
-                self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg).check_return_status()
 
-            self.msg = (
-                "Successfully created the fabric devices with the payload to the fabric site '{fabric_site}': {payload}"
-                .format(fabric_site=fabric_name, payload=create_fabric_devices)
-            )
-            self.log(self.msg, "INFO")
-            self.status = "success"
+        return errors
 
-        except Exception as msg:
-            self.msg = (
-                "Exception occurred while updating the fabric devices with the payload '{payload}': {msg}"
-                .format(payload=create_fabric_devices, msg=msg)
-            )
-            self.status = "failed"
-            return self
+    def bulk_add_fabric_devices(self, create_fabric_devices, fabric_name):
+        """
+        Add the SDA fabric devices with the given payload under the fabric.
+
+        Parameters:
+            create_fabric_devices (list): The payload for adding the fabric devices in bulk.
+            fabric_name (str): The name of the fabric site or zone.
+        Returns:
+            self (object): The current object with adding SDA fabric device information.
+        Description:
+            Add the Control Plane Nodes first, as the other devices need them in the fabric.
+            Then add the remaining devices in batches which are submitted concurrently.
+        """
+
+        self.log("Starting to add fabric devices in batches.", "INFO")
+        control_plane_devices = [
+            device for device in create_fabric_devices if "CONTROL_PLANE_NODE" in (device.get("deviceRoles") or [])
+        ]
+        other_devices = [
+            device for device in create_fabric_devices if "CONTROL_PLANE_NODE" not in (device.get("deviceRoles") or [])
+        ]
+        for devices in (control_plane_devices, other_devices):
+            if not devices:
+                continue
+
+            errors = self.process_fabric_devices_in_batches("add_fabric_devices", devices)
+            if errors:
+                self.msg = " ".join(errors)
+                self.set_operation_result("failed", False, self.msg, "ERROR")
+                return self
 
+        self.msg = (
+            "Successfully created the fabric devices with the payload to the fabric site '{fabric_site}': {payload}"
+            .format(fabric_site=fabric_name, payload=create_fabric_devices)
+        )
+        self.log(self.msg, "INFO")
+        self.status = "success"
         return self
 
     def bulk_update_fabric_devices(self, update_fabric_devices, fabric_name):
@@ -3655,48 +3679,22 @@ class FabricDevices(DnacBase):
         Returns:
             self (object): The current object with updated SDA fabric device information.
         Description:
-            Find the length of the payload, if it is greater than 40, seperate it out into batches of 40.
-            Call the update fabric devices API with the bulk payload. Check the task status from the task ID.
+            Update the devices in batches which are submitted concurrently.
         """
 
-        try:
-            self.log("Starting to update fabric devices in batches.", "INFO")
-            num_devices = len(update_fabric_devices)
-
-            for item in range(0, num_devices, 40):
-                payload = {"payload": update_fabric_devices[item:item + 40]}
-                task_name = "update_fabric_devices"
-                task_id = self.get_taskid_post_api_call("sda", task_name, payload)
-                if not task_id:
-                    self.msg = (
-                        "Unable to retrive the task_id for the task '{task_name}'."
-                        .format(task_name=task_name)
-                    )
-                    self.set_operation_result("failed", False, self.msg, "ERROR")
-                    return self
-
-                success_msg = (
-                    "Successfully updated the fabric device with details '{device_details}'."
-                    .format(device_details=update_fabric_devices[item:item + 40])
-                )
-                self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg).check_return_status()
-
-            self.msg = (
-                "Successfully updated the device with payload '{payload}' to the fabric site '{fabric_site}'."
-                .format(payload=update_fabric_devices, fabric_site=fabric_name), "INFO"
-            )
-            self.log(self.msg, "INFO")
-            self.status = "success"
-
-        except Exception as msg:
-            self.msg = (
-                "Exception occurred while updating the fabric devices for the payload '{payload}': {msg}"
-                .format(payload=update_fabric_devices, msg=msg)
-            )
-            self.log(self.msg, "ERROR")
-            self.status = "failed"
+        self.log("Starting to update fabric devices in batches.", "INFO")
+        errors = self.process_fabric_devices_in_batches("update_fabric_devices", update_fabric_devices)
+        if errors:
+            self.msg = " ".join(errors)
+            self.set_operation_result("failed", False, self.msg, "ERROR")
             return self
 
+        self.msg = (
+            "Successfully updated the device with payload '{payload}' to the fabric site '{fabric_site}'."
+            .format(payload=update_fabric_devices, fabric_site=fabric_name)
+        )
+        self.log(self.msg, "INFO")
+        self.status = "success"
         return self
 
     def update_l2_handoff(self, have_l2_handoff, want_l2_handoff,
@@ -4392,6 +4390,9 @@ class FabricDevices(DnacBase):
         fabric_devices = config.get("fabric_devices")
         if fabric_devices is not None:
             self.log("Updating fabric devices: {devices}".format(devices=fabric_devices), "DEBUG")
+
+            # The fabric devices and handoffs are fetched again for the verification
+            self.clear_fabric_device_snapshot()
             try:
                 self.update_fabric_devices(fabric_devices).check_return_status()
                 self.log("Successfully updated fabric devices.", "INFO")
@@ -4903,6 +4904,9 @@ class FabricDevices(DnacBase):
         fabric_devices = config.get("fabric_devices")
         if fabric_devices is not None:
             self.log("Fabric devices found in the configuration. Initiating deletion process.", "INFO")
+
+            # The fabric devices and handoffs are fetched again for the verification
+            self.clear_fabric_device_snapshot()
             self.delete_fabric_devices(fabric_devices)
         else:
             self.log("No fabric devices found in the configuration. No deletion actions performed.", "INFO")
@@ -5240,6 +5244,8 @@ def main():
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
+        "sda_fabric_devices_batch_size": {"type": 'int', "default": 40},
+        "max_concurrent_batches": {"type": 'int', "default": 5},
     }
 
     # Create an AnsibleModule object with argument specifications
@@ -36,6 +36,20 @@ options:
     type: str
     choices: [merged, deleted]
     default: merged
+  pending_fabric_events_batch_size:
+    description: Maximum number of pending fabric events applied with a single request when 'apply_pending_events'
+        is enabled. The pending events of all the fabric sites and zones in the playbook are applied together in batches
+        of this size. Must be at least 1.
+    type: int
+    default: 40
+    version_added: 6.32.0
+  max_concurrent_requests:
+    description: Maximum number of requests sent to Cisco Catalyst Center at the same time when the telemetry settings
+        and the pending fabric events of the sites are retrieved, and when the batches of pending fabric events are applied.
+        Set to 1 to send the requests one after the other.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description: A list containing detailed configurations for creating, updating, or deleting fabric sites or zones
         in a Software-Defined Access (SDA) environment. It also includes specifications for updating the authentication
@@ -169,6 +183,9 @@ notes:
   - Reconfiguration of fabric pending events is supported starting from version 2.3.7.9 onwards. Additionally, the authentication
     profile for the 'Low Impact' profile now allows more customization of its parameters
   - Parameter 'site_name' is updated to 'site_name_hierarchy'.
+  - The fabric sites and fabric zones are retrieved once and shared by all the sites in the playbook. The pending fabric
+    events of all the fabric sites and zones are collected first and then applied in concurrent batches.
+  - Added 'pending_fabric_events_batch_size' and 'max_concurrent_requests' options in v6.32.0.
   - SDK Method used are
     ccc_fabric_sites.FabricSitesZones.get_site
     ccc_fabric_sites.FabricSitesZones.get_fabric_sites
@@ -387,6 +404,7 @@ dnac_response:
     }
 """
 
+import copy
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
@@ -404,6 +422,8 @@ class FabricSitesZones(DnacBase):
         self.create_zone, self.update_zone, self.no_update_zone = [], [], []
         self.update_auth_profile, self.no_update_profile, self.pending_fabric_event = [], [], []
         self.delete_site, self.delete_zone, self.absent_site, self.absent_zone = [], [], [], []
+        self.fabric_snapshot = {}
+        self.telemetry_settings = {}
 
     def validate_input(self):
         """
@@ -474,12 +494,60 @@ class FabricSitesZones(DnacBase):
             self.set_operation_result("failed", False, self.msg, "ERROR")
             return self
 
+        batch_size = self.params.get("pending_fabric_events_batch_size")
+        if batch_size is not None and batch_size < 1:
+            self.msg = "'pending_fabric_events_batch_size' must be at least 1 but passed {0}.".format(batch_size)
+            self.set_operation_result("failed", False, self.msg, "ERROR")
+            return self
+
         self.validated_config = valid_temp
         self.msg = "Successfully validated playbook configuration parameters using 'validate_input': {0}".format(str(valid_temp))
         self.log(self.msg, "INFO")
 
         return self
 
+    def get_fabric_snapshot(self, collection):
+        """
+        Retrieves all the fabric sites or fabric zones from the Cisco Catalyst Center indexed by their site ID.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            collection (str): The SDA collection to return, either 'fabric_sites' or 'fabric_zones'.
+        Returns:
+            dict: The fabric site or fabric zone details indexed by the site ID.
+        Description:
+            The collection is paged once with the `get_fabric_sites` or `get_fabric_zones` API and kept until
+            one of its records is created, updated or deleted, so the lookups of every site in the playbook are
+            answered from memory instead of one filtered request per site.
+        """
+
+        if collection in self.fabric_snapshot:
+            return self.fabric_snapshot[collection]
+
+        self.log("Loading the '{0}' snapshot from Cisco Catalyst Center.".format(collection), "DEBUG")
+        try:
+            records = self.get_paginated_response("sda", "get_{0}".format(collection))
+        except Exception as e:
+            self.msg = "Error while retrieving the '{0}' details from Cisco Catalyst Center: {1}".format(collection, str(e))
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+        snapshot = dict((record.get("siteId"), record) for record in records)
+        self.log("Loaded {0} record(s) in the '{1}' snapshot.".format(len(snapshot), collection), "INFO")
+        self.fabric_snapshot[collection] = snapshot
+
+        return snapshot
+
+    def invalidate_fabric_snapshot(self, collection):
+        """
+        Discards the snapshot of the fabric sites or fabric zones after one of them has been changed.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            collection (str): The SDA collection whose snapshot is no longer current, either 'fabric_sites' or 'fabric_zones'.
+        Returns:
+            None
+        """
+
+        self.fabric_snapshot.pop(collection, None)
+
     def get_fabric_site_detail(self, site_name, site_id):
         """
         Retrieves the detailed information of a fabric site from the Cisco Catalyst Center.
@@ -489,35 +557,21 @@ class FabricSitesZones(DnacBase):
             site_id (str): The unique identifier of the site in the Cisco Catalyst Center.
         Returns:
             dict or None: A dictionary containing the details of the fabric site if found.
-                        Returns None if the site is not a fabric site or if an error occurs.
+                        Returns None if the site is not a fabric site.
         Description:
-            This function fetches the fabric site details from Cisco Catalyst Center using the provided site ID.
-            It logs the API response and returns the site details if the site is a fabric site. If the site is not
-            found or is not a fabric site, it returns None. In case of an error, it logs the issue, sets the status
-            to "failed", and handles the failure.
+            This function looks up the fabric site details with the provided site ID in the snapshot of the
+            fabric sites returned by `get_fabric_snapshot`. If the site is not found or is not a fabric site,
+            it returns None.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="sda",
-                function='get_fabric_sites',
-                op_modifies=True,
-                params={"site_id": site_id},
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_fabric_sites' for the site '{0}': {1}".format(site_name, str(response)), "DEBUG")
+        site_detail = self.get_fabric_snapshot("fabric_sites").get(site_id)
+        self.log("Fabric site details for the site '{0}': {1}".format(site_name, str(site_detail)), "DEBUG")
 
-            if not response:
-                self.log("Given site '{0}' is not a fabric site in Cisco Catalyst Center.".format(site_name), "INFO")
-                return None
+        if not site_detail:
+            self.log("Given site '{0}' is not a fabric site in Cisco Catalyst Center.".format(site_name), "INFO")
+            return None
 
-            return response[0]
-        except Exception as e:
-            self.msg = """Error while getting the details of Site with given name '{0}' present in
-                    Cisco Catalyst Center: {1}""".format(site_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
-
-        return None
+        return site_detail
 
     def get_fabric_zone_detail(self, site_name, site_id):
         """
@@ -528,36 +582,21 @@ class FabricSitesZones(DnacBase):
             site_id (str): The unique identifier of the site in the Cisco Catalyst Center.
         Returns:
             dict or None: A dictionary containing the details of the fabric zone if found,
-                        or None if the site is not a fabric zone or an error occurs.
+                        or None if the site is not a fabric zone.
         Description:
-            This function fetches the fabric zone details from Cisco Catalyst Center using the provided site ID.
-            It logs the API response and returns the details if the site is a fabric zone. If the site is not
-            recognized as a fabric zone, it returns None. In case of an error, it logs the issue, sets the status
-            to "failed", and handles the failure appropriately.
+            This function looks up the fabric zone details with the provided site ID in the snapshot of the
+            fabric zones returned by `get_fabric_snapshot`. If the site is not recognized as a fabric zone,
+            it returns None.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="sda",
-                function='get_fabric_zones',
-                op_modifies=True,
-                params={"site_id": site_id},
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_fabric_zones' for the site '{0}': {1}".format(site_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("Given site '{0}' is not a fabric zone in Cisco Catalyst Center.".format(site_name), "INFO")
-                return None
-
-            return response[0]
+        zone_detail = self.get_fabric_snapshot("fabric_zones").get(site_id)
+        self.log("Fabric zone details for the site '{0}': {1}".format(site_name, str(zone_detail)), "DEBUG")
 
-        except Exception as e:
-            self.msg = """Error while getting the details of fabric zone '{0}' present in
-                    Cisco Catalyst Center: {1}""".format(site_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        if not zone_detail:
+            self.log("Given site '{0}' is not a fabric zone in Cisco Catalyst Center.".format(site_name), "INFO")
+            return None
 
-        return None
+        return zone_detail
 
     def get_have(self, config):
         """
@@ -727,6 +766,7 @@ class FabricSitesZones(DnacBase):
 
             success_msg = "Fabric site '{0}' created successfully in the Cisco Catalyst Center".format(site_name)
             self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            self.invalidate_fabric_snapshot("fabric_sites")
             self.create_site.append(site_name)
 
         except Exception as e:
@@ -814,6 +854,7 @@ class FabricSitesZones(DnacBase):
 
             success_msg = "Fabric site '{0}' updated successfully in the Cisco Catalyst Center".format(site_name)
             self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            self.invalidate_fabric_snapshot("fabric_sites")
             self.update_site.append(site_name)
 
         except Exception as e:
@@ -867,6 +908,7 @@ class FabricSitesZones(DnacBase):
 
             success_msg = "Fabric zone '{0}' created successfully in the Cisco Catalyst Center.".format(site_name)
             self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            self.invalidate_fabric_snapshot("fabric_zones")
             self.create_zone.append(site_name)
 
         except Exception as e:
@@ -919,6 +961,7 @@ class FabricSitesZones(DnacBase):
             success_msg = "Fabric zone '{0}' updated successfully in the Cisco Catalyst Center".format(site_name)
             self.log(success_msg, "DEBUG")
             self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            self.invalidate_fabric_snapshot("fabric_zones")
             self.update_zone.append(site_name)
 
         except Exception as e:
@@ -1329,6 +1372,7 @@ class FabricSitesZones(DnacBase):
 
             success_msg = "{0} '{1}' deleted successfully from the Cisco Catalyst Center".format(type_name.title(), site_name)
             self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            self.invalidate_fabric_snapshot(fabric_type + "s")
 
             if fabric_type == "fabric_site":
                 self.delete_site.append(site_name)
@@ -1423,25 +1467,23 @@ class FabricSitesZones(DnacBase):
 
         return self
 
-    def is_wired_data_collection_enable(self, site_name, site_id):
+    def fetch_telemetry_settings(self, site):
         """
-        Checks if wired data collection is enabled for a specified site.
+        Retrieves the telemetry settings of a site from the Cisco Catalyst Center.
 
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            site_name (str): The name of the site to check.
-            site_id (str): The unique identifier of the site.
+            site (tuple): The name and the unique identifier of the site.
         Returns:
-            bool: True if wired data collection is enabled for the site, False otherwise.
+            tuple: The telemetry settings of the site (an empty dictionary if none are found) and the error
+                message of the request, one of them being None.
         Description:
-            This function logs the status of wired data collection for a given site and checks if it is enabled.
-            It retrieves telemetry settings for the specified site using the `retrieve_telemetry_settings_for_a_site`
-            API function. If telemetry settings or wired data collection details are missing or disabled,
-            function logs relevant messages and returns False. If wired data collection is enabled, it returns True.
+            This function calls the `retrieve_telemetry_settings_for_a_site` API function for the given site. It is run
+            from the worker threads of `prefetch_telemetry_settings`, so it returns the outcome instead of updating
+            the operation result.
         """
 
-        self.log("Checking whether wired data collection is enabled for the site: {0}".format(site_name), "INFO")
-
+        site_name, site_id = site
         try:
             telemetry_response = self.dnac._exec(
                 family="network_settings",
@@ -1449,29 +1491,91 @@ class FabricSitesZones(DnacBase):
                 op_modifies=False,
                 params={"id": site_id}
             )
-            telemetry_details = telemetry_response.get("response", {})
-            if not telemetry_details:
-                self.log("No telemetry settings found for site '{0}' (ID: {1})".format(site_name, site_id), "WARNING")
-                return False
-
-            self.log("Successfully retrieved telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, telemetry_details), "DEBUG")
-            wired_data_collection = telemetry_details.get("wiredDataCollection")
-
-            if not wired_data_collection:
-                self.log("Wired Data Collection is not enabled at this site '{0}'.".format(site_name), "DEBUG")
-                return False
-
-            is_enabled = wired_data_collection.get("enableWiredDataCollection")
-            if not is_enabled:
-                self.log("Wired Data Collection is not enabled at this site '{0}'.".format(site_name), "DEBUG")
-                return False
-            self.log("Wired Data Collection is enabled at this site '{0}'.".format(site_name), "DEBUG")
+            telemetry_details = telemetry_response.get("response") or {}
+            self.log("Received telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, telemetry_details), "DEBUG")
+
+            return telemetry_details, None
         except Exception as e:
-            self.msg = (
-                "Exception occurred while getting telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
-            )
+            return None, "Exception occurred while getting telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
+
+    def prefetch_telemetry_settings(self, sites):
+        """
+        Retrieves the telemetry settings of several sites concurrently and stores them for the later lookups.
+
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            sites (list): The name and the unique identifier of every site, as tuples.
+        Returns:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+        Description:
+            Up to 'max_concurrent_requests' sites are queried at the same time and their telemetry settings are stored by
+            site ID in 'self.telemetry_settings'. If any request fails, the operation result is set to "failed".
+        """
+
+        pending_site_names = {}
+        for site_name, site_id in sites:
+            if site_id not in self.telemetry_settings:
+                pending_site_names.setdefault(site_id, site_name)
+
+        pending_sites = [(site_name, site_id) for site_id, site_name in pending_site_names.items()]
+
+        if not pending_sites:
+            return self
+
+        self.log("Fetching telemetry settings for {0} site(s) concurrently.".format(len(pending_sites)), "INFO")
+        results = self.execute_concurrently(self.fetch_telemetry_settings, pending_sites, self.params.get("max_concurrent_requests"))
+        errors = []
+        for (site_name, site_id), (telemetry_details, error) in zip(pending_sites, results):
+            if error:
+                errors.append(error)
+                continue
+
+            self.telemetry_settings[site_id] = telemetry_details
+
+        if errors:
+            self.msg = " ".join(errors)
             self.set_operation_result("failed", False, self.msg, "CRITICAL").check_return_status()
 
+        return self
+
+    def is_wired_data_collection_enable(self, site_name, site_id):
+        """
+        Checks if wired data collection is enabled for a specified site.
+
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            site_name (str): The name of the site to check.
+            site_id (str): The unique identifier of the site.
+        Returns:
+            bool: True if wired data collection is enabled for the site, False otherwise.
+        Description:
+            This function logs the status of wired data collection for a given site and checks if it is enabled.
+            It uses the telemetry settings of the site stored by `prefetch_telemetry_settings`, which calls the
+            `retrieve_telemetry_settings_for_a_site` API function when they are not known yet. If telemetry settings
+            or wired data collection details are missing or disabled, function logs relevant messages and returns False.
+            If wired data collection is enabled, it returns True.
+        """
+
+        self.log("Checking whether wired data collection is enabled for the site: {0}".format(site_name), "INFO")
+        self.prefetch_telemetry_settings([(site_name, site_id)])
+        telemetry_details = self.telemetry_settings.get(site_id)
+        if not telemetry_details:
+            self.log("No telemetry settings found for site '{0}' (ID: {1})".format(site_name, site_id), "WARNING")
+            return False
+
+        self.log("Successfully retrieved telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, telemetry_details), "DEBUG")
+        wired_data_collection = telemetry_details.get("wiredDataCollection")
+
+        if not wired_data_collection:
+            self.log("Wired Data Collection is not enabled at this site '{0}'.".format(site_name), "DEBUG")
+            return False
+
+        is_enabled = wired_data_collection.get("enableWiredDataCollection")
+        if not is_enabled:
+            self.log("Wired Data Collection is not enabled at this site '{0}'.".format(site_name), "DEBUG")
+            return False
+        self.log("Wired Data Collection is enabled at this site '{0}'.".format(site_name), "DEBUG")
+
         return True
 
     def get_telemetry_details(self, site_name, site_id):
@@ -1483,37 +1587,24 @@ class FabricSitesZones(DnacBase):
             site_name (str): The name of the site for which telemetry settings are being retrieved.
             site_id (str): The unique identifier of the site.
         Returns:
-            dict: A dictionary containing telemetry details for the site. If telemetry settings are not found
-                or an exception occurs, it logs an error and returns an empty dictionary.
+            dict: A copy of the telemetry details for the site, which can be modified by the caller.
         Description:
             This function logs the process of checking and retrieving telemetry settings for a specified site.
-            It sends a request to the `retrieve_telemetry_settings_for_a_site` API function using the provided
-            site ID. If no telemetry settings are found, it logs an error message and sets the operation result
-            to "failed."
+            The settings already retrieved by `prefetch_telemetry_settings` are reused, else the
+            `retrieve_telemetry_settings_for_a_site` API function is called with the provided site ID.
+            If no telemetry settings are found, it logs an error message and sets the operation result to "failed."
         """
 
         self.log("Fetching telemetry settings for site: {0}".format(site_name), "INFO")
-        try:
-            telemetry_response = self.dnac._exec(
-                family="network_settings",
-                function='retrieve_telemetry_settings_for_a_site',
-                op_modifies=False,
-                params={"id": site_id}
-            )
-            telemetry_details = telemetry_response.get("response", {})
-            if not telemetry_details:
-                self.mg = "No telemetry settings found for site '{0}' (ID: {1})".format(site_name, site_id)
-                self.set_operation_result("failed", False, self.msg, "CRITICAL").check_return_status()
-
-            self.log("Successfully retrieved telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, telemetry_details), "DEBUG")
-
-        except Exception as e:
-            self.msg = (
-                "Exception occurred while getting telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, str(e))
-            )
+        self.prefetch_telemetry_settings([(site_name, site_id)])
+        telemetry_details = self.telemetry_settings.get(site_id)
+        if not telemetry_details:
+            self.msg = "No telemetry settings found for site '{0}' (ID: {1})".format(site_name, site_id)
             self.set_operation_result("failed", False, self.msg, "CRITICAL").check_return_status()
 
-        return telemetry_details
+        self.log("Successfully retrieved telemetry settings for site '{0}' (ID: {1}): {2}".format(site_name, site_id, telemetry_details), "DEBUG")
+
+        return copy.deepcopy(telemetry_details)
 
     def enable_wired_data_collection(self, site_name, site_id):
         """
@@ -1562,6 +1653,7 @@ class FabricSitesZones(DnacBase):
             success_msg = "Successfully enabled wired data collection for site '{0}'.".format(site_name)
             self.log(success_msg, "INFO")
             self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            self.telemetry_settings.pop(site_id, None)
         except Exception as e:
             self.msg = (
                 "An exception occured while eanbling the Wired Data Collection for the site '{0}' "
@@ -1571,24 +1663,25 @@ class FabricSitesZones(DnacBase):
 
         return self
 
-    def get_all_pending_events_ids(self, site_name, fabric_id):
+    def get_all_pending_events_ids(self, fabric):
         """
         Fetches all pending fabric events for a specified site in Cisco Catalyst Center.
 
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            site_name (str): The name of the site for which pending fabric events need to be retrieved.
-            fabric_id (str): The unique identifier of the fabric associated with the site.
+            fabric (tuple): The name of the site and the unique identifier of the fabric associated with the site.
         Returns:
-            dict: A dictionary where keys are event details (names) and values are their corresponding event IDs.
+            tuple: A dictionary where keys are event details (names) and values are their corresponding event IDs,
+                and the error message of the requests, one of them being None.
         Description:
             This function iteratively retrieves all pending fabric events for a given site using the `get_pending_fabric_events`
             API in Cisco Catalyst Center. It uses pagination, incrementing the offset by 500 for each subsequent API call until no
             more events are found. Each event's name (`detail`) and ID (`id`) are extracted and stored in a dictionary.
-
-            This method helps in monitoring or troubleshooting fabric events that haven't been addressed yet within the network.
+            It is run from the worker threads of `collect_pending_fabric_events`, so it returns the outcome instead of
+            updating the operation result.
         """
 
+        site_name, fabric_id = fabric
         self.log("Fetching all the pending fabric events for site: {0}".format(site_name), "INFO")
         pending_fabric_events = {}
         offset = 1
@@ -1618,55 +1711,133 @@ class FabricSitesZones(DnacBase):
 
                 offset += 500
             except Exception as e:
-                self.msg = (
-                    "Exception occurred while fetching the pending fabric events for site '{0}': {1}".format(site_name, str(e))
-                )
-                self.set_operation_result("failed", False, self.msg, "CRITICAL").check_return_status()
+                return None, "Exception occurred while fetching the pending fabric events for site '{0}': {1}".format(site_name, str(e))
 
-        return pending_fabric_events
+        return pending_fabric_events, None
 
-    def apply_pending_fabric_events(self, event_name, event_id, fabric_id, site_name):
+    def collect_pending_fabric_events(self, fabrics):
         """
-        Applies a pending fabric event to a specified site in Cisco Catalyst Center.
+        Fetches the pending fabric events of several fabric sites and zones concurrently.
 
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            event_name (str): The name of the fabric event to be applied.
-            event_id (str): The unique identifier of the pending fabric event.
-            fabric_id (str): The unique identifier of the fabric where the event should be applied.
-            site_name (str): The name of the site associated with the fabric event.
+            fabrics (list): The name of the site and the unique identifier of its fabric site or zone, as tuples.
         Returns:
-            self (object): Returns the instance of the class to allow method chaining.
+            list: The pending fabric events of all the fabrics as dictionaries with the 'site_name', 'fabric_id',
+                'event_name' and 'event_id' of every event.
         Description:
-            This function applies a pending fabric event to a specific site within Cisco DNA Center. It constructs a payload
-            containing the `fabricId` and `eventId`, then initiates the API call to apply the event.
-            The function logs the payload details and checks for the task ID to confirm the event application process
-            initiation. If the task ID retrieval fails, it logs an error and marks the operation as failed. Upon successfully
-            retrieving the task ID, the function monitors the task status to ensure the event is applied correctly.
-            If any exception occurs during this process, it logs an error message and updates the operation result to "failed."
+            Up to 'max_concurrent_requests' fabrics are queried at the same time with `get_all_pending_events_ids`.
+            If the events of any fabric cannot be retrieved, the operation result is set to "failed".
         """
 
-        try:
-            event_payload = {
-                "fabricId": fabric_id,
-                "id": event_id
-            }
-            self.log("Requested payload for applying fabric event '{0}' is:  {1}".format(event_name, event_payload), "INFO")
-            task_name = "apply_pending_fabric_events"
-            payload = {"payload": [event_payload]}
-            task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+        results = self.execute_concurrently(self.get_all_pending_events_ids, fabrics, self.params.get("max_concurrent_requests"))
+        pending_events, errors = [], []
+        for (site_name, fabric_id), (pending_events_map, error) in zip(fabrics, results):
+            if error:
+                errors.append(error)
+                continue
 
-            if not task_id:
-                self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
-                self.set_operation_result("failed", False, self.msg, "ERROR")
-                return self
+            if not pending_events_map:
+                self.log("There is no pending fabric event present for the site {0}".format(site_name), "INFO")
 
-            success_msg = "Pending fabric event '{0}' applied successfully to the fabric site {1}".format(event_name, site_name)
-            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            for event_name, event_id in pending_events_map.items():
+                pending_events.append({
+                    "site_name": site_name,
+                    "fabric_id": fabric_id,
+                    "event_name": event_name,
+                    "event_id": event_id
+                })
+
+        if errors:
+            self.msg = " ".join(errors)
+            self.set_operation_result("failed", False, self.msg, "CRITICAL").check_return_status()
+
+        self.log("Collected {0} pending fabric event(s) across {1} fabric(s).".format(len(pending_events), len(fabrics)), "INFO")
+
+        return pending_events
+
+    def submit_pending_fabric_events(self, pending_events):
+        """
+        Submits a batch of pending fabric events to be applied in Cisco Catalyst Center.
+
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            pending_events (list): The pending fabric events of the batch, as returned by `collect_pending_fabric_events`.
+        Returns:
+            tuple: The task ID of the request and the error message, one of them being None.
+        Description:
+            This function sends the `fabricId` and `id` of every event of the batch to the `apply_pending_fabric_events` API.
+            It is run from the worker threads of `apply_pending_fabric_events`, so it returns the outcome instead of
+            updating the operation result.
+        """
 
+        payload = [{"fabricId": event.get("fabric_id"), "id": event.get("event_id")} for event in pending_events]
+        self.log("Requested payload for applying the pending fabric events is:  {0}".format(payload), "INFO")
+        try:
+            response = self.dnac._exec(
+                family="sda",
+                function="apply_pending_fabric_events",
+                op_modifies=True,
+                params={"payload": payload}
+            )
+            self.log("Received API response from 'apply_pending_fabric_events': {0}".format(str(response)), "DEBUG")
+            task_info = response.get("response") if isinstance(response, dict) else None
+            if not task_info or not task_info.get("taskId"):
+                return None, "Unable to retrieve the task_id for the task 'apply_pending_fabric_events'."
+
+            return task_info.get("taskId"), None
         except Exception as e:
-            self.msg = "An exception occured while applying the pending fabric event '{0}' for site {1}: {2}".format(event_name, site_name, str(e))
+            return None, str(e)
+
+    def apply_pending_fabric_events(self, pending_events):
+        """
+        Applies the pending fabric events of all the fabric sites and zones in Cisco Catalyst Center.
+
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            pending_events (list): The pending fabric events, as returned by `collect_pending_fabric_events`.
+        Returns:
+            self (object): Returns the instance of the class to allow method chaining.
+        Description:
+            This function splits the pending fabric events in batches of 'pending_fabric_events_batch_size' events, which
+            can hold the events of different fabrics. Up to 'max_concurrent_requests' batches are submitted at the same
+            time and the status of all their tasks is checked together. The events of the successful batches are recorded
+            as applied, and if any batch fails, the error messages are combined and the operation result is set to "failed".
+        """
+
+        if not pending_events:
+            return self
+
+        batch_size = self.params.get("pending_fabric_events_batch_size")
+        max_workers = self.params.get("max_concurrent_requests")
+        batches = [pending_events[index:index + batch_size] for index in range(0, len(pending_events), batch_size)]
+        self.log("Applying {0} pending fabric event(s) in {1} batch(es).".format(len(pending_events), len(batches)), "INFO")
+
+        submissions = self.execute_concurrently(self.submit_pending_fabric_events, batches, max_workers)
+        task_results = self.wait_for_tasks([task_id for task_id, error in submissions if task_id], max_workers=max_workers)
+
+        errors = []
+        for batch, (task_id, error) in zip(batches, submissions):
+            task_details = task_results.get(task_id) or {}
+            if not error and task_details.get("isError"):
+                error = task_details.get("failureReason") or task_details.get("progress")
+
+            event_names = ["{0} for site {1}".format(event.get("event_name"), event.get("site_name")) for event in batch]
+            if error:
+                errors.append("Unable to apply the pending fabric event(s) {0}: {1}".format(event_names, error))
+                self.log(errors[-1], "ERROR")
+                continue
+
+            self.log("Pending fabric event(s) {0} applied successfully.".format(event_names), "INFO")
+            self.pending_fabric_event.extend(event_names)
+
+        if errors:
+            self.msg = " ".join(errors)
             self.set_operation_result("failed", False, self.msg, "ERROR")
+            return self
+
+        self.msg = "Pending fabric event(s) applied successfully to the fabric site(s)/zone(s)."
+        self.set_operation_result("success", True, self.msg, "INFO")
 
         return self
 
@@ -1716,7 +1887,10 @@ class FabricSitesZones(DnacBase):
                 - If 'fabric_sites' is present in the configuration, it iterates over the list of sites.
                 - Checks if the site needs to be created or updated based on its type ("fabric_site" or "fabric_zone").
                 - Creates or updates the site as necessary. If the site does not need any updates, it logs this information.
-            2. Authentication Profile
+            2. Pending Fabric Events
+                - The pending fabric events of all the sites with `apply_pending_events` are collected concurrently and
+                    applied together in batches once every fabric site and zone has been created or updated.
+            3. Authentication Profile
                 - If an `update_authentication_profile` parameter is provided, it validates and updates the authentication
                     profile template associated with the site.
                 - Ensures that the authentication profile is valid and performs updates if needed.
@@ -1739,14 +1913,24 @@ class FabricSitesZones(DnacBase):
 
         self.log("Deduplication complete. Total unique sites: {0}".format(len(fabric_sites)), "DEBUG")
 
+        site_ids = []
         for site in fabric_sites:
             site_name = site.get("site_name_hierarchy")
-            fabric_type = site.get("fabric_type", "fabric_site")
             site_exists, site_id = self.get_site_id(site_name)
             if not site_exists:
                 self.msg = "Given site '{0}' does not exist in the Catalyst Center.".format(site_name)
                 self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
 
+            site_ids.append(site_id)
+
+        self.prefetch_telemetry_settings(
+            [(site.get("site_name_hierarchy"), site_id) for site, site_id in zip(fabric_sites, site_ids)]
+        )
+        pending_event_fabrics = []
+
+        for site, site_id in zip(fabric_sites, site_ids):
+            site_name = site.get("site_name_hierarchy")
+            fabric_type = site.get("fabric_type", "fabric_site")
             auth_profile = site.get("authentication_profile")
 
             if auth_profile and auth_profile not in ["Closed Authentication", "Low Impact", "No Authentication", "Open Authentication"]:
@@ -1815,19 +1999,20 @@ class FabricSitesZones(DnacBase):
                         zone_detail = self.get_fabric_zone_detail(site_name, site_id)
                         fabric_id = zone_detail.get("id")
 
-                    pending_events_map = self.get_all_pending_events_ids(site_name, fabric_id)
-
-                    if not pending_events_map:
-                        self.log("There is no pending fabric event present for the site {0}".format(site_name), "INFO")
-
-                    for event_detail, event_id in pending_events_map.items():
-                        self.log("Applying the pending fabric event {0} for the site {1}".format(event_detail, site_name), "DEBUG")
-                        self.apply_pending_fabric_events(event_detail, event_id, fabric_id, site_name).check_return_status()
-                        self.pending_fabric_event.append(event_detail + " for site " + site_name)
-                        self.log("Pending fabric events get applied successfully to the site {0}".format(site_name), "INFO")
+                    pending_event_fabrics.append((site_name, fabric_id))
                 else:
                     self.log("Reconfigure the fabric pending events start supporting from 2.3.7.9 onwards only.", "WARNING")
 
+        # Apply the pending fabric events of all the fabric sites/zones together
+        if pending_event_fabrics:
+            pending_fabric_events = self.collect_pending_fabric_events(pending_event_fabrics)
+            self.apply_pending_fabric_events(pending_fabric_events).check_return_status()
+
+        for site, site_id in zip(fabric_sites, site_ids):
+            site_name = site.get("site_name_hierarchy")
+            fabric_type = site.get("fabric_type", "fabric_site")
+            auth_profile = site.get("authentication_profile")
+
             # Updating/customising the default parameters for authentication profile template
             if site.get("update_authentication_profile"):
                 if not auth_profile:
@@ -2142,6 +2327,8 @@ def main():
                     'config_verify': {'type': 'bool', "default": False},
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
+                    'pending_fabric_events_batch_size': {'type': 'int', "default": 40},
+                    'max_concurrent_requests': {'type': 'int', "default": 5},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
                     'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
                     }
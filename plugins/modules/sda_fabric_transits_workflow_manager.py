@@ -33,6 +33,21 @@ options:
     type: str
     choices: [merged, deleted]
     default: merged
+  sda_fabric_transits_batch_size:
+    description:
+      - Maximum number of fabric transits sent in a single create or update request.
+      - Larger requests are split into batches of this size.
+      - Must be at least 1.
+    type: int
+    default: 40
+    version_added: 6.32.0
+  max_concurrent_batches:
+    description:
+      - Maximum number of fabric transit batches or deletions submitted and tracked at the same time.
+      - Set to 1 to submit them one after the other.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description:
       - A list of SDA fabric transit configurations.
@@ -110,6 +125,7 @@ requirements:
   - dnacentersdk >= 2.9.2
   - python >= 3.9
 notes:
+  - Added 'sda_fabric_transits_batch_size' and 'max_concurrent_batches' options in v6.32.0
   - SDK Method used are
     devices.Devices.get_device_list,
     sda.Sda.get_transit_networks,
@@ -332,7 +348,6 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
     validate_list_of_dicts,
-    get_dict_result,
     dnac_compare_equality,
 )
 
@@ -348,6 +363,8 @@ class FabricTransit(DnacBase):
         ]
         self.fabric_transits_obj_params = self.get_obj_params("fabricTransits")
         self.max_timeout = self.params.get('dnac_api_task_timeout')
+        self.fabric_transit_snapshot = None
+        self.network_device_details = {}
 
     def validate_input(self):
         """
@@ -366,6 +383,12 @@ class FabricTransit(DnacBase):
             'self.msg' will describe the validation issues.
         """
 
+        batch_size = self.params.get("sda_fabric_transits_batch_size")
+        if batch_size is not None and batch_size < 1:
+            self.msg = "'sda_fabric_transits_batch_size' must be at least 1 but passed {batch_size}".format(batch_size=batch_size)
+            self.status = "failed"
+            return self
+
         if not self.config:
             self.msg = "config not available in playbook for validation."
             self.status = "success"
@@ -482,10 +505,14 @@ class FabricTransit(DnacBase):
         Returns:
             device_details (dict or None): The network device details with the given IP address.
         Description:
-            This function calls the API to get the devices list based on the IP address.
+            Return the details stored by 'prefetch_network_devices' when the IP address was prefetched.
+            Else, this function calls the API to get the devices list based on the IP address.
             Returns the network device details.
         """
 
+        if device_ip in self.network_device_details:
+            return self.network_device_details.get(device_ip)
+
         response = self.dnac._exec(
             family="devices",
             function="get_device_list",
@@ -505,6 +532,34 @@ class FabricTransit(DnacBase):
 
         return device_details
 
+    def prefetch_network_devices(self, device_ips):
+        """
+        Get the network device details of several IP addresses at once.
+
+        Parameters:
+            device_ips (list): The IP addresses of the network devices.
+        Returns:
+            None
+        Description:
+            Call the API 'get_device_list' with batches of IP addresses and store the details of every
+            device found by its management IP address, for the later calls of 'get_device_details_by_ip'.
+            The IP addresses without a device are stored with an empty list.
+        """
+
+        device_ips = [device_ip for device_ip in device_ips if device_ip and device_ip not in self.network_device_details]
+        if not device_ips:
+            return
+
+        device_details = {device_ip: [] for device_ip in device_ips}
+        for device in self.get_device_list_in_bulk("management_ip_address", device_ips):
+            device_details.setdefault(device.get("managementIpAddress"), []).append(device)
+
+        self.network_device_details.update(device_details)
+        self.log(
+            "Prefetched the details of the network devices for {total} IP address(es): {details}"
+            .format(total=len(device_ips), details=device_details), "DEBUG"
+        )
+
     def format_fabric_transit_params(self, fabric_transit_details):
         """
         Process the fabric transit parameters retrieved from the Cisco Catalyst Center
@@ -536,31 +591,25 @@ class FabricTransit(DnacBase):
 
         return fabric_transit_info
 
-    def fabric_transit_exists(self, name):
+    def get_fabric_transit_snapshot(self):
         """
-        Check if the SDA fabric transit with the given name exists
+        Get all the SDA fabric transits of the Cisco Catalyst Center indexed by name.
 
         Parameters:
-            name (str): The name of the fabric transit to check for existence.
+            None
         Returns:
-            dict - A dictionary containing information about the
-                   SDA fabric transit's existence:
-                - 'exists' (bool): True if the fabric transit exists, False otherwise.
-                - 'id' (str or None): The ID of the fabric transit if it exists or None if it doesn't.
-                - 'details' (dict or None): Details of the fabric transit if it exists else None.
+            fabric_transit_snapshot (dict): The fabric transit details keyed by the transit name.
         Description:
-            Sets the existance, details and the id of the fabric tranist as None.
-            Calls the API 'get_transit_networks' until the transit is found or there are
-            no more transits available in the Cisco Catalyst Center.
-            If the transit is not found, the offset is incremented by 500, as the API returns
-            a maximum of 500 entries at a time.
+            Calls the API 'get_transit_networks' until there are no more transits available in
+            the Cisco Catalyst Center, incrementing the offset by 500 as the API returns a maximum
+            of 500 entries at a time. The snapshot is kept until 'clear_fabric_transit_snapshot'
+            is called, so all the transits of the playbook are looked up with the same calls.
         """
 
-        transit_info = {
-            "exists": False,
-            "details": None,
-            "id": None
-        }
+        if self.fabric_transit_snapshot is not None:
+            return self.fabric_transit_snapshot
+
+        fabric_transit_snapshot = {}
         offset = 1
         while True:
             response = self.dnac._exec(
@@ -579,22 +628,72 @@ class FabricTransit(DnacBase):
 
             all_fabric_transit_details = response.get("response")
             if not all_fabric_transit_details:
-                self.log("Fabric transit {name} does not exist.".format(name=name), "DEBUG")
-                return transit_info
+                break
 
-            fabric_transit_details = get_dict_result(all_fabric_transit_details, "name", name)
-            if fabric_transit_details:
-                self.log("Fabric transit found with name '{name}': {details}"
-                         .format(name=name, details=fabric_transit_details), "INFO")
-                transit_info.update({
-                    "exists": True,
-                    "id": fabric_transit_details.get("id"),
-                    "details": self.format_fabric_transit_params(fabric_transit_details)
-                })
+            for fabric_transit_details in all_fabric_transit_details:
+                fabric_transit_snapshot[fabric_transit_details.get("name")] = fabric_transit_details
+
+            if len(all_fabric_transit_details) < 500:
                 break
 
             offset += 500
 
+        self.log("Collected {count} SDA fabric transit(s) from the Cisco Catalyst Center."
+                 .format(count=len(fabric_transit_snapshot)), "DEBUG")
+        self.fabric_transit_snapshot = fabric_transit_snapshot
+        return self.fabric_transit_snapshot
+
+    def clear_fabric_transit_snapshot(self):
+        """
+        Clear the stored SDA fabric transits and network device details.
+
+        Parameters:
+            None
+        Returns:
+            None
+        Description:
+            Called before the fabric transits are changed, so that the verification reads the new state.
+        """
+
+        self.fabric_transit_snapshot = None
+        self.network_device_details = {}
+
+    def fabric_transit_exists(self, name):
+        """
+        Check if the SDA fabric transit with the given name exists
+
+        Parameters:
+            name (str): The name of the fabric transit to check for existence.
+        Returns:
+            dict - A dictionary containing information about the
+                   SDA fabric transit's existence:
+                - 'exists' (bool): True if the fabric transit exists, False otherwise.
+                - 'id' (str or None): The ID of the fabric transit if it exists or None if it doesn't.
+                - 'details' (dict or None): Details of the fabric transit if it exists else None.
+        Description:
+            Sets the existance, details and the id of the fabric tranist as None.
+            Looks up the transit by name in the snapshot of all the fabric transits
+            returned by 'get_fabric_transit_snapshot'.
+        """
+
+        transit_info = {
+            "exists": False,
+            "details": None,
+            "id": None
+        }
+        fabric_transit_details = self.get_fabric_transit_snapshot().get(name)
+        if not fabric_transit_details:
+            self.log("Fabric transit {name} does not exist.".format(name=name), "DEBUG")
+            return transit_info
+
+        self.log("Fabric transit found with name '{name}': {details}"
+                 .format(name=name, details=fabric_transit_details), "INFO")
+        transit_info.update({
+            "exists": True,
+            "id": fabric_transit_details.get("id"),
+            "details": self.format_fabric_transit_params(copy.deepcopy(fabric_transit_details))
+        })
+
         self.log("SDA fabric transit details: {details}".format(details=transit_info.get("details")), "DEBUG")
         self.log("SDA fabric transit id: {id}".format(id=transit_info.get("id")), "DEBUG")
         return transit_info
@@ -894,6 +993,11 @@ class FabricTransit(DnacBase):
         """
 
         want_fabric_transits = []
+        control_plane_ips = []
+        for item in fabric_transits:
+            control_plane_ips.extend((item.get("sda_transit_settings") or {}).get("control_plane_network_device_ips") or [])
+
+        self.prefetch_network_devices(control_plane_ips)
         fabric_transit_index = 0
         for item in fabric_transits:
             fabric_transits_values = {}
@@ -993,6 +1097,113 @@ class FabricTransit(DnacBase):
         self.status = "success"
         return self
 
+    def submit_fabric_transits_request(self, request):
+        """
+        Submit one create, update or delete request of SDA fabric transits.
+
+        Parameters:
+            request (tuple): The API function name ('add_transit_networks', 'update_transit_networks'
+                             or 'delete_transit_network_by_id') and the parameters of the request.
+        Returns:
+            tuple: The task ID of the request and the error message, one of them being None.
+        Description:
+            Called from the worker threads, so the outcome is returned instead of being stored in the object.
+        """
+
+        api_function, params = request
+        try:
+            response = self.dnac._exec(
+                family="sda",
+                function=api_function,
+                op_modifies=True,
+                params=params
+            )
+            self.log(
+                "Received API response from '{api}' with the parameters {params}: {response}"
+                .format(api=api_function, params=params, response=response), "DEBUG"
+            )
+            task_info = response.get("response") if isinstance(response, dict) else None
+            if not task_info or not task_info.get("taskId"):
+                return None, "Unable to retrive the task_id for the task '{api}': {response}".format(
+                    api=api_function, response=response)
+
+            return task_info.get("taskId"), None
+
+        except Exception as msg:
+            return None, str(msg)
+
+    def process_fabric_transit_requests(self, requests):
+        """
+        Submit the SDA fabric transit requests concurrently and check the status of all their tasks together.
+
+        Parameters:
+            requests (list): Tuples of the API function name and the parameters of every request.
+        Returns:
+            list: The task ID of every request, or None when the request failed.
+            list: The error messages of the requests which failed, an empty list if all succeeded.
+        Description:
+            Submit up to 'max_concurrent_batches' requests at the same time and wait for all the tasks
+            in a single status poll.
+        """
+
+        max_workers = self.params.get("max_concurrent_batches")
+        submissions = self.execute_concurrently(self.submit_fabric_transits_request, requests, max_workers)
+        task_results = self.wait_for_tasks([task_id for task_id, error in submissions if task_id], max_workers=max_workers)
+
+        task_ids, errors = [], []
+        for (api_function, params), (task_id, error) in zip(requests, submissions):
+            task_details = task_results.get(task_id) or {}
+            if not error and task_details.get("isError"):
+                error = task_details.get("failureReason") or task_details.get("progress")
+
+            if error:
+                errors.append(
+                    "Failed to execute the task '{api}' with the details '{details}': {error}"
+                    .format(api=api_function, details=params, error=error)
+                )
+                self.log(errors[-1], "ERROR")
+                task_ids.append(None)
+            else:
+                self.log("Successfully executed the task '{api}' with the details '{details}'."
+                         .format(api=api_function, details=params), "INFO")
+                task_ids.append(task_id)
+
+        return task_ids, errors
+
+    def process_fabric_transits_in_batches(self, api_function, fabric_transits):
+        """
+        Create or update the SDA fabric transits with batches submitted concurrently.
+
+        Parameters:
+            api_function (str): The API function name, 'add_transit_networks' or 'update_transit_networks'.
+            fabric_transits (list): The payload of all the fabric transits.
+        Returns:
+            list: The names of the fabric transits which were processed successfully.
+            list: The error messages of the batches which failed, an empty list if all succeeded.
+        Description:
+            Split the payload in batches of 'sda_fabric_transits_batch_size' transits, which are
+            submitted concurrently by 'process_fabric_transit_requests'.
+        """
+
+        batch_size = self.params.get("sda_fabric_transits_batch_size")
+        batches = [
+            fabric_transits[item:item + batch_size]
+            for item in range(0, len(fabric_transits), batch_size)
+        ]
+        self.log(
+            "Submitting {count} transit(s) to '{api}' in {batches} batch(es)."
+            .format(count=len(fabric_transits), api=api_function, batches=len(batches)), "INFO"
+        )
+        task_ids, errors = self.process_fabric_transit_requests(
+            [(api_function, {"payload": batch}) for batch in batches]
+        )
+        processed_names = [
+            fabric_transit.get("name")
+            for batch, task_id in zip(batches, task_ids) if task_id
+            for fabric_transit in batch
+        ]
+        return processed_names, errors
+
     def update_fabric_transits(self, fabric_transits):
         """
         Create/Update fabric transit in Cisco Catalyst Center with fields provided in playbook.
@@ -1003,17 +1214,19 @@ class FabricTransit(DnacBase):
             self (object): The current object with updated desired Fabric Transits information.
         Description:
             Check if the fabric transit is present in the Cisco Catalys Center or not.
-            If not, call the API 'add_transit_networks' to create the  fabric transit. Else, check for the update.
-            Call the requires_update, if the transit requires does not an update, return self after updating the msg.
-            Or Call the API 'update_transit_networks' to update the transit.
+            If not, add it to the transits to be created with the API 'add_transit_networks'. Else, check for the update.
+            Call the requires_update, if the transit does not require an update, update the msg and continue.
+            Or add it to the transits to be updated with the API 'update_transit_networks'.
+            The transits are then created and updated in batches submitted concurrently.
             Update the result and return self.
         """
 
+        result_fabric_transit = self.response[0].get("fabric_transits")
+        create_fabric_transits, update_fabric_transits = [], []
         fabric_transit_index = -1
         for item in fabric_transits:
             fabric_transit_index += 1
             name = item.get("name")
-            result_fabric_transit = self.response[0].get("fabric_transits")
             have_fabric_transit = self.have.get("fabric_transits")[fabric_transit_index]
             want_fabric_transit = self.want.get("fabric_transits")[fabric_transit_index]
             self.log("Current SDA fabric transit '{name}' details in Catalyst Center: {current_details}"
@@ -1025,29 +1238,7 @@ class FabricTransit(DnacBase):
             if not have_fabric_transit.get("exists"):
                 self.log("Desired fabric transit '{name}' details (want): {requested_state}"
                          .format(name=name, requested_state=want_fabric_transit), "DEBUG")
-                payload = {"payload": [want_fabric_transit]}
-                task_name = "add_transit_networks"
-                task_id = self.get_taskid_post_api_call("sda", task_name, payload)
-                if not task_id:
-                    self.msg = (
-                        "Unable to retrive the task_id for the task '{task_name}'."
-                        .format(task_name=task_name)
-                    )
-                    self.set_operation_result("failed", False, self.msg, "ERROR")
-                    return self
-
-                success_msg = (
-                    "Successfully created the SDA Transit with the details '{transit_details}'."
-                    .format(transit_details=want_fabric_transit)
-                )
-                self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg).check_return_status()
-                self.log("Successfully created SDA fabric transit '{name}'.".format(name=name), "INFO")
-                result_fabric_transit.get("response").update({
-                    name: want_fabric_transit
-                })
-                result_fabric_transit.get("msg").update({
-                    name: "SDA fabric transit created successfully"
-                })
+                create_fabric_transits.append(want_fabric_transit)
                 continue
 
             # Check update is required
@@ -1070,31 +1261,35 @@ class FabricTransit(DnacBase):
             self.log("Desired SDA fabric transit '{name}' details: {requested_state}"
                      .format(name=name, requested_state=want_fabric_transit), "DEBUG")
             want_fabric_transit.update({"id": have_fabric_transit.get("id")})
-            payload = {"payload": [want_fabric_transit]}
-            task_name = "update_transit_networks"
-            task_id = self.get_taskid_post_api_call("sda", task_name, payload)
-            if not task_id:
-                self.msg = (
-                    "Unable to retrive the task_id for the task '{task_name}'."
-                    .format(task_name=task_name)
-                )
-                self.set_operation_result("failed", False, self.msg, "ERROR")
-                return self
+            update_fabric_transits.append(want_fabric_transit)
 
-            success_msg = (
-                "Successfully updated the SDA Transit with the details '{transit_details}'."
-                .format(transit_details=want_fabric_transit)
-            )
-            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg).check_return_status()
-            self.log("SDA fabric transit '{name}' updated successfully.".format(name=name), "INFO")
-            result_fabric_transit.get("response").update({
-                name: want_fabric_transit
-            })
-            result_fabric_transit.get("msg").update({
-                name: "SDA fabric transit updated successfully."
-            })
-
-        self.log("Updated the SDA fabric transits successfully", "INFO")
+        if not create_fabric_transits and not update_fabric_transits:
+            self.log("The SDA fabric transits doesn't require any change.", "INFO")
+            return self
+
+        self.clear_fabric_transit_snapshot()
+        errors = []
+        for api_function, fabric_transit_payload, success_msg in (
+                ("add_transit_networks", create_fabric_transits, "SDA fabric transit created successfully"),
+                ("update_transit_networks", update_fabric_transits, "SDA fabric transit updated successfully.")):
+            if not fabric_transit_payload:
+                continue
+
+            processed_names, batch_errors = self.process_fabric_transits_in_batches(api_function, fabric_transit_payload)
+            errors.extend(batch_errors)
+            for fabric_transit in fabric_transit_payload:
+                name = fabric_transit.get("name")
+                if name in processed_names:
+                    result_fabric_transit.get("response").update({name: fabric_transit})
+                    result_fabric_transit.get("msg").update({name: success_msg})
+
+        if errors:
+            self.msg = " ".join(errors)
+            self.set_operation_result("failed", False, self.msg, "ERROR")
+            return self
+
+        self.msg = "Successfully created/updated the SDA fabric transit(s)."
+        self.set_operation_result("success", True, self.msg, "INFO")
         return self
 
     def get_diff_merged(self, config):
@@ -1129,17 +1324,19 @@ class FabricTransit(DnacBase):
             self (object): The current object with updated desired Fabric Transits information.
         Description:
             Check if the fabric transit is present in the Cisco Catalys Center or not.
-            If not, set the result and return self.
-            Or Call the API 'delete_transit_network_by_id' to delete the transit.
+            If not, set the result and continue.
+            Or Call the API 'delete_transit_network_by_id' to delete the transit. The deletions
+            are submitted concurrently and their tasks are checked together.
             Update the result and return self.
         """
 
+        result_fabric_transit = self.response[0].get("fabric_transits")
+        delete_names, delete_requests = [], []
         fabric_transit_index = -1
         for item in fabric_transits:
             fabric_transit_index += 1
             name = item.get("name")
             have_fabric_transit = self.have.get("fabric_transits")[fabric_transit_index]
-            result_fabric_transit = self.response[0].get("fabric_transits")
 
             if not have_fabric_transit.get("exists"):
                 result_fabric_transit.get("msg").update({name: "SDA fabric transit not found."})
@@ -1149,29 +1346,30 @@ class FabricTransit(DnacBase):
             self.log("SDA fabric transit scheduled for deletion with the name '{name}'.".format(name=name), "INFO")
             transit_id = have_fabric_transit.get("id")
             self.log("SDA fabric transit '{name}' id: {id}".format(name=name, id=transit_id), "DEBUG")
-            payload = {"id": transit_id}
-            task_name = "delete_transit_network_by_id"
-            task_id = self.get_taskid_post_api_call("sda", task_name, payload)
-            if not task_id:
-                self.msg = (
-                    "Unable to retrive the task_id for the task '{task_name}'."
-                    .format(task_name=task_name)
-                )
+            delete_names.append(name)
+            delete_requests.append(("delete_transit_network_by_id", {"id": transit_id}))
+
+        if delete_requests:
+            self.clear_fabric_transit_snapshot()
+            task_ids, errors = self.process_fabric_transit_requests(delete_requests)
+            for name, task_id in zip(delete_names, task_ids):
+                if not task_id:
+                    continue
+
+                result_fabric_transit.get("response").update({name: {}})
+                result_fabric_transit.get("response").get(name).update({
+                    "Task Id": task_id
+                })
+                result_fabric_transit.get("msg").update({
+                    name: "SDA fabric transit deleted successfully"
+                })
+
+            if errors:
+                self.msg = " ".join(errors)
                 self.set_operation_result("failed", False, self.msg, "ERROR")
                 return self
 
-            success_msg = (
-                "Successfully deleted the SDA Transit with id '{id}'."
-                .format(id=transit_id)
-            )
-            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg).check_return_status()
-            result_fabric_transit.get("response").update({name: {}})
-            result_fabric_transit.get("response").get(name).update({
-                "Task Id": task_id
-            })
-            result_fabric_transit.get("msg").update({
-                name: "SDA fabric transit deleted successfully"
-            })
+            self.result.update({"changed": True})
 
         self.msg = "SDA fabric transit(s) deleted successfully."
         self.status = "success"
@@ -1344,6 +1542,8 @@ def main():
         "config": {"type": 'list', "required": True, "elements": 'dict'},
         "state": {"default": 'merged', "choices": ['merged', 'deleted']},
         "validate_response_schema": {"type": 'bool', "default": True},
+        "sda_fabric_transits_batch_size": {"type": 'int', "default": 40},
+        "max_concurrent_batches": {"type": 'int', "default": 5},
     }
 
     # Create an AnsibleModule object with argument specifications
@@ -42,6 +42,12 @@ options:
         aligning with GUI constraints. The default is 20, as the GUI allows creating up to 20 anycast gateways at a time.
     type: int
     default: 20
+  sda_fabric_vn_limit:
+    description: Sets the maximum number of layer3 virtual networks that can be created or updated at a time via the SDA API.
+        Larger playbooks are split into requests of this size.
+    type: int
+    default: 50
+    version_added: 6.32.0
   config:
     description: A list containing detailed configurations for creating, updating, or deleting fabric sites/zones
         in a Software-Defined Access (SDA) environment. It also includes specifications for updating the authentication
@@ -584,6 +590,8 @@ class VirtualNetwork(DnacBase):
 
         self.deleted_anycast_gateways = []
         self.absent_anycast_gateways = []
+        self.fabric_snapshot = {}
+        self.reserved_ip_pools = {}
 
     def validate_input(self):
         """
@@ -676,6 +684,68 @@ class VirtualNetwork(DnacBase):
 
         return self
 
+    def get_fabric_snapshot(self, collection):
+        """
+        Returns the indexed snapshot of an SDA collection present in Cisco Catalyst Center.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            collection (str): The SDA collection to return. One of 'fabric_sites', 'fabric_zones',
+                'layer2_virtual_networks', 'layer3_virtual_networks' or 'anycast_gateways'.
+        Returns:
+            dict: The records of the collection indexed by their lookup key -
+                - fabric_sites, fabric_zones: site id -> fabric id.
+                - layer2_virtual_networks: (fabric id, VLAN id) -> fabric VLAN.
+                - layer3_virtual_networks: virtual network name -> virtual network.
+                - anycast_gateways: (fabric id, virtual network name, IP pool name) -> anycast gateway.
+        Description:
+            Each collection is paged once across all the fabrics and kept until one of its records is created,
+            updated or deleted, so the per-item lookups done while planning and verifying the playbook are
+            answered from memory instead of one filtered GET request per fabric VLAN, virtual network or gateway.
+        """
+
+        if collection in self.fabric_snapshot:
+            return self.fabric_snapshot[collection]
+
+        self.log("Loading the '{0}' snapshot from Cisco Catalyst Center.".format(collection), "DEBUG")
+        try:
+            records = self.get_paginated_response("sda", "get_{0}".format(collection))
+        except Exception as e:
+            self.msg = "Error while retrieving the '{0}' details from Cisco Catalyst Center: {1}".format(collection, str(e))
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+        if collection in ("fabric_sites", "fabric_zones"):
+            snapshot = dict((record.get("siteId"), record.get("id")) for record in records)
+        elif collection == "layer2_virtual_networks":
+            snapshot = dict(((record.get("fabricId"), str(record.get("vlanId"))), record) for record in records)
+        elif collection == "layer3_virtual_networks":
+            snapshot = dict((record.get("virtualNetworkName"), record) for record in records)
+        else:
+            snapshot = dict(
+                ((record.get("fabricId"), record.get("virtualNetworkName"), record.get("ipPoolName")), record)
+                for record in records
+            )
+
+        self.log("Loaded {0} record(s) in the '{1}' snapshot.".format(len(snapshot), collection), "INFO")
+        self.fabric_snapshot[collection] = snapshot
+
+        return snapshot
+
+    def invalidate_fabric_snapshot(self, collection):
+        """
+        Discards the snapshot of an SDA collection after one of its records has been changed.
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            collection (str): The SDA collection whose snapshot is no longer current.
+        Returns:
+            None
+        Description:
+            The collection is paged again on its next lookup, so later planning and verification steps see
+            the result of the create, update or delete operation.
+        """
+
+        self.log("Discarding the '{0}' snapshot as its records have been modified.".format(collection), "DEBUG")
+        self.fabric_snapshot.pop(collection, None)
+
     def fetch_site_id_from_fabric_id(self, fabric_id, site_name):
         """
         Fetches the site id corresponding to a given fabric ID in Cisco Catalyst Center.
@@ -748,37 +818,19 @@ class VirtualNetwork(DnacBase):
         Returns:
             str or None: The fabric site id if the site is a fabric site, or `None` if it is not found.
         Description:
-            This function interacts with the Cisco Catalyst Center API to check if a site is part of the fabric network.
-            It uses the site id to query the `get_fabric_sites` API, and if the site exists within the fabric, its fabric
-            site id is returned. If the site is not part of the fabric or an error occurs, the function logs an appropriate
+            This function looks up the site id in the 'fabric_sites' snapshot. If the site exists within the fabric,
+            its fabric site id is returned. If the site is not part of the fabric, the function logs an appropriate
             message and returns `None`.
-            In case of an exception during the API call, the function logs the error, updates the status to "failed", and
-            triggers a check for return status.
         """
 
-        fabric_site_id = None
         self.log("Starting retrieval of fabric site id for site '{0}' with ID '{1}'.".format(site_name, site_id), "DEBUG")
+        fabric_site_id = self.get_fabric_snapshot("fabric_sites").get(site_id)
 
-        try:
-            response = self.dnac._exec(
-                family="sda",
-                function='get_fabric_sites',
-                op_modifies=False,
-                params={"site_id": site_id},
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_fabric_sites' for the site '{0}': {1}".format(site_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("Given site '{0}' is not a fabric site in Cisco Catalyst Center.".format(site_name), "INFO")
-                return fabric_site_id
+        if not fabric_site_id:
+            self.log("Given site '{0}' is not a fabric site in Cisco Catalyst Center.".format(site_name), "INFO")
+            return None
 
-            fabric_site_id = response[0].get("id")
-            self.log("Successfully retrieved fabric site id '{0}' for site '{1}'.".format(fabric_site_id, site_name), "DEBUG")
-        except Exception as e:
-            self.msg = """Error while getting the details of Site with given name '{0}' present in
-                    Cisco Catalyst Center: {1}""".format(site_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        self.log("Successfully retrieved fabric site id '{0}' for site '{1}'.".format(fabric_site_id, site_name), "DEBUG")
 
         return fabric_site_id
 
@@ -792,38 +844,19 @@ class VirtualNetwork(DnacBase):
         Returns:
             str or None: The fabric zone ID if the site is a fabric zone, or `None` if it is not found.
         Description:
-            This function queries Cisco Catalyst Center's API to determine whether a site is part of a fabric zone.
-            It sends a request to the `get_fabric_zones` API using the provided site id. If the site is part of a fabric
-            zone, the corresponding zone ID is returned. If the site is not a fabric zone or no response is received,
-            the function logs an informational message and returns `None`.
-            If an error occurs during the API call, the function logs the error, sets the status to "failed", and performs
-            error handling through `check_return_status`.
+            This function looks up the site id in the 'fabric_zones' snapshot. If the site is part of a fabric
+            zone, the corresponding zone ID is returned. If the site is not a fabric zone, the function logs an
+            informational message and returns `None`.
         """
 
-        fabric_zone_id = None
         self.log("Starting retrieval of fabric zone ID for site '{0}' with ID '{1}'.".format(site_name, site_id), "DEBUG")
+        fabric_zone_id = self.get_fabric_snapshot("fabric_zones").get(site_id)
 
-        try:
-            response = self.dnac._exec(
-                family="sda",
-                function='get_fabric_zones',
-                op_modifies=False,
-                params={"site_id": site_id},
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_fabric_zones' for the site '{0}': {1}".format(site_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("Given site '{0}' is not a fabric zone in Cisco Catalyst Center.".format(site_name), "INFO")
-                return fabric_zone_id
-
-            fabric_zone_id = response[0].get("id")
-            self.log("Successfully retrieved fabric zone ID '{0}' for site '{1}'.".format(fabric_zone_id, site_name), "DEBUG")
+        if not fabric_zone_id:
+            self.log("Given site '{0}' is not a fabric zone in Cisco Catalyst Center.".format(site_name), "INFO")
+            return None
 
-        except Exception as e:
-            self.msg = """Error while getting the details of fabric zone '{0}' present in
-                    Cisco Catalyst Center: {1}""".format(site_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        self.log("Successfully retrieved fabric zone ID '{0}' for site '{1}'.".format(fabric_zone_id, site_name), "DEBUG")
 
         return fabric_zone_id
 
@@ -909,45 +942,23 @@ class VirtualNetwork(DnacBase):
             vlan_name (str): The name of the VLAN whose fabric VLAN IDs are to be collected.
             vlan_id (str): The unique identifier of the VLAN in Cisco Catalyst Center.
         Returns:
-            list: A list of VLAN IDs associated with the given VLAN. Returns an empty list if no VLANs are found or if
-            an error occurs.
+            list: A list of VLAN IDs associated with the given VLAN. Returns an empty list if no VLANs are found.
         Description:
-            This function interacts with the Cisco Catalyst Center API to retrieve fabric VLAN IDs for a specified VLAN.
-            It queries the `get_layer2_virtual_networks` API using the provided VLAN ID. If VLAN data is found, it collects
-            the corresponding VLAN IDs into a list and returns them. If the VLAN is not present or an error occurs during
-            the API call, the function logs an appropriate message, updates the status to "failed" if necessary, and returns
-            an empty list.
+            This function collects the IDs of the fabric VLANs having the given VLAN ID across all the fabrics
+            from the 'layer2_virtual_networks' snapshot.
         """
 
-        vlan_ids = []
-        try:
-            self.log("Starting to collect fabric VLAN IDs for VLAN '{0}' with ID '{1}'.".format(vlan_name, vlan_id), "DEBUG")
-            response = self.dnac._exec(
-                family="sda",
-                function='get_layer2_virtual_networks',
-                op_modifies=False,
-                params={"vlan_id": vlan_id},
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_layer2_virtual_networks' for the VLAN '{0}': {1}".format(vlan_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("Given layer2 fabric VLAN '{0}' is not present in Cisco Catalyst Center.".format(vlan_name), "INFO")
-                return vlan_ids
-
-            for vlan_vn in response:
-                vlan_id_value = vlan_vn.get("id")
-                vlan_ids.append(vlan_id_value)
-                self.log("Collected VLAN ID '{0}' for VLAN '{1}'.".format(vlan_id_value, vlan_name), "DEBUG")
+        self.log("Starting to collect fabric VLAN IDs for VLAN '{0}' with ID '{1}'.".format(vlan_name, vlan_id), "DEBUG")
+        vlan_ids = [
+            vlan_vn.get("id") for (fabric_id, vlan_key), vlan_vn in self.get_fabric_snapshot("layer2_virtual_networks").items()
+            if vlan_key == str(vlan_id)
+        ]
 
-            self.log("Finished collecting fabric VLAN IDs for VLAN '{0}'. Collected IDs: {1}".format(vlan_name, vlan_ids), "DEBUG")
+        if not vlan_ids:
+            self.log("Given layer2 fabric VLAN '{0}' is not present in Cisco Catalyst Center.".format(vlan_name), "INFO")
+            return vlan_ids
 
-        except Exception as e:
-            self.msg = (
-                "Error while getting the details for layer2 fabric VLAN '{0}' present in "
-                "Cisco Catalyst Center: {1}"
-            ).format(vlan_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        self.log("Finished collecting fabric VLAN IDs for VLAN '{0}'. Collected IDs: {1}".format(vlan_name, vlan_ids), "DEBUG")
 
         return vlan_ids
 
@@ -961,41 +972,22 @@ class VirtualNetwork(DnacBase):
             fabric_id (str): The unique identifier of the fabric in which the VLAN resides.
         Returns:
             dict or None: A dictionary containing the details of the VLAN if found. Returns `None` if the VLAN does not
-            exist or an error occurs during the API call.
+            exist.
         Description:
-            This function queries Cisco Catalyst Center's API to fetch details about a specified fabric VLAN using the
-            provided `vlan_id` and `fabric_id`. If the VLAN is not found or an exception occurs, the function logs an
-            appropriate message, sets the status to "failed" if needed, and returns `None`.
+            This function looks up the fabric VLAN by `fabric_id` and `vlan_id` in the 'layer2_virtual_networks'
+            snapshot. A copy of the snapshot record is returned so the caller can modify it freely.
         """
 
-        try:
-            self.log("Fetching details for VLAN '{0}' with ID '{1}' in fabric '{2}'.".format(vlan_name, vlan_id, fabric_id), "DEBUG")
-            response = self.dnac._exec(
-                family="sda",
-                function='get_layer2_virtual_networks',
-                op_modifies=False,
-                params={
-                    "vlan_id": vlan_id,
-                    "fabric_id": fabric_id
-                },
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_layer2_virtual_networks' for VLAN '{0}': {1}".format(vlan_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("Given layer2 VLAN '{0}' is not present in Cisco Catalyst Center.".format(vlan_name), "INFO")
-                return None
+        self.log("Fetching details for VLAN '{0}' with ID '{1}' in fabric '{2}'.".format(vlan_name, vlan_id, fabric_id), "DEBUG")
+        fabric_vlan = self.get_fabric_snapshot("layer2_virtual_networks").get((fabric_id, str(vlan_id)))
 
-            self.log("Returning details for VLAN '{0}': {1}".format(vlan_name, response[0]), "DEBUG")
+        if not fabric_vlan:
+            self.log("Given layer2 VLAN '{0}' is not present in Cisco Catalyst Center.".format(vlan_name), "INFO")
+            return None
 
-        except Exception as e:
-            self.msg = (
-                "Error while getting the details for layer2 VLAN '{0}' present in "
-                "Cisco Catalyst Center: {1}"
-            ).format(vlan_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        self.log("Returning details for VLAN '{0}': {1}".format(vlan_name, fabric_vlan), "DEBUG")
 
-        return response[0]
+        return copy.deepcopy(fabric_vlan)
 
     def validate_traffic_type(self, traffic_type):
         """
@@ -1099,6 +1091,7 @@ class VirtualNetwork(DnacBase):
                 payload = {"payload": fabric_vlan_payload}
                 task_name = "add_layer2_virtual_networks"
                 task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+                self.invalidate_fabric_snapshot("layer2_virtual_networks")
 
                 if not task_id:
                     self.msg = (
@@ -1240,6 +1233,7 @@ class VirtualNetwork(DnacBase):
                 payload = {"payload": vlan_payload}
                 task_name = "update_layer2_virtual_networks"
                 task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+                self.invalidate_fabric_snapshot("layer2_virtual_networks")
 
                 if not task_id:
                     self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
@@ -1258,43 +1252,69 @@ class VirtualNetwork(DnacBase):
 
         return self
 
-    def delete_layer2_fabric_vlan(self, vlan_vn_id, vlan_name_with_id_and_site):
+    def delete_fabric_objects_in_batches(self, task_name, objects, collection, object_type, deleted_list):
         """
-        Deletes a Layer2 fabric VLAN in Cisco Catalyst Center based on the provided VLAN ID.
+        Deletes fabric VLANs or Anycast Gateways by ID from Cisco Catalyst Center in batches.
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            vlan_vn_id (str): The unique identifier of the Fabric VLAN to be deleted.
-            vlan_name_with_id_and_site (str): Uniquely identify the name of vlan with it's VLAN id and
-                to the site(s) it is assoicated with
+            task_name (str): The SDA delete-by-id API to call, e.g. 'delete_layer2_virtual_network_by_id'.
+            objects (list): A list of (id, name) tuples of the objects to be deleted.
+            collection (str): The SDA collection the objects belong to, whose snapshot is discarded.
+            object_type (str): A readable name of the object type used in the log and error messages.
+            deleted_list (list): The list to which the names of the deleted objects are appended.
         Returns:
-            self (object): Returns the instance of the class. If the deletion process fails at any point, the
-                instance's status is set to "failed" and the failure response is added to result dictionary.
+            self (object): Returns the instance of the class. If any deletion fails, the instance's status is set
+                to "failed" with the failure reasons of the batch.
         Description:
-            This function interacts with the Cisco Catalyst Center API to delete a specified Layer 2 fabric VLAN.
-            If the task completes successfully, an informational message is logged and VLAN name is appended to
-            the list of deleted VLANs. If the task fails, the function logs the reason for failure, updating the
-            class status accordingly.
-            In case of exceptions during the process, the function captures the error, logs an appropriate message,
-            and sets the status to "failed".
+            The objects are deleted in batches of 'sda_fabric_vlan_limit' or 'sda_fabric_gateway_limit' items. All
+            the delete requests of a batch are submitted first and their tasks are then monitored together, so a
+            batch costs one task wait instead of one per deleted object.
         """
 
-        try:
-            payload = {"id": vlan_vn_id}
-            task_name = "delete_layer2_virtual_network_by_id"
-            task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+        if collection == "anycast_gateways":
+            req_limit = self.params.get('sda_fabric_gateway_limit', 20)
+        else:
+            req_limit = self.params.get('sda_fabric_vlan_limit', 50)
 
-            if not task_id:
-                self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
-                self.set_operation_result("failed", False, self.msg, "ERROR")
-                return self
+        for i in range(0, len(objects), req_limit):
+            batch_number = (i // req_limit) + 1
+            task_names = {}
 
-            success_msg = "Fabric VLAN '{0}' deleted successfully from the Cisco Catalyst Center.".format(vlan_name_with_id_and_site)
-            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
-            self.deleted_fabric_vlans.append(vlan_name_with_id_and_site)
+            for object_id, object_name in objects[i: i + req_limit]:
+                try:
+                    task_id = self.get_taskid_post_api_call("sda", task_name, {"id": object_id})
+                    self.invalidate_fabric_snapshot(collection)
+                except Exception as e:
+                    self.msg = "Exception occurred while deleting the {0} '{1}' due to: {2}".format(object_type, object_name, str(e))
+                    self.set_operation_result("failed", False, self.msg, "ERROR")
+                    return self
 
-        except Exception as e:
-            self.msg = "Exception occurred while deleting the fabric Vlan '{0}' due to: {1}".format(vlan_name_with_id_and_site, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR")
+                if not task_id:
+                    self.msg = "Unable to retrieve the task_id for the task '{0}' deleting the {1} '{2}'.".format(
+                        task_name, object_type, object_name)
+                    self.set_operation_result("failed", False, self.msg, "ERROR")
+                    return self
+
+                task_names[task_id] = object_name
+
+            self.log("Batch {0}: Monitoring {1} '{2}' task(s).".format(batch_number, len(task_names), task_name), "INFO")
+            task_results = self.wait_for_tasks(list(task_names))
+            failed_objects = []
+
+            for task_id, object_name in task_names.items():
+                task_details = task_results.get(task_id) or {}
+                if task_details.get("isError"):
+                    failed_objects.append("{0}: {1}".format(object_name, task_details.get("failureReason")))
+                    continue
+
+                deleted_list.append(object_name)
+                self.log("{0} '{1}' deleted successfully from the Cisco Catalyst Center.".format(object_type, object_name), "INFO")
+
+            if failed_objects:
+                self.msg = "Batch {0}: Unable to delete the {1}(s) from the Cisco Catalyst Center: {2}".format(
+                    batch_number, object_type, "; ".join(failed_objects))
+                self.set_operation_result("failed", False, self.msg, "ERROR")
+                return self
 
         return self
 
@@ -1307,34 +1327,12 @@ class VirtualNetwork(DnacBase):
         Returns:
             bool: Returns True if the virtual network exists, False if it does not.
         Description:
-            This function interacts with the Cisco Catalyst Center API to determine the existence of a
-            specified Layer3 Virtual Network by querying the `get_layer3_virtual_networks` endpoint.
-            If the function successfully retrieves a response, it will return True, indicating the
-            virtual network exists.
+            This function checks the 'layer3_virtual_networks' snapshot for the given virtual network name.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="sda",
-                function='get_layer3_virtual_networks',
-                op_modifies=False,
-                params={
-                    "virtual_network_name": vn_name,
-                },
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_layer3_virtual_networks' for vn '{0}': {1}".format(vn_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("Given layer3 Virtual Network '{0}' is not present in Cisco Catalyst Center.".format(vn_name), "INFO")
-                return False
-
-        except Exception as e:
-            self.msg = (
-                "Error while getting the details for layer3 virtual network '{0}' present in "
-                "Cisco Catalyst Center: {1}"
-            ).format(vn_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        if vn_name not in self.get_fabric_snapshot("layer3_virtual_networks"):
+            self.log("Given layer3 Virtual Network '{0}' is not present in Cisco Catalyst Center.".format(vn_name), "INFO")
+            return False
 
         return True
 
@@ -1452,39 +1450,19 @@ class VirtualNetwork(DnacBase):
             dict or None: A dictionary containing the details of the specified virtual network if found;
                         otherwise, returns None.
         Description:
-            This function queries the Cisco Catalyst Center API to obtain information about a Layer3
-            Virtual Network identified by the provided name.
-            If the response does not contain any data, it logs an informational message indicating that the
-            specified virtual network is not present.
-            The function returns the details of the virtual network as a dictionary, or None if the network
-            does not exist or if an error occurs during the retrieval process.
+            This function looks up the virtual network in the 'layer3_virtual_networks' snapshot. A copy of
+            the snapshot record is returned, as callers edit the fabric ids of the returned virtual network
+            to build their update payloads.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="sda",
-                function='get_layer3_virtual_networks',
-                op_modifies=False,
-                params={
-                    "virtual_network_name": vn_name,
-                },
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_layer3_virtual_networks' for the vn '{0}': {1}".format(vn_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("Given layer3 virtual network '{0}' is not present in Cisco Catalyst Center.".format(vn_name), "INFO")
-                return None
+        vn_in_ccc = self.get_fabric_snapshot("layer3_virtual_networks").get(vn_name)
+        if not vn_in_ccc:
+            self.log("Given layer3 virtual network '{0}' is not present in Cisco Catalyst Center.".format(vn_name), "INFO")
+            return None
 
-        except Exception as e:
-            self.msg = (
-                "Error while getting the details for layer3 virtual network '{0}' present in "
-                "Cisco Catalyst Center: {1}"
-            ).format(vn_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
-            self.log("Details retrieved successfully for Layer3 virtual network '{0}': {1}".format(vn_name, response[0]), "INFO")
+        self.log("Details retrieved successfully for Layer3 virtual network '{0}': {1}".format(vn_name, vn_in_ccc), "INFO")
 
-        return response[0]
+        return copy.deepcopy(vn_in_ccc)
 
     def create_vn_and_assign_to_fabric_site(self, item):
         """
@@ -1514,6 +1492,7 @@ class VirtualNetwork(DnacBase):
             task_name = "add_layer3_virtual_networks"
             self.log("Triggering '{0}' API call with payload.".format(task_name), "DEBUG")
             task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+            self.invalidate_fabric_snapshot("layer3_virtual_networks")
 
             if not task_id:
                 self.msg = "Failed to retrieve task ID for '{0}'. VN creation aborted.".format(task_name)
@@ -1569,6 +1548,7 @@ class VirtualNetwork(DnacBase):
             task_name = "update_layer3_virtual_networks"
             self.log("Triggering '{0}' API call with payload.".format(task_name), "DEBUG")
             task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+            self.invalidate_fabric_snapshot("layer3_virtual_networks")
 
             if not task_id:
                 self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
@@ -1625,6 +1605,7 @@ class VirtualNetwork(DnacBase):
             task_name = "update_layer3_virtual_networks"
             self.log("Triggering '{0}' API call with payload.".format(task_name), "DEBUG")
             task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+            self.invalidate_fabric_snapshot("layer3_virtual_networks")
 
             if not task_id:
                 self.msg = "Failed to retrieve task ID for '{0}'. VN extension aborted.".format(task_name)
@@ -1664,6 +1645,7 @@ class VirtualNetwork(DnacBase):
 
         try:
             self.log("Checking if the virtual network needs to be anchored to fabric site...", "DEBUG")
+            remaining_vn_payloads = []
 
             for item in add_vn_payloads:
                 vn_name = item.get("virtualNetworkName")
@@ -1679,29 +1661,38 @@ class VirtualNetwork(DnacBase):
                         self.log("Virtual Network '{0}' needs to be extended to additional fabric sites.".format(vn_name), "INFO")
                         self.extend_vn_to_fabric_sites(item)
 
-                    self.log("Remove the virtual network '{0}' details from the creation payload as it is already created.".format(vn_name), "DEBUG")
-                    add_vn_payloads.remove(item)
-                    self.log("Successfully removed '{0}' from add_vn_payloads.".format(vn_name), "DEBUG")
+                    self.log("Virtual network '{0}' is already created, leaving it out of the creation payload.".format(vn_name), "DEBUG")
+                    continue
+
+                remaining_vn_payloads.append(item)
 
-            if not add_vn_payloads:
+            if not remaining_vn_payloads:
                 self.log("There are no more virtual networks to be created in the Cisco Catalyst Center.", "INFO")
                 return self
 
             self.log("Proceeding with creation of remaining Virtual Networks in Cisco Catalyst Center.", "INFO")
-            payload = {"payload": add_vn_payloads}
-            self.log("Constructed payload for VN creation: {0}".format(payload), "DEBUG")
+            req_limit = self.params.get('sda_fabric_vn_limit', 50)
             task_name = "add_layer3_virtual_networks"
-            self.log("Triggering '{0}' API call with payload.".format(task_name), "DEBUG")
-            task_id = self.get_taskid_post_api_call("sda", task_name, payload)
 
-            if not task_id:
-                self.msg = "Failed to retrieve task ID for '{0}'. VN creation aborted.".format(task_name)
-                self.set_operation_result("failed", False, self.msg, "ERROR")
-                return self
+            for i in range(0, len(remaining_vn_payloads), req_limit):
+                vn_payload = remaining_vn_payloads[i: i + req_limit]
+                vn_names = [item.get("virtualNetworkName") for item in vn_payload]
+                payload = {"payload": vn_payload}
+                self.log("Constructed payload for VN creation: {0}".format(payload), "DEBUG")
+                self.log("Triggering '{0}' API call with payload.".format(task_name), "DEBUG")
+                task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+                self.invalidate_fabric_snapshot("layer3_virtual_networks")
 
-            self.log("Received task ID: {0}. Monitoring task status.".format(task_id), "DEBUG")
-            success_msg = "Layer3 Virtual Network(s) '{0}' created successfully in the Cisco Catalyst Center.".format(self.created_virtual_networks)
-            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+                if not task_id:
+                    self.msg = "Failed to retrieve task ID for '{0}'. VN creation aborted.".format(task_name)
+                    self.set_operation_result("failed", False, self.msg, "ERROR")
+                    return self
+
+                self.log("Received task ID: {0}. Monitoring task status.".format(task_id), "DEBUG")
+                success_msg = "Layer3 Virtual Network(s) '{0}' created successfully in the Cisco Catalyst Center.".format(vn_names)
+                self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+                if self.status == "failed":
+                    return self
 
         except Exception as e:
             self.msg = (
@@ -1869,25 +1860,31 @@ class VirtualNetwork(DnacBase):
         Returns:
             self (object): The instance of the class, allowing for method chaining.
         Description:
-            This function sends a request to the Cisco Catalyst Center to update Layer3 Virtual
-            Networks using the provided payload.
+            This function sends requests to the Cisco Catalyst Center to update Layer3 Virtual
+            Networks using the provided payload, in batches of 'sda_fabric_vn_limit' virtual networks.
             The function returns the instance of the class, allowing for further method calls on the
             same instance.
         """
 
-        payload = {"payload": update_vn_payloads}
+        req_limit = self.params.get('sda_fabric_vn_limit', 50)
         task_name = "update_layer3_virtual_networks"
 
         try:
-            task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+            for i in range(0, len(update_vn_payloads), req_limit):
+                vn_payload = update_vn_payloads[i: i + req_limit]
+                vn_names = [item.get("virtualNetworkName") for item in vn_payload]
+                task_id = self.get_taskid_post_api_call("sda", task_name, {"payload": vn_payload})
+                self.invalidate_fabric_snapshot("layer3_virtual_networks")
 
-            if not task_id:
-                self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
-                self.set_operation_result("failed", False, self.msg, "ERROR")
-                return self
+                if not task_id:
+                    self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
+                    self.set_operation_result("failed", False, self.msg, "ERROR")
+                    return self
 
-            success_msg = "Layer3 Virtual Network(s) '{0}' updated successfully in the Cisco Catalyst Center.".format(self.updated_virtual_networks)
-            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+                success_msg = "Layer3 Virtual Network(s) '{0}' updated successfully in the Cisco Catalyst Center.".format(vn_names)
+                self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+                if self.status == "failed":
+                    return self
 
         except Exception as e:
             self.msg = (
@@ -1920,6 +1917,7 @@ class VirtualNetwork(DnacBase):
 
         try:
             task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+            self.invalidate_fabric_snapshot("layer3_virtual_networks")
 
             if not task_id:
                 self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
@@ -1946,37 +1944,38 @@ class VirtualNetwork(DnacBase):
         Returns:
             bool: True if the IP pool exists, False otherwise.
         Description:
-            This function sends a request to the Cisco Catalyst Center to retrieve information
-            about a specific reserved IP subpool based on the provided IP pool name and site id.
-            The primary purpose of this function is to facilitate validation of IP pool existence
-            for network configurations or management tasks.
+            The reserved IP pools of a site are paged once and their names are kept per site id, so validating
+            several anycast gateways of the same site does not query the reserved IP pools again. The offset
+            advances by the number of records returned, as older releases return at most 25 records per page.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="network_settings",
-                function="get_reserve_ip_subpool",
-                op_modifies=True,
-                params={
-                    "site_id": site_id,
-                    "group_name": ip_pool_name
-                }
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_reserve_ip_subpool' for the IP Pool '{0}': {1}".format(ip_pool_name, str(response)), "DEBUG")
+        if site_id not in self.reserved_ip_pools:
+            reserved_pools = []
+            offset = 1
+            while True:
+                response = self.execute_get_request(
+                    "network_settings", "get_reserve_ip_subpool", {"site_id": site_id, "offset": offset, "limit": 500}
+                )
+                page = response.get("response") if isinstance(response, dict) else None
+                if not page:
+                    break
 
-            if not response:
-                self.log("There is no reserve ip pool '{0}' present in the Cisco Catalyst Center system.".format(ip_pool_name), "INFO")
-                return False
+                reserved_pools.extend(page)
 
-            self.log("IP Pool '{0}' exists in the Cisco Catalyst Center.".format(ip_pool_name), "INFO")
+                # Older releases ignore the limit and return pages of 25 records
+                if len(page) < 25:
+                    break
 
-        except Exception as e:
-            self.msg = (
-                "Error while getting the details for reserve IP Pool with name '{0}' present in "
-                "Cisco Catalyst Center: {1}"
-            ).format(ip_pool_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+                offset += len(page)
+
+            self.reserved_ip_pools[site_id] = set(pool.get("groupName") for pool in reserved_pools)
+            self.log("Collected {0} reserved IP pool(s) for the site id '{1}'.".format(len(self.reserved_ip_pools[site_id]), site_id), "DEBUG")
+
+        if ip_pool_name not in self.reserved_ip_pools[site_id]:
+            self.log("There is no reserve ip pool '{0}' present in the Cisco Catalyst Center system.".format(ip_pool_name), "INFO")
+            return False
+
+        self.log("IP Pool '{0}' exists in the Cisco Catalyst Center.".format(ip_pool_name), "INFO")
 
         return True
 
@@ -1992,41 +1991,18 @@ class VirtualNetwork(DnacBase):
             dict or None: Returns a dictionary containing the Anycast Gateway details if found,
                         or None if no details are available.
         Description:
-            This function sends a request to the Cisco Catalyst Center to fetch the details
-            of an Anycast Gateway related to the specified virtual network and IP pool.
-            The function primarily serves to facilitate the management and configuration of
-            Anycast Gateways in network environments, aiding in tasks related to IP addressing
-            and routing.
+            This function looks up the Anycast Gateway by fabric id, virtual network and IP pool name in the
+            'anycast_gateways' snapshot and returns a copy of it.
         """
 
-        try:
-            response = self.dnac._exec(
-                family="sda",
-                function="get_anycast_gateways",
-                op_modifies=False,
-                params={
-                    "fabric_id": fabric_id,
-                    "ip_pool_name": ip_pool_name,
-                    "virtual_network_name": vn_name
-                }
-            )
-            response = response.get("response")
-            self.log("Received API response from 'get_anycast_gateways' for the IP Pool '{0}': {1}".format(ip_pool_name, str(response)), "DEBUG")
-
-            if not response:
-                self.log("There is no reserve ip pool '{0}' present in the Cisco Catalyst Center system.".format(ip_pool_name), "INFO")
-                return None
-
-            self.log("Returning Anycast Gateway details for IP Pool '{0}': {1}".format(ip_pool_name, str(response[0])), "INFO")
+        gateway = self.get_fabric_snapshot("anycast_gateways").get((fabric_id, vn_name, ip_pool_name))
+        if not gateway:
+            self.log("There is no reserve ip pool '{0}' present in the Cisco Catalyst Center system.".format(ip_pool_name), "INFO")
+            return None
 
-        except Exception as e:
-            self.msg = (
-                "Error while getting the details for reserve IP Pool with name '{0}' for the virtual network '{1}' present in "
-                "Cisco Catalyst Center: {2}"
-            ).format(ip_pool_name, vn_name, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        self.log("Returning Anycast Gateway details for IP Pool '{0}': {1}".format(ip_pool_name, str(gateway)), "INFO")
 
-        return response[0]
+        return copy.deepcopy(gateway)
 
     def validate_gateway_payload(self, anycast):
         """
@@ -2381,6 +2357,7 @@ class VirtualNetwork(DnacBase):
 
             try:
                 task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+                self.invalidate_fabric_snapshot("anycast_gateways")
 
                 if not task_id:
                     self.msg = "Batch {0}: Failed to retrieve task ID for '{1}'.".format(batch_number, task_name)
@@ -2435,6 +2412,7 @@ class VirtualNetwork(DnacBase):
                     "{2}".format(batch_number, task_name, payload), "DEBUG"
                 )
                 task_id = self.get_taskid_post_api_call("sda", task_name, payload)
+                self.invalidate_fabric_snapshot("anycast_gateways")
 
                 if not task_id:
                     self.msg = "Batch {0}: Failed to retrieve task ID for '{1}'.".format(batch_number, task_name)
@@ -2454,51 +2432,6 @@ class VirtualNetwork(DnacBase):
 
         return self
 
-    def delete_anycast_gateway(self, gateway_id, unique_anycast):
-        """
-        Deletes an Anycast Gateway in the Cisco Catalyst Center based on the provided gateway ID.
-        Args:
-            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            gateway_id (str): The unique identifier of the Anycast Gateway to be deleted.
-            unique_anycast (str): A descriptive name or identifier for the Anycast Gateway, used for logging.
-        Returns:
-            self (object): The instance of the class, allowing for method chaining. The status of the operation
-                can be checked via the `status` attribute.
-        Description:
-            This function sends a request to the Cisco DNA Center API to delete the specified Anycast Gateway
-            using its ID. It processes the API response and checks for the presence of a task ID to confirm that
-            the deletion request was received.
-            If the deletion is successful, it logs a success message and appends the deleted gateway's name to the
-            `deleted_anycast_gateways` list. If there is an error during the deletion process or an exception occurs, it
-            captures the error, logs an appropriate message, and updates the status.
-            The method returns the instance itself, allowing for further interactions with the object.
-        """
-
-        self.log("Initiating deletion of Anycast Gateway '{0}'.".format(unique_anycast), "INFO")
-        payload = {"id": gateway_id}
-        task_name = "delete_anycast_gateway_by_id"
-
-        try:
-            self.log("Constructing API call payload for task '{0}': {1}".format(task_name, payload), "DEBUG")
-            task_id = self.get_taskid_post_api_call("sda", task_name, payload)
-
-            if not task_id:
-                self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
-                self.set_operation_result("failed", False, self.msg, "ERROR")
-                return self
-
-            success_msg = "Anycast Gateway '{0}' deleted successfully from the Cisco Catalyst Center.".format(unique_anycast)
-            self.log("Task ID '{0}' received. Checking task status...".format(task_id), "INFO")
-            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
-            self.deleted_anycast_gateways.append(unique_anycast)
-            self.log("Completed deletion process for Anycast Gateway '{0}'.".format(unique_anycast), "INFO")
-
-        except Exception as e:
-            self.msg = "Exception occurred while deleting the Anycast Gateway '{0}' due to: {1}".format(unique_anycast, str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR")
-
-        return self
-
     def get_want_fabric_vlan_details(self, fabric_vlan_details):
         """
         Retrieves and validates fabric VLAN details required for Cisco Catalyst Center operations.
@@ -3262,7 +3195,7 @@ class VirtualNetwork(DnacBase):
             are logged.
         """
 
-        fabric_site_dict = {}
+        fabric_site_vlans, fabric_zone_vlans = [], []
 
         for vlan in fabric_vlan_details:
             vlan_name = vlan.get("vlan_name")
@@ -3300,17 +3233,16 @@ class VirtualNetwork(DnacBase):
 
                 fabric_vlan_id = fabric_vlan_in_ccc.get("id")
                 if fabric_type == "fabric_site":
-                    name_id_site_key = "{0}${1}${2}".format(vlan_name, vlan_id, site_name)
-                    fabric_site_dict[name_id_site_key] = fabric_vlan_id
+                    fabric_site_vlans.append((fabric_vlan_id, vlan_name_with_id_and_site))
                 else:
-                    self.delete_layer2_fabric_vlan(fabric_vlan_id, vlan_name_with_id_and_site).check_return_status()
-                    self.log("Successfully deleted fabric VLAN '{0}' from Cisco Catalyst Center.".format(vlan_name_with_id_and_site), "INFO")
+                    fabric_zone_vlans.append((fabric_vlan_id, vlan_name_with_id_and_site))
 
-        for name_id_key, fabric_vlan_id in fabric_site_dict.items():
-            vlan_name, vlan_id, site_name = name_id_key.split("$")
-            vlan_name_with_id_and_site = "{0} having vlan id: {1} and site: {2}".format(vlan_name, vlan_id, site_name)
-            self.delete_layer2_fabric_vlan(fabric_vlan_id, vlan_name_with_id_and_site).check_return_status()
-            self.log("Successfully deleted fabric VLAN '{0}' from Cisco Catalyst Center.".format(vlan_name_with_id_and_site), "INFO")
+        # Fabric VLANs of the fabric zones are removed before the ones of their fabric sites.
+        for fabric_vlans in (fabric_zone_vlans, fabric_site_vlans):
+            self.delete_fabric_objects_in_batches(
+                "delete_layer2_virtual_network_by_id", fabric_vlans, "layer2_virtual_networks",
+                "Fabric VLAN", self.deleted_fabric_vlans
+            ).check_return_status()
 
         if self.deleted_fabric_vlans:
             self.log("Given VLAN(s) '{0}' deleted successfully from the Cisco Catalyst Center".format(self.deleted_fabric_vlans), "INFO")
@@ -3465,7 +3397,7 @@ class VirtualNetwork(DnacBase):
             deletions and any gateways that could not be found, ensuring clarity and traceability of actions taken within
             the Cisco Catalyst Center.
         """
-        anchored_gateway_dict = {}
+        gateways, anchored_gateways = [], []
 
         for anycast in anycast_gateways:
             vn_name = anycast.get("vn_name")
@@ -3507,17 +3439,17 @@ class VirtualNetwork(DnacBase):
                     "Anycast Gateway '{0}' is extending the anchored VN '{1}'. "
                     "It will be deleted at the end.".format(unique_anycast, vn_name), "INFO"
                 )
-                anchored_gateway_dict[unique_anycast] = gateway_id
+                anchored_gateways.append((gateway_id, unique_anycast))
                 continue
 
-            self.delete_anycast_gateway(gateway_id, unique_anycast).check_return_status()
-
-        if anchored_gateway_dict:
-            self.log("Anycast Gateway(s) associated with an anchored VN are available for deletion.", "DEBUG")
+            gateways.append((gateway_id, unique_anycast))
 
-            for gateway_name, gateway_id in anchored_gateway_dict.items():
-                self.log("Deleting Anycast Gateway '{0}' associated with the anchored VN's main site.".format(gateway_name), "INFO")
-                self.delete_anycast_gateway(gateway_id, gateway_name).check_return_status()
+        # Gateways of the anchored site of a VN can only be removed once the sites extending it are gone.
+        for gateway_batch in (gateways, anchored_gateways):
+            self.delete_fabric_objects_in_batches(
+                "delete_anycast_gateway_by_id", gateway_batch, "anycast_gateways",
+                "Anycast Gateway", self.deleted_anycast_gateways
+            ).check_return_status()
 
         if self.deleted_anycast_gateways:
             self.log("Given Anycast Gateway(s) '{0}' deleted successfully from the Cisco Catalyst Center.".format(self.deleted_anycast_gateways), "INFO")
@@ -4031,6 +3963,7 @@ def main():
         'config_verify': {'type': 'bool', "default": False},
         'sda_fabric_vlan_limit': {'type': 'int', 'default': 50},
         'sda_fabric_gateway_limit': {'type': 'int', 'default': 20},
+        'sda_fabric_vn_limit': {'type': 'int', 'default': 50},
         'dnac_api_task_timeout': {'type': 'int', "default": 1200},
         'dnac_task_poll_interval': {'type': 'int', "default": 2},
         'config': {'required': True, 'type': 'list', 'elements': 'dict'},
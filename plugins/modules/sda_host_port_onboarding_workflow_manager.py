@@ -40,6 +40,22 @@ options:
     type: str
     choices: [merged, deleted]
     default: merged
+  port_batch_size:
+    description:
+      - Maximum number of port assignments or port channels sent in a single add or update request.
+      - Larger requests are split into batches of this size.
+      - Must be at least 1.
+    type: int
+    default: 100
+    version_added: 6.32.0
+  max_concurrent_batches:
+    description:
+      - Maximum number of port assignment and port channel requests submitted and tracked at the same time.
+      - Set to 1 to submit the requests one after the other.
+      - Must be at least 1.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description:
       - A list containing detailed configurations for Adding/Updating/Deleting Port assignment(s) or Port channel(s) for Network Devices in SDA Fabric roles
@@ -271,6 +287,11 @@ notes:
     - DELETE /dna/intent/api/v1/sda/portChannels
     - PUT /dna/intent/api/v1/sda/fabrics/${fabricId}/vlanToSsids
     - GET /dna/intent/api/v1/sda/fabrics/${fabricId}/vlanToSsids
+
+  - Added 'port_batch_size' and 'max_concurrent_batches' options in v6.32.0
+  - The existing port assignments and port channels of a fabric site are fetched once for all the devices
+    of the playbook when it configures 10 or more devices of the fabric site, otherwise they are fetched
+    device by device. Only the devices changed by the module are fetched again.
 """
 
 EXAMPLES = r"""
@@ -626,6 +647,34 @@ EXAMPLES = r"""
             ssid_details:
               - ssid_name: "guest_ssid_1"
               - ssid_name: "ent-ssid-2-wpa2"
+
+- name: Add port assignments on several devices, sending up to 200 ports per request
+  cisco.dnac.sda_host_port_onboarding_workflow_manager:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log: true
+    dnac_log_level: "{{dnac_log_level}}"
+    state: merged
+    port_batch_size: 200
+    max_concurrent_batches: 4
+    config:
+      - ip_address: "204.1.2.2"
+        fabric_site_name_hierarchy: "Global/USA/San Jose/BLDG23"
+        port_assignments:
+          - interface_name: "GigabitEthernet1/0/1"
+            connected_device_type: "USER_DEVICE"
+            data_vlan_name: "AG_VLAN_23"
+      - ip_address: "204.1.2.3"
+        fabric_site_name_hierarchy: "Global/USA/San Jose/BLDG23"
+        port_assignments:
+          - interface_name: "GigabitEthernet1/0/1"
+            connected_device_type: "USER_DEVICE"
+            data_vlan_name: "AG_VLAN_23"
 """
 
 RETURN = r"""
@@ -657,6 +706,7 @@ response_2:
 """
 
 
+import copy
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
@@ -678,6 +728,9 @@ class SDAHostPortOnboarding(DnacBase):
         """
         self.supported_states = ["merged", "deleted"]
         super().__init__(module)
+        self.port_index = {}
+        self.fabric_device_counts = {}
+        self.port_index_device_threshold = 10
 
     def validate_input(self):
         """
@@ -695,6 +748,13 @@ class SDAHostPortOnboarding(DnacBase):
             If the validation is successful, it logs a success message and returns an instance of the class
             with the validated configuration.
         """
+        for batch_param in ("port_batch_size", "max_concurrent_batches"):
+            batch_value = self.params.get(batch_param)
+            if batch_value is not None and batch_value < 1:
+                self.msg = "'{0}' must be at least 1 but passed {1}".format(batch_param, batch_value)
+                self.set_operation_result("failed", False, self.msg, "ERROR")
+                return self
+
         # Check if configuration is available
         if not self.config:
             self.status = "success"
@@ -1720,82 +1780,182 @@ class SDAHostPortOnboarding(DnacBase):
         Args:
             get_port_assignments_params (dict): Parameters for querying port assignments, including fabric ID and network device ID.
         Returns:
-            list: A list of port assignments retrieved from the API.
+            list: A list of port assignments matching the parameters.
         Description:
-            This method retrieves port assignments from Cisco Catalyst Center by executing the 'get_port_assignments' API call.
-            It uses pagination with offset and limit to handle large datasets. The method logs relevant information and returns
-            the list of port assignments. If an error occurs during the API call, it logs an error message and sets the validation
-            status to "failed".
+            The port assignments of a device are answered from the fabric-wide port index, see 'get_indexed_port_records'.
         """
-        try:
-            offset = 1
-            limit = 500
-            port_assignments = []
+        return self.get_indexed_port_records("get_port_assignments", get_port_assignments_params)
 
-            while True:
-                try:
-                    # Update offset and limit in the parameters
-                    get_port_assignments_params.update({
-                        "offset": offset,
-                        "limit": limit
-                    })
+    def fetch_port_records(self, api_function, api_params):
+        """
+        Retrieves port assignments or port channels from Cisco Catalyst Center using the given parameters.
+        Args:
+            api_function (str): The SDA API function to call, 'get_port_assignments' or 'get_port_channels'.
+            api_params (dict): Parameters for querying the records, such as the fabric ID and the network device ID.
+        Returns:
+            list: A list of the records retrieved from the API.
+        Description:
+            This method executes the given API call using pagination with offset and limit to handle large datasets.
+            The given parameters are not modified. If an error occurs during the API call, it logs an error message
+            and fails the module.
+        """
+        record_type = "Port Assignment" if api_function == "get_port_assignments" else "Port Channel"
+        offset = 1
+        limit = 500
+        records = []
+
+        while True:
+            # Update offset and limit in a copy of the parameters
+            page_params = dict(api_params, offset=offset, limit=limit)
+            self.log("Retrieving {0} details with params: {1}".format(record_type, page_params), "INFO")
+
+            try:
+                response = self.dnac._exec(
+                    family="sda",
+                    function=api_function,
+                    op_modifies=False,
+                    params=page_params,
+                )
+            except Exception as e:
+                self.msg = (
+                    "An error occurred during iteration while retrieving {0} Details: '{1}' using SDA - "
+                    "'{2}' API call: {3}".format(record_type, page_params, api_function, str(e))
+                )
+                self.fail_and_exit(self.msg)
 
-                    self.log("Updated 'get_port_assignments_params' with offset and limit: {0} ".format(get_port_assignments_params), "INFO")
+            self.log(
+                "Response received from GET API call to Function: '{0}' from Family: '{1}' is Response: {2}".format(
+                    api_function, "sda", str(response)
+                ),
+                "INFO"
+            )
 
-                    # Execute the API call to get port assignments
-                    response = self.dnac._exec(
-                        family="sda",
-                        function="get_port_assignments",
-                        op_modifies=False,
-                        params=get_port_assignments_params,
-                    )
-                    self.log(
-                        "Response received from GET API call to Function: '{0}' from Family: '{1}' is Response: {2}".format(
-                            "get_port_assignments", "sda", str(response)
-                        ),
-                        "INFO"
-                    )
+            # Process the response if available
+            response = response.get("response") if isinstance(response, dict) else None
+            if not response:
+                self.log(
+                    "Exiting the loop because no records were returned after increasing the offset. "
+                    "Current offset: {0}".format(offset),
+                    "INFO"
+                )
+                break
 
-                    # Process the response if available
-                    response = response.get("response")
-                    if not response:
-                        self.log(
-                            "Exiting the loop because no port assignments were returned after increasing the offset. "
-                            "Current offset: {0}".format(offset),
-                            "INFO"
-                        )
-                        break
+            records.extend(response)
 
-                    port_assignments.extend(response)
+            # Check if the response size is less than the limit
+            if len(response) < limit:
+                self.log("Received less than limit ({0}) results, assuming last page. Exiting pagination.".format(limit), "DEBUG")
+                break
 
-                    # Check if the response size is less than the limit
-                    if len(response) < limit:
-                        self.log("Received less than limit ({0}) results, assuming last page. Exiting pagination.".format(limit), "DEBUG")
-                        break
+            offset += limit
 
-                    offset += limit
+        self.log("Retrieved {0} {1}(s) for params: {2}".format(len(records), record_type, api_params), "DEBUG")
+        return records
 
-                except Exception as e:
-                    self.msg = (
-                        "An error occurred during iteration while retrieving Port Assignment Details: '{0}' using SDA - "
-                        "'get_port_assignments' API call: {1}".format(get_port_assignments_params, str(e))
-                    )
-                    self.fail_and_exit(self.msg)
+    def get_fabric_device_count(self, fabric_site_name_hierarchy):
+        """
+        Counts the network devices of the playbook belonging to a fabric site.
+        Args:
+            fabric_site_name_hierarchy (str): The name hierarchy of the fabric site.
+        Returns:
+            int: The number of distinct IP addresses and hostnames given for the fabric site in the playbook.
+        """
+        devices = set()
+        for config in self.validated_config:
+            device = config.get("ip_address") or config.get("hostname")
+            if device and config.get("fabric_site_name_hierarchy") == fabric_site_name_hierarchy:
+                devices.add(device)
 
-            if port_assignments:
-                self.log("Port Assignment Details: {0}".format(port_assignments), "DEBUG")
-            else:
-                self.log("No port assignments found.", "DEBUG")
+        return len(devices)
 
-            return port_assignments
+    def get_fabric_port_index(self, api_function, fabric_id):
+        """
+        Returns the port assignments or port channels of the devices of a fabric site, fetching them on first use.
+        Args:
+            api_function (str): The SDA API function holding the records, 'get_port_assignments' or 'get_port_channels'.
+            fabric_id (str): The ID of the fabric site.
+        Returns:
+            dict: The index of the fabric site, with the records grouped by network device ID under 'devices',
+                  the IDs of the devices changed since they were loaded under 'stale' and whether the records of
+                  every device of the fabric site were loaded under 'complete'.
+        Description:
+            When the playbook configures at least 'port_index_device_threshold' devices of the fabric site, the records
+            of all its devices are retrieved with a single paginated query, so the devices are not queried separately.
+            Otherwise the index starts empty and the records are fetched device by device when first needed.
+        """
+        fabric_index = self.port_index.setdefault(api_function, {}).get(fabric_id)
+        if fabric_index is not None:
+            return fabric_index
 
-        except Exception as e:
-            # Log an error message and fail if an exception occurs
-            self.msg = (
-                "An error occurred while retrieving Port Assignment Details: '{0}' using SDA - "
-                "'get_port_assignments' API call: {1}".format(get_port_assignments_params, str(e))
+        device_count = self.fabric_device_counts.get(fabric_id, 0)
+        fabric_index = {"devices": {}, "stale": set(), "complete": device_count >= self.port_index_device_threshold}
+        if fabric_index["complete"]:
+            for record in self.fetch_port_records(api_function, {"fabric_id": fabric_id}):
+                fabric_index["devices"].setdefault(record.get("networkDeviceId"), []).append(record)
+
+        self.port_index[api_function][fabric_id] = fabric_index
+        self.log("Indexed '{0}' records of {1} device(s) for the fabric ID '{2}' configuring {3} device(s).".format(
+            api_function, len(fabric_index["devices"]), fabric_id, device_count), "DEBUG")
+        return fabric_index
+
+    def get_indexed_port_records(self, api_function, api_params):
+        """
+        Returns the port assignments or port channels of a device which match the given parameters.
+        Args:
+            api_function (str): The SDA API function holding the records, 'get_port_assignments' or 'get_port_channels'.
+            api_params (dict): Parameters for querying the records. The 'fabric_id' and 'network_device_id' select the
+                               device, the optional 'interface_name', 'data_vlan_name', 'voice_vlan_name',
+                               'port_channel_name' and 'connected_device_type' filter its records.
+        Returns:
+            list: Copies of the matching records.
+        Description:
+            The records are taken from the index of the fabric site. The devices not loaded yet and the devices changed
+            by the module since they were loaded are fetched on their own. Queries without a fabric ID and a network
+            device ID are sent to Cisco Catalyst Center directly.
+        """
+        fabric_id = api_params.get("fabric_id")
+        network_device_id = api_params.get("network_device_id")
+        if not fabric_id or not network_device_id:
+            return self.fetch_port_records(api_function, api_params)
+
+        fabric_index = self.get_fabric_port_index(api_function, fabric_id)
+        device_missing = not fabric_index["complete"] and network_device_id not in fabric_index["devices"]
+        if device_missing or network_device_id in fabric_index["stale"]:
+            self.log("Fetching the '{0}' records of the device '{1}'.".format(api_function, network_device_id), "DEBUG")
+            fabric_index["devices"][network_device_id] = self.fetch_port_records(
+                api_function, {"fabric_id": fabric_id, "network_device_id": network_device_id}
             )
-            self.fail_and_exit(self.msg)
+            fabric_index["stale"].discard(network_device_id)
+
+        record_filters = {
+            "interface_name": "interfaceName",
+            "data_vlan_name": "dataVlanName",
+            "voice_vlan_name": "voiceVlanName",
+            "port_channel_name": "portChannelName",
+            "connected_device_type": "connectedDeviceType",
+        }
+        filters = [
+            (record_key, api_params[param]) for param, record_key in record_filters.items() if api_params.get(param)
+        ]
+        records = [
+            copy.deepcopy(record) for record in fabric_index["devices"].get(network_device_id, [])
+            if all(record.get(record_key) == value for record_key, value in filters)
+        ]
+
+        self.log("Found {0} '{1}' record(s) for params: {2}".format(len(records), api_function, api_params), "DEBUG")
+        return records
+
+    def invalidate_port_index(self, api_function, fabric_id, network_device_id):
+        """
+        Marks the port assignments or port channels of a device as changed, so they are fetched again on next use.
+        Args:
+            api_function (str): The SDA API function holding the records, 'get_port_assignments' or 'get_port_channels'.
+            fabric_id (str): The ID of the fabric site of the device.
+            network_device_id (str): The ID of the network device.
+        """
+        fabric_index = self.port_index.get(api_function, {}).get(fabric_id)
+        if fabric_index is not None:
+            fabric_index["stale"].add(network_device_id)
 
     def check_differences(self, existing_port, requested_port):
         """
@@ -1861,44 +2021,30 @@ class SDAHostPortOnboarding(DnacBase):
         self.log("Existing Port assignments: {0}".format(existing_port_assignment_details), "DEBUG")
         self.log("Requested Port assignments: {0}".format(requested_port_assignment_details), "DEBUG")
 
-        create_port_assignments = []
+        # Index both sides by interface name and split the requested interfaces with set operations
+        existing_ports_dict = {port.get("interfaceName"): port for port in existing_port_assignment_details}
+        requested_ports_dict = {port["interface_name"]: port for port in requested_port_assignment_details}
+        existing_interfaces = set(existing_ports_dict) & set(requested_ports_dict)
+
+        create_port_assignments = [
+            port for interface_name, port in requested_ports_dict.items() if interface_name not in existing_interfaces
+        ]
         update_port_assignments = []
         no_update_port_assignments = []
 
-        # Convert the requested_port_assignment_details to a dictionary for quick lookup
-        requested_ports_dict = {port['interface_name']: port for port in requested_port_assignment_details}
-
-        if not existing_port_assignment_details:
-            self.log("Port assignments that need to be CREATED: {0} - {1}".format(len(create_port_assignments), create_port_assignments), "DEBUG")
-            create_port_assignments.extend(requested_ports_dict.values())
-            return create_port_assignments, update_port_assignments, no_update_port_assignments
-
-        # Iterate over existing ports to find matches and differences
-        for existing_port in existing_port_assignment_details:
-            interface_name = existing_port['interfaceName']
-            # If the interface exists in both, compare fields
-
-            if interface_name in requested_ports_dict:
-                requested_port = requested_ports_dict[interface_name]
-
-                # Check for differences using the new function
-                has_diff = self.check_differences(existing_port, requested_port)
-
-                if has_diff:
-                    # Add the requested port with the id and relevant metadata from the existing port
-                    updated_port = requested_port.copy()
-                    # Copy the ID from existing port
-                    updated_port["id"] = existing_port.get("id")
-                    update_port_assignments.append(updated_port)
-                else:
-                    # If there's no difference, add to no_update_port_assignments
-                    no_update_port_assignments.append(existing_port)
-
-                # Remove the requested port from the dictionary so we know it's processed
-                del requested_ports_dict[interface_name]
-
-        # Remaining items in requested_ports_dict are new ports to be created
-        create_port_assignments.extend(requested_ports_dict.values())
+        # Only the interfaces present on both sides need a field by field comparison
+        for interface_name, requested_port in requested_ports_dict.items():
+            if interface_name not in existing_interfaces:
+                continue
+
+            existing_port = existing_ports_dict[interface_name]
+            if self.check_differences(existing_port, requested_port):
+                # Add the requested port with the id of the existing port
+                updated_port = requested_port.copy()
+                updated_port["id"] = existing_port.get("id")
+                update_port_assignments.append(updated_port)
+            else:
+                no_update_port_assignments.append(existing_port)
 
         # Log details of port assignments to be created, update, not updated
         self.log("Port assignments that need to be CREATED: {0} - {1}".format(len(create_port_assignments), create_port_assignments), "DEBUG")
@@ -1944,81 +2090,11 @@ class SDAHostPortOnboarding(DnacBase):
         Args:
             get_port_channels_params (dict): Parameters for querying port channels, including fabric ID and network device ID.
         Returns:
-            list: A list of port channels retrieved from the API.
+            list: A list of port channels matching the parameters.
         Description:
-            This method retrieves port channels from Cisco Catalyst Center by executing the 'get_port_channels' API call.
-            It uses pagination with offset and limit to handle large datasets. The method logs relevant information and returns
-            the list of port channels. If an error occurs during the API call, it logs an error message and sets the validation
-            status to "failed".
+            The port channels of a device are answered from the fabric-wide port index, see 'get_indexed_port_records'.
         """
-        try:
-            offset = 1
-            limit = 500
-            port_channels = []
-
-            while True:
-                try:
-                    # Update offset and limit in the parameters
-                    get_port_channels_params.update({
-                        "offset": offset,
-                        "limit": limit
-                    })
-
-                    # Execute the API call to get port channels
-                    response = self.dnac._exec(
-                        family="sda",
-                        function="get_port_channels",
-                        op_modifies=False,
-                        params=get_port_channels_params,
-                    )
-
-                    self.log(
-                        "Response received from GET API call to Function: '{0}' from Family: '{1}' is Response: {2}".format(
-                            "get_port_channels", "sda", str(response)
-                        ),
-                        "INFO"
-                    )
-
-                    # Process the response if available
-                    response = response.get("response")
-                    if not response:
-                        self.log(
-                            "Exiting the loop because no port channels were returned after increasing the offset. "
-                            "Current offset: {0}".format(offset),
-                            "INFO"
-                        )
-                        break
-
-                    port_channels.extend(response)
-
-                    # Check if the response size is less than the limit
-                    if len(response) < limit:
-                        self.log("Received less than limit ({0}) results, assuming last page. Exiting pagination.".format(limit), "DEBUG")
-                        break
-
-                    offset += limit
-
-                except Exception as e:
-                    self.msg = (
-                        "An error occurred during iteration while retrieving Port Channel Details: '{0}' using "
-                        "SDA - 'get_port_channels' API call: {1}".format(get_port_channels_params, str(e))
-                    )
-                    self.fail_and_exit(self.msg)
-
-            if port_channels:
-                self.log("Port Channel Details: {0}".format(port_channels), "DEBUG")
-            else:
-                self.log("No port channels found.", "DEBUG")
-
-            return port_channels
-
-        except Exception as e:
-            # Log an error message and fail if an exception occurs
-            self.msg = (
-                "An error occurred while retrieving Port Channel Details: '{0}' using SDA - "
-                "'get_port_channels' API call: {1}".format(get_port_channels_params, str(e))
-            )
-            self.fail_and_exit(self.msg)
+        return self.get_indexed_port_records("get_port_channels", get_port_channels_params)
 
     def get_add_port_assignments_params(self):
         """
@@ -2828,32 +2904,6 @@ class SDAHostPortOnboarding(DnacBase):
         # Retrieve and return the task status using the provided task ID
         return self.get_task_status_from_tasks_by_id(task_id, task_name, msg)
 
-    def add_port_assignments(self, add_port_assignments_params):
-        """
-        Initiates the task to add port assignments.
-        Args:
-            add_port_assignments_params (dict): Parameters for adding port assignments.
-        Returns:
-            dict: The task ID from the API call.
-        Description:
-            This method initiates the task to add port assignments using the provided parameters and returns the task ID.
-        """
-        self.log("Initiating addition of port assignments with parameters: {0}".format(add_port_assignments_params), "INFO")
-        return self.get_taskid_post_api_call("sda", "add_port_assignments", add_port_assignments_params)
-
-    def update_port_assignments(self, update_port_assignments_params):
-        """
-        Initiates the task to update port assignments.
-        Args:
-            update_port_assignments_params (dict): Parameters for updating port assignments.
-        Returns:
-            dict: The task ID from the API call.
-        Description:
-            This method initiates the task to update port assignments using the provided parameters and returns the task ID.
-        """
-        self.log("Initiating update of port assignments with parameters: {0}".format(update_port_assignments_params), "INFO")
-        return self.get_taskid_post_api_call("sda", "update_port_assignments", update_port_assignments_params)
-
     def verify_delete_port_assignments_requirement(self, delete_port_assignments_params_list, get_port_assignments_params):
         """
         Verifies the requirement for deleting port assignments.
@@ -2916,121 +2966,163 @@ class SDAHostPortOnboarding(DnacBase):
 
         return results
 
-    def delete_port_assignments(self, delete_port_assignments_params):
+    def get_port_batch_requests(self, api_function, task_name, payload):
         """
-        Initiates the task to delete port assignments.
+        Splits the payload of an add or update operation into requests of at most 'port_batch_size' items.
         Args:
-            delete_port_assignments_params (dict): Parameters for deleting port assignments.
+            api_function (str): The SDA API function to call, e.g. 'add_port_assignments'.
+            task_name (str): The name of the operation used in the result message, e.g. 'Add Port Assignment(s) Task'.
+            payload (list): The port assignments or port channels to be sent.
         Returns:
-            dict: The task ID from the API call.
-        Description:
-            This method initiates the task to delete port assignments using the provided parameters and returns the task ID.
+            list: The requests, each a tuple of the API function, the task name, the API parameters and the payload items.
         """
-        self.log("Initiating deletion of port assignments with parameters: {0}".format(delete_port_assignments_params), "INFO")
-        return self.get_taskid_post_api_call("sda", "delete_port_assignments", delete_port_assignments_params)
+        batch_size = self.params.get("port_batch_size")
+        requests = []
+        for start in range(0, len(payload), batch_size):
+            batch = payload[start:start + batch_size]
+            requests.append((api_function, task_name, {"payload": batch}, batch))
 
-    def add_port_channels(self, add_port_channels_params):
-        """
-        Initiates the task to add port channels.
-        Args:
-            add_port_channels_params (dict): Parameters for adding port channels.
-        Returns:
-            dict: The task ID from the API call.
-        Description:
-            This method initiates the task to add port channels using the provided parameters and returns the task ID.
-        """
-        self.log("Initiating addition of port channels with parameters: {0}".format(add_port_channels_params), "INFO")
-        return self.get_taskid_post_api_call("sda", "add_port_channels", add_port_channels_params)
+        self.log("Split {0} item(s) of '{1}' into {2} request(s) of up to {3} item(s).".format(
+            len(payload), api_function, len(requests), batch_size), "DEBUG")
+        return requests
 
-    def update_port_channels(self, update_port_channels_params):
+    def submit_port_request(self, request):
         """
-        Initiates the task to update port channels.
+        Submits one add, update or delete request for port assignments or port channels.
         Args:
-            update_port_channels_params (dict): Parameters for updating port channels.
+            request (tuple): The API function, the task name, the API parameters and the items of the request.
         Returns:
-            dict: The task ID from the API call.
+            tuple: The task ID of the request and the error message, one of them being None.
         Description:
-            This method initiates the task to update port channels using the provided parameters and returns the task ID.
+            Called from the worker threads, so the outcome is returned instead of being stored in the instance.
+            The devices targeted by the request are marked as changed in the port index whatever the outcome.
         """
-        self.log("Initiating update of port channels with parameters: {0}".format(update_port_channels_params), "INFO")
-        return self.get_taskid_post_api_call("sda", "update_port_channels", update_port_channels_params)
+        api_function, task_name, api_params, items = request
+        collection = "get_port_assignments" if "port_assignments" in api_function else "get_port_channels"
+        devices = set((item.get("fabricId"), item.get("networkDeviceId")) for item in api_params.get("payload", []))
+        if "payload" not in api_params:
+            devices.add((api_params.get("fabric_id"), api_params.get("network_device_id")))
 
-    def delete_port_channels(self, delete_port_channel_param):
-        """
-        Initiates the task to delete port channels.
-        Args:
-            delete_port_channel_param (dict): Parameters for deleting port channels.
-        Returns:
-            dict: The task ID from the API call.
-        Description:
-            This method initiates the task to delete port channels using the provided parameters and returns the task ID.
-        """
-        self.log("Initiating deletion of port channels with parameters: {0}".format(delete_port_channel_param), "DEBUG")
-        return self.get_taskid_post_api_call("sda", "delete_port_channels", delete_port_channel_param)
+        try:
+            response = self.dnac._exec(
+                family="sda",
+                function=api_function,
+                op_modifies=True,
+                params=api_params,
+            )
+            self.log("Response received from API call to Function: '{0}' from Family: 'sda' is Response: {1}".format(
+                api_function, response), "DEBUG")
+            task_info = response.get("response") if isinstance(response, dict) else None
+            if not task_info or not task_info.get("taskId"):
+                return None, "Invalid response received from '{0}': {1}".format(api_function, response)
 
-    def get_add_port_assignments_task_status(self, task_id):
+            return task_info.get("taskId"), None
+
+        except Exception as e:
+            return None, str(e)
+
+        finally:
+            for fabric_id, network_device_id in devices:
+                self.invalidate_port_index(collection, fabric_id, network_device_id)
+
+    def process_port_requests(self, requests):
         """
-        Retrieves the task status for adding port assignments.
+        Submits add, update or delete requests for port assignments and port channels and waits for all their tasks.
         Args:
-            task_id (str): The ID of the task to check.
+            requests (list): The requests, each a tuple of the API function, the task name, the API parameters and
+                             the items of the request.
         Returns:
-            dict: The status of the task retrieved using the task ID.
+            list: The error message of every request in the same order, None for the requests which succeeded.
         Description:
-            This method constructs a message indicating the successful completion of the add port assignments
-            operation. It then retrieves the task status using the provided task ID and logs the relevant information.
-        """
-        task_name = "Add Port Assignment(s) Task"
-        msg = {}
+            Up to 'max_concurrent_batches' requests are submitted at the same time, and the tasks of all the requests
+            are then monitored together, so a device with many ports does not wait for its tasks one after the other.
+        """
+        max_workers = self.params.get("max_concurrent_batches")
+        self.log("Submitting {0} port request(s) with up to {1} request(s) in flight.".format(len(requests), max_workers), "INFO")
+        submissions = self.execute_concurrently(self.submit_port_request, requests, max_workers)
+        task_results = self.wait_for_tasks([task_id for task_id, error in submissions if task_id], max_workers=max_workers)
+
+        errors = []
+        for (api_function, task_name, api_params, items), (task_id, error) in zip(requests, submissions):
+            task_details = task_results.get(task_id) or {}
+            if not error and task_details.get("isError"):
+                error = task_details.get("failureReason") or task_details.get("progress")
+
+            if error:
+                self.log("{0} failed for params {1}: {2}".format(task_name, api_params, error), "ERROR")
+            else:
+                self.log("{0} with task ID '{1}' completed successfully.".format(task_name, task_id), "INFO")
 
-        # Retrieve the parameters for adding port assignments
-        add_port_assignments_params = self.want["add_port_assignments_params"]
-        interface_list = [port.get("interfaceName") for port in add_port_assignments_params["payload"]]
-        msg["{0} Succeeded for following interface(s)".format(task_name)] = {"success_count": len(interface_list), "success_interfaces": interface_list}
+            errors.append(error)
 
-        # Retrieve and return the task status using the provided task ID
-        return self.get_task_status_from_tasks_by_id(task_id, task_name, msg)
+        return errors
 
-    def get_update_port_assignments_task_status(self, task_id):
+    def process_port_batches(self, port_action_map):
         """
-        Retrieves the task status for updating port assignments.
+        Adds and updates the port assignments and port channels of the desired state in batches.
         Args:
-            task_id (str): The ID of the task to check.
+            port_action_map (dict): The 'want' keys of the operations mapped to their API function and task name.
         Returns:
-            dict: The status of the task retrieved using the task ID.
+            self: Returns the instance with the updated operation result and message.
         Description:
-            This method constructs a message indicating the successful completion of the update port assignments
-            operation. It then retrieves the task status using the provided task ID and logs the relevant information.
+            Every payload is split into requests of 'port_batch_size' items. All the requests of the port assignments
+            and port channels are submitted together and their tasks are monitored by a single waiter. The message
+            lists the interfaces or port channels of every operation which succeeded or failed.
         """
-        task_name = "Update Port Assignment(s) Task"
+        requests = []
+        for action_param, (api_function, task_name) in port_action_map.items():
+            req_action_param = self.want.get(action_param)
+            if req_action_param and req_action_param.get("payload"):
+                requests.extend(self.get_port_batch_requests(api_function, task_name, req_action_param["payload"]))
+
+        errors = self.process_port_requests(requests)
+
+        outcomes = {}
+        for (api_function, task_name, api_params, items), error in zip(requests, errors):
+            outcome = outcomes.setdefault(task_name, {"success": [], "failed": [], "errors": []})
+            if error:
+                outcome["failed"].extend(items)
+                outcome["errors"].append(error)
+            else:
+                outcome["success"].extend(items)
+
         msg = {}
+        is_failed = False
+        for task_name, outcome in outcomes.items():
+            if "Port Assignment" in task_name:
+                item_type, name_key = "interface", "interfaces"
+                names = [item.get("interfaceName") for item in outcome["success"]]
+                failed_names = [item.get("interfaceName") for item in outcome["failed"]]
+            else:
+                item_type, name_key = "port channel", "port_channels"
+                if task_name.startswith("Add"):
+                    names = self.get_created_port_channel_names(outcome["success"])
+                    failed_names = [item.get("interfaceNames") for item in outcome["failed"]]
+                else:
+                    names = [item.get("portChannelName") for item in outcome["success"]]
+                    failed_names = [item.get("portChannelName") for item in outcome["failed"]]
 
-        # Retrieve the parameters for update port assignments
-        update_port_assignments_params = self.want["update_port_assignments_params"]
-        interface_list = [port.get("interfaceName") for port in update_port_assignments_params["payload"]]
-        msg["{0} Succeeded for following interface(s)".format(task_name)] = {"success_count": len(interface_list), "success_interfaces": interface_list}
+            if outcome["success"]:
+                msg["{0} Succeeded for following {1}(s)".format(task_name, item_type)] = {
+                    "success_count": len(names),
+                    "success_{0}".format(name_key): names
+                }
 
-        # Retrieve and return the task status using the provided task ID
-        return self.get_task_status_from_tasks_by_id(task_id, task_name, msg)
+            if outcome["failed"]:
+                is_failed = True
+                msg["{0} Failed for following {1}(s)".format(task_name, item_type)] = {
+                    "failed_count": len(failed_names),
+                    "failed_{0}".format(name_key): failed_names,
+                    "failure_reasons": list(dict.fromkeys(outcome["errors"]))
+                }
 
-    def get_delete_port_assignments_task_status(self, task_id, task_name, interface_list):
-        """
-        Retrieves the task status for deleting port assignments.
-        Args:
-            task_id (str): The ID of the task to check.
-            task_name (str): The name of the task being performed.
-            delete_port_assignment_params (dict): Parameters for the delete port assignment operation.
-            interface_list (list): List of interfaces involved in the delete operation.
-        Returns:
-            dict: The status of the task retrieved using the task ID.
-        Description:
-            This method constructs a message indicating the successful completion of the delete port assignments
-            operation. It then retrieves the task status using the provided task ID and logs the relevant information.
-        """
-        msg = "{0} operation has completed successfully for {1} interfaces: {2}.".format(task_name, len(interface_list), ", ".join(interface_list))
+        self.msg = msg
+        if is_failed:
+            self.set_operation_result("failed", True, self.msg, "ERROR")
+        else:
+            self.set_operation_result("success", True, self.msg, "INFO")
 
-        # Retrieve and return the task status using the provided task ID
-        self.get_task_status_from_tasks_by_id(task_id, task_name, msg).check_return_status()
-        return self.status
+        return self
 
     def process_delete_port_assignments(self, delete_port_assignments_params_list):
         """
@@ -3040,29 +3132,27 @@ class SDAHostPortOnboarding(DnacBase):
         Returns:
             self: Returns the instance with the updated operation result and message.
         Description:
-            This method processes the deletion of port assignments by iterating over the provided parameters. It checks
-            if deletion is required for each port assignment and performs the deletion if necessary. It logs the task ID,
-            status, and interfaces for which the deletion was successful, failed, or skipped. The method sets the final
-            message and operation result based on the status of the deletion tasks.
+            This method submits the deletion of every required port assignment, up to 'max_concurrent_batches' at the
+            same time, and monitors all the resulting tasks together. It logs the interfaces for which the deletion was
+            successful or failed and sets the final message and operation result based on the status of the tasks.
         """
         task_name = "Delete Port Assignment(s) Task"
         failed_interfaces = []
         success_interfaces = []
-        skipped_interfaces = []
         msg = {}
 
+        requests = []
         for index, delete_port_assignment_param in delete_port_assignments_params_list.items():
-            interface_list = delete_port_assignment_param.get("interfaces_list")
             self.log("Processing - index: {0}, delete_port_assignment_param: {1}".format(index, delete_port_assignment_param), "DEBUG")
+            interface_list = delete_port_assignment_param.get("interfaces_list")
+            requests.append(("delete_port_assignments", task_name, delete_port_assignment_param.get("delete_port_assignment_params"), interface_list))
 
-            task_id = self.delete_port_assignments(delete_port_assignment_param.get("delete_port_assignment_params"))
-            self.log("Task ID: {0}".format(task_id), "DEBUG")
-            status = self.get_delete_port_assignments_task_status(task_id, task_name, interface_list)
-
-            if status == "success":
-                success_interfaces.extend(interface_list)
-            else:
+        errors = self.process_port_requests(requests)
+        for (api_function, task_name, api_params, interface_list), error in zip(requests, errors):
+            if error:
                 failed_interfaces.extend(interface_list)
+            else:
+                success_interfaces.extend(interface_list)
 
         # Set the final message
         if success_interfaces:
@@ -3089,99 +3179,35 @@ class SDAHostPortOnboarding(DnacBase):
 
         return self
 
-    def get_add_port_channels_task_status(self, task_id):
+    def get_created_port_channel_names(self, add_port_channels_payload):
         """
-        Retrieves the task status for adding port channels and updates the message accordingly.
+        Returns the names given by Cisco Catalyst Center to the port channels which were just added.
         Args:
-            task_id (str): The ID of the task to check.
+            add_port_channels_payload (list): The port channels sent to the 'add_port_channels' API.
         Returns:
-            self: Returns the instance with the updated operation result and message.
-        Description:
-            This method constructs a message indicating the successful completion of the add port channels
-            operation. It then retrieves the task status using the provided task ID. If the operation is
-            successful, it fetches existing port channels and updates the message with the names of the
-            newly created port channels.
-        """
-        task_name = "Add Port Channel(s) Task"
-        add_port_channels_params = self.want["add_port_channels_params"]
-        msg = "{0} has completed successfully for params: {1}.".format(task_name, add_port_channels_params["payload"])
-
-        # Execute the task and get the status
-        self.get_task_status_from_tasks_by_id(task_id, task_name, msg)
-
-        # Check if the operation status matches self.status
-        if self.status == "success":
-            # Fetch existing port channels
-            existing_port_channels = self.get_port_channels(self.have.get("get_port_channels_params"))
-
-            # Log the fetched port channels
+            list: The names of the existing port channels having the same interfaces as one of the added port channels
+                  on the same device.
+        """
+        # Group the interfaces of the added port channels by device
+        added_interfaces = {}
+        for payload_channel in add_port_channels_payload:
+            device = (payload_channel.get("fabricId"), payload_channel.get("networkDeviceId"))
+            added_interfaces.setdefault(device, []).append(set(payload_channel["interfaceNames"]))
+
+        port_channels_names = []
+        for (fabric_id, network_device_id), device_interfaces in added_interfaces.items():
+            # Fetch existing port channels of the device
+            existing_port_channels = self.get_port_channels(self.get_port_channels_params(network_device_id, fabric_id))
             self.log("Existing Port Channels after task completion: {0}".format(existing_port_channels), "DEBUG")
 
             # Compare interface names and collect created port channel names
-            port_channels_names = []
-            for port_channel in existing_port_channels:
-                for payload_channel in add_port_channels_params["payload"]:
-                    if set(payload_channel["interfaceNames"]) == set(port_channel["interfaceNames"]):
-                        port_channels_names.append(port_channel["portChannelName"])
-                        break
-
-            self.log("Names of port_channels that were successfully created: {0}".format(port_channels_names), "DEBUG")
-
-            updated_msg = {}
-
-            # Update the message
-            updated_msg["{0} Succeeded for following port channel(s)".format(task_name)] = {
-                "success_count": len(port_channels_names),
-                "success_port_channels": port_channels_names
-            }
-            self.msg = updated_msg
-
-        return self
-
-    def get_update_port_channels_task_status(self, task_id):
-        """
-        Retrieves the task status for updating port channels.
-        Args:
-            task_id (str): The ID of the task to check.
-        Returns:
-            dict: The status of the task retrieved using the task ID.
-        Description:
-            This method constructs a message indicating the successful completion of the update port channels
-            operation. It then retrieves the task status using the provided task ID and logs the relevant information.
-        """
-        task_name = "Update Port Channel(s) Task"
-        msg = {}
-
-        # Retrieve the parameters for updating port channels
-        update_port_channels_params = self.want.get("update_port_channels_params")
-        port_channels_list = [port.get("portChannelName") for port in update_port_channels_params["payload"]]
-        msg["{0} Succeeded for following port channel(s)".format(task_name)] = {
-            "success_count": len(port_channels_list),
-            "success_port_channels": port_channels_list
-        }
-
-        # Retrieve and return the task status using the provided task ID
-        return self.get_task_status_from_tasks_by_id(task_id, task_name, msg)
-
-    def get_delete_port_channels_task_status(self, task_id, task_name, port_channels_list):
-        """
-        Retrieves the task status for deleting port channels.
-        Args:
-            task_id (str): The ID of the task to check.
-            task_name (str): The name of the task being performed.
-            delete_port_channel_params (dict): Parameters for the delete port channel operation.
-            port_channels_list (list): List of port channels involved in the delete operation.
-        Returns:
-            dict: The status of the task retrieved using the task ID.
-        Description:
-            This method constructs a message indicating the successful completion of the delete port channels
-            operation. It then retrieves the task status using the provided task ID and logs the relevant information.
-        """
-        msg = "{0} operation has completed successfully for {1} port channels: {2}.".format(task_name, len(port_channels_list), ", ".join(port_channels_list))
+            port_channels_names.extend(
+                port_channel["portChannelName"] for port_channel in existing_port_channels
+                if set(port_channel["interfaceNames"]) in device_interfaces
+            )
 
-        # Retrieve the task status using the provided task ID and check the return status
-        self.get_task_status_from_tasks_by_id(task_id, task_name, msg).check_return_status()
-        return self.status
+        self.log("Names of port_channels that were successfully created: {0}".format(port_channels_names), "DEBUG")
+        return port_channels_names
 
     def process_delete_port_channels(self, delete_port_channels_params_list):
         """
@@ -3191,29 +3217,27 @@ class SDAHostPortOnboarding(DnacBase):
         Returns:
             self: Returns the instance with the updated operation result and message.
         Description:
-            This method processes the deletion of port channels by iterating over the provided parameters. It checks
-            if deletion is required for each port channel and performs the deletion if necessary. It logs the task ID,
-            status, and channels for which the deletion was successful, failed, or skipped. The method sets the final
-            message and operation result based on the status of the deletion tasks.
+            This method submits the deletion of every required port channel, up to 'max_concurrent_batches' at the
+            same time, and monitors all the resulting tasks together. It logs the channels for which the deletion was
+            successful or failed and sets the final message and operation result based on the status of the tasks.
         """
         task_name = "Delete Port Channel(s) Task"
         failed_channels = []
         success_channels = []
-        skipped_channels = []
         msg = {}
 
+        requests = []
         for index, delete_port_channel_param in delete_port_channels_params_list.items():
-            channel_list = delete_port_channel_param.get("port_channels_list")
             self.log("Processing - index: {0}, delete_port_channel_param: {1}".format(index, delete_port_channel_param), "DEBUG")
+            channel_list = delete_port_channel_param.get("port_channels_list")
+            requests.append(("delete_port_channels", task_name, delete_port_channel_param.get("delete_port_channel_params"), channel_list))
 
-            task_id = self.delete_port_channels(delete_port_channel_param.get("delete_port_channel_params"))
-            self.log("Task ID: {0}".format(task_id), "DEBUG")
-            status = self.get_delete_port_channels_task_status(task_id, task_name, channel_list)
-
-            if status == "success":
-                success_channels.extend(channel_list)
-            else:
+        errors = self.process_port_requests(requests)
+        for (api_function, task_name, api_params, channel_list), error in zip(requests, errors):
+            if error:
                 failed_channels.extend(channel_list)
+            else:
+                success_channels.extend(channel_list)
 
         if success_channels:
             self.log("{0} Succeeded for following port channel(s): {1} ".format(task_name, success_channels))
@@ -3751,6 +3775,9 @@ class SDAHostPortOnboarding(DnacBase):
         hostname = config.get("hostname")
 
         fabric_id = self.get_fabric_id(fabric_site_name_hierarchy)
+        if fabric_id not in self.fabric_device_counts:
+            self.fabric_device_counts[fabric_id] = self.get_fabric_device_count(fabric_site_name_hierarchy)
+
         have = {"fabric_id": fabric_id, "fabric_site_name_hierarchy": fabric_site_name_hierarchy}
 
         def update_network_details():
@@ -3985,19 +4012,21 @@ class SDAHostPortOnboarding(DnacBase):
         self.log("Starting 'get_diff_merged' operation.", "INFO")
         result_details = {}
 
+        port_action_map = {
+            "add_port_assignments_params": ("add_port_assignments", "Add Port Assignment(s) Task"),
+            "update_port_assignments_params": ("update_port_assignments", "Update Port Assignment(s) Task"),
+            "add_port_channels_params": ("add_port_channels", "Add Port Channel(s) Task"),
+            "update_port_channels_params": ("update_port_channels", "Update Port Channel(s) Task"),
+        }
         action_map = {
-            "add_port_assignments_params": (self.add_port_assignments, self.get_add_port_assignments_task_status),
-            "update_port_assignments_params": (self.update_port_assignments, self.get_update_port_assignments_task_status),
-            "add_port_channels_params": (self.add_port_channels, self.get_add_port_channels_task_status),
-            "update_port_channels_params": (self.update_port_channels, self.get_update_port_channels_task_status),
             "create_update_vlans_and_ssids_mapped_to_vlans_params": (
                 self.create_update_remove_vlans_and_ssids_mapped_to_vlans,
                 self.get_create_update_vlans_and_ssids_mapped_to_vlans_task_status
             )
         }
 
-        # Check if all action_map keys are missing in self.want
-        if not any(action_param in self.want for action_param in action_map.keys()):
+        # Check if all action keys are missing in self.want
+        if not any(self.want.get(action_param) for action_param in list(port_action_map) + list(action_map)):
             self.msg = "Host Onboarding(Add/Update) operation(s) are not required for the provided input parameters in the Cisco Catalyst Center."
             self.set_operation_result("ok", False, self.msg, "INFO")
             return self
@@ -4005,6 +4034,12 @@ class SDAHostPortOnboarding(DnacBase):
         final_status_list = []
         result_details = {}
 
+        if any(self.want.get(action_param) for action_param in port_action_map):
+            # Submit the port assignments and port channels in batches and track all their tasks together
+            self.process_port_batches(port_action_map).check_return_status()
+            result_details.update(self.msg)
+            final_status_list.append(self.status)
+
         for action_param, (action_func, status_func) in action_map.items():
             # Execute the action and check its status
             req_action_param = self.want.get(action_param)
@@ -4195,7 +4230,9 @@ def main():
         "dnac_api_task_timeout": {"type": "int", "default": 1200},
         "dnac_task_poll_interval": {"type": "int", "default": 2},
         "config": {"required": True, "type": "list", "elements": "dict"},
-        "state": {"default": "merged", "choices": ["merged", "deleted"]}
+        "state": {"default": "merged", "choices": ["merged", "deleted"]},
+        "port_batch_size": {"type": "int", "default": 100},
+        "max_concurrent_batches": {"type": "int", "default": 5}
     }
 
     # Initialize the Ansible module with the provided argument specifications
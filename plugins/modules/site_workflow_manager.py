@@ -38,6 +38,25 @@ options:
     type: str
     choices: [merged, deleted]
     default: merged
+  site_creation_batch_size:
+    description:
+      - Maximum number of sites sent in a single bulk site creation request.
+      - Sites are created in hierarchy order, areas first, then buildings and then floors,
+        so that the parent of every site exists before its own batch is sent.
+      - Must be at least 1.
+      - Applicable only for Catalyst Center version 2.3.7.6 and later.
+    type: int
+    default: 100
+    version_added: 6.32.0
+  max_concurrent_requests:
+    description:
+      - Maximum number of building/floor updates and floor image uploads processed at the same time.
+      - Set to 1 to process them one after the other.
+      - Must be at least 1.
+      - Applicable only for Catalyst Center version 2.3.7.6 and later.
+    type: int
+    default: 5
+    version_added: 6.32.0
   config:
     description: It represents a list of details for creating/managing/deleting sites, including areas, buildings, and floors.
     type: list
@@ -165,6 +184,8 @@ notes:
     site.Sites.delete_a_building
     site.Sites.delete_an_area
     site.Sites.get_site_assigned_network_devices
+    site_design.Site_design.get_sites
+    site_design.Site_design.uploads_floor_image
 
   - Paths used are
     POST /dna/intent/api/v1/site,
@@ -343,6 +364,36 @@ EXAMPLES = r"""
                 force_upload_floor_image: True
           type: floor
 
+- name: Create a large site hierarchy in batches of 50 sites
+  cisco.dnac.site_workflow_manager:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log: True
+    dnac_log_level: DEBUG
+    state: merged
+    site_creation_batch_size: 50
+    max_concurrent_requests: 10
+    config:
+        - site:
+            area:
+                name: bangalore99
+                parent_name: Global
+          type: area
+        - site:
+            building:
+                name: s1
+                address: 1234 Elm Street3
+                parent_name: Global/bangalore99
+                latitude: 37.373
+                longitude: -121.873
+                country: india
+          type: building
+
 """
 
 RETURN = r"""
@@ -478,6 +529,7 @@ class Site(DnacBase):
         self.deleted_site_list, self.site_absent_list = [], []
         self.keymap = {}
         self.handle_config = {}
+        self.site_tree = None
 
     def validate_input(self):
         """
@@ -498,6 +550,13 @@ class Site(DnacBase):
             'self.msg' will describe the validation issues.
         """
 
+        for batch_param in ("site_creation_batch_size", "max_concurrent_requests"):
+            batch_value = self.params.get(batch_param)
+            if batch_value is not None and batch_value < 1:
+                self.msg = "'{0}' must be at least 1 but passed {1}".format(batch_param, batch_value)
+                self.set_operation_result("failed", False, self.msg, "ERROR")
+                return self
+
         if not self.config:
             self.status = "success"
             self.msg = "Configuration is not available in the playbook for validation"
@@ -654,30 +713,15 @@ class Site(DnacBase):
         current_site = {}
 
         if self.compare_dnac_versions(self.get_ccc_version(), "2.3.7.6") >= 0:
-            sites = None
-            response = self.get_site(site_name_hierarchy)
-            self.log("Raw response from get_site: {}".format(response), "DEBUG")
-
-            if not response:
-                self.log("Unexpected response received:", "ERROR")
+            site = self.get_site_from_tree(site_name_hierarchy)
+            if not site:
+                self.log("No site information found for name: {0}".format(site_name_hierarchy), "WARNING")
                 return site_exists, current_site
 
-            if isinstance(response, list):
-                self.log("Unexpected list returned from get_site, skipping: {}".format(response), "ERROR")
-                return site_exists, current_site
-
-            if isinstance(response, dict):
-                sites = response.get("response", [])
-                if not sites:
-                    self.log("No site information found: {0}".format(response), "WARNING")
-                    return site_exists, current_site
-
-                for site in sites:
-                    if isinstance(site, dict):
-                        self.log("No site information found for name: {0}".format(site), "INFO")
-                        current_site = dict(site.items())
-                        current_site['parentName'] = site.get('nameHierarchy', '').rsplit('/', 1)[0] if site.get('nameHierarchy') else None
-                        site_exists = True
+            self.log("Site information found for name '{0}': {1}".format(site_name_hierarchy, site), "INFO")
+            current_site = dict(site.items())
+            current_site['parentName'] = site.get('nameHierarchy', '').rsplit('/', 1)[0] if site.get('nameHierarchy') else None
+            site_exists = True
 
         else:
             site_name_hierarchy = self.want.get("site_name_hierarchy")
@@ -699,6 +743,40 @@ class Site(DnacBase):
 
         return site_exists, current_site
 
+    def load_site_tree(self):
+        """
+        Load every site of Cisco Catalyst Center into a snapshot keyed by the site name hierarchy.
+
+        Returns:
+        - dict: The site details keyed by 'nameHierarchy'.
+
+        Description:
+        The whole hierarchy is retrieved with a single paginated 'get_sites' walk, so the existence checks and
+        parent lookups of all the sites in the playbook are answered from memory instead of one 'get_sites'
+        call per site. The snapshot is reloaded on every call and dropped after sites are created.
+        """
+        self.site_tree = {}
+        for site in self.get_paginated_response("site_design", "get_sites"):
+            self.site_tree[site.get("nameHierarchy")] = site
+
+        self.log("Loaded {0} site(s) into the site tree snapshot.".format(len(self.site_tree)), "DEBUG")
+        return self.site_tree
+
+    def get_site_from_tree(self, site_name_hierarchy):
+        """
+        Look up a site in the site tree snapshot, loading the snapshot first if it is not available.
+
+        Parameters:
+        - site_name_hierarchy (str): The name hierarchy of the site.
+
+        Returns:
+        - dict or None: The site details if the site exists, otherwise None.
+        """
+        if self.site_tree is None:
+            self.load_site_tree()
+
+        return self.site_tree.get(site_name_hierarchy)
+
     def get_parent_id(self, parent_name):
         """
         Retrieve the ID of the parent site in Cisco Catalyst Center.
@@ -720,12 +798,11 @@ class Site(DnacBase):
         self.log("Starting retrieval of parent site ID for site name: '{}'".format(parent_name), "DEBUG")
 
         try:
-            parent_response = self.get_site(parent_name)
-            parent_response = parent_response.get("response")
-            if not parent_response:
+            parent_site = self.get_site_from_tree(parent_name)
+            if not parent_site:
                 self.log("No data found for site '{}'. Site does not exist.".format(parent_name), "INFO")
                 return None
-            parent_id = parent_response[0].get("id")
+            parent_id = parent_site.get("id")
             if parent_id:
                 self.log("Parent site ID for site '{}' successfully retrieved: {}".format(parent_name, parent_id), "DEBUG")
             else:
@@ -1032,6 +1109,8 @@ class Site(DnacBase):
                 self.handle_config['area'] = []
                 self.handle_config['building'] = []
                 self.handle_config['floor'] = []
+                # Diff the whole requested hierarchy against a single snapshot of the site tree
+                self.load_site_tree()
                 for each_config in config:
                     try:
                         have = {
@@ -1041,31 +1120,17 @@ class Site(DnacBase):
                             "site_exists": False
                         }
 
-                        response = self.get_site(have["site_name_hierarchy"])
-                        self.log("Raw response from get_site: {}".format(response), "DEBUG")
-
-                        if not response:
-                            self.log("Unexpected response received:", "ERROR")
+                        site = self.get_site_from_tree(have["site_name_hierarchy"])
+                        if not site:
+                            self.log("Site '{0}' not found in the site tree snapshot.".format(have["site_name_hierarchy"]), "DEBUG")
                             self.handle_config["create_site"].append(have)
                             self.handle_config["have"].append(have)
                             continue
 
-                        if isinstance(response, list):
-                            self.log("Unexpected list returned from get_site, skipping: {}".format(response), "ERROR")
-                            continue
-
-                        if isinstance(response, dict):
-                            sites = response.get("response", [])
-                            if not sites:
-                                self.log("No site information found for name: {0}".format(have["site_name_hierarchy"]), "WARNING")
-                                continue
-
-                            for site in sites:
-                                if isinstance(site, dict):
-                                    self.log("site information found: {0}".format(site), "INFO")
-                                    current_site = dict(site.items())
-                                    current_site['parentName'] = site.get('nameHierarchy', '').rsplit('/', 1)[0] if site.get('nameHierarchy') else None
-                                    site_exists = True
+                        self.log("site information found: {0}".format(site), "INFO")
+                        current_site = dict(site.items())
+                        current_site['parentName'] = site.get('nameHierarchy', '').rsplit('/', 1)[0] if site.get('nameHierarchy') else None
+                        site_exists = True
 
                         have["site_exists"] = site_exists
                         have["current_site"] = current_site
@@ -1352,18 +1417,18 @@ class Site(DnacBase):
         self.status = "success"
         return self
 
-    def update_floor(self, site_params, config):
+    def get_floor_update_params(self, site_params, config):
         """
-        Updates a floor in the site hierarchy using the provided site parameters.
+        Builds the payload of the 'updates_a_floor' request from the provided site parameters.
 
         Parameters:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
             site_params (dict): Dictionary containing parameters required for the floor update, including the site_id.
+            config (dict): The floor configuration holding the 'unitsOfMeasure' to apply.
 
         Returns:
-            dict: The API response from the 'updates_a_floor' operation or None if an exception occurs.
+            dict: The floor parameters of the update request or None if the parent site cannot be found.
         """
-        response = None
         units_of_measure = ["feet", "meters"]
         rf_model = [
             "Free Space",
@@ -1372,39 +1437,54 @@ class Site(DnacBase):
             "Indoor High Ceiling",
             "Drywall Office Only"
         ]
-        try:
-            self.log("Updating floor with parameters: {0}".format(site_params), "INFO")
-            parent_name = site_params.get("site", {}).get("floor", {}).get("parentName")
-            if not parent_name:
-                self.log("Parent name is missing in the site parameters.", "ERROR")
-                return None
-            parent_id = self.get_parent_id(parent_name)
-            if not parent_id:
-                self.log("Failed to retrieve parent ID for parent name: '{}'".format(parent_name), "ERROR")
-                return None
-            site_params['site']['floor']['parentId'] = parent_id
-            self.log("Retrieved parent ID: '{}' for parent name: '{}'".format(parent_id, parent_name), "DEBUG")
+        self.log("Updating floor with parameters: {0}".format(site_params), "INFO")
+        parent_name = site_params.get("site", {}).get("floor", {}).get("parentName")
+        if not parent_name:
+            self.log("Parent name is missing in the site parameters.", "ERROR")
+            return None
+        parent_id = self.get_parent_id(parent_name)
+        if not parent_id:
+            self.log("Failed to retrieve parent ID for parent name: '{}'".format(parent_name), "ERROR")
+            return None
+        site_params['site']['floor']['parentId'] = parent_id
+        self.log("Retrieved parent ID: '{}' for parent name: '{}'".format(parent_id, parent_name), "DEBUG")
 
-            units_of_measure_value = config.get("unitsOfMeasure")
-            if units_of_measure_value not in units_of_measure:
-                error_msg = "Given Unit of Measure: {} not in allowed units: {}".format(units_of_measure_value, units_of_measure)
-                self.module.fail_json(msg=error_msg)
-            else:
-                site_params['site']['floor']['unitsOfMeasure'] = units_of_measure_value
-                self.log("Set 'units of measure' to: {}".format(units_of_measure_value), "DEBUG")
+        units_of_measure_value = config.get("unitsOfMeasure")
+        if units_of_measure_value not in units_of_measure:
+            error_msg = "Given Unit of Measure: {} not in allowed units: {}".format(units_of_measure_value, units_of_measure)
+            self.module.fail_json(msg=error_msg)
+        else:
+            site_params['site']['floor']['unitsOfMeasure'] = units_of_measure_value
+            self.log("Set 'units of measure' to: {}".format(units_of_measure_value), "DEBUG")
 
-            rf_model_value = site_params.get('site', {}).get('floor', {}).get('rfModel')
-            if rf_model_value not in rf_model:
-                error_msg = "Given RF Model: {} not in valid models: {}".format(rf_model_value, rf_model)
-                self.module.fail_json(msg=error_msg)
-            else:
-                self.log("Validated 'RF Model' as: {}".format(rf_model_value), "DEBUG")
+        rf_model_value = site_params.get('site', {}).get('floor', {}).get('rfModel')
+        if rf_model_value not in rf_model:
+            error_msg = "Given RF Model: {} not in valid models: {}".format(rf_model_value, rf_model)
+            self.module.fail_json(msg=error_msg)
+        else:
+            self.log("Validated 'RF Model' as: {}".format(rf_model_value), "DEBUG")
+
+        self.log("Updated site_params with parent_id: {0}".format(site_params), "INFO")
+        floor_param = site_params.get('site', {}).get('floor')
+        floor_param['id'] = site_params.get("site_id")
+        return floor_param
+
+    def update_floor(self, site_params, config):
+        """
+        Updates a floor in the site hierarchy using the provided site parameters.
+
+        Parameters:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            site_params (dict): Dictionary containing parameters required for the floor update, including the site_id.
 
-            self.log("Updated site_params with parent_id: {0}".format(site_params), "INFO")
-            floor_param = site_params.get('site', {}).get('floor')
-            site_params['site']['floor']['parentId'] = parent_id
-            site_id = site_params.get("site_id")
-            floor_param['id'] = site_id
+        Returns:
+            dict: The API response from the 'updates_a_floor' operation or None if an exception occurs.
+        """
+        response = None
+        try:
+            floor_param = self.get_floor_update_params(site_params, config)
+            if not floor_param:
+                return None
 
             response = self.dnac._exec(
                 family="site_design",
@@ -1438,6 +1518,25 @@ class Site(DnacBase):
 
         return response
 
+    def get_building_update_params(self, site_params):
+        """
+        Builds the payload of the 'updates_a_building' request from the provided site parameters.
+
+        Args:
+            site_params (dict): Dictionary containing parameters required for the building update, including the site_id.
+
+        Returns:
+            dict: The building parameters of the update request.
+        """
+        self.log("Updating building with parameters: {0}".format(site_params), "INFO")
+        parent_name = site_params.get("site", {}).get("building", {}).get("parentName")
+        parent_id = self.get_parent_id(parent_name)
+        site_params['site']['building']['parentId'] = parent_id
+        self.log("Updated site_params with parent_id: {0}".format(site_params), "INFO")
+        building_param = site_params.get('site', {}).get('building')
+        building_param['id'] = site_params.get("site_id")
+        return building_param
+
     def update_building(self, site_params):
         """
         Updates a building in the site hierarchy using the provided site id.
@@ -1450,14 +1549,7 @@ class Site(DnacBase):
         """
         response = None
         try:
-            self.log("Updating building with parameters: {0}".format(site_params), "INFO")
-            parent_name = site_params.get("site", {}).get("building", {}).get("parentName")
-            parent_id = self.get_parent_id(parent_name)
-            site_params['site']['building']['parentId'] = parent_id
-            self.log("Updated site_params with parent_id: {0}".format(site_params), "INFO")
-            building_param = site_params.get('site', {}).get('building')
-            site_id = site_params.get("site_id")
-            building_param['id'] = site_id
+            building_param = self.get_building_update_params(site_params)
 
             self.log("Before updating the building params:{0}".format(building_param), "INFO")
             response = self.dnac._exec(
@@ -1631,45 +1723,56 @@ class Site(DnacBase):
          Processes the bulk creation of sites in Cisco Catalyst Center and uploads floor maps for floor sites if specified.
 
         Args:
-            process_config (list): A list of dictionaries, where each dictionary contains details for creating a site.
+            process_config (list): A list of dictionaries, where each dictionary contains details for creating a site,
+                                   ordered so that every parent site comes before its children.
 
         Returns:
             bool: True if all sites were created successfully and floor maps (if applicable) were uploaded.
                   Returns False if the bulk site creation failed.
 
         Details:
-            - Calls `creating_bulk_site` to initiate the creation of multiple sites in Cisco Catalyst Center.
+            - Splits the sites into batches of 'site_creation_batch_size' and calls `creating_bulk_site` for each
+              batch in order, waiting for a batch to complete before sending the next one so that parents exist.
             - Logs detailed debug information about the creation process.
-            - If the creation is successful, logs the task ID and monitors the task status.
-            - For floor sites, attempts to upload the floor map if an upload path is provided.
+            - For floor sites with an upload path, uploads the floor maps concurrently once all sites are created.
             - If a floor map upload fails, logs an error message. If no upload path is provided, logs that no floor map was uploaded.
         """
-        self.log("Initiating bulk site creation for {0} sites.".format(
-            len(process_config)), "INFO")
-        response = self.creating_bulk_site(process_config)
-        self.log("Response from creating_bulk_site for {0}: {1}".
-                 format(process_config, response), "DEBUG")
+        batch_size = self.params.get("site_creation_batch_size")
+        self.log("Initiating bulk site creation for {0} sites in batches of {1}.".format(
+            len(process_config), batch_size), "INFO")
 
-        if not response or not isinstance(response, dict):
-            self.log("Invalid response received from creating_bulk_site.", "ERROR")
-            return False
+        for start in range(0, len(process_config), batch_size):
+            batch = process_config[start:start + batch_size]
+            response = self.creating_bulk_site(batch)
+            self.log("Response from creating_bulk_site for {0}: {1}".
+                     format(batch, response), "DEBUG")
 
-        task_id = response.get("response", {}).get("taskId")
-        if not task_id:
-            self.log("Failed to retrieve task ID for site creation.", "ERROR")
-            return False
+            if not response or not isinstance(response, dict):
+                self.log("Invalid response received from creating_bulk_site.", "ERROR")
+                return False
 
-        self.log("Task Id for the 'site_creation' task: {0}".format(task_id), "INFO")
+            task_id = response.get("response", {}).get("taskId")
+            if not task_id:
+                self.log("Failed to retrieve task ID for site creation.", "ERROR")
+                return False
 
-        task_name = "create_sites"
-        success_msg = "Site created successfully."
-        self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            self.log("Task Id for the 'site_creation' task: {0}".format(task_id), "INFO")
 
-        for site in process_config:
-            site_name = site.get("name")
-            if site_name:
-                self.created_site_list.append("{0}: {1}".format(site, site_name))
+            task_name = "create_sites"
+            success_msg = "Site created successfully."
+            self.get_task_status_from_tasks_by_id(task_id, task_name, success_msg)
+            if self.status != "success":
+                self.log("Bulk site creation failed for the sites {0}: {1}".format(
+                    [site.get("name") for site in batch], self.msg), "ERROR")
+                return False
+
+            for site in batch:
+                site_name = site.get("name")
+                if site_name:
+                    self.created_site_list.append("{0}: {1}".format(site, site_name))
 
+        # The snapshot no longer reflects the hierarchy once sites are created
+        self.site_tree = None
         self.log("List of successfully created sites: {0}".format(self.created_site_list), "DEBUG")
 
         if len(self.created_site_list) != len(process_config):
@@ -1681,30 +1784,213 @@ class Site(DnacBase):
                  "INFO")
 
         # Process floor sites if all sites were successfully created
+        floors_to_upload = []
         for site in process_config:
             if site.get("type") == "floor":
                 floor_name = site.get("name")
-                self.log("Processing floor site '{0}'.".format(floor_name), "INFO")
-
-                upload_path = site.get("upload_floor_image_path", None)
-                if upload_path:
-                    self.log("Uploading floor map for '{0}' from '{1}'.".
-                             format(floor_name, upload_path), "INFO")
-                    self.log("Upload path found for floor '{0}'. Starting upload floor map from '{1}.'".
-                             format(floor_name, upload_path), "INFO")
-                    map_details, map_status, success_message = self.upload_floor_image(site)
-                    if map_details:
-                        self.log("Floor map for '{0}' uploaded successfully: {1}".format(
-                            floor_name, success_message), "INFO")
-                    else:
-                        self.log("Floor map upload failed for '{0}'. Please check the upload path and retry.".
-                                 format(floor_name), "ERROR")
+                if site.get("upload_floor_image_path"):
+                    floors_to_upload.append(site)
                 else:
                     self.log("No upload path provided for '{0}'. Floor created without floor map.".
                              format(floor_name), "INFO")
+
+        if floors_to_upload:
+            self.validate_floor_images(floors_to_upload)
+            self.load_site_tree()
+            upload_results = self.execute_concurrently(self.upload_floor_image, floors_to_upload,
+                                                       self.params.get("max_concurrent_requests"))
+            for site, (map_status, error) in zip(floors_to_upload, upload_results):
+                if map_status:
+                    self.log("Floor map for '{0}' uploaded successfully: {1}".format(
+                        site.get("name"), map_status), "INFO")
+                else:
+                    self.log("Floor map upload failed for '{0}': {1}".format(site.get("name"), error), "ERROR")
+
         self.log("Bulk site creation process completed successfully.", "INFO")
         return True
 
+    def order_sites_for_creation(self):
+        """
+        Order the sites to be created so that every parent site is created before its children.
+
+        Returns:
+            list: The payloads of the areas, sorted by the depth of their parent, followed by the buildings and then the floors.
+        """
+        combined_config = []
+        for each_type in ("area", "building", "floor"):
+            combined_config.extend(sorted(
+                self.handle_config[each_type],
+                key=lambda site: str(site.get(self.keymap["parent_name_hierarchy"])).count("/")
+            ))
+
+        return combined_config
+
+    def submit_site_update(self, site_update):
+        """
+        Upload the floor image and send the update request of a single building or floor.
+
+        Args:
+            site_update (dict): The planned update with the keys 'new_site_config', 'force_upload',
+                                'requires_update', 'update_function' and 'update_params'.
+
+        Returns:
+            dict: 'image_uploaded' telling whether the floor image was uploaded, 'upload_error' with the reason of
+                  a failed upload, 'task_id' of the update task and 'error' with the reason the update request
+                  failed, or None when it was sent.
+
+        Description:
+            Called from the worker threads, so it only sends the prepared requests and returns the outcome to
+            the caller, which reports it and updates the module state.
+        """
+        result = {"image_uploaded": False, "upload_error": None, "task_id": None, "error": None}
+        new_site_config = site_update["new_site_config"]
+
+        if site_update["force_upload"]:
+            map_status, result["upload_error"] = self.upload_floor_image(new_site_config)
+            result["image_uploaded"] = bool(map_status)
+
+        if not site_update["requires_update"]:
+            return result
+
+        if not site_update["update_params"]:
+            result["error"] = "Failed to retrieve the parent site ID."
+            return result
+
+        try:
+            response = self.dnac._exec(
+                family="site_design",
+                function=site_update["update_function"],
+                op_modifies=True,
+                params=site_update["update_params"]
+            )
+            self.log("Received API response from '{0}': {1}".format(
+                site_update["update_function"], str(response)), "DEBUG")
+        except Exception as e:
+            result["error"] = str(e)
+            return result
+
+        if response and isinstance(response, dict):
+            result["task_id"] = response.get("response", {}).get("taskId")
+        if not result["task_id"]:
+            result["error"] = "No task ID returned in the response: {0}".format(response)
+
+        return result
+
+    def update_existing_sites(self):
+        """
+        Update the existing buildings and floors which differ from the playbook and upload the forced floor images.
+
+        Returns:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+
+        Description:
+            The sites requiring an update are found from the site tree snapshot. The update requests and the floor
+            image uploads are independent of each other, so up to 'max_concurrent_requests' of them are processed
+            at the same time and all the resulting update tasks are monitored together.
+        """
+        pending_updates = []
+        for each_config in self.have:
+            site_name_hierarchy = each_config.get("site_name_hierarchy")
+            if not each_config.get("site_exists"):
+                continue
+
+            self.log("Processing site: {}".format(site_name_hierarchy), "DEBUG")
+            new_site_config = self.change_payload_data(each_config.get("want"))
+            if new_site_config.get("type") == "area":
+                self.msg = "Site - {0} does not need any update".format(site_name_hierarchy)
+                self.log(self.msg, "INFO")
+                self.update_not_needed_sites.append(new_site_config.get("type") + ": " + site_name_hierarchy)
+                continue
+
+            if new_site_config.get("type") not in ("building", "floor"):
+                continue
+
+            site_params = each_config.get("site_params")
+            site_params["site_id"] = each_config.get("site_id")
+            site_type = site_params.get("type")
+            force_upload = bool(
+                site_type == "floor"
+                and site_params["site_id"]
+                and new_site_config.get("force_upload_floor_image")
+                and new_site_config.get("upload_floor_image_path")
+            )
+            requires_update = self.site_requires_update(each_config)
+
+            if not force_upload and not requires_update:
+                self.msg = "Site - {0} does not need any update".format(site_name_hierarchy)
+                self.log(self.msg, "INFO")
+                self.update_not_needed_sites.append(new_site_config.get("type") + ": " + site_name_hierarchy)
+                continue
+
+            self.log("Site '{0}' requires update: {1}, floor image upload: {2}".format(
+                site_name_hierarchy, requires_update, force_upload), "DEBUG")
+            pending_updates.append({
+                "site_name_hierarchy": site_name_hierarchy,
+                "site_params": site_params,
+                "new_site_config": new_site_config,
+                "force_upload": force_upload,
+                "requires_update": requires_update
+            })
+
+        if not pending_updates:
+            return self
+
+        self.validate_floor_images([site_update["new_site_config"] for site_update in pending_updates
+                                    if site_update["force_upload"]])
+        if self.site_tree is None:
+            self.load_site_tree()
+
+        for site_update in pending_updates:
+            site_update["update_function"] = site_update["update_params"] = None
+            if not site_update["requires_update"]:
+                continue
+            if site_update["site_params"].get("type") == "floor":
+                site_update["update_function"] = "updates_a_floor"
+                site_update["update_params"] = self.get_floor_update_params(
+                    site_update["site_params"], site_update["new_site_config"])
+            else:
+                site_update["update_function"] = "updates_a_building"
+                site_update["update_params"] = self.get_building_update_params(site_update["site_params"])
+
+        max_workers = self.params.get("max_concurrent_requests")
+        self.log("Processing {0} site update(s) with up to {1} concurrent request(s).".format(
+            len(pending_updates), max_workers), "INFO")
+        results = self.execute_concurrently(self.submit_site_update, pending_updates, max_workers)
+        task_results = self.wait_for_tasks([result["task_id"] for result in results if result["task_id"]],
+                                           "updated successfully", max_workers)
+
+        for site_update, result in zip(pending_updates, results):
+            site_name_hierarchy = site_update["site_name_hierarchy"]
+            site_type = site_update["site_params"].get("type")
+
+            if not site_update["requires_update"]:
+                if result["image_uploaded"]:
+                    self.msg = "Floor image updated for the Site : {0}".format(site_name_hierarchy)
+                    self.updated_site_list.append(site_type + ": " + site_name_hierarchy)
+                    self.log(self.msg, "INFO")
+                else:
+                    self.log("Floor map upload failed for '{0}': {1}".format(
+                        site_update["new_site_config"].get("name"), result["upload_error"]), "ERROR")
+                    self.msg = "Site - {0} does not need any update".format(site_name_hierarchy)
+                    self.update_not_needed_sites.append(site_type + ": " + site_name_hierarchy)
+                continue
+
+            if not result["task_id"]:
+                self.msg = "Unable to execute the update the site: {0} due to: {1}".format(
+                    site_name_hierarchy, result["error"])
+                self.log(self.msg, "INFO")
+                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+            task_details = task_results.get(result["task_id"], {})
+            if task_details.get("isError") or task_details.get("bapiError"):
+                msg = task_details.get("bapiError") or task_details.get("failureReason") or task_details.get("progress")
+                self.set_operation_result("failed", False, msg, "ERROR", task_details).check_return_status()
+
+            self.updated_site_list.append(site_type + ": " + site_name_hierarchy)
+            self.log("Site '{}' updated successfully.".format(site_name_hierarchy), "INFO")
+
+        return self
+
     def get_diff_merged(self, config):
         """
         Update/Create site information in Cisco Catalyst Center with fields
@@ -1753,94 +2039,13 @@ class Site(DnacBase):
                             self.msg = "Site not available in payload '{0}'.".format(payload_data)
                             self.fail_and_exit(self.msg)
 
-                    combined_config = []
-                    for each_type in ("area", "building", "floor"):
-                        if self.handle_config[each_type]:
-                            combined_config.extend(self.handle_config[each_type])
-
+                    combined_config = self.order_sites_for_creation()
                     if not self.process_bulk_site(combined_config):
                         site_name = payload_data.get(self.keymap["parent_name_hierarchy"])
                         self.msg = "Unable to proceed to create bulk site '{0}'.".format(site_name)
                         self.fail_and_exit(self.msg)
 
-                task_detail_list = []
-                for each_config in self.have:
-                    site_name_hierarchy = each_config.get("site_name_hierarchy")
-                    if each_config.get("site_exists"):
-                        self.log("Processing site: {}".format(site_name_hierarchy), "DEBUG")
-                        new_site_config = self.change_payload_data(each_config.get("want"))
-                        if new_site_config.get("type") == "area":
-                            self.msg = "Site - {0} does not need any update".format(site_name_hierarchy)
-                            self.log(self.msg, "INFO")
-                            self.update_not_needed_sites.append(new_site_config.get("type") + ": " + site_name_hierarchy)
-                        elif new_site_config.get("type") in ("building", "floor"):
-                            site_params = each_config.get("site_params")
-                            site_params["site_id"] = each_config.get("site_id")
-                            site_type = site_params.get("type")
-                            force_upload_image_state = False
-
-                            if (
-                                site_type == "floor"
-                                and site_params["site_id"]
-                                and new_site_config.get("force_upload_floor_image")
-                                and new_site_config.get("upload_floor_image_path")
-                            ):
-                                map_details, map_status, success_message = self.upload_floor_image(new_site_config)
-
-                                if map_details:
-                                    self.log("Floor map for '{0}' uploaded successfully: {1}".
-                                             format(new_site_config.get("name"), success_message), "INFO")
-                                    force_upload_image_state = True
-                                else:
-                                    self.log("Floor map upload failed for '{0}'. Please check the upload path and retry.".
-                                             format(new_site_config.get("name")), "ERROR")
-
-                            if self.site_requires_update(each_config):
-
-                                self.log("Site requires update, starting update for type: {}".format(site_type), "DEBUG")
-                                response = (self.update_floor(site_params, new_site_config) if site_type == "floor"
-                                            else self.update_area(site_params) if site_type == "area"
-                                            else self.update_building(site_params) if site_type == "building"
-                                            else self.log("Unknown site type: {0}".format(site_type), "ERROR"))
-
-                                self.log("Received API response from 'update_site': {0}".
-                                         format(str(response)), "DEBUG")
-
-                                if response and isinstance(response, dict):
-                                    taskid = response["response"]["taskId"]
-
-                                    while True:
-                                        task_details = self.get_task_details(taskid)
-                                        if site_type != "floor":
-                                            if task_details.get("progress") == "Group is updated successfully":
-                                                task_detail_list.append(task_details)
-                                                self.updated_site_list.append(site_type + ": " + site_name_hierarchy)
-                                                self.log("Site '{}' updated successfully.".format(site_name_hierarchy), "INFO")
-                                                break
-                                        else:
-                                            if task_details.get("progress") == "Service domain is updated successfully.":
-                                                task_detail_list.append(task_details)
-                                                self.updated_site_list.append(site_type + ": " + site_name_hierarchy)
-                                                break
-
-                                        if task_details.get("bapiError"):
-                                            msg = task_details.get("bapiError")
-                                            self.set_operation_result("failed", False, msg, "ERROR",
-                                                                      task_details).check_return_status()
-                                            break
-                                else:
-                                    self.msg = "Unable to execute the update the site: {0} ".format(site_name_hierarchy)
-                                    self.log(self.msg, "INFO")
-                                    self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
-                            else:
-                                self.msg = "Site - {0} does not need any update".format(site_name_hierarchy)
-                                if force_upload_image_state:
-                                    self.msg = "Floor image updated for the Site : {0}".format(site_name_hierarchy)
-                                    self.updated_site_list.append(site_type + ": " + site_name_hierarchy)
-                                    self.log(self.msg, "INFO")
-                                else:
-                                    self.log(self.msg, "INFO")
-                                    self.update_not_needed_sites.append(new_site_config.get("type") + ": " + site_name_hierarchy)
+                self.update_existing_sites()
             except Exception as e:
                 self.log("Yaml is not available for bulk: {}".format(str(e)), "ERROR")
 
@@ -2529,118 +2734,134 @@ class Site(DnacBase):
 
         return self
 
-    def upload_floor_image(self, config):
+    def validate_floor_image_path(self, file_path):
         """
-        Upload a floor image to the Cisco Catalyst Center.
+        Validate the path and the format of a floor image.
 
         Args:
             self (object): An instance of a class used for interacting with Cisco Catalyst Center.
-            config (dict): A dictionary containing configuration details, including the file path for the floor image.
+            file_path (str): The path of the floor image given in 'upload_floor_image_path'.
 
         Returns:
             tuple: A tuple containing:
-                - map_details (bool): Indicates if the upload was successful.
-                - map_status (dict or None): Contains the upload status if successful; otherwise None.
-                - success_message (str or None): A success message if upload was successful; otherwise None.
+                - content_type (str or None): The content type of the image when the path is valid; otherwise None.
+                - error (str or None): The reason the path is not valid; otherwise None.
+        """
+        if not isinstance(file_path, str) or not file_path:
+            return None, "Invalid file path format. It must be a non-empty string."
+
+        if not os.path.exists(file_path):
+            return None, "File path does not exist: {0}".format(file_path)
+
+        content_types = {
+            '.png': 'image/png',
+            '.jpg': 'image/jpeg',
+            '.jpeg': 'image/jpeg',
+            '.pdf': 'application/pdf'
+        }
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in content_types:
+            return None, "Unsupported file format. Supported formats: {0}".format(", ".join(content_types))
+
+        return content_types[extension], None
+
+    def validate_floor_images(self, site_configs):
+        """
+        Validate the floor images of all the given floors before any of them is uploaded.
+
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            site_configs (list): The floor configurations holding 'upload_floor_image_path'.
+
+        Returns:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
 
         Description:
-            This method uploads a specified floor image by validating the file path, ensuring the file exists,
-            determining the content type, reading the file content, and invoking the appropriate API to upload the image.
-            It logs the success or failure of the upload operation.
+            The uploads run in worker threads which must not end the module, so the paths are checked here first
+            and the operation fails with every invalid path before any request is sent.
         """
-        map_details = None
-        map_status = None
-        response = None
-        success_message = None
-        content_type = None
+        errors = []
+        for config in site_configs:
+            content_type, error = self.validate_floor_image_path(config.get("upload_floor_image_path"))
+            if error:
+                errors.append("Floor '{0}': {1}".format(config.get("name"), error))
 
-        try:
-            self.log("Starting upload_floor_image function", "DEBUG")
-            file_path = config.get('upload_floor_image_path')
-            self.log("File path extracted from config: {}".format(file_path), "DEBUG")
+        if errors:
+            self.msg = "Invalid floor image(s): {0}".format("; ".join(errors))
+            self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+
+        return self
+
+    def upload_floor_image(self, config):
+        """
+        Upload a floor image to the Cisco Catalyst Center.
 
-            if not isinstance(file_path, str) or not file_path:
-                msg = "Invalid file path format. It must be a non-empty string."
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
-            if not os.path.exists(file_path):
-                msg = "File path does not exist: {0}".format(file_path)
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+        Args:
+            self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            config (dict): A dictionary containing configuration details, including the file path for the floor image.
 
-            self.log("File path exists: {0}".format(file_path), "DEBUG")
+        Returns:
+            tuple: A tuple containing:
+                - map_status (dict or None): The upload response if the upload was successful; otherwise None.
+                - error (str or None): The reason of the failure if the upload failed; otherwise None.
 
-            valid_extensions = ['.png', '.jpg', '.jpeg', '.pdf']
-            if not any(file_path.lower().endswith(ext) for ext in valid_extensions):
-                msg = "Unsupported file format. Supported formats: {0}".format(", ".join(valid_extensions))
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+        Description:
+            This method uploads a specified floor image by validating the file path, determining the content
+            type, reading the file content, and invoking the appropriate API to upload the image. It is called
+            from worker threads, so the outcome is returned to the caller which reports it.
+        """
+        self.log("Starting upload_floor_image function", "DEBUG")
+        file_path = config.get('upload_floor_image_path')
+        self.log("File path extracted from config: {}".format(file_path), "DEBUG")
 
-            if file_path.lower().endswith('.png'):
-                content_type = 'image/png'
-            elif file_path.lower().endswith('.jpg') or file_path.lower().endswith('.jpeg'):
-                content_type = 'image/jpeg'
-            elif file_path.lower().endswith('.pdf'):
-                content_type = 'application/pdf'
+        content_type, error = self.validate_floor_image_path(file_path)
+        if error:
+            return None, error
 
-            self.log("Determined content type: {}".format(content_type), "DEBUG")
+        self.log("Determined content type: {}".format(content_type), "DEBUG")
 
-            try:
-                with open(file_path, "rb") as image_file:
-                    file_content = image_file.read()
-            except IOError as e:
-                msg = "Failed to read file at {0}: {1}".format(file_path, str(e))
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
-
-            multipart_fields = {
-                'image': (os.path.basename(file_path), file_content, content_type)
-            }
+        try:
+            with open(file_path, "rb") as image_file:
+                file_content = image_file.read()
+        except IOError as e:
+            return None, "Failed to read file at {0}: {1}".format(file_path, str(e))
 
-            site_hierarchy = config.get(self.keymap["parent_name_hierarchy"], "parent_name_hierarchy") + "/" + str(config.get('name'))
-            if config.get(self.keymap["parent_name"]):
-                site_hierarchy = str(config.get(self.keymap["parent_name"])) + "/" + str(config.get('name'))
+        multipart_fields = {
+            'image': (os.path.basename(file_path), file_content, content_type)
+        }
 
-            site_exists, current_site = self.site_exists(site_hierarchy)
-            site_id = current_site.get("id")
-            if not site_id:
-                msg = "No valid Site found for the site hierarchy {0}".format(site_hierarchy)
-                self.set_operation_result("failed", False, msg, "ERROR").check_return_status()
+        site_hierarchy = config.get(self.keymap["parent_name_hierarchy"], "parent_name_hierarchy") + "/" + str(config.get('name'))
+        if config.get(self.keymap["parent_name"]):
+            site_hierarchy = str(config.get(self.keymap["parent_name"])) + "/" + str(config.get('name'))
 
-            try:
-                response = self.dnac._exec(
-                    family="site_design",
-                    function="uploads_floor_image",
-                    op_modifies=True,
-                    params={
-                        "id": site_id,
-                        "multipart_fields": multipart_fields,
-                        "multipart_monitor_callback": None
-                    }
-                )
-                if response is None:
-                    self.log("No response received from the API.", "ERROR")
-                else:
-                    self.log("API response: {}".format(response), "DEBUG")
-            except Exception as e:
-                self.msg = "An exception occurred during uploads_floor_image API execution: {0}".format(str(e))
-                self.log(self.msg, "ERROR")
-                self.set_operation_result("failed", False, self.msg, "ERROR").check_return_status()
+        site_exists, current_site = self.site_exists(site_hierarchy)
+        site_id = current_site.get("id")
+        if not site_id:
+            return None, "No valid Site found for the site hierarchy {0}".format(site_hierarchy)
 
+        try:
+            response = self.dnac._exec(
+                family="site_design",
+                function="uploads_floor_image",
+                op_modifies=True,
+                params={
+                    "id": site_id,
+                    "multipart_fields": multipart_fields,
+                    "multipart_monitor_callback": None
+                }
+            )
         except Exception as e:
-            self.msg = "An exception occurred: {}".format(str(e))
-            self.set_operation_result("failed", False, self.msg, "ERROR")
-            return None, None, None
+            return None, "An exception occurred during uploads_floor_image API execution: {0}".format(str(e))
 
         if not response:
-            self.msg = "Failed to upload floor image: No response from the API."
-            self.set_operation_result("failed", False, self.msg, "ERROR")
-        if isinstance(response, dict) and "id" in response:
-            self.log("Received valid API response: {}".format(response), "DEBUG")
-            map_details = True
-            map_status = response
-            success_message = "Floor image uploaded successfully."
-            self.log(success_message, "INFO")
-        else:
+            return None, "Failed to upload floor image: No response from the API."
+
+        if not isinstance(response, dict) or "id" not in response:
             self.log("Invalid response received from API. Response: {}".format(response), "ERROR")
+            return None, "Failed to upload floor image: Invalid response from the API."
 
-        return map_details, map_status, success_message
+        self.log("Floor image uploaded successfully: {}".format(response), "INFO")
+        return response, None
 
 
 def main():
@@ -2662,7 +2883,9 @@ def main():
                     'dnac_api_task_timeout': {'type': 'int', "default": 1200},
                     'dnac_task_poll_interval': {'type': 'int', "default": 2},
                     'config': {'required': True, 'type': 'list', 'elements': 'dict'},
-                    'state': {'default': 'merged', 'choices': ['merged', 'deleted']}
+                    'state': {'default': 'merged', 'choices': ['merged', 'deleted']},
+                    'site_creation_batch_size': {'type': 'int', 'default': 100},
+                    'max_concurrent_requests': {'type': 'int', 'default': 5}
                     }
 
     module = AnsibleModule(argument_spec=element_spec,
@@ -416,10 +416,30 @@ options:
               template_name:
                 description: Name of the template which we need to be exported.
                 type: str
+          export_directory:
+            description:
+              - Path of the directory where the exported projects and templates are written, one JSON file per project.
+              - Projects are written to '<project_name>.json' and templates to '<project_name>_templates.json'.
+              - The export fails for project names which cannot be used as a file name in the directory, such as names containing a path separator.
+              - When provided, the module result carries the paths of the written files instead of the exported content.
+            type: str
+            version_added: 6.32.0
+          max_concurrent_requests:
+            description: Maximum number of projects exported at the same time when 'export_directory' is provided.
+            type: int
+            default: 5
+            version_added: 6.32.0
       import:
-        description: Perform import on the projects and templates.
+        description:
+          - Perform import on the projects and templates.
+          - Templates whose content matches the content of the same template in Cisco Catalyst Center are not imported again.
         type: dict
         suboptions:
+          max_concurrent_requests:
+            description: Maximum number of projects uploaded at the same time.
+            type: int
+            default: 5
+            version_added: 6.32.0
           project:
             description: Import the projects.
             type: dict
@@ -436,6 +456,14 @@ options:
                   - If both 'project_file' and 'payload' are provided, the 'project_file' will be given priority.
                 type: str
                 version_added: 6.17.0
+              project_directory:
+                description:
+                  - Path of a directory containing JSON project files, such as the files written by 'export_directory'.
+                  - Every project found in the files is uploaded separately, and the files are read incrementally.
+                  - Files ending with '_templates.json', which hold the templates written by 'export_directory', are skipped.
+                  - Ignored if 'project_file' is also provided.
+                type: str
+                version_added: 6.32.0
               payload:
                 description:
                   - Directly imports configuration data into the system using the provided payload.
@@ -1004,6 +1032,26 @@ EXAMPLES = r"""
           - string
           - string
 
+- name: Export the projects to one JSON file per project.
+  cisco.dnac.template_workflow_manager:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log: True
+    dnac_log_level: "{{dnac_log_level}}"
+    state: merged
+    config:
+      export:
+        export_directory: /tmp/template_export
+        max_concurrent_requests: 5
+        project:
+          - string
+          - string
+
 - name: Export the templates.
   cisco.dnac.template_workflow_manager:
     dnac_host: "{{dnac_host}}"
@@ -1046,6 +1094,25 @@ EXAMPLES = r"""
           - name: string
           - name: string
 
+- name: Import the Projects from the JSON files of a directory.
+  cisco.dnac.template_workflow_manager:
+    dnac_host: "{{dnac_host}}"
+    dnac_username: "{{dnac_username}}"
+    dnac_password: "{{dnac_password}}"
+    dnac_verify: "{{dnac_verify}}"
+    dnac_port: "{{dnac_port}}"
+    dnac_version: "{{dnac_version}}"
+    dnac_debug: "{{dnac_debug}}"
+    dnac_log: True
+    dnac_log_level: "{{dnac_log_level}}"
+    state: merged
+    config:
+      import:
+        max_concurrent_requests: 5
+        project:
+          do_version: true
+          project_directory: /tmp/template_export
+
 - name: Import the Templates.
   cisco.dnac.template_workflow_manager:
     dnac_host: "{{dnac_host}}"
@@ -1214,7 +1281,9 @@ response_5:
 """
 
 import copy
+import hashlib
 import json
+import os
 import time
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
@@ -1236,6 +1305,9 @@ class Template(DnacBase):
         self.accepted_languages = ["JINJA", "VELOCITY"]
         self.export_template = []
         self.max_timeout = self.params.get('dnac_api_task_timeout')
+        self.template_catalog = None
+        self.stale_catalog_projects = set()
+        self.template_content_hashes = {}
         self.result['response'] = [
             {"configurationTemplate": {"response": {}, "msg": {}}},
             {"export": {"response": {}}},
@@ -1327,6 +1399,8 @@ class Template(DnacBase):
             },
             'export': {
                 'type': 'dict',
+                'export_directory': {'type': 'str'},
+                'max_concurrent_requests': {'type': 'int', 'default': 5},
                 'project': {'type': 'list', 'elements': 'str'},
                 'template': {
                     'type': 'list',
@@ -1337,9 +1411,11 @@ class Template(DnacBase):
             },
             'import': {
                 'type': 'dict',
+                'max_concurrent_requests': {'type': 'int', 'default': 5},
                 'project': {
                     'type': 'dict',
                     'project_file': {'type': 'str'},
+                    'project_directory': {'type': 'str'},
                     'do_version': {'type': 'str', 'default': 'False'},
                 },
                 'template': {
@@ -1640,6 +1716,175 @@ class Template(DnacBase):
 
         return templateParams
 
+    def get_all_projects(self, project_name=None):
+        """
+        Get the details of all the projects, or of the projects matching the given name, from Cisco Catalyst Center.
+
+        Parameters:
+            project_name (str) - Name of the project to filter on. All the projects are returned when not provided.
+
+        Returns:
+            projects (list) - Project details, each carrying the list of templates under the project.
+        """
+
+        self.log("Retrieving project details from Cisco Catalyst Center for project: {0}".format(project_name), "DEBUG")
+        ccc_version = self.get_ccc_version()
+        params = {}
+        if project_name:
+            params["name"] = project_name
+
+        if self.compare_dnac_versions(ccc_version, "2.3.7.9") < 0:
+            items = self.dnac_apply['exec'](
+                family="configuration_templates",
+                function='get_projects',
+                op_modifies=True,
+                params=params,
+            )
+            self.log("Received Response from get_projects for project: {0} when catalyst version is less than 2.3.7.9: {1}"
+                     .format(project_name, items), "DEBUG")
+            return items or []
+
+        projects = []
+        limit = 500
+        offset = 1
+        while True:
+            params.update({"offset": offset, "limit": limit})
+            items = self.dnac_apply['exec'](
+                family="configuration_templates",
+                function='get_projects_details_v2',
+                op_modifies=True,
+                params=params,
+            )
+            self.log("Received Response from get_projects_details_v2 for project: {0} at offset {1}: {2}"
+                     .format(project_name, offset, items), "DEBUG")
+            page = (items or {}).get("response") or []
+            projects.extend(page)
+            if len(page) < limit:
+                break
+
+            offset += limit
+
+        return projects
+
+    def get_available_templates(self, project_name=None, un_committed=False):
+        """
+        Get the summary of the available templates, along with their version details, from Cisco Catalyst Center.
+
+        Parameters:
+            project_name (str) - Name of the project to filter on. Templates of all the projects are returned when not provided.
+            un_committed (bool) - True to get the templates which are not committed yet, else the committed templates.
+
+        Returns:
+            template_list (list) - Templates with 'name', 'projectName', 'templateId' and 'versionsInfo'.
+        """
+
+        params = {}
+        if project_name:
+            params["projectNames"] = project_name
+
+        if un_committed:
+            params["un_committed"] = True
+
+        template_list = self.dnac_apply['exec'](
+            family="configuration_templates",
+            function="gets_the_templates_available",
+            op_modifies=False,
+            params=params,
+        )
+        self.log("Received API response from 'gets_the_templates_available' for project '{0}' with "
+                 "un_committed '{1}': {2}".format(project_name, un_committed, template_list), "DEBUG")
+        if not isinstance(template_list, list):
+            return []
+
+        return template_list
+
+    def add_to_template_catalog(self, projects, committed_templates, uncommitted_templates):
+        """
+        Index the given projects and templates in the template catalog by project name, template name and template id.
+
+        Parameters:
+            projects (list) - Project details as returned by the projects API.
+            committed_templates (list) - Committed templates as returned by 'gets_the_templates_available'.
+            uncommitted_templates (list) - Uncommitted templates as returned by 'gets_the_templates_available'.
+
+        Returns:
+            None
+        """
+
+        for project in projects:
+            self.template_catalog["projects"][project.get("name")] = project
+
+        for index_name, template_list in (("committed", committed_templates), ("uncommitted", uncommitted_templates)):
+            for template in template_list:
+                key = (template.get("projectName"), template.get("name"))
+                self.template_catalog[index_name][key] = template
+                self.template_catalog["templates_by_id"][template.get("templateId")] = template
+
+    def load_template_catalog(self):
+        """
+        Load all the projects and templates from Cisco Catalyst Center once and index them in the template catalog.
+        Projects which got modified during the run are fetched again on their next lookup.
+
+        Parameters:
+            self - The current object.
+
+        Returns:
+            template_catalog (dict) - Projects by name, committed/uncommitted templates by (project name, template name)
+                                      and templates by template id.
+        """
+
+        if self.template_catalog is None:
+            self.log("Loading the projects and templates catalog from the Cisco Catalyst Center.", "INFO")
+            self.template_catalog = {
+                "projects": {},
+                "committed": {},
+                "uncommitted": {},
+                "templates_by_id": {},
+            }
+            self.add_to_template_catalog(
+                self.get_all_projects(),
+                self.get_available_templates(),
+                self.get_available_templates(un_committed=True)
+            )
+            self.stale_catalog_projects.clear()
+            self.log("Loaded {0} project(s) and {1} template(s) in the catalog.".format(
+                len(self.template_catalog["projects"]), len(self.template_catalog["templates_by_id"])), "INFO")
+
+        while self.stale_catalog_projects:
+            project_name = self.stale_catalog_projects.pop()
+            self.log("Refreshing the catalog entries of the project '{0}'.".format(project_name), "DEBUG")
+            self.template_catalog["projects"].pop(project_name, None)
+            for index_name in ("committed", "uncommitted"):
+                stale_keys = [key for key in self.template_catalog[index_name] if key[0] == project_name]
+                for key in stale_keys:
+                    template = self.template_catalog[index_name].pop(key)
+                    self.template_catalog["templates_by_id"].pop(template.get("templateId"), None)
+
+            projects = [project for project in self.get_all_projects(project_name) if project.get("name") == project_name]
+            self.add_to_template_catalog(
+                projects,
+                self.get_available_templates(project_name),
+                self.get_available_templates(project_name, un_committed=True)
+            )
+
+        return self.template_catalog
+
+    def invalidate_template_catalog(self, project_name):
+        """
+        Mark the catalog entries of a project as stale after it or one of its templates got modified.
+
+        Parameters:
+            project_name (str) - Name of the project to be fetched again on the next catalog lookup.
+
+        Returns:
+            None
+        """
+
+        self.template_content_hashes.pop(project_name, None)
+        if self.template_catalog is not None and project_name:
+            self.log("Marking the catalog entries of the project '{0}' as stale.".format(project_name), "DEBUG")
+            self.stale_catalog_projects.add(project_name)
+
     def get_templates_details(self, name):
         """
         Get the template details from the template name provided in the playbook.
@@ -1651,17 +1896,14 @@ class Template(DnacBase):
             result (dict) - Template details for the given template name.
         """
 
-        result = None
-        items = self.dnac_apply['exec'](
-            family="configuration_templates",
-            function="get_templates_details",
-            op_modifies=True,
-            params={"name": name}
-        )
-        if items:
-            result = items
-
-        self.log("Received API response from 'get_templates_details': {0}".format(items), "DEBUG")
+        template_catalog = self.load_template_catalog()
+        items = [
+            dict(template, id=template.get("templateId"))
+            for (project_name, template_name), template in template_catalog.get("committed").items()
+            if template_name == name
+        ]
+        result = {"response": items}
+        self.log("Template details from the catalog for the template '{0}': {1}".format(name, result), "DEBUG")
         return result
 
     def get_project_defined_template_details(self, project_name, template_name):
@@ -1677,22 +1919,15 @@ class Template(DnacBase):
         self.log("Starting to retrieve template details for project '{0}' and template '{1}'.".format(project_name, template_name), "INFO")
         template_details = None
         try:
-            items = self.dnac_apply['exec'](
-                family="configuration_templates",
-                function="get_templates_details",
-                op_modifies=True,
-                params={
-                    "project_name": project_name,
-                    "name": template_name
-                }
-            )
-            if items:
-                template_details = items
+            template_catalog = self.load_template_catalog()
+            template = template_catalog.get("committed").get((project_name, template_name))
+            template_details = {"response": []}
+            if template:
+                template_details["response"].append(dict(template, id=template.get("templateId")))
                 self.log("Received template details for '{0}': {1}".format(template_name, template_details), "DEBUG")
             else:
                 self.log("No template details found for project '{0}' and template '{1}'.".format(project_name, template_name), "WARNING")
 
-            self.log("Received API response from 'get_templates_details': {0}".format(template_details), "DEBUG")
         except Exception as e:
             self.log("Exception occurred while retrieving template details for '{0}': {1}".format(template_name, str(e)), "ERROR")
 
@@ -1934,16 +2169,8 @@ class Template(DnacBase):
                  )
         template_id = None
         try:
-            template_list = self.dnac_apply['exec'](
-                family="configuration_templates",
-                function="gets_the_templates_available",
-                op_modifies=False,
-                params={
-                    "projectNames": project_name,
-                    "un_committed": True
-                },
-            )
-            if not template_list:
+            uncommitted_templates = self.load_template_catalog().get("uncommitted")
+            if not any(key[0] == project_name for key in uncommitted_templates):
                 msg = (
                     "No uncommitted templates available under the project '{0}'. "
                     "Cannot commit or deploy the template '{1}' in device(s)."
@@ -1951,11 +2178,11 @@ class Template(DnacBase):
                 self.log(msg, "WARNING")
                 return template_id
 
-            for template in template_list:
-                if template.get("name") == template_name:
-                    template_id = template.get("templateId")
-                    self.log("Found uncommitted template '{0}' with ID: '{1}'.".format(template_name, template_id), "INFO")
-                    return template_id
+            template = uncommitted_templates.get((project_name, template_name))
+            if template:
+                template_id = template.get("templateId")
+                self.log("Found uncommitted template '{0}' with ID: '{1}'.".format(template_name, template_id), "INFO")
+                return template_id
             self.log("Template '{0}' not found in the uncommitted templates for project '{1}'.".format(template_name, project_name), "WARNING")
         except Exception as e:
             error_msg = (
@@ -1998,6 +2225,7 @@ class Template(DnacBase):
             self.log("Preparing to version template with parameters: {0}".format(version_params), "DEBUG")
             task_name = "version_template"
             task_id = self.get_taskid_post_api_call("configuration_templates", task_name, version_params)
+            self.invalidate_template_catalog(project_name)
 
             if not task_id:
                 self.msg = "Unable to retrieve the task_id for the task '{0}'.".format(task_name)
@@ -2087,18 +2315,11 @@ class Template(DnacBase):
         config["templateId"] = template_details.get("id")
         have_template["id"] = template_details.get("id")
         # Get available templates which are committed under the project
-        template_list = self.dnac_apply['exec'](
-            family="configuration_templates",
-            function="gets_the_templates_available",
-            op_modifies=True,
-            params={"projectNames": config.get("projectName")},
-        )
+        committed_templates = self.load_template_catalog().get("committed")
         have_template["isCommitPending"] = True
         # This check will fail if specified template is there not committed in Cisco Catalyst Center
-        if template_list and isinstance(template_list, list):
-            template_info = get_dict_result(template_list,
-                                            "name",
-                                            templateName)
+        if committed_templates:
+            template_info = committed_templates.get((projectName, templateName))
             if template_info:
                 template = self.get_template(config)
                 have_template["template"] = template
@@ -2171,35 +2392,11 @@ class Template(DnacBase):
             projectName (str) - Project Name
 
         Returns:
-            items (dict) - Project details with given project name.
+            items (list) - Project details with given project name.
         """
         self.log("Initializing retrival of project details for project: {0}".format(projectName), "DEBUG")
-        ccc_version = self.get_ccc_version()
-
-        if self.compare_dnac_versions(ccc_version, "2.3.7.9") < 0:
-            self.log("Retrieving project details for project: {0} when catalyst version is less than 2.3.7.9".format(projectName), "DEBUG")
-
-            items = self.dnac_apply['exec'](
-                family="configuration_templates",
-                function='get_projects',
-                op_modifies=True,
-                params={"name": projectName},
-            )
-
-            self.log("Received Response from get_projects for project: {0} when catalyst version is less than 2.3.7.9: {1}".format(projectName, items), "DEBUG")
-        else:
-            self.log("Retrieving project details for project: {0} when catalyst version is greater than or equal to 2.3.7.9".format(projectName), "DEBUG")
-            items = self.dnac_apply['exec'](
-                family="configuration_templates",
-                function='get_projects_details_v2',
-                op_modifies=True,
-                params={"name": projectName},
-            )
-
-            self.log("Received Response from get_projects for project: {0} when catalyst version is greater than or equal to 2.3.7.9: {1}".format(
-                projectName, items), "DEBUG")
-            items = items["response"]
-
+        project = self.load_template_catalog().get("projects").get(projectName)
+        items = [project] if project else []
         self.log("Retrieved project details for project '{0}' are {1}".format(projectName, items), "DEBUG")
         return items
 
@@ -2295,11 +2492,13 @@ class Template(DnacBase):
             name = "project: {0}".format(project_params.get('name'))
             validation_string = "Successfully created project"
             creation_value = "create_project"
+            self.invalidate_template_catalog(project_params.get('name'))
         else:
             params_key = template_params
             name = "template: {0}".format(template_params.get('name'))
             validation_string = "Successfully created template"
             creation_value = "create_template"
+            self.invalidate_template_catalog(template_params.get('projectName'))
 
         response = self.dnac_apply['exec'](
             family="configuration_templates",
@@ -2477,11 +2676,7 @@ class Template(DnacBase):
             self
         """
 
-        all_project_details = self.dnac._exec(
-            family="configuration_templates",
-            function='get_projects_details_v2'
-        )
-        all_project_details = all_project_details.get("response")
+        all_project_details = list(self.load_template_catalog().get("projects").values())
         for values in export_values:
             project_name = values.get("project_name")
             self.log("Project name for export template: {0}".format(project_name), "DEBUG")
@@ -2616,6 +2811,7 @@ class Template(DnacBase):
                 params=template_params,
             )
             template_updated = True
+            self.invalidate_template_catalog(configuration_templates.get("project_name"))
             self.log("Updating existing template '{0}'."
                      .format(self.have_template.get("template").get("name")), "INFO")
 
@@ -2665,6 +2861,436 @@ class Template(DnacBase):
 
         return self
 
+    def stream_json_file(self, file_path, chunk_size=65536):
+        """
+        Read the JSON file incrementally and yield the elements of its top level array one at a time.
+
+        Parameters:
+            file_path (str) - Path of the JSON file.
+            chunk_size (int) - Number of characters read from the file at a time.
+
+        Returns:
+            generator - Elements of the top level JSON array. A file holding a single JSON object yields that object.
+
+        Description:
+            The elements are decoded in place from the current position of the buffer. When an element continues past
+            the end of the buffer, the decoded part is dropped and the next read is twice as large as the previous one,
+            so an element spanning many chunks is only decoded a logarithmic number of times.
+        """
+
+        decoder = json.JSONDecoder()
+        with open(file_path, 'r') as file:
+            buffer = ""
+            while not buffer:
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    break
+                buffer = chunk.lstrip()
+
+            if not buffer.startswith("["):
+                yield json.loads(buffer + file.read())
+                return
+
+            position = 1
+            read_size = chunk_size
+            is_eof = False
+            while True:
+                position = self.skip_json_whitespace(buffer, position)
+                if buffer.startswith(",", position):
+                    position = self.skip_json_whitespace(buffer, position + 1)
+
+                if buffer.startswith("]", position):
+                    return
+
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                    if end >= len(buffer) and not is_eof:
+                        raise ValueError("Element may continue in the next chunk")
+                except ValueError:
+                    if is_eof:
+                        raise ValueError("Invalid or truncated JSON array in the file '{0}'".format(file_path))
+
+                    chunk = file.read(read_size)
+                    read_size *= 2
+                    is_eof = not chunk
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    continue
+
+                yield item
+                position = end
+                read_size = chunk_size
+
+    def skip_json_whitespace(self, buffer, position):
+        """
+        Get the position of the first character in the buffer which is not JSON whitespace.
+
+        Parameters:
+            buffer (str) - Text being decoded.
+            position (int) - Position to start from.
+
+        Returns:
+            position (int) - Position of the next non-whitespace character, or the length of the buffer.
+        """
+
+        while position < len(buffer) and buffer[position] in " \t\n\r":
+            position += 1
+
+        return position
+
+    def get_import_files(self, file_path=None, directory=None):
+        """
+        Get the list of JSON files to be imported from a file path or from a directory.
+
+        Parameters:
+            file_path (str) - Path of a single JSON file.
+            directory (str) - Path of a directory containing JSON files.
+
+        Returns:
+            file_list (list) - Paths of the JSON files, or None if the given path does not exist. The
+                               '<project_name>_templates.json' files written by the export are left out of a directory.
+        """
+
+        if file_path:
+            if not self.is_path_exists(file_path):
+                return None
+
+            return [file_path]
+
+        if not os.path.isdir(directory):
+            self.log("The specified directory '{0}' is not valid.".format(directory), "ERROR")
+            return None
+
+        file_list = []
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(".json"):
+                continue
+
+            if file_name.endswith("_templates.json"):
+                self.log("Skipping the templates file '{0}' while importing the projects.".format(file_name), "DEBUG")
+                continue
+
+            file_list.append(os.path.join(directory, file_name))
+
+        return file_list
+
+    def get_template_content_hash(self, template):
+        """
+        Get the hash of the content of a template.
+
+        Parameters:
+            template (dict) - Template details having the 'templateContent' field.
+
+        Returns:
+            content_hash (str) - SHA-256 digest of the template content, or None if the template has no content.
+        """
+
+        template_content = template.get("templateContent")
+        if template_content is None:
+            return None
+
+        return hashlib.sha256(template_content.encode("utf-8")).hexdigest()
+
+    def get_controller_template_hashes(self, project_name):
+        """
+        Get the content hash of every template under the project in Cisco Catalyst Center.
+
+        Parameters:
+            project_name (str) - Name of the project.
+
+        Returns:
+            template_hashes (dict) - Content hash keyed by template name.
+        """
+
+        if project_name in self.template_content_hashes:
+            return self.template_content_hashes.get(project_name)
+
+        template_hashes = {}
+        if project_name in self.load_template_catalog().get("projects"):
+            limit = 500
+            offset = 1
+            while True:
+                response = self.dnac_apply['exec'](
+                    family="configuration_templates",
+                    function="get_templates_details",
+                    op_modifies=True,
+                    params={"project_name": project_name, "offset": offset, "limit": limit}
+                )
+                templates = (response or {}).get("response") or []
+                for template in templates:
+                    if template.get("projectName", project_name) == project_name:
+                        template_hashes[template.get("name")] = self.get_template_content_hash(template)
+
+                if len(templates) < limit:
+                    break
+
+                offset += limit
+
+        self.log("Content hash of the templates under the project '{0}': {1}".format(project_name, template_hashes), "DEBUG")
+        self.template_content_hashes[project_name] = template_hashes
+        return template_hashes
+
+    def filter_unchanged_templates(self, project_name, templates):
+        """
+        Remove the templates whose content matches the current template content in Cisco Catalyst Center.
+
+        Parameters:
+            project_name (str) - Name of the project the templates are imported to.
+            templates (list) - Templates to be imported.
+
+        Returns:
+            tuple - The templates to be imported and the names of the templates skipped as unchanged.
+        """
+
+        controller_hashes = self.get_controller_template_hashes(project_name)
+        changed_templates, unchanged_names = [], []
+        for template in templates or []:
+            name = template.get("name")
+            content_hash = self.get_template_content_hash(template)
+            if content_hash and controller_hashes.get(name) == content_hash:
+                unchanged_names.append(name)
+                continue
+
+            changed_templates.append(template)
+
+        if unchanged_names:
+            self.log("Skipping the unchanged template(s) {0} under the project '{1}'.".format(unchanged_names, project_name), "INFO")
+
+        return changed_templates, unchanged_names
+
+    def write_json_file(self, file_path, data):
+        """
+        Write the exported data to the file.
+
+        Parameters:
+            file_path (str) - Path of the file to be written.
+            data (str or list or dict) - Exported data, either already serialized or as JSON objects.
+
+        Returns:
+            None
+
+        Description:
+            Serialized data is written as it is. JSON objects are encoded incrementally with
+            'JSONEncoder.iterencode', so the whole document is never built as one string.
+        """
+
+        with open(file_path, 'w') as file:
+            if isinstance(data, str):
+                file.write(data)
+                return
+
+            for chunk in json.JSONEncoder().iterencode(data):
+                file.write(chunk)
+
+    def get_export_file_path(self, export_directory, project_name, suffix):
+        """
+        Build the path of the export file of a project and make sure it stays under the export directory.
+
+        Parameters:
+            export_directory (str) - Directory the exported files are written to.
+            project_name (str) - Name of the exported project.
+            suffix (str) - Ending of the file name, such as '.json' or '_templates.json'.
+
+        Returns:
+            tuple - The path of the file, or None, and an error message when the project name cannot be used
+                    as a file name.
+        """
+
+        name = str(project_name or "")
+        invalid_characters = [separator for separator in (os.sep, os.altsep, "\0") if separator]
+        if not name.strip() or name in (".", "..") or any(character in name for character in invalid_characters):
+            return None, "The project name '{0}' cannot be used as a file name.".format(project_name)
+
+        real_directory = os.path.realpath(export_directory)
+        file_path = os.path.realpath(os.path.join(real_directory, name + suffix))
+        if os.path.dirname(file_path) != real_directory:
+            return None, "The export file of the project '{0}' resolves outside of the directory '{1}'.".format(
+                project_name, export_directory)
+
+        return file_path, None
+
+    def submit_configuration_template_task(self, function_name, payload, params=None):
+        """
+        Send an export or import request and return the ID of its task.
+
+        Parameters:
+            function_name (str) - Name of the 'configuration_templates' API to call.
+            payload (list) - Payload of the request.
+            params (dict) - Additional parameters of the request.
+
+        Returns:
+            tuple - The task ID, or None, and an error message when the request failed. Called from worker
+                    threads, so failures are returned to the caller.
+        """
+
+        request_params = dict(params or {}, payload=payload)
+        try:
+            response = self.dnac._exec(
+                family="configuration_templates",
+                function=function_name,
+                op_modifies=True,
+                params=request_params,
+            )
+        except Exception as e:
+            return None, "An error occurred while calling '{0}': {1}".format(function_name, str(e))
+
+        self.log("Received API response from '{0}': {1}".format(function_name, response), "DEBUG")
+        task_id = ((response or {}).get("response") or {}).get("taskId")
+        if not task_id:
+            return None, "No task ID received from '{0}'.".format(function_name)
+
+        return task_id, None
+
+    def export_to_directory(self, export):
+        """
+        Export the projects and templates concurrently and write them to one JSON file per project.
+
+        Parameters:
+            export (dict) - Playbook details containing export project/template information.
+
+        Returns:
+            self
+        """
+
+        export_directory = export.get("export_directory")
+        max_workers = export.get("max_concurrent_requests") or 5
+        try:
+            if not os.path.isdir(export_directory):
+                os.makedirs(export_directory)
+        except OSError as e:
+            self.msg = "Unable to create the export directory '{0}': {1}".format(export_directory, str(e))
+            self.status = "failed"
+            return self
+
+        export_jobs, invalid_names = [], []
+        for project_name in export.get("project") or []:
+            file_path, error = self.get_export_file_path(export_directory, project_name, ".json")
+            if error:
+                invalid_names.append(error)
+                continue
+
+            export_jobs.append(("exportProject", project_name, "export_projects", [project_name], file_path))
+
+        templates_by_project = {}
+        for template in export.get("template") or []:
+            templates_by_project.setdefault(template.get("project_name"), []).append(template)
+
+        for project_name, export_values in templates_by_project.items():
+            file_path, error = self.get_export_file_path(export_directory, project_name, "_templates.json")
+            if error:
+                invalid_names.append(error)
+                continue
+
+            self.export_template = []
+            self.get_export_template_values(export_values).check_return_status()
+            export_jobs.append(("exportTemplate", project_name, "export_templates", list(self.export_template), file_path))
+
+        if invalid_names:
+            self.msg = "Unable to export to the directory '{0}': {1}".format(export_directory, " ".join(invalid_names))
+            self.status = "failed"
+            return self
+
+        submissions = self.execute_concurrently(lambda job: self.submit_configuration_template_task(job[2], job[3]),
+                                                export_jobs, max_workers)
+        task_results = self.wait_for_tasks([task_id for task_id, error in submissions], "successfully exported", max_workers)
+        export_response = self.result['response'][1].get("export").get("response")
+        failed_exports = []
+        for job, (task_id, error) in zip(export_jobs, submissions):
+            result_key, project_name, api_name, payload, file_path = job
+            task_details = task_results.get(task_id) or {}
+            if error or task_details.get("isError"):
+                failed_exports.append("{0} for the project '{1}': {2}".format(
+                    api_name, project_name, error or task_details.get("failureReason") or task_details.get("progress")))
+                continue
+
+            self.write_json_file(file_path, task_details.get("data"))
+            self.log("Exported data of '{0}' for the project '{1}' is written to '{2}'.".format(api_name, project_name, file_path), "INFO")
+            export_response.setdefault(result_key, {}).update({project_name: file_path})
+            self.result['changed'] = True
+
+        if failed_exports:
+            self.msg = "Failed to export: {0}".format("; ".join(failed_exports))
+            self.status = "failed"
+            return self
+
+        self.msg = "Successfully exported the projects and templates to the directory '{0}'.".format(export_directory)
+        self.status = "success"
+        return self
+
+    def prepare_project_for_import(self, project):
+        """
+        Remove the unchanged templates of a project which is going to be imported.
+
+        Parameters:
+            project (dict) - Project details read from the import file.
+
+        Returns:
+            project (dict) - Project to be imported, or None if the project exists with all its templates unchanged.
+        """
+
+        project_name = project.get("name")
+        if not self.get_project_details(project_name):
+            return project
+
+        templates, unchanged_names = self.filter_unchanged_templates(project_name, project.get("templates"))
+        if unchanged_names and not templates:
+            self.log("Project '{0}' and all its templates are already available.".format(project_name), "INFO")
+            return None
+
+        if unchanged_names:
+            project = dict(project, templates=templates)
+
+        return project
+
+    def import_projects(self, projects, do_version, max_workers):
+        """
+        Upload the projects concurrently, a window of 'max_workers' projects at a time, and wait for all the uploads together.
+
+        Parameters:
+            projects (iterable) - Projects to be imported. A generator keeps only one window of projects in memory.
+            do_version (bool) - True to create a new version of the existing templates with the imported contents.
+            max_workers (int) - Maximum number of projects uploaded at the same time.
+
+        Returns:
+            tuple - Names of the imported projects, names of the skipped projects and the failure messages.
+        """
+
+        def submit_import(project):
+            return self.submit_configuration_template_task('imports_the_projects_provided', [project],
+                                                           {"do_version": do_version})
+
+        submitted, skipped, window = [], [], []
+        for project in projects:
+            prepared_project = self.prepare_project_for_import(project)
+            if prepared_project is None:
+                skipped.append(project.get("name"))
+                continue
+
+            window.append(prepared_project)
+            if len(window) >= max_workers:
+                submitted.extend(zip([item.get("name") for item in window],
+                                     self.execute_concurrently(submit_import, window, max_workers)))
+                window = []
+
+        if window:
+            submitted.extend(zip([item.get("name") for item in window],
+                                 self.execute_concurrently(submit_import, window, max_workers)))
+
+        task_results = self.wait_for_tasks([task_id for name, (task_id, error) in submitted], "successfully imported project",
+                                           max_workers)
+        imported, failures = [], []
+        for project_name, (task_id, error) in submitted:
+            self.invalidate_template_catalog(project_name)
+            task_details = task_results.get(task_id) or {}
+            if error or task_details.get("isError"):
+                failures.append("Project '{0}': {1}".format(
+                    project_name, error or task_details.get("failureReason") or task_details.get("progress")))
+                continue
+
+            imported.append(project_name)
+
+        return imported, skipped, failures
+
     def handle_export(self, export):
         """
         Export templates and projects in CCC with fields provided in Cisco Catalyst Center.
@@ -2676,6 +3302,11 @@ class Template(DnacBase):
             self
         """
 
+        if export.get("export_directory"):
+            self.log("Exporting the projects and templates to the directory '{0}'."
+                     .format(export.get("export_directory")), "DEBUG")
+            return self.export_to_directory(export)
+
         export_project = export.get("project")
         self.log("Export project playbook details: {0}"
                  .format(export_project), "DEBUG")
@@ -2728,6 +3359,7 @@ class Template(DnacBase):
             self
         """
 
+        max_workers = _import.get("max_concurrent_requests") or 5
         _import_project = _import.get("project")
         if _import_project:
             do_version = _import_project.get("do_version")
@@ -2736,61 +3368,80 @@ class Template(DnacBase):
 
             payload = _import.get("project").get("payload")
             project_file = _import.get("project").get("project_file")
-            if not (payload or project_file):
-                self.msg = "Required parameter 'payload' or 'project_file' is not found under import project"
+            project_directory = _import.get("project").get("project_directory")
+            if not (payload or project_file or project_directory):
+                self.msg = (
+                    "Required parameter 'payload', 'project_file' or 'project_directory' is not found under import project"
+                )
                 self.status = "failed"
                 return self
 
-            final_payload = []
-            if project_file:
-                is_path_exists = self.is_path_exists(project_file)
-                if not is_path_exists:
-                    self.msg = "Import project file path '{0}' does not exist.".format(project_file)
+            if project_file or project_directory:
+                file_list = self.get_import_files(project_file, project_directory)
+                if file_list is None:
+                    self.msg = "Import project file path '{0}' does not exist.".format(project_file or project_directory)
                     self.status = "failed"
                     return self
 
-                is_json = self.is_json(project_file)
-                if not is_json:
-                    self.msg = "Import project file '{0}' is not in JSON format".format(project_file)
+                def read_projects():
+                    for file_path in file_list:
+                        self.log("Reading the projects to be imported from the file '{0}'.".format(file_path), "DEBUG")
+                        for project in self.stream_json_file(file_path):
+                            yield project
+
+                try:
+                    imported, skipped, failures = self.import_projects(read_projects(), do_version, max_workers)
+                except ValueError as msg:
+                    self.msg = "Import project file is not in JSON format: {0}".format(msg)
                     self.status = "failed"
                     return self
-                try:
-                    with open(project_file, 'r') as file:
-                        json_data = file.read()
-                    json_project = json.loads(json_data)
-                    final_payload = json_project
                 except Exception as msg:
-                    self.msg = "An unexpected error occurred while processing the file '{0}': {1}".format(project_file, msg)
+                    self.msg = "An unexpected error occurred while processing the file(s) '{0}': {1}".format(file_list, msg)
+                    self.status = "failed"
+                    return self
+
+                if failures:
+                    self.msg = "Failed to import the project(s): {0}".format("; ".join(failures))
                     self.status = "failed"
                     return self
+
+                if imported:
+                    self.result['changed'] = True
+
+                self.msg = "Successfully imported the project(s) {0}. Project(s) {1} already available.".format(imported, skipped)
+                self.result['response'][2].get("import").get("response").update({"importProject": self.msg})
+
             elif payload:
+                final_payload = []
                 for item in payload:
                     response = self.get_project_details(item.get("name"))
                     if response == []:
                         final_payload.append(item)
 
-            if final_payload != []:
-                _import_project = {
-                    "do_version": do_version,
-                    "payload": final_payload,
-                }
-                self.log("Importing project details from the playbook: {0}"
-                         .format(_import_project), "DEBUG")
-                if _import_project:
+                if final_payload != []:
+                    _import_project = {
+                        "do_version": do_version,
+                        "payload": final_payload,
+                    }
+                    self.log("Importing project details from the playbook: {0}"
+                             .format(_import_project), "DEBUG")
                     response = self.dnac._exec(
                         family="configuration_templates",
                         function='imports_the_projects_provided',
                         op_modifies=True,
                         params=_import_project,
                     )
+                    for project in final_payload:
+                        self.invalidate_template_catalog(project.get("name"))
+
                     validation_string = "successfully imported project"
                     self.check_task_response_status(response, validation_string, "imports_the_projects_provided").check_return_status()
                     self.result['response'][2].get("import").get("response").update({"importProject": "Successfully imported the project(s)."})
-            else:
-                self.msg = "Projects '{0}' already available.".format(payload)
-                self.result['response'][2].get("import").get("response").update({
-                    "importProject": "Projects '{0}' already available.".format(payload)
-                })
+                else:
+                    self.msg = "Projects '{0}' already available.".format(payload)
+                    self.result['response'][2].get("import").get("response").update({
+                        "importProject": "Projects '{0}' already available.".format(payload)
+                    })
 
         _import_template = _import.get("template")
         if _import_template:
@@ -2825,16 +3476,12 @@ class Template(DnacBase):
                     self.status = "failed"
                     return self
 
-                is_json = self.is_json(template_file)
-                if not is_json:
+                try:
+                    final_payload = list(self.stream_json_file(template_file))
+                except ValueError:
                     self.msg = "Import template file '{0}' is not in JSON format".format(template_file)
                     self.status = "failed"
                     return self
-                try:
-                    with open(template_file, 'r') as file:
-                        json_data = file.read()
-                    json_template = json.loads(json_data)
-                    final_payload = json_template
                 except Exception as msg:
                     self.msg = "An unexpected error occurred while processing the file '{0}': {1}".format(template_file, msg)
                     self.status = "failed"
@@ -2862,6 +3509,14 @@ class Template(DnacBase):
                     self.status = "failed"
                     return self
 
+            final_payload, unchanged_names = self.filter_unchanged_templates(project_name, import_template.get("payload"))
+            if not final_payload:
+                self.msg = "Templates {0} under the project '{1}' are already available.".format(unchanged_names, project_name)
+                self.log(self.msg, "INFO")
+                self.result['response'][2].get("import").get("response").update({"importTemplate": self.msg})
+                return self
+
+            import_template["payload"] = final_payload
             if _import_template:
                 response = self.dnac._exec(
                     family="configuration_templates",
@@ -2869,6 +3524,7 @@ class Template(DnacBase):
                     op_modifies=True,
                     params=import_template
                 )
+                self.invalidate_template_catalog(project_name)
                 validation_string = "successfully imported template"
                 self.check_task_response_status(response, validation_string, "imports_the_templates_provided").check_return_status()
                 self.result['response'][2].get("import").get("response") \
@@ -2953,7 +3609,8 @@ class Template(DnacBase):
         Returns:
             str: The ID of the latest version of the template if available; otherwise, returns None.
         Description:
-            This method calls the Cisco Catalyst Center API to fetch all versions of the specified template.
+            This method looks up the versions of the specified template in the template catalog and falls back
+            to the Cisco Catalyst Center API when the template is not indexed in the catalog.
             It selects the version with the most recent timestamp and retrieves its version ID.
             If no versions are available or an error occurs during the API call, appropriate logs are generated.
         """
@@ -2964,14 +3621,18 @@ class Template(DnacBase):
         )
 
         try:
-            response = self.dnac._exec(
-                family="configuration_templates",
-                function='get_template_versions',
-                op_modifies=True,
-                params={
-                    "template_id": template_id,
-                }
-            )
+            template = self.load_template_catalog().get("templates_by_id").get(template_id)
+            if template:
+                response = [template]
+            else:
+                response = self.dnac._exec(
+                    family="configuration_templates",
+                    function='get_template_versions',
+                    op_modifies=True,
+                    params={
+                        "template_id": template_id,
+                    }
+                )
 
             if not response or not isinstance(response, list) or not response[0].get("versionsInfo"):
                 self.log(
@@ -3480,6 +4141,7 @@ class Template(DnacBase):
             op_modifies=True,
             params=params_key,
         )
+        self.invalidate_template_catalog(config.get("configuration_templates").get("project_name"))
         task_id = response.get("response").get("taskId")
         sleep_duration = self.params.get('dnac_task_poll_interval')
         if not task_id:
@@ -3658,17 +4320,11 @@ class Template(DnacBase):
         if config.get("configuration_templates") is not None:
             self.log("Current State (have): {0}".format(self.have), "INFO")
             self.log("Desired State (want): {0}".format(self.want), "INFO")
-            template_list = self.dnac_apply['exec'](
-                family="configuration_templates",
-                function="gets_the_templates_available",
-                op_modifies=True,
-                params={"projectNames": config.get("configuration_templates").get("project_name")},
-            )
-            if template_list and isinstance(template_list, list):
+            project_name = config.get("configuration_templates").get("project_name")
+            committed_templates = self.load_template_catalog().get("committed")
+            if committed_templates:
                 templateName = config.get("configuration_templates").get("template_name")
-                template_info = get_dict_result(template_list,
-                                                "name",
-                                                templateName)
+                template_info = committed_templates.get((project_name, templateName))
                 if template_info:
                     self.log("Configuration Template config is not applied to the Cisco Catalyst Center.", "WARNING")
                     return self
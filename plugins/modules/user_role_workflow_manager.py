@@ -877,6 +877,7 @@ response_11:
     }
 """
 
+import copy
 import re
 from ansible_collections.cisco.dnac.plugins.module_utils.dnac import (
     DnacBase,
@@ -897,6 +898,9 @@ class UserandRole(DnacBase):
         self.created_role, self.updated_role, self.no_update_role = [], [], []
         self.deleted_user, self.deleted_role = [], []
         self.no_deleted_user, self.no_deleted_role = [], []
+        self.user_index, self.role_index = None, None
+        self.modified_users, self.modified_roles = set(), set()
+        self.permission_tree = None
 
     def validate_input_yml(self, user_role_details):
         """
@@ -1403,7 +1407,7 @@ class UserandRole(DnacBase):
 
                 if "error_message" not in role_info_params:
                     filtered_data, overall_update_required = self.get_permissions(self.want, role_info_params, "create")
-                    denied_permissions = self.find_denied_permissions(self.want)
+                    denied_permissions = self.get_permission_tree(self.want)["denied_permissions"]
                     denied_required, create_role_params = self.remove_denied_operations(filtered_data, denied_permissions)
 
                     if denied_required or overall_update_required:
@@ -1524,10 +1528,11 @@ class UserandRole(DnacBase):
                 - current_role_configuration (dict): Dictionary containing current role details.
 
         Description:
-            - Checks the existence of a user and retrieves user details in Cisco Catalyst Center
-              by querying the "get_users_api" function in the "user_and_roles" family.
-            - Checks the existence of a role and retrieves role details in Cisco Catalyst Center
-              by querying the "get_roles_api" function in the "user_and_roles" family.
+            - Checks the existence of a user and retrieves user details from the users index built
+              with the "get_users_api" function in the "user_and_roles" family.
+            - Checks the existence of a role and retrieves role details from the roles index built
+              with the "get_roles_api" function in the "user_and_roles" family.
+            - Returns copies of the indexed details, so they can be modified by the caller.
             - Logs errors if required parameters are missing in the playbook config.
         """
         user_exists = False
@@ -1539,14 +1544,12 @@ class UserandRole(DnacBase):
         if "role_name" in input_config and input_config["role_name"] is not None:
             self.log("Retrieving role details for role_name: {0}".format(str(input_config["role_name"])), "DEBUG")
 
-            response_role = self.get_role()
-            response_role = self.camel_to_snake_case(response_role)
-            roles = response_role.get("response", {}).get("roles", [])
-
-            for role in roles:
-                if role.get("name") == input_config.get("role_name"):
-                    current_role_configuration = role
-                    role_exists = True
+            role_name = input_config.get("role_name")
+            role_index = self.get_role_index(refresh=role_name.lower() in self.modified_roles)
+            role = role_index["by_name"].get(role_name)
+            if role:
+                current_role_configuration = copy.deepcopy(role)
+                role_exists = True
 
             self.log("Role retrieval result - role_exists: {0}, current_role_configuration: {1}".format(
                 str(role_exists), str(current_role_configuration)), "DEBUG")
@@ -1555,38 +1558,86 @@ class UserandRole(DnacBase):
         if "username" in input_config or "email" in input_config:
             self.log("Retrieving user details for username: {0}, email: {1}".format(
                 str(input_config.get("username")), str(input_config.get("email"))), "DEBUG")
-            response_user = self.get_user()
-            response_role = self.get_role()
-            response_user = self.camel_to_snake_case(response_user)
-            response_role = self.camel_to_snake_case(response_role)
-            users = response_user.get("response", {}).get("users", [])
-            roles = response_role.get("response", {}).get("roles", [])
-
-            for user in users:
-                if user.get("username") == input_config.get("username"):
-                    current_user_configuration = user
-                    user_exists = True
-                elif input_config.get("email") is not None:
-                    if user.get("email") == input_config.get("email"):
-                        current_user_configuration = user
-                        user_exists = True
+            username = input_config.get("username")
+            email = input_config.get("email")
+            user_index = self.get_user_index(refresh=bool({username, email} & self.modified_users))
+
+            role_names = [role_name.lower() for role_name in input_config.get("role_list") or ["observer-role"]]
+            role_index = self.get_role_index(refresh=bool(set(role_names) & self.modified_roles))
+
+            user = user_index["by_username"].get(username)
+            if not user and email is not None:
+                user = user_index["by_email"].get(email)
+
+            if user:
+                current_user_configuration = copy.deepcopy(user)
+                user_exists = True
 
             self.log("User retrieval result - user_exists: {0}, current_user_configuration: {1}".format(
                 str(user_exists), str(current_user_configuration)), "DEBUG")
 
-            if input_config.get("role_list"):
-                for role_name in input_config["role_list"]:
-                    for role in roles:
-                        if role.get("name").lower() == role_name.lower():
-                            current_role_id[role.get("name").lower()] = role.get("role_id")
-            else:
-                for role in roles:
-                    if role.get("name").lower() == "observer-role":
-                        current_role_id[role.get("name").lower()] = role.get("role_id")
+            for role_name in role_names:
+                role = role_index["by_lower_name"].get(role_name)
+                if role:
+                    current_role_id[role_name] = role.get("role_id")
 
             self.log("Role ID retrieval result - current_role_id: {0}".format(str(current_role_id)), "DEBUG")
             return user_exists, current_user_configuration, current_role_id
 
+    def get_user_index(self, refresh=False):
+        """
+        Retrieve the users of Cisco Catalyst Center once and index them by username and email.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - refresh (bool): Retrieve the users again even if they were already retrieved.
+        Returns:
+            - dict: The users in snake case under "by_username" and "by_email".
+        Description:
+            - The users are retrieved with a single "get_users_api" request and kept for the whole run, so every
+              user of the playbook is looked up without another request.
+            - The index is refreshed when a user created, updated or deleted during the run is looked up again.
+        """
+        if self.user_index is not None and not refresh:
+            return self.user_index
+
+        response_user = self.camel_to_snake_case(self.get_user())
+        users = response_user.get("response", {}).get("users", [])
+        self.user_index = {"by_username": {}, "by_email": {}}
+        for user in users:
+            self.user_index["by_username"][user.get("username")] = user
+            if user.get("email") is not None:
+                self.user_index["by_email"][user.get("email")] = user
+
+        self.modified_users.clear()
+        self.log("Indexed {0} user(s) from Cisco Catalyst Center.".format(len(users)), "DEBUG")
+        return self.user_index
+
+    def get_role_index(self, refresh=False):
+        """
+        Retrieve the roles of Cisco Catalyst Center once and index them by role name.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - refresh (bool): Retrieve the roles again even if they were already retrieved.
+        Returns:
+            - dict: The roles in snake case under "by_name" and, with lower case names, under "by_lower_name".
+        Description:
+            - The roles are retrieved with a single "get_roles_api" request and kept for the whole run.
+            - The index is refreshed when a role created, updated or deleted during the run is looked up again.
+        """
+        if self.role_index is not None and not refresh:
+            return self.role_index
+
+        response_role = self.camel_to_snake_case(self.get_role())
+        roles = response_role.get("response", {}).get("roles", [])
+        self.role_index = {"by_name": {}, "by_lower_name": {}}
+        for role in roles:
+            self.role_index["by_name"][role.get("name")] = role
+            self.role_index["by_lower_name"][role.get("name").lower()] = role
+
+        self.modified_roles.clear()
+        self.log("Indexed {0} role(s) from Cisco Catalyst Center.".format(len(roles)), "DEBUG")
+        return self.role_index
+
     def create_user(self, user_params):
         """
         Create a new user in Cisco Catalyst Center with the provided parameters.
@@ -1635,6 +1686,7 @@ class UserandRole(DnacBase):
             )
             self.log("Received API response from create_user: {0}".format(str(response)), "DEBUG")
             self.created_user.append(user_params.get("username"))
+            self.modified_users.update([user_params.get("username"), user_params.get("email")])
             return response
 
         except Exception as e:
@@ -1675,6 +1727,7 @@ class UserandRole(DnacBase):
                 )
                 self.log("Received API response from create_role: {0}".format(str(response)), "DEBUG")
                 self.created_role.append(role_params.get("role"))
+                self.modified_roles.add(str(role_params.get("role")).lower())
                 return response
 
             except Exception as e:
@@ -2477,19 +2530,21 @@ class UserandRole(DnacBase):
         update_required = False
         update_role_params = {}
 
+        have_resources = {}
+        for have_resource in current_role["resource_types"]:
+            have_resources.setdefault(have_resource["type"], have_resource)
+
         for want_resource in desired_role["resourceTypes"]:
-            resource_found = False
-            for have_resource in current_role["resource_types"]:
-                if have_resource["type"] == want_resource["type"]:
-                    resource_found = True
-                    if have_resource["operations"] != want_resource["operations"]:
-                        self.log("Updating operations for resource type {0}.".format(want_resource["type"]), "DEBUG")
-                        have_resource["operations"] = want_resource["operations"]
-                        update_required = True
-                    break
-            if not resource_found:
+            have_resource = have_resources.get(want_resource["type"])
+            if have_resource is not None:
+                if have_resource["operations"] != want_resource["operations"]:
+                    self.log("Updating operations for resource type {0}.".format(want_resource["type"]), "DEBUG")
+                    have_resource["operations"] = want_resource["operations"]
+                    update_required = True
+            else:
                 self.log("Adding new resource type {0} to current role.".format(want_resource["type"]), "DEBUG")
                 current_role["resource_types"].append(want_resource)
+                have_resources[want_resource["type"]] = want_resource
                 update_required = True
 
         # Compare and update first name
@@ -2516,7 +2571,7 @@ class UserandRole(DnacBase):
         filtered_data, overall_update_required = self.get_permissions(self.want, updated_get_have, "update")
 
         self.log("Finding denied permissions...", "DEBUG")
-        denied_permissions = self.find_denied_permissions(self.want)
+        denied_permissions = self.get_permission_tree(self.want)["denied_permissions"]
         denied_update_required, updated_get_have = self.remove_denied_operations(filtered_data, denied_permissions)
 
         if update_required or denied_update_required or overall_update_required:
@@ -2643,6 +2698,7 @@ class UserandRole(DnacBase):
             )
             self.log("Received API response from update_user: {0}".format(str(response)), "DEBUG")
             self.updated_user.append(user_params.get("username"))
+            self.modified_users.update([user_params.get("username"), user_params.get("email")])
             return response
 
         except Exception as e:
@@ -2677,6 +2733,7 @@ class UserandRole(DnacBase):
                 )
                 self.log("Received API response from update_role: {0}".format(str(response)), "DEBUG")
                 self.updated_role.append(self.have.get("role_name"))
+                self.modified_roles.add(str(self.have.get("role_name")).lower())
                 return response
 
             except Exception as e:
@@ -2733,6 +2790,27 @@ class UserandRole(DnacBase):
         self.log("Denied permissions are {0}".format(str(denied_permissions)), "DEBUG")
         return denied_permissions
 
+    def get_permission_tree(self, config):
+        """
+        Build the permission tree and the denied permissions of a role configuration once.
+        Parameters:
+            - self (object): An instance of a class used for interacting with Cisco Catalyst Center.
+            - config (dict): The role configuration of the playbook.
+        Returns:
+            - dict: The parsed permissions under "permissions" and the denied permission paths under "denied_permissions".
+        Description:
+            - The payload generation, the permission filtering and the update check of a role all need the same
+              tree, so it is computed for the first of them and reused until another configuration is processed.
+        """
+        if self.permission_tree is None or self.permission_tree["config"] is not config:
+            self.permission_tree = {
+                "config": config,
+                "permissions": self.parse_config(config),
+                "denied_permissions": self.find_denied_permissions(config)
+            }
+
+        return self.permission_tree
+
     def remove_denied_operations(self, input_data, denied_permissions):
         """
         Remove denied operations from the input data based on the provided denied permissions.
@@ -2754,44 +2832,25 @@ class UserandRole(DnacBase):
         remaining_resource_types = []
         update_required = False
 
+        # Resource names which are ambiguous on their own are matched with their parent resource type.
+        qualified_types = {
+            "network settings": "network design.network settings",
+            "provision": "network provision.provision",
+            "group based policy": "security.group-based policy"
+        }
+        denied_types = []
+        for denied in denied_permissions:
+            denied_type_lower = denied.split(".")[-1].replace("_", " ").replace("[0]", "").lower()
+            denied_types.append(qualified_types.get(denied_type_lower, denied_type_lower))
+
         for resource in resource_types:
-            keep_resource = True
             resource_type_lower = resource["type"].lower()
-            for denied in denied_permissions:
-                denied_type_lower = denied.split(".")[-1].replace("_", " ").replace("[0]", "").lower()
-
-                if denied_type_lower == "network settings":
-                    denied_type_lower = "network design.network settings"
-                    if denied_type_lower in resource_type_lower:
-                        keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
-                        update_required = True
-                        break
-
-                elif denied_type_lower == "provision":
-                    denied_type_lower = "network provision.provision"
-                    if denied_type_lower in resource_type_lower:
-                        keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
-                        update_required = True
-                        break
-
-                elif denied_type_lower == "group based policy":
-                    denied_type_lower = "security.group-based policy"
-                    if denied_type_lower in resource_type_lower:
-                        keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
-                        update_required = True
-                        break
+            denied_type = next((denied_type for denied_type in denied_types if denied_type in resource_type_lower), None)
 
-                else:
-                    if denied_type_lower in resource_type_lower:
-                        keep_resource = False
-                        self.log("Removing resource due to denied type: {0}".format(denied_type_lower), "DEBUG")
-                        update_required = True
-                        break
-
-            if keep_resource:
+            if denied_type is not None:
+                self.log("Removing resource due to denied type: {0}".format(denied_type), "DEBUG")
+                update_required = True
+            else:
                 remaining_resource_types.append(resource)
 
         input_data["resourceTypes"] = remaining_resource_types
@@ -2914,7 +2973,7 @@ class UserandRole(DnacBase):
             are denied.
         """
         self.log("Starting permission retrieval for role operation: {0}".format(role_operation), "INFO")
-        permissions = self.parse_config(config)
+        permissions = self.get_permission_tree(config)["permissions"]
         allowed_operations = []
         check_deny = []
 
@@ -3058,6 +3117,8 @@ class UserandRole(DnacBase):
                 if response and isinstance(response, dict):
                     self.log("Received API response from delete_user '{0}': {1}".format(username, str(response)), "DEBUG")
                     self.deleted_user.append(username)
+                    current_user = self.have.get("current_user_config", {})
+                    self.modified_users.update([current_user.get("username"), current_user.get("email")])
                     return response
 
                 error_msg = response.get("error_message", "Unknown error occurred while deleting user '{0}'".format(username))
@@ -3108,6 +3169,7 @@ class UserandRole(DnacBase):
                 )
                 self.log("Received API response from delete_role: {0}".format(str(response)), "DEBUG")
                 self.deleted_role.append(self.have.get("role_name"))
+                self.modified_roles.add(str(self.have.get("role_name")).lower())
                 return response
 
             except Exception as e:
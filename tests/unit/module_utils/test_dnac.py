@@ -0,0 +1,194 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.cisco.dnac.plugins.module_utils import dnac
+
+
+class DnacBaseHelper(dnac.DnacBase):
+    """Minimal concrete class used to exercise the shared helpers of DnacBase."""
+
+    def validate_input(self):
+        return self
+
+
+class TestDnacBaseHelpers(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_dnac_init = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK.__init__", return_value=None)
+        self.mock_dnac_init.start()
+        self.mock_dnac_exec = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK._exec")
+        self.mock_dnac_exec.start()
+
+    def tearDown(self):
+        self.mock_dnac_init.stop()
+        self.mock_dnac_exec.stop()
+
+    def build(self, **params):
+        module = MagicMock()
+        module.params = {
+            "dnac_host": "1.1.1.1",
+            "dnac_port": "443",
+            "dnac_username": "dummy",
+            "dnac_password": "dummy",
+            "dnac_version": "2.3.7.6",
+            "dnac_verify": False,
+            "dnac_debug": False,
+            "dnac_log": False,
+            "dnac_api_task_timeout": 30,
+            "dnac_task_poll_interval": 0,
+            "config": [],
+        }
+        module.params.update(params)
+        return DnacBaseHelper(module)
+
+    def test_execute_concurrently_keeps_the_order_of_the_items(self):
+        helper = self.build()
+        threads = set()
+
+        def worker(item):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.01 * (5 - item))
+            return item * 10
+
+        self.assertEqual(helper.execute_concurrently(worker, range(5), max_workers=5), [0, 10, 20, 30, 40])
+        self.assertGreater(len(threads), 1)
+
+    def test_execute_concurrently_runs_serially_with_one_worker(self):
+        helper = self.build()
+        threads = set()
+
+        def worker(item):
+            threads.add(threading.current_thread().name)
+            return item
+
+        self.assertEqual(helper.execute_concurrently(worker, [3, 2, 1], max_workers=1), [3, 2, 1])
+        self.assertEqual(threads, {threading.current_thread().name})
+
+    def test_execute_concurrently_raises_the_worker_exception(self):
+        helper = self.build()
+
+        def worker(item):
+            if item == 2:
+                raise ValueError("item {0} failed".format(item))
+            return item
+
+        with self.assertRaises(ValueError):
+            helper.execute_concurrently(worker, [1, 2, 3], max_workers=3)
+
+    def test_wait_for_tasks_returns_completed_and_failed_tasks(self):
+        helper = self.build()
+        polls = {"done": 0}
+
+        def get_task_details(task_id):
+            if task_id == "done":
+                polls["done"] += 1
+                return {"id": task_id, "endTime": 1} if polls["done"] > 1 else {"id": task_id}
+            if task_id == "error":
+                return {"id": task_id, "isError": True, "failureReason": "bad request"}
+            return {"id": task_id, "progress": "Provisioning COMPLETED"}
+
+        helper.fetch_task_details = get_task_details
+        results = helper.wait_for_tasks(["done", "error", "progress", "done", None], validation_string="completed")
+
+        self.assertEqual(sorted(results), ["done", "error", "progress"])
+        self.assertEqual(results["done"].get("endTime"), 1)
+        self.assertEqual(polls["done"], 2)
+        self.assertTrue(results["error"].get("isError"))
+        self.assertFalse(results["progress"].get("isError"))
+
+    def test_wait_for_tasks_reports_the_tasks_not_completed_within_the_timeout(self):
+        helper = self.build(dnac_api_task_timeout=-1)
+        helper.fetch_task_details = lambda task_id: {"id": task_id, "endTime": 1} if task_id == "done" else {"id": task_id}
+
+        results = helper.wait_for_tasks(["done", "stuck"])
+
+        self.assertFalse(results["done"].get("isError"))
+        self.assertTrue(results["stuck"].get("isError"))
+        self.assertIn("timeout", results["stuck"].get("failureReason"))
+
+    def test_wait_for_tasks_reports_the_tasks_whose_status_cannot_be_retrieved(self):
+        helper = self.build()
+        helper.dnac._exec = MagicMock(side_effect=Exception("connection reset"))
+
+        results = helper.wait_for_tasks(["first", "second"])
+
+        self.assertTrue(results["first"].get("isError"))
+        self.assertIn("connection reset", results["second"].get("failureReason"))
+
+    def test_get_backoff_interval_doubles_up_to_the_cap(self):
+        helper = self.build(dnac_task_poll_interval=2)
+
+        self.assertEqual(
+            [helper.get_backoff_interval(attempt) for attempt in range(6)],
+            [2, 4, 8, 16, 30, 30]
+        )
+        self.assertEqual(helper.get_backoff_interval(100, max_interval=10), 10)
+
+    def test_get_backoff_interval_does_not_return_zero(self):
+        helper = self.build(dnac_task_poll_interval=0)
+
+        self.assertEqual(helper.get_backoff_interval(0), 1)
+        self.assertEqual(helper.get_backoff_interval(3), 8)
+        self.assertEqual(helper.get_backoff_interval(3, max_interval=0), 1)
+
+    def test_get_paginated_response_stops_on_a_short_page(self):
+        helper = self.build()
+        pages = [{"response": [{"id": index} for index in range(3)]}, {"response": [{"id": 3}]}]
+        helper.execute_get_request = MagicMock(side_effect=pages)
+
+        records = helper.get_paginated_response("sda", "get_fabric_sites", {"site_id": "1"}, limit=3)
+
+        self.assertEqual([record["id"] for record in records], [0, 1, 2, 3])
+        self.assertEqual(helper.execute_get_request.call_count, 2)
+        self.assertEqual(
+            [call.args[2] for call in helper.execute_get_request.call_args_list],
+            [{"site_id": "1", "offset": 1, "limit": 3}, {"site_id": "1", "offset": 4, "limit": 3}]
+        )
+
+    def test_get_paginated_response_stops_on_an_empty_page(self):
+        helper = self.build()
+        helper.execute_get_request = MagicMock(side_effect=[{"response": [{"id": 0}, {"id": 1}]}, None])
+
+        records = helper.get_paginated_response("sda", "get_fabric_sites", limit=2)
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(helper.execute_get_request.call_count, 2)
+
+    def test_get_device_list_in_bulk_deduplicates_and_batches_the_values(self):
+        helper = self.build()
+        helper.execute_get_request = MagicMock(side_effect=lambda family, function, params: {
+            "response": [{"managementIpAddress": ip} for ip in params["management_ip_address"]]
+        })
+
+        devices = helper.get_device_list_in_bulk(
+            "management_ip_address", ["10.0.0.1", "10.0.0.2", "10.0.0.1", None, "10.0.0.3"], batch_size=2)
+
+        self.assertEqual([device["managementIpAddress"] for device in devices], ["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+        self.assertEqual(
+            [call.args[2] for call in helper.execute_get_request.call_args_list],
+            [{"management_ip_address": ["10.0.0.1", "10.0.0.2"]}, {"management_ip_address": ["10.0.0.3"]}]
+        )
@@ -59,7 +59,12 @@ class TestDnacAccesspointWorkflow(TestDnacModule):
         """
         Load fixtures for user.
         """
-        if "provision_device" in self._testMethodName:
+        if "fleet_mode" in self._testMethodName or "rolling_reboot" in self._testMethodName:
+            self.fleet_ap_configs = {}
+            self.aps_in_flight = []
+            self.max_aps_in_flight_seen = 0
+            self.run_dnac_exec.side_effect = self.fleet_response
+        elif "provision_device" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
                 self.test_data.get("get_device_detail"),
                 self.test_data.get("get_site_exist_response"),
@@ -124,6 +129,166 @@ class TestDnacAccesspointWorkflow(TestDnacModule):
                 self.test_data.get("ap_task_error_status")
             ]
 
+    def get_fleet_device(self, index):
+        device = dict(self.get_device_detail_all_data.get("response")[0])
+        device.update({
+            "hostname": "FLEET-AP-{0}".format(index),
+            "macAddress": "34:5d:a8:3b:d8:e{0}".format(index),
+            "ap_ethernet_mac_address": "34:b8:83:15:7c:6{0}".format(index),
+            "id": "fleet-ap-{0}".format(index)
+        })
+        device.pop("mac_address")
+        return device
+
+    def get_fleet_ap_config(self, ap_ethernet_mac_address):
+        if ap_ethernet_mac_address not in self.fleet_ap_configs:
+            index = ap_ethernet_mac_address[-1]
+            ap_config = dict(self.test_data.get("get_accesspoint_config"))
+            ap_config.update({
+                "ap_name": "FLEET-AP-{0}".format(index),
+                "eth_mac": ap_ethernet_mac_address,
+                "mac_address": "34:5d:a8:3b:d8:e{0}".format(index)
+            })
+            self.fleet_ap_configs[ap_ethernet_mac_address] = ap_config
+        return self.fleet_ap_configs[ap_ethernet_mac_address]
+
+    def fleet_response(self, family, function, params=None, **kwargs):
+        if function == "get_device_list":
+            devices = [self.get_fleet_device(index) for index in range(1, 7)]
+            for key, values in params.items():
+                devices = [device for device in devices if device.get(key) in values]
+            return {"response": devices}
+        if function == "get_access_point_configuration":
+            if "key" not in params:
+                return {"response": [self.get_fleet_ap_config(device.get("ap_ethernet_mac_address"))
+                                     for device in [self.get_fleet_device(index) for index in range(1, 7)]]}
+            return self.get_fleet_ap_config(params.get("key"))
+        if function == "configure_access_points_v2":
+            payload = params.get("payload")
+            for ap_entry in payload.get("apList"):
+                ap_config = self.get_fleet_ap_config(ap_entry.get("macAddress"))
+                if payload.get("configureLedStatus"):
+                    ap_config["led_status"] = "Enabled" if payload.get("led_status") else "Disabled"
+                if payload.get("configureLedBrightnessLevel"):
+                    ap_config["led_brightness_level"] = payload.get("led_brightness_level")
+            return {"response": {"taskId": ",".join(entry.get("macAddress") for entry in payload.get("apList"))}}
+        if function == "get_task_by_id":
+            return self.test_data.get("ap_task_status")
+        if function == "reboot_access_points":
+            self.aps_in_flight.extend(params.get("apMacAddresses"))
+            self.max_aps_in_flight_seen = max(self.max_aps_in_flight_seen, len(self.aps_in_flight))
+            return {"response": {"taskId": ",".join(params.get("apMacAddresses"))}}
+        if function == "get_tasks_by_id":
+            return self.test_data.get("ap_reboot_task_response")
+        if function == "get_access_point_reboot_task_result":
+            ap_list = []
+            for ap_ethernet_mac_address in params.get("parentTaskId").split(","):
+                self.aps_in_flight.remove(ap_ethernet_mac_address)
+                ap_list.append({"ethernetMacAddress": ap_ethernet_mac_address, "rebootStatus": "Success"})
+            return [{"wlcIP": "204.192.6.200", "apList": ap_list}]
+        return {"response": []}
+
+    def get_ap_update_calls(self):
+        return [call.kwargs.get("params").get("payload") for call in self.run_dnac_exec.call_args_list
+                if call.kwargs.get("function") == "configure_access_points_v2"]
+
+    def get_bulk_config_reads(self):
+        return [call for call in self.run_dnac_exec.call_args_list
+                if call.kwargs.get("function") == "get_access_point_configuration"
+                and "limit" in call.kwargs.get("params")]
+
+    def get_fleet_module_args(self, **params):
+        module_args = dict(
+            dnac_host="1.1.1.1",
+            dnac_username="dummy",
+            dnac_password="dummy",
+            dnac_log=True,
+            state="merged",
+            dnac_version="2.3.7.9",
+            dnac_task_poll_interval=1
+        )
+        module_args.update(params)
+        return module_args
+
+    def test_accesspoint_workflow_manager_fleet_mode_grouped_updates(self):
+        """
+        Test case for access point workflow manager fleet mode update.
+
+        This test case checks that the APs requiring the same change are updated with a single request.
+        """
+        config = [
+            {"mac_address": "34:5d:a8:3b:d8:e1", "led_status": "Disabled"},
+            {"mac_address": "34:5d:a8:3b:d8:e2", "led_status": "Disabled"},
+            {"mac_address": "34:5d:a8:3b:d8:e3", "led_brightness_level": 3}
+        ]
+        set_module_args(self.get_fleet_module_args(fleet_mode=True, config=config))
+        result = self.execute_module(changed=True, failed=False)
+        ap_updates = sorted([sorted(entry.get("macAddress") for entry in payload.get("apList"))
+                             for payload in self.get_ap_update_calls()])
+        self.assertEqual(ap_updates, [["34:b8:83:15:7c:61", "34:b8:83:15:7c:62"], ["34:b8:83:15:7c:63"]])
+        self.assertEqual(result.get("msg"), "3 AP(s) processed: 0 provisioned, 3 updated.")
+
+    def test_accesspoint_workflow_manager_fleet_mode_verify(self):
+        """
+        Test case for access point workflow manager fleet mode update with config verification.
+
+        This test case checks that the updated APs are verified against one bulk read of the AP configurations.
+        """
+        config = [
+            {"mac_address": "34:5d:a8:3b:d8:e1", "led_status": "Disabled"},
+            {"mac_address": "34:5d:a8:3b:d8:e2", "led_status": "Disabled"}
+        ]
+        set_module_args(self.get_fleet_module_args(fleet_mode=True, config_verify=True, config=config))
+        self.execute_module(changed=True, failed=False)
+        self.assertEqual(len(self.get_ap_update_calls()), 1)
+        self.assertEqual(len(self.get_bulk_config_reads()), 1)
+
+    def test_accesspoint_workflow_manager_fleet_mode_verify_old_version(self):
+        """
+        Test case for access point workflow manager fleet mode verification before release 2.3.7.9.
+
+        This test case checks that the AP configurations are read individually when the bulk read is not supported.
+        """
+        config = [
+            {"mac_address": "34:5d:a8:3b:d8:e1", "led_status": "Disabled"},
+            {"mac_address": "34:5d:a8:3b:d8:e2", "led_status": "Disabled"}
+        ]
+        set_module_args(self.get_fleet_module_args(fleet_mode=True, config_verify=True,
+                                                   dnac_version="2.3.7.6", config=config))
+        self.execute_module(changed=True, failed=False)
+        self.assertEqual(self.get_bulk_config_reads(), [])
+
+    def test_accesspoint_workflow_manager_rolling_reboot(self):
+        """
+        Test case for access point workflow manager rolling reboot.
+
+        This test case checks that the reboot requests never exceed 'max_aps_in_flight' APs in flight.
+        """
+        config = [{"reboot_aps": {"hostnames": ["FLEET-AP-{0}".format(index) for index in range(1, 6)]}}]
+        set_module_args(self.get_fleet_module_args(ap_batch_size=2, max_aps_in_flight=3, config=config))
+        result = self.execute_module(changed=True, failed=False)
+        reboot_requests = [call.kwargs.get("params").get("apMacAddresses") for call in self.run_dnac_exec.call_args_list
+                           if call.kwargs.get("function") == "reboot_access_points"]
+        self.assertEqual(sorted(len(ap_list) for ap_list in reboot_requests), [1, 2, 2])
+        self.assertEqual(self.max_aps_in_flight_seen, 3)
+        self.assertEqual(self.aps_in_flight, [])
+        self.assertEqual(
+            result.get("response").get("accesspoints_updates").get("ap_reboot_status"),
+            "5 AP(s) rebooted successfully"
+        )
+
+    def test_accesspoint_workflow_manager_rolling_reboot_invalid_max_aps_in_flight(self):
+        """
+        Test case for access point workflow manager reboot with 'max_aps_in_flight' lower than 1.
+
+        This test case checks that the module fails before any reboot request is sent.
+        """
+        config = [{"reboot_aps": {"hostnames": ["FLEET-AP-1", "FLEET-AP-2"]}}]
+        set_module_args(self.get_fleet_module_args(max_aps_in_flight=0, config=config))
+        result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(self.aps_in_flight, [])
+        self.assertEqual(result.get("msg"), "'max_aps_in_flight' must be at least 1 but passed 0")
+
     def test_accesspoint_workflow_manager_provision_device(self):
         """
         Test case for access point workfollow manager provision and update device.
@@ -34,6 +34,8 @@ class TestDnacNetworkSettings(TestDnacModule):
     playbook_config_reserve_pool = test_data.get("playbook_config_reserve_pool")
     playbook_config_reserve_pool_deletion = test_data.get("playbook_config_reserve_pool_deletion")
     playbook_config_global_pool_deletion = test_data.get("playbook_config_global_pool_deletion")
+    playbook_global_pool_overlap = test_data.get("playbook_global_pool_overlap")
+    playbook_config_reserve_pool_overlap = test_data.get("playbook_config_reserve_pool_overlap")
 
     def setUp(self):
         super(TestDnacNetworkSettings, self).setUp()
@@ -368,13 +370,11 @@ class TestDnacNetworkSettings(TestDnacModule):
         if "global_pool_creation" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
                 self.test_data.get("global_pool_exist_ipv6"),
-                self.test_data.get("global_pool_exist_ipv4"),
                 self.test_data.get("global_pool_creation"),
                 self.test_data.get("global_pool_creation_task"),
                 self.test_data.get("global_pool_creation_task"),
                 self.test_data.get("global_pool_creation_task"),
                 self.test_data.get("global_pool_ipv6_exist2"),
-                self.test_data.get("global_pool_ipv4_exist2")
             ]
 
         if "global_pool_deletion" in self._testMethodName:
@@ -415,10 +415,23 @@ class TestDnacNetworkSettings(TestDnacModule):
             self.run_dnac_exec.side_effect = [
                 self.test_data.get("Global_Pool1"),
                 self.test_data.get("Global_Pool2"),
-                self.test_data.get("update_global_pool"),
-                self.test_data.get("update_global_pool_task"),
-                self.test_data.get("Global_Pool_1"),
-                self.test_data.get("Global_Pool_2")
+            ]
+
+        if "exception_get_network_v1" in self._testMethodName:
+            self.run_dnac_exec.side_effect = [
+                self.test_data.get("get_sites_network"),
+                Exception("status_code: 500, Internal Server Error"),
+            ]
+
+        if "global_pool_overlap" in self._testMethodName:
+            self.run_dnac_exec.side_effect = [
+                self.test_data.get("Global_Pool1"),
+            ]
+
+        if "reserve_pool_overlap" in self._testMethodName:
+            self.run_dnac_exec.side_effect = [
+                self.test_data.get("site_reserve_deletion"),
+                self.test_data.get("get_reserved_ip_subpool_deletion"),
             ]
 
     def test_Network_settings_workflow_manager_network_network_not_need_update(self):
@@ -446,6 +459,32 @@ class TestDnacNetworkSettings(TestDnacModule):
             "Exception occurred while updating the network settings of 'Global/Vietnam': 'list' object has no attribute 'get'"
         )
 
+    def test_Network_settings_workflow_manager_network_exception_get_network_v1(self):
+        """
+        Test case for network settings workflow manager when the network settings of a site cannot be read.
+
+        This test case checks that the error of 'get_network_v2' on Catalyst Center version 2.3.5.3 fails the module.
+        """
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=True,
+                state="merged",
+                dnac_version="2.3.5.3",
+                config_verify=True,
+                config=self.playbook_config_network
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        print(result.get('msg'))
+        self.assertEqual(
+            result.get('msg'),
+            "Exception occurred while getting the network settings details of the site 'Global/Vietnam' "
+            "from Cisco Catalyst Center: status_code: 500, Internal Server Error"
+        )
+
     def test_Network_settings_workflow_manager_not_verified(self):
         """
         Test case for site workflow manager when creating a site.
@@ -964,7 +1003,7 @@ class TestDnacNetworkSettings(TestDnacModule):
                 config=self.playbook_global_pool_updation
             )
         )
-        result = self.execute_module(changed=False, failed=True)
+        result = self.execute_module(changed=False, failed=False)
         print(result["response"][0].get("globalPool").get("msg"))
         # print(result)
         self.assertEqual(
@@ -972,6 +1011,63 @@ class TestDnacNetworkSettings(TestDnacModule):
             {'Global_Pool2': "Global pool doesn't require an update", 'Global_Pool3': "Global pool doesn't require an update"}
 
         )
+        self.assertEqual(
+            [call.kwargs.get("function") for call in self.run_dnac_exec.call_args_list],
+            ["get_global_pool", "get_global_pool"]
+        )
+
+    def test_Network_settings_workflow_manager_global_pool_overlap(self):
+        """
+        Test case for network settings workflow manager when creating a global pool overlapping an existing one.
+
+        This test case checks that the new global pool is rejected before any request is sent.
+        """
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=True,
+                state="merged",
+                config_verify=True,
+                dnac_version="2.3.5.3",
+                config=self.playbook_global_pool_overlap
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        print(result["msg"])
+        self.assertEqual(
+            result["msg"],
+            "The CIDR '10.10.0.0/16' of the global pool 'Global_Pool4' overlaps with the existing global pool(s) ['10.0.0.0/8']."
+        )
+        self.assertNotIn("create_global_pool", [call.kwargs.get("function") for call in self.run_dnac_exec.call_args_list])
+
+    def test_Network_settings_workflow_manager_reserve_pool_overlap(self):
+        """
+        Test case for network settings workflow manager when reserving a subnet overlapping a reserved pool of the site.
+
+        This test case checks that the new reserve pool is rejected before any request is sent.
+        """
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=True,
+                state="merged",
+                config_verify=True,
+                dnac_version="2.3.5.3",
+                config=self.playbook_config_reserve_pool_overlap
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        print(result["msg"])
+        self.assertEqual(
+            result["msg"],
+            "The subnet '10.192.0.0/10' of the reserve pool 'IP_Pool_4' overlaps with the reserved pool(s) "
+            "['10.128.0.0/9'] in the site 'Global/Abc2'."
+        )
+        self.assertNotIn("reserve_ip_subpool", [call.kwargs.get("function") for call in self.run_dnac_exec.call_args_list])
 
     def test_Network_settings_workflow_manager_global_pool_deletion(self):
         """
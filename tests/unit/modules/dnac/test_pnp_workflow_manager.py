@@ -76,13 +76,10 @@ class TestDnacPnpWorkflow(TestDnacModule):
                 self.test_data.get("get_device_by_id"),
                 self.test_data.get("get_site_detail"),
                 self.test_data.get("get_site_detail"),
-                self.test_data.get("get_device_by_id"),
                 self.test_data.get("get_site_detail"),
-                self.test_data.get("add_devices"),
                 self.test_data.get("get_device_by_id"),
                 self.test_data.get("get_device_by_id"),
-                self.test_data.get("device_claimed"),
-                self.test_data.get("get_device_by_id")
+                self.test_data.get("get_device_detail")
             ]
         elif "claim_ap_claimed_old" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
@@ -94,38 +91,36 @@ class TestDnacPnpWorkflow(TestDnacModule):
                 self.test_data.get("get_site_detail_old"),
                 self.test_data.get("get_site_detail_old"),
                 self.test_data.get("add_devices"),
-                self.test_data.get("get_device_by_id"),
-                self.test_data.get("get_device_by_id"),
                 self.test_data.get("device_claimed"),
                 self.test_data.get("device_claimed"),
-                self.test_data.get("get_device_by_id")
+                self.test_data.get("get_device_detail")
             ]
         elif "claim_switch" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
+                self.test_data.get("get_device_list_empty"),
+                self.test_data.get("add_devices_sw"),
+                self.test_data.get("get_device_detail_sw"),
                 self.test_data.get("get_software_image_detail_sw"),
                 self.test_data.get("get_template_configuration_sw"),
                 self.test_data.get("get_device_by_id_sw"),
+                self.test_data.get("get_site_detail_sw"),
                 self.test_data.get("add_devices_sw"),
-                self.test_data.get("add_devices_sw"),
-                self.test_data.get("device_claimed")
+                self.test_data.get("get_device_detail_sw")
             ]
         elif "device_delete" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                self.test_data.get("get_device_detail_delete"),
-                self.test_data.get("get_device_detail_delete"),
-                self.test_data.get("get_device_detail_delete"),
-                self.test_data.get("get_device_detail_delete"),
+                self.test_data.get("get_device_list_empty"),
+                self.test_data.get("get_device_list_empty"),
             ]
         elif "wlc_error" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                self.test_data.get("get_device_detail_sw"),
+                self.test_data.get("get_device_detail_wlc"),
                 self.test_data.get("get_software_image_detail"),
                 self.test_data.get("get_template_configuration_sw"),
                 self.test_data.get("get_device_by_id_wlc"),
                 self.test_data.get("get_site_detail_sw"),
                 self.test_data.get("get_device_by_id_wlc"),
                 self.test_data.get("get_device_by_id_wlc"),
-                self.test_data.get("get_device_by_id_wlc"),
             ]
         elif "sw_err" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
@@ -135,23 +130,20 @@ class TestDnacPnpWorkflow(TestDnacModule):
                 self.test_data.get("get_device_by_id_sw_err"),
                 self.test_data.get("get_site_detail_sw")
             ]
+        elif "claim_before_later_failure" in self._testMethodName:
+            self.run_dnac_exec.side_effect = self.claim_before_later_failure_response
         elif "import_devices_in_bulk_new" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                self.test_data.get("playbook_config_pnp_site"),
-                self.test_data.get("get_device_detail_sw"),
-                self.test_data.get("get_device_detail_sw"),
-                self.test_data.get("get_device_detail_sw"),
+                self.test_data.get("get_device_list_empty"),
                 self.test_data.get("get_import_devices_in_bulk")
             ]
         elif "devices_idempotent" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                self.test_data.get("get_device_detail_exist1"),
-                self.test_data.get("get_device_detail_exist2")
+                self.test_data.get("get_device_list_unclaimed")
             ]
         elif "device_claim_idempotent" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
-                self.test_data.get("get_device_detail_exist3"),
-                self.test_data.get("get_device_detail_exist4")
+                self.test_data.get("get_device_list_claimed")
             ]
         elif "site_error" in self._testMethodName:
             self.run_dnac_exec.side_effect = [
@@ -184,6 +176,32 @@ class TestDnacPnpWorkflow(TestDnacModule):
                 self.test_data.get("get_site_detail_floor")
             ]
 
+    def claim_before_later_failure_response(self, family=None, function=None, params=None, **kwargs):
+        """
+        Return the responses of the API calls made when the second config entry fails after
+        the device of the first entry has been added and its claim queued.
+        """
+        params = params or {}
+        if function == "get_device_list":
+            if isinstance(params.get("serial_number"), list):
+                return self.test_data.get("get_device_list_empty")
+            return self.test_data.get("get_device_detail_sw")
+        if function == "add_device":
+            return self.test_data.get("add_devices_sw")
+        if function == "get_software_image_details":
+            if params.get("image_name") == "cat9k_iosxe.17.15.01.SPA.bin":
+                return self.test_data.get("get_software_image_detail_sw")
+            return self.test_data.get("get_software_image_detail_sw_error")
+        if function == "gets_the_templates_available":
+            return self.test_data.get("get_template_configuration_sw")
+        if function == "get_device_by_id":
+            return self.test_data.get("get_device_by_id_sw")
+        if function == "get_sites":
+            return self.test_data.get("get_site_detail_sw")
+        if function == "claim_a_device_to_a_site":
+            return {"response": "Device Claimed", "version": "1.0"}
+        return None
+
     def test_pnp_workflow_manager_claim_ap_claimed_new(self):
         """
         Test case for PNP workflow manager when add and claim switch device.
@@ -518,3 +536,33 @@ class TestDnacPnpWorkflow(TestDnacModule):
             result.get('msg'),
             "Either project not found or it is Empty."
         )
+
+    def test_pnp_workflow_manager_claim_before_later_failure(self):
+        """
+        Test case for PNP workflow manager when the second config entry fails after the
+        first device is added, the queued claim of the first device is still submitted.
+        """
+        failing_entry = dict(self.playbook_config_switch[0])
+        failing_entry["image_name"] = "cat9k_iosxe.17.09.01.SPA.bin"
+        failing_entry["device_info"] = [dict(failing_entry["device_info"][0], serial_number="FOC2439LA90")]
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_version="2.3.7.6",
+                dnac_log=True,
+                config_verify=True,
+                state="merged",
+                config=[self.playbook_config_switch[0], failing_entry]
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        self.assertIn("is either not present or not tagged as 'Golden'", result.get('msg'))
+        self.assertIn("Device Added and Claimed Successfully", result.get('msg'))
+        claim_calls = [
+            call for call in self.run_dnac_exec.call_args_list
+            if call.kwargs.get("function") == "claim_a_device_to_a_site"
+        ]
+        self.assertEqual(len(claim_calls), 1)
+        self.assertEqual(claim_calls[0].kwargs["params"].get("deviceId"), "671b1d88c301a454b89d2c84")
@@ -40,6 +40,8 @@ class TestDnacProvisionWorkflow(TestDnacModule):
     playbook_force_provision_device = test_data.get(
         "playbook_force_provision_device")
     playbook_wireless_provision = test_data.get("playbook_wireless_provision")
+    playbook_bulk_provision_devices = test_data.get("playbook_bulk_provision_devices")
+    playbook_bulk_assign_provisioned_device = test_data.get("playbook_bulk_assign_provisioned_device")
 
     def setUp(self):
         super(TestDnacProvisionWorkflow, self).setUp()
@@ -131,6 +133,52 @@ class TestDnacProvisionWorkflow(TestDnacModule):
                 self.test_data.get("get_network_device_by_ip3_wp"),
                 self.test_data.get("wireless_provision_response_wp"),
             ]
+        elif "bulk" in self._testMethodName:
+            self.run_dnac_exec.side_effect = self.bulk_provision_response
+
+    def bulk_provision_response(self, family, function, params=None, **kwargs):
+        if function == "get_network_device_by_ip":
+            return self.test_data.get("get_network_device_by_ip_bulk")
+        if function == "get_device_list":
+            devices = self.test_data.get("get_device_list_bulk").get("response")
+            return {"response": [device for device in devices
+                                 if device.get("managementIpAddress") in params.get("management_ip_address")]}
+        if function == "get_sites":
+            return self.test_data.get("get_sites_bulk")
+        if function == "get_provisioned_devices":
+            if "provisioned_device" in self._testMethodName and params.get("offset") == 1:
+                return self.test_data.get("get_provisioned_devices_bulk_one_provisioned")
+            return self.test_data.get("get_provisioned_devices_bulk")
+        if function == "provision_devices":
+            device_ids = [device.get("networkDeviceId") for device in params.get("payload")]
+            if "batch_failure" in self._testMethodName and self.get_bulk_device_id("204.1.2.13") in device_ids:
+                raise Exception("status_code: 500, Internal Server Error")
+            return self.test_data.get("provision_devices_bulk")
+        if function == "get_task_by_id":
+            return self.test_data.get("get_task_by_id_bulk")
+        return {"response": []}
+
+    def get_bulk_device_id(self, ip_address):
+        devices = self.test_data.get("get_device_list_bulk").get("response")
+        return next(device.get("id") for device in devices if device.get("managementIpAddress") == ip_address)
+
+    def provision_calls(self):
+        return [call.kwargs.get("params").get("payload") for call in self.run_dnac_exec.call_args_list
+                if call.kwargs.get("function") == "provision_devices"]
+
+    def get_bulk_module_args(self, config, **params):
+        module_args = dict(
+            dnac_host="1.1.1.1",
+            dnac_username="dummy",
+            dnac_password="dummy",
+            dnac_log=True,
+            dnac_version="2.3.7.9",
+            dnac_task_poll_interval=1,
+            state="merged",
+            config=config
+        )
+        module_args.update(params)
+        return module_args
 
     def test_provision_workflow_manager_playbook_assign_wired_device_to_site(self):
         """
@@ -274,3 +322,73 @@ class TestDnacProvisionWorkflow(TestDnacModule):
             result.get('msg'),
             "Provision done Successfully"
         )
+
+    def test_provision_workflow_manager_bulk_provision_in_batches(self):
+        """
+        Test case for provisioning wired devices in batches of 'provision_batch_size' devices.
+
+        This test case checks that three devices are provisioned with one request of two devices and one of one device.
+        """
+        set_module_args(self.get_bulk_module_args(self.playbook_bulk_provision_devices, provision_batch_size=2))
+        result = self.execute_module(changed=True, failed=False)
+        print(result)
+        self.assertEqual(
+            [[device.get("networkDeviceId") for device in payload] for payload in self.provision_calls()],
+            [
+                ["3a1e0e5c-7a42-4c0a-9b0f-1b7b6c2f0011", "3a1e0e5c-7a42-4c0a-9b0f-1b7b6c2f0012"],
+                ["3a1e0e5c-7a42-4c0a-9b0f-1b7b6c2f0013"]
+            ]
+        )
+        self.assertEqual(
+            result.get("msg"),
+            [
+                "Provisioning of the device(s) '['204.1.2.11', '204.1.2.12']' completed successfully.",
+                "Provisioning of the device(s) '['204.1.2.13']' completed successfully."
+            ]
+        )
+
+    def test_provision_workflow_manager_bulk_provision_batch_failure(self):
+        """
+        Test case for a provisioning batch which cannot be submitted.
+
+        This test case checks that the failed batch is reported with its devices while the other batch is still provisioned.
+        """
+        set_module_args(self.get_bulk_module_args(self.playbook_bulk_provision_devices, provision_batch_size=2))
+        result = self.execute_module(changed=True, failed=True)
+        print(result)
+        self.assertEqual(len(self.provision_calls()), 2)
+        self.assertEqual(
+            result.get("msg"),
+            [
+                "Error in provisioning of the device(s) '['204.1.2.13']' due to status_code: 500, Internal Server Error",
+                "Provisioning of the device(s) '['204.1.2.11', '204.1.2.12']' completed successfully."
+            ]
+        )
+
+    def test_provision_workflow_manager_bulk_assign_provisioned_device(self):
+        """
+        Test case for assigning an already provisioned device to a site with 'provisioning' set to false.
+
+        This test case checks that the device is reported as failed while the other devices of the playbook are still provisioned.
+        """
+        set_module_args(self.get_bulk_module_args(self.playbook_bulk_assign_provisioned_device))
+        result = self.execute_module(changed=True, failed=True)
+        print(result)
+        self.assertEqual(
+            [[device.get("networkDeviceId") for device in payload] for payload in self.provision_calls()],
+            [["3a1e0e5c-7a42-4c0a-9b0f-1b7b6c2f0011"]]
+        )
+        self.assertIn("Cannot assign the provisioned device '204.1.2.12' to the site.", result.get("msg")[0])
+        self.assertIn("Provisioning of the device(s) '['204.1.2.11']' completed successfully.", result.get("msg"))
+
+    def test_provision_workflow_manager_bulk_invalid_batch_size(self):
+        """
+        Test case for a 'provision_batch_size' lower than 1.
+
+        This test case checks that the playbook is rejected before any device is provisioned.
+        """
+        set_module_args(self.get_bulk_module_args(self.playbook_bulk_provision_devices, provision_batch_size=0))
+        result = self.execute_module(changed=False, failed=True)
+        print(result)
+        self.assertEqual(result.get("msg"), "'provision_batch_size' must be at least 1 but passed 0")
+        self.assertEqual(self.provision_calls(), [])
@@ -0,0 +1,141 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+from unittest.mock import patch
+from ansible_collections.cisco.dnac.plugins.modules import sda_fabric_devices_workflow_manager
+from .dnac_module import TestDnacModule, set_module_args, loadPlaybookData
+
+
+class TestDnacSdaFabricDevicesWorkflow(TestDnacModule):
+
+    module = sda_fabric_devices_workflow_manager
+    test_data = loadPlaybookData("sda_fabric_devices_workflow_manager")
+    playbook_config_fabric_devices_bulk = test_data.get("playbook_config_fabric_devices_bulk")
+
+    def setUp(self):
+        super(TestDnacSdaFabricDevicesWorkflow, self).setUp()
+
+        self.mock_dnac_init = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK.__init__")
+        self.run_dnac_init = self.mock_dnac_init.start()
+        self.run_dnac_init.side_effect = [None]
+        self.mock_dnac_exec = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK._exec"
+        )
+        self.run_dnac_exec = self.mock_dnac_exec.start()
+
+        self.load_fixtures()
+
+    def tearDown(self):
+        super(TestDnacSdaFabricDevicesWorkflow, self).tearDown()
+        self.mock_dnac_exec.stop()
+        self.mock_dnac_init.stop()
+
+    def load_fixtures(self, response=None, device=""):
+        """
+        Load fixtures for user.
+        """
+
+        self.run_dnac_exec.side_effect = self.fabric_devices_response
+
+    def fabric_devices_response(self, family, function, params=None, **kwargs):
+        if function == "get_sites":
+            return self.test_data.get("get_sites_bulk")
+        if function == "get_fabric_sites":
+            return self.test_data.get("get_fabric_sites_bulk")
+        if function == "get_device_list":
+            devices = self.test_data.get("get_device_list_bulk").get("response")
+            return {"response": [device for device in devices
+                                 if device.get("managementIpAddress") in params.get("management_ip_address")]}
+        if function == "get_provisioned_devices":
+            fabric_site = self.test_data.get("get_fabric_sites_bulk").get("response")[0]
+            return {"response": [{"networkDeviceId": params.get("network_device_id"), "siteId": fabric_site.get("siteId")}]}
+        if function == "get_fabric_devices":
+            return self.test_data.get("get_fabric_devices_bulk")
+        if function == "add_fabric_devices":
+            device_ids = [device.get("networkDeviceId") for device in params.get("payload")]
+            if "batch_failure" in self._testMethodName and "device-3" in device_ids:
+                raise Exception("status_code: 500, Internal Server Error")
+            return self.test_data.get("add_fabric_devices_bulk")
+        if function == "get_task_by_id":
+            return self.test_data.get("get_task_by_id_bulk")
+        return {"response": []}
+
+    def add_fabric_devices_calls(self):
+        return [[device.get("networkDeviceId") for device in call.kwargs.get("params").get("payload")]
+                for call in self.run_dnac_exec.call_args_list
+                if call.kwargs.get("function") == "add_fabric_devices"]
+
+    def get_module_args(self, **params):
+        module_args = dict(
+            dnac_host="1.1.1.1",
+            dnac_username="dummy",
+            dnac_password="dummy",
+            dnac_log=True,
+            dnac_version="2.3.7.9",
+            dnac_task_poll_interval=1,
+            state="merged",
+            config=self.playbook_config_fabric_devices_bulk
+        )
+        module_args.update(params)
+        return module_args
+
+    def test_sda_fabric_devices_workflow_manager_add_devices_in_batches(self):
+        """
+        Test case for adding the fabric devices in batches.
+
+        This test case checks that the fabric devices are split in batches of 'sda_fabric_devices_batch_size'.
+        """
+        set_module_args(self.get_module_args(sda_fabric_devices_batch_size=2))
+        # The module reports the fabric device operations in 'response' and does not set 'changed'
+        result = self.execute_module(changed=False, failed=False)
+        self.assertEqual(
+            sorted(self.add_fabric_devices_calls()),
+            [["device-1", "device-2"], ["device-3", "device-4"], ["device-5"]]
+        )
+        self.assertEqual(
+            result.get("response")[0].get("msg").get("Global/USA/SAN JOSE").get("204.1.2.5"),
+            {"device_details": "SDA fabric device details added successfully."}
+        )
+
+    def test_sda_fabric_devices_workflow_manager_add_devices_batch_failure(self):
+        """
+        Test case for adding the fabric devices when one of the batches fails.
+
+        This test case checks that the failed batch is reported and the module fails.
+        """
+        set_module_args(self.get_module_args(sda_fabric_devices_batch_size=2))
+        result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(len(self.add_fabric_devices_calls()), 3)
+        self.assertIn("'device-3'", result.get("msg"))
+        self.assertIn("status_code: 500, Internal Server Error", result.get("msg"))
+        self.assertNotIn("'device-1'", result.get("msg"))
+
+    def test_sda_fabric_devices_workflow_manager_invalid_batch_size(self):
+        """
+        Test case for a fabric devices batch size lower than 1.
+
+        This test case checks that the module fails before any fabric device is added.
+        """
+        set_module_args(self.get_module_args(sda_fabric_devices_batch_size=0))
+        result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(self.add_fabric_devices_calls(), [])
+        self.assertEqual(
+            result.get("msg"),
+            "'sda_fabric_devices_batch_size' must be at least 1 but passed 0"
+        )
@@ -87,10 +87,8 @@ class SDAHostPortOnboarding(TestDnacModule):
                 self.test_data.get("response_get_fabric_sites"),
                 self.test_data.get("response_get_device_list"),
                 self.test_data.get("response_get_device_info"),
-                self.test_data.get("response_get_port_assignments_5"),
-                self.test_data.get("response_get_port_assignments_6"),
+                self.test_data.get("response_get_port_assignments_7"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_port_assignments")
@@ -107,7 +105,6 @@ class SDAHostPortOnboarding(TestDnacModule):
                 self.test_data.get("response_get_port_channels"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
-                self.test_data.get("response_get_port_channels_2"),
                 self.test_data.get("response_get_port_channels_2")
             ]
 
@@ -135,17 +132,11 @@ class SDAHostPortOnboarding(TestDnacModule):
                 self.test_data.get("response_get_device_info"),
                 self.test_data.get("response_get_port_channels_3"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_port_channels"),
-                self.test_data.get("response_get_port_channels"),
-                self.test_data.get("response_get_port_channels"),
-                self.test_data.get("response_get_port_channels"),
             ]
 
         # Add SSIDs
@@ -193,14 +184,12 @@ class SDAHostPortOnboarding(TestDnacModule):
                 self.test_data.get("response_get_port_channels"),
                 self.test_data.get("response_get_wireless_ssids"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_port_channels_2"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_port_assignments_2"),
-                self.test_data.get("response_get_port_channels_2"),
                 self.test_data.get("response_get_wireless_ssids_2")
             ]
 
@@ -234,32 +223,57 @@ class SDAHostPortOnboarding(TestDnacModule):
                 self.test_data.get("response_get_fabric_sites"),
                 self.test_data.get("response_get_device_list"),
                 self.test_data.get("response_get_device_info"),
-                self.test_data.get("response_get_port_assignments_5"),
-                self.test_data.get("response_get_port_assignments_6"),
+                self.test_data.get("response_get_port_assignments_7"),
                 self.test_data.get("response_get_port_channels_3"),
                 self.test_data.get("response_get_wireless_ssids_3"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
-                self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_task_id"),
                 self.test_data.get("response_get_task_status_by_id"),
                 self.test_data.get("response_get_port_assignments"),
                 self.test_data.get("response_get_port_channels"),
-                self.test_data.get("response_get_port_channels"),
-                self.test_data.get("response_get_port_channels"),
-                self.test_data.get("response_get_port_channels"),
                 self.test_data.get("response_get_wireless_ssids_4"),
             ]
 
+        # Port Assignments in batches
+        if "port_assignments_batch" in self._testMethodName or "port_assignments_same_device" in self._testMethodName:
+            self.added_port_assignments = []
+            self.run_dnac_exec.side_effect = self.port_assignments_batch_response
+
+    def port_assignments_batch_response(self, family, function, params=None, **kwargs):
+        if function == "get_device_list":
+            return self.test_data.get("response_get_device_list")
+        if function == "get_sites":
+            return self.test_data.get("response_get_sites")
+        if function == "get_fabric_sites":
+            return self.test_data.get("response_get_fabric_sites")
+        if function == "get_device_info":
+            return self.test_data.get("response_get_device_info")
+        if function == "get_port_assignments":
+            return {"response": [dict(port_assignment, id=port_assignment.get("interfaceName"))
+                                 for port_assignment in self.added_port_assignments]}
+        if function in ("add_port_assignments", "update_port_assignments"):
+            interface_names = [port_assignment.get("interfaceName") for port_assignment in params.get("payload")]
+            if "batch_failure" in self._testMethodName and "GigabitEthernet1/0/3" in interface_names:
+                raise Exception("status_code: 500, Internal Server Error")
+            if function == "add_port_assignments":
+                self.added_port_assignments.extend(params.get("payload"))
+            return self.test_data.get("response_get_task_id")
+        if function == "get_task_by_id":
+            return self.test_data.get("response_get_task_status_by_id")
+        return {"response": []}
+
+    def port_assignments_calls(self, api_function):
+        return [[port_assignment.get("interfaceName") for port_assignment in call.kwargs.get("params").get("payload")]
+                for call in self.run_dnac_exec.call_args_list
+                if call.kwargs.get("function") == api_function]
+
 # SUCCESS TESTCASES ########################################################################################
 
     # Add Port Assignments
@@ -564,3 +578,85 @@ class SDAHostPortOnboarding(TestDnacModule):
         for expected_message in expected_messages:
             with self.subTest(expected_message=expected_message):
                 self.assertIn(expected_message, result.get('msg'))
+
+    # Port Assignments in batches
+    def test_port_assignments_batches(self):
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=False,
+                dnac_version="2.3.7.9",
+                state="merged",
+                port_batch_size=2,
+                config=self.test_data.get("playbook_config_port_assignments_batch")
+            )
+        )
+        result = self.execute_module(changed=True, failed=False)
+        self.assertEqual(
+            sorted(self.port_assignments_calls("add_port_assignments")),
+            [
+                ["GigabitEthernet1/0/1", "GigabitEthernet1/0/2"],
+                ["GigabitEthernet1/0/3", "GigabitEthernet1/0/4"],
+                ["GigabitEthernet1/0/5"]
+            ]
+        )
+        self.assertEqual(
+            result.get("msg").get("Add Port Assignment(s) Task Succeeded for following interface(s)").get("success_count"),
+            5
+        )
+
+    # Port Assignments with a failing batch
+    def test_port_assignments_batch_failure(self):
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=False,
+                dnac_version="2.3.7.9",
+                state="merged",
+                port_batch_size=2,
+                config=self.test_data.get("playbook_config_port_assignments_batch")
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(len(self.port_assignments_calls("add_port_assignments")), 3)
+        self.assertIn("GigabitEthernet1/0/3", str(result.get("msg")))
+        self.assertIn("status_code: 500, Internal Server Error", str(result.get("msg")))
+
+    # Entries of the same device are compared with the state left by the previous entries
+    def test_port_assignments_same_device(self):
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=False,
+                dnac_version="2.3.7.9",
+                state="merged",
+                config=self.test_data.get("playbook_config_port_assignments_same_device")
+            )
+        )
+        result = self.execute_module(changed=True, failed=False)
+        self.assertEqual(self.port_assignments_calls("add_port_assignments"), [["GigabitEthernet1/0/1"]])
+        self.assertEqual(self.port_assignments_calls("update_port_assignments"), [["GigabitEthernet1/0/1"]])
+        self.assertIn("Update Port Assignment(s) Task Succeeded for following interface(s)", result.get("msg"))
+
+    # Invalid batch size
+    def test_invalid_port_batch_size(self):
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_log=False,
+                dnac_version="2.3.7.9",
+                state="merged",
+                port_batch_size=0,
+                config=self.test_data.get("playbook_config_port_assignments_batch")
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(result.get("msg"), "'port_batch_size' must be at least 1 but passed 0")
@@ -614,3 +614,27 @@ class TestDnacSiteWorkflow(TestDnacModule):
             "Site(s) '['Global/Mysore', 'Global/Mysore/Mod-x', 'Global/Mysore/Mod-x/Mezzanine']'" +
             " updated successfully in Cisco Catalyst Center."
         )
+
+    def test_site_workflow_manager_invalid_batch_size(self):
+        """
+        Test case for site workflow manager when the site creation batch size is lower than 1.
+
+        This test case checks that the module fails before any site is processed.
+        """
+        set_module_args(
+            dict(
+                dnac_host="1.1.1.1",
+                dnac_username="dummy",
+                dnac_password="dummy",
+                dnac_version="2.3.7.6",
+                dnac_log=True,
+                state="merged",
+                site_creation_batch_size=0,
+                config=self.playbook_config_site
+            )
+        )
+        result = self.execute_module(changed=False, failed=True)
+        self.assertEqual(
+            result.get('msg'),
+            "'site_creation_batch_size' must be at least 1 but passed 0"
+        )
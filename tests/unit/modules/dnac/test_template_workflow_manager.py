@@ -0,0 +1,174 @@
+# Copyright (c) 2024 Cisco and/or its affiliates.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Make coding more python3-ish
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from ansible_collections.cisco.dnac.plugins.modules import template_workflow_manager
+from .dnac_module import TestDnacModule, set_module_args, loadPlaybookData
+
+
+class TestDnacTemplateWorkflowManager(TestDnacModule):
+
+    module = template_workflow_manager
+
+    test_data = loadPlaybookData("template_workflow_manager")
+
+    def setUp(self):
+        super(TestDnacTemplateWorkflowManager, self).setUp()
+
+        self.mock_dnac_init = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK.__init__")
+        self.run_dnac_init = self.mock_dnac_init.start()
+        self.run_dnac_init.side_effect = [None]
+        self.mock_dnac_exec = patch(
+            "ansible_collections.cisco.dnac.plugins.module_utils.dnac.DNACSDK._exec"
+        )
+        self.run_dnac_exec = self.mock_dnac_exec.start()
+        self.directory = tempfile.mkdtemp()
+        self.load_fixtures()
+
+    def tearDown(self):
+        super(TestDnacTemplateWorkflowManager, self).tearDown()
+        self.mock_dnac_init.stop()
+        self.mock_dnac_exec.stop()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def load_fixtures(self, response=None, device=""):
+        """
+        Load fixtures for user.
+        """
+
+        if "export_api_error" in self._testMethodName:
+            self.run_dnac_exec.side_effect = self.export_api_error_response
+        elif "export" in self._testMethodName:
+            self.run_dnac_exec.side_effect = self.export_response
+        elif "import" in self._testMethodName:
+            self.run_dnac_exec.side_effect = self.import_response
+
+    def export_response(self, family, function, params=None, **kwargs):
+        if function == "export_projects":
+            return self.test_data.get("export_projects_response")
+        if function == "get_task_by_id":
+            return self.test_data.get("export_projects_task_details")
+        return {"response": []}
+
+    def export_api_error_response(self, family, function, params=None, **kwargs):
+        if function == "export_projects":
+            raise Exception("status_code: 500, Internal Server Error")
+        return {"response": []}
+
+    def import_response(self, family, function, params=None, **kwargs):
+        if function == "imports_the_projects_provided":
+            return self.test_data.get("import_projects_response")
+        if function == "get_task_by_id":
+            return self.test_data.get("import_projects_task_details")
+        return {"response": []}
+
+    def get_module_args(self, config):
+        return dict(
+            dnac_host="1.1.1.1",
+            dnac_username="dummy",
+            dnac_password="dummy",
+            dnac_log=False,
+            dnac_version="2.3.7.9",
+            dnac_task_poll_interval=1,
+            state="merged",
+            config=config
+        )
+
+    def export_config(self, name):
+        config = copy.deepcopy(self.test_data.get(name))
+        config[0]["export"]["export_directory"] = self.directory
+        return config
+
+    def import_calls(self):
+        return [call for call in self.run_dnac_exec.call_args_list
+                if call.kwargs.get("function") == "imports_the_projects_provided"]
+
+    def test_template_workflow_manager_export_to_directory(self):
+        """
+        Test case for exporting a project to the export directory.
+
+        The exported data of the project is written to '<project_name>.json' in the export directory.
+        """
+
+        set_module_args(self.get_module_args(self.export_config("playbook_config_export_project")))
+        result = self.execute_module(changed=True, failed=False)
+        file_path = os.path.join(os.path.realpath(self.directory), "Onboarding Configuration.json")
+        self.assertEqual(
+            result.get("response")[1].get("export").get("response").get("exportProject"),
+            {"Onboarding Configuration": file_path}
+        )
+        with open(file_path) as export_file:
+            self.assertEqual(json.load(export_file), [{"name": "Onboarding Configuration", "templates": []}])
+
+    def test_template_workflow_manager_export_invalid_project_name(self):
+        """
+        Test case for exporting a project whose name would be written outside of the export directory.
+
+        The export fails before any request is sent and no file is written.
+        """
+
+        set_module_args(self.get_module_args(self.export_config("playbook_config_export_invalid_project_name")))
+        result = self.execute_module(changed=False, failed=True)
+        self.assertIn("'../Onboarding Configuration' cannot be used as a file name", result.get("msg"))
+        self.assertEqual(os.listdir(self.directory), [])
+        self.assertFalse([call for call in self.run_dnac_exec.call_args_list
+                          if call.kwargs.get("function") == "export_projects"])
+
+    def test_template_workflow_manager_export_api_error(self):
+        """
+        Test case for an export request failing in a worker thread.
+
+        The error is reported in the module result instead of ending the module from the worker.
+        """
+
+        set_module_args(self.get_module_args(self.export_config("playbook_config_export_project")))
+        result = self.execute_module(changed=False, failed=True)
+        self.assertIn("export_projects for the project 'Onboarding Configuration'", result.get("msg"))
+        self.assertIn("Internal Server Error", result.get("msg"))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_template_workflow_manager_import_project_directory(self):
+        """
+        Test case for importing the projects of the JSON files of a directory.
+
+        Every project found in the files is uploaded with its own request.
+        """
+
+        with open(os.path.join(self.directory, "projects.json"), "w") as project_file:
+            json.dump(self.test_data.get("import_projects"), project_file)
+
+        config = copy.deepcopy(self.test_data.get("playbook_config_import_project_directory"))
+        config[0]["import"]["project"]["project_directory"] = self.directory
+        set_module_args(self.get_module_args(config))
+        result = self.execute_module(changed=True, failed=False)
+        self.assertIn(
+            "Successfully imported the project(s) ['Campus Templates', 'Branch Templates']",
+            result.get("response")[2].get("import").get("response").get("importProject")
+        )
+        self.assertEqual(
+            sorted(call.kwargs.get("params").get("payload")[0].get("name") for call in self.import_calls()),
+            ["Branch Templates", "Campus Templates"]
+        )